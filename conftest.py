@@ -0,0 +1,6 @@
+import os
+
+from electricitymap.contrib.config.reading import SNAPSHOT_CACHE_DIR_ENV
+
+# The tests never read or write the config snapshots of the user running them.
+os.environ.pop(SNAPSHOT_CACHE_DIR_ENV, None)
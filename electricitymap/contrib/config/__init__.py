@@ -1,30 +1,37 @@
-"""Global config variables with data read from the config directory."""
+"""
+Global config variables with data read from the config directory.
 
+The variables are views of the shared CONFIG_REGISTRY. The config files are
+only read when first needed: ZONES_CONFIG, RETIRED_ZONES_CONFIG and
+EXCHANGES_CONFIG parse a file the first time its key is looked up, and the
+variables derived from them are computed on first access.
+"""
+
+import threading
+from collections.abc import Callable, Mapping
 from operator import itemgetter
-from pathlib import Path
 from typing import Any
 
-from electricitymap.contrib.config.co2eq_parameters import generate_co2eq_parameters
-from electricitymap.contrib.config.reading import (
-    read_data_centers_config,
-    read_defaults,
-    read_exchanges_config,
-    read_zones_config,
+from electricitymap.contrib.config.registry import CONFIG_REGISTRY
+
+# Re-exported for backward compatibility.
+from electricitymap.contrib.config.zones import (
+    generate_all_neighbours as generate_all_neighbours,
 )
 from electricitymap.contrib.config.zones import (
-    generate_all_neighbours,
-    generate_zone_neighbours,
-    zone_bounding_boxes,
-    zone_parents,
+    generate_zone_neighbours as generate_zone_neighbours,
 )
+from electricitymap.contrib.config.zones import (
+    zone_bounding_boxes as zone_bounding_boxes,
+)
+from electricitymap.contrib.config.zones import zone_parents as zone_parents
 from electricitymap.contrib.types import BoundingBox, ZoneKey
 
-CONFIG_DIR = Path(__file__).parent.parent.parent.parent.joinpath("config").resolve()
+CONFIG_DIR = CONFIG_REGISTRY.config_dir
 
-ZONES_CONFIG = read_zones_config(CONFIG_DIR)
-RETIRED_ZONES_CONFIG = read_zones_config(CONFIG_DIR, retired=True)
-EXCHANGES_CONFIG = read_exchanges_config(CONFIG_DIR)
-DATA_CENTERS_CONFIG = read_data_centers_config(CONFIG_DIR)
+ZONES_CONFIG = CONFIG_REGISTRY.zones
+RETIRED_ZONES_CONFIG = CONFIG_REGISTRY.retired_zones
+EXCHANGES_CONFIG = CONFIG_REGISTRY.exchanges
 
 EU_ZONES = [
     "AT",
@@ -88,31 +95,50 @@ EU_ZONES = [
     "SI",
     "SK",
 ]
-EU_ZONES_CONFIG = {k: v for k, v in ZONES_CONFIG.items() if k in EU_ZONES}
-
-# Prepare the CO2eq parameters config dicts.
-defaults = read_defaults(CONFIG_DIR)
-(
-    co2eq_parameters_all,
-    co2eq_parameters_direct,
-    co2eq_parameters_lifecycle,
-) = generate_co2eq_parameters(defaults, ZONES_CONFIG)
-CO2EQ_PARAMETERS_DIRECT = {**co2eq_parameters_all, **co2eq_parameters_direct}
-CO2EQ_PARAMETERS_LIFECYCLE = {**co2eq_parameters_all, **co2eq_parameters_lifecycle}
-CO2EQ_PARAMETERS = CO2EQ_PARAMETERS_LIFECYCLE  # Global LCA is the default
-
-# Make a dict mapping each zone to its bounding box.
-ZONE_BOUNDING_BOXES: dict[ZoneKey, BoundingBox] = zone_bounding_boxes(ZONES_CONFIG)
-
-# Make a mapping from subzone to the parent zone (full zone).
-ZONE_PARENT: dict[ZoneKey, ZoneKey] = zone_parents(ZONES_CONFIG)
-
-# Zone neighbours are zones that are connected by exchanges.
-ZONE_NEIGHBOURS: dict[ZoneKey, list[ZoneKey]] = generate_zone_neighbours(
-    ZONES_CONFIG, EXCHANGES_CONFIG
-)
 
-ALL_NEIGHBOURS: dict[ZoneKey, list[ZoneKey]] = generate_all_neighbours(EXCHANGES_CONFIG)
+
+_LAZY_VARIABLES: dict[str, Callable[[], Any]] = {
+    "DATA_CENTERS_CONFIG": lambda: CONFIG_REGISTRY.data_centers,
+    "EU_ZONES_CONFIG": lambda: {k: v for k, v in ZONES_CONFIG.items() if k in EU_ZONES},
+    # The CO2eq parameters config dicts.
+    "defaults": lambda: CONFIG_REGISTRY.defaults,
+    "co2eq_parameters_all": lambda: CONFIG_REGISTRY.co2eq_parameters[0],
+    "co2eq_parameters_direct": lambda: CONFIG_REGISTRY.co2eq_parameters[1],
+    "co2eq_parameters_lifecycle": lambda: CONFIG_REGISTRY.co2eq_parameters[2],
+    "CO2EQ_PARAMETERS_DIRECT": lambda: CONFIG_REGISTRY.co2eq_parameters_direct,
+    "CO2EQ_PARAMETERS_LIFECYCLE": lambda: CONFIG_REGISTRY.co2eq_parameters_lifecycle,
+    # Global LCA is the default
+    "CO2EQ_PARAMETERS": lambda: CONFIG_REGISTRY.co2eq_parameters_lifecycle,
+    # A mapping from each zone to its bounding box.
+    "ZONE_BOUNDING_BOXES": lambda: CONFIG_REGISTRY.zone_bounding_boxes,
+    # A mapping from subzone to the parent zone (full zone).
+    "ZONE_PARENT": lambda: CONFIG_REGISTRY.zone_parents,
+    # Zone neighbours are zones that are connected by exchanges.
+    "ZONE_NEIGHBOURS": lambda: CONFIG_REGISTRY.zone_neighbours,
+    "ALL_NEIGHBOURS": lambda: CONFIG_REGISTRY.all_neighbours,
+}
+_LAZY_LOCK = threading.Lock()
+
+# Declared for type checkers, these are set by __getattr__ on first access.
+DATA_CENTERS_CONFIG: Any
+EU_ZONES_CONFIG: dict[ZoneKey, Any]
+CO2EQ_PARAMETERS_DIRECT: dict[str, Any]
+CO2EQ_PARAMETERS_LIFECYCLE: dict[str, Any]
+CO2EQ_PARAMETERS: dict[str, Any]
+ZONE_BOUNDING_BOXES: Mapping[ZoneKey, BoundingBox]
+ZONE_PARENT: Mapping[ZoneKey, ZoneKey]
+ZONE_NEIGHBOURS: Mapping[ZoneKey, list[ZoneKey]]
+ALL_NEIGHBOURS: Mapping[ZoneKey, list[ZoneKey]]
+
+
+def __getattr__(name: str) -> Any:
+    """Computes the derived config variables on first access (PEP 562)."""
+    if name not in _LAZY_VARIABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _LAZY_LOCK:
+        if name not in globals():
+            globals()[name] = _LAZY_VARIABLES[name]()
+    return globals()[name]
 
 
 def _get_most_recent_value(emission_factors: dict) -> dict[dict, Any]:
@@ -124,8 +150,10 @@ def _get_most_recent_value(emission_factors: dict) -> dict[dict, Any]:
 
 def emission_factors(zone_key: ZoneKey) -> dict[str, float]:
     """Looks up the emission factors for a given zone."""
-    override = CO2EQ_PARAMETERS["emissionFactors"]["zoneOverrides"].get(zone_key, {})
-    defaults = CO2EQ_PARAMETERS["emissionFactors"]["defaults"]
+    # Module globals set lazily are not visible to functions until first accessed.
+    co2eq_parameters = __getattr__("CO2EQ_PARAMETERS")
+    override = co2eq_parameters["emissionFactors"]["zoneOverrides"].get(zone_key, {})
+    defaults = co2eq_parameters["emissionFactors"]["defaults"]
 
     # Only use most recent yearly numbers from defaults & overrides
     defaults = _get_most_recent_value(defaults)
@@ -1,28 +1,27 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
+from typing import Any
 
-from electricitymap.contrib.config.reading import read_zones_config
+from electricitymap.contrib.config.registry import CONFIG_REGISTRY
 from electricitymap.contrib.types import ZoneKey
 
-CONFIG_DIR = Path(__file__).parent.parent.parent.parent.joinpath("config").resolve()
-
-ZONES_CONFIG = read_zones_config(CONFIG_DIR)
-# Get productionCapacity source to zones mapping
-CAPACITY_PARSER_SOURCE_TO_ZONES: dict[str, list[ZoneKey]] = {}
-for zone_id, zone_config in ZONES_CONFIG.items():
-    if zone_config.get("parsers", {}).get("productionCapacity") is None:
-        continue
-    source = zone_config.get("parsers", {}).get("productionCapacity").split(".")[0]
-    if source not in CAPACITY_PARSER_SOURCE_TO_ZONES:
-        CAPACITY_PARSER_SOURCE_TO_ZONES[source] = []
-    CAPACITY_PARSER_SOURCE_TO_ZONES[source].append(zone_id)
-
-ZONE_TO_CAPACITY_PARSER_SOURCE = {
-    zone: source
-    for source, zones in CAPACITY_PARSER_SOURCE_TO_ZONES.items()
-    for zone in zones
-}
+CONFIG_DIR = CONFIG_REGISTRY.config_dir
+
+ZONES_CONFIG = CONFIG_REGISTRY.zones
+
+# Declared for type checkers, these are looked up by __getattr__.
+CAPACITY_PARSER_SOURCE_TO_ZONES: Mapping[str, list[ZoneKey]]
+ZONE_TO_CAPACITY_PARSER_SOURCE: Mapping[ZoneKey, str]
+
+
+def __getattr__(name: str) -> Any:
+    """Looks up the capacity parser indexes in the config registry (PEP 562)."""
+    if name == "CAPACITY_PARSER_SOURCE_TO_ZONES":
+        return CONFIG_REGISTRY.capacity_parser_source_to_zones
+    if name == "ZONE_TO_CAPACITY_PARSER_SOURCE":
+        return CONFIG_REGISTRY.zone_to_capacity_parser_source
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @dataclass
@@ -6,6 +6,14 @@ from typing import Any
 
 from electricitymap.contrib.types import ZoneKey
 
+# Zone config keys holding co2eq parameters, which are moved out of ZONES_CONFIG.
+CO2EQ_PARAMETER_KEYS = (
+    "fallbackZoneMixes",
+    "isLowCarbon",
+    "isRenewable",
+    "emissionFactors",
+)
+
 
 def generate_co2eq_parameters(
     defaults: dict[str, Any], zones_config: dict[ZoneKey, Any]
@@ -46,7 +54,6 @@ def generate_co2eq_parameters(
         for k in ["fallbackZoneMixes", "isLowCarbon", "isRenewable"]:
             if k in zone_config:
                 co2eq_parameters_all[k]["zoneOverrides"][zone_key] = zone_config[k]
-                del zone_config[k]
         if "emissionFactors" in zone_config:
             for k in ["direct", "lifecycle"]:
                 if k in zone_config["emissionFactors"]:
@@ -58,6 +65,10 @@ def generate_co2eq_parameters(
                         co2eq_parameters_lifecycle["emissionFactors"]["zoneOverrides"][
                             zone_key
                         ] = zone_config["emissionFactors"][k]
-            del zone_config["emissionFactors"]
 
     return co2eq_parameters_all, co2eq_parameters_direct, co2eq_parameters_lifecycle
+
+
+def without_co2eq_parameters(zone_config: dict[str, Any]) -> dict[str, Any]:
+    """Returns a copy of a zone config without its co2eq parameters."""
+    return {k: v for k, v in zone_config.items() if k not in CO2EQ_PARAMETER_KEYS}
@@ -1,7 +1,11 @@
+from bisect import bisect_right
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from operator import itemgetter
 from typing import Any
 
+import numpy as np
+import pandas as pd
 from pydantic import ValidationError
 
 from electricitymap.contrib.config import (
@@ -17,210 +21,317 @@ from electricitymap.contrib.config.model import (
 )
 from electricitymap.contrib.types import ZoneKey
 
+# The ways an emission factor can be found for a datetime, see
+# Co2eqParameterLookup.get for details. Vectorized lookups use their index.
+EXACT_TIMELESS = "exact_timeless"
+EXACT_TIMELY = "exact_timely"
+FALLBACK_LATEST = "fallback_latest"
+FALLBACK_OLDER = "fallback_older"
+FALLBACK_OLDEST = "fallback_oldest"
+HOWS = (EXACT_TIMELESS, EXACT_TIMELY, FALLBACK_LATEST, FALLBACK_OLDER, FALLBACK_OLDEST)
 
-def get_zone_specific_co2eq_parameter(
-    co2eq_parameters: dict,
-    zone_key: str,
-    key: str,
-    sub_key: str,
-    dt: datetime,
-    metadata: bool = False,
-) -> dict[str, float]:
-    if metadata:
-        return _get_zone_specific_co2eq_parameter_with_metadata(
-            co2eq_parameters=co2eq_parameters,
+
+def _utc_timestamp(dt: datetime) -> float:
+    # The wall time is read as UTC, whatever the timezone of `dt`.
+    return dt.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _utc_wall_times(datetimes) -> np.ndarray:
+    """
+    Vectorized version of the UTC reading in `_utc_timestamp`.
+    Wall times are kept in microseconds, so that datetimes pandas cannot
+    represent in nanoseconds (e.g. `datetime.max`) are resolved as well.
+    """
+    if isinstance(datetimes, pd.DatetimeIndex | pd.Series):
+        index = pd.DatetimeIndex(datetimes)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        return index.values.astype("datetime64[us]")
+    return np.array(
+        [dt.replace(tzinfo=None) for dt in datetimes], dtype="datetime64[us]"
+    )
+
+
+@dataclass(frozen=True)
+class CompiledCo2eqParameter:
+    """
+    A co2eq parameter of a zone (e.g. its direct emission factor for coal),
+    compiled for lookups by datetime.
+
+    A parameter is either a single entry, or a list of entries sorted by
+    datetime, each valid from its datetime until the next one. `variants` holds
+    the variant matching each of HOWS, depending on whether the parameter is a
+    zone override.
+    `timestamps` and `years` are the epoch seconds and years of the entries'
+    datetimes, and `values` and `sources` hold their values (NaN if missing)
+    and sources, so that many datetimes can be resolved at once.
+    """
+
+    zone_key: ZoneKey
+    key: str
+    sub_key: str
+    is_zone_override: bool
+    variants: tuple[EmissionFactorVariant, ...]
+    is_list: bool
+    entries: tuple[Any, ...]
+    timestamps: tuple[int, ...]
+    timestamp_array: np.ndarray
+    years: np.ndarray
+    values: np.ndarray
+    sources: np.ndarray
+
+    @classmethod
+    def compile(
+        cls, zone_key: ZoneKey, key: str, sub_key: str, res: Any, is_zone_override: bool
+    ) -> "CompiledCo2eqParameter":
+        is_list = isinstance(res, list)
+        if is_list:
+            if len(res) == 0:
+                raise ValueError(
+                    f"Error in given co2eq_parameters. List is empty for [{zone_key}, {key}, {sub_key}]"
+                )
+            entries = tuple(sorted(res, key=itemgetter("datetime")))
+        else:
+            entries = (res,)
+        entry_datetimes = [
+            datetime.fromisoformat(entry["datetime"]).replace(tzinfo=timezone.utc)
+            if isinstance(entry, dict) and entry.get("datetime") is not None
+            else None
+            for entry in entries
+        ]
+        timestamps = [
+            int(entry_dt.timestamp()) for entry_dt in entry_datetimes if entry_dt
+        ]
+        scope = "zone" if is_zone_override else "global"
+        return cls(
             zone_key=zone_key,
             key=key,
             sub_key=sub_key,
-            dt=dt,
+            is_zone_override=is_zone_override,
+            variants=tuple(EmissionFactorVariant(f"{scope}_{how}") for how in HOWS),
+            is_list=is_list,
+            entries=entries,
+            timestamps=tuple(timestamps),
+            timestamp_array=np.array(timestamps, dtype=np.int64),
+            years=np.array(
+                [
+                    -1 if entry_dt is None else entry_dt.year
+                    for entry_dt in entry_datetimes
+                ]
+            ),
+            values=np.array(
+                [
+                    entry.get("value") if isinstance(entry, dict) else None
+                    for entry in entries
+                ],
+                dtype=float,
+            ),
+            sources=np.array(
+                [
+                    entry.get("source") if isinstance(entry, dict) else None
+                    for entry in entries
+                ],
+                dtype=object,
+            ),
         )
-    else:
-        return _get_zone_specific_co2eq_parameter_no_metadata(
-            co2eq_parameters=co2eq_parameters,
-            zone_key=zone_key,
-            key=key,
-            sub_key=sub_key,
-            dt=dt,
+
+    def get(self, dt: datetime) -> tuple[Any, str]:
+        """Returns the entry valid at `dt`, and how it was found."""
+        if not self.is_list:
+            year = int(self.years[0])
+            if year == -1:
+                return self.entries[0], EXACT_TIMELESS
+            if year == dt.year:
+                return self.entries[0], EXACT_TIMELY
+            if year < dt.year:
+                return self.entries[0], FALLBACK_LATEST
+            return self.entries[0], FALLBACK_OLDEST
+        index = bisect_right(self.timestamps, _utc_timestamp(dt)) - 1
+        if index < 0:
+            return self.entries[0], FALLBACK_OLDEST
+        if self.years[index] == dt.year:
+            return self.entries[index], EXACT_TIMELY
+        if index == len(self.entries) - 1:
+            return self.entries[index], FALLBACK_LATEST
+        return self.entries[index], FALLBACK_OLDER
+
+    def _indices(self, wall_times: np.ndarray) -> np.ndarray:
+        if not self.is_list:
+            return np.zeros(len(wall_times), dtype=np.intp)
+        seconds = wall_times.astype("datetime64[s]").astype(np.int64)
+        indices = np.searchsorted(self.timestamp_array, seconds, side="right") - 1
+        return np.maximum(indices, 0)
+
+    def _is_before_first(self, wall_times: np.ndarray) -> np.ndarray:
+        seconds = wall_times.astype("datetime64[s]").astype(np.int64)
+        return seconds < self.timestamp_array[0]
+
+    def resolve(self, datetimes) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized `get`: returns, for each of the datetimes, the index of the
+        entry valid at that datetime and how it was found, as an index in HOWS.
+        """
+        wall_times = _utc_wall_times(datetimes)
+        indices = self._indices(wall_times)
+        years = wall_times.astype("datetime64[Y]").astype(np.int64) + 1970
+        if not self.is_list:
+            year = self.years[0]
+            conditions = [
+                np.full(len(indices), year == -1),
+                years == year,
+                year < years,
+            ]
+            choices = [EXACT_TIMELESS, EXACT_TIMELY, FALLBACK_LATEST]
+        else:
+            conditions = [
+                self._is_before_first(wall_times),
+                self.years[indices] == years,
+                indices == len(self.entries) - 1,
+            ]
+            choices = [FALLBACK_OLDEST, EXACT_TIMELY, FALLBACK_LATEST]
+        default = FALLBACK_OLDEST if not self.is_list else FALLBACK_OLDER
+        hows = np.select(
+            conditions, [HOWS.index(how) for how in choices], HOWS.index(default)
         )
+        return indices, hows
 
+    def values_at(self, datetimes) -> np.ndarray:
+        """Returns the value valid at each of the datetimes."""
+        return self.values[self._indices(_utc_wall_times(datetimes))]
 
-def _get_zone_specific_co2eq_parameter_no_metadata(
-    co2eq_parameters: dict, zone_key: str, key: str, sub_key: str, dt: datetime
-) -> dict[str, float]:  # TODO: actually this returns Union[Dict, bool]
-    """Accessor for co2eq_parameters.
-    If Available, it will return the zoneOverride value. If not, it will return the default value.
+    def sources_at(self, datetimes) -> np.ndarray:
+        """Returns the source of the value valid at each of the datetimes."""
+        return self.sources[self._indices(_utc_wall_times(datetimes))]
 
-    Args:
-        co2eq_parameters (dict): The dictionary to read from.
-        zone_key (str): The zone_key to try and find a zoneOverride for.
-        key (str): The key of the parameter to find.
-        sub_key (str): The specific sub key inside the parameter that you want to access
-        dt (datetime): Will return the most recent co2eq for that dt. For the latest co2eq, pass `datetime.max`
+    def variants_at(self, datetimes) -> np.ndarray:
+        """Returns the variant of the value valid at each of the datetimes."""
+        _, hows = self.resolve(datetimes)
+        return np.array(self.variants, dtype=object)[hows]
 
-    Raises:
-        ValueError: Raised when both the zoneOverride and default value is unavailable
-    """
-    # TODO this doesn't raise a ValueError at the moment. Which gives typing errors because it can return None.
-    params = co2eq_parameters[key]
-    zone_key = ZoneKey(zone_key)
-
-    defaults = params["defaults"][sub_key]
-    zone_override = params["zoneOverrides"].get(zone_key, {}).get(sub_key, None)
-    # If no entry was found, use the parent if it exists
-    if ZONE_PARENT.get(zone_key) and not zone_override:
-        zone_override = (
-            params["zoneOverrides"].get(ZONE_PARENT[zone_key], {}).get(sub_key, None)
-        )
 
-    res = None
-    res = zone_override if zone_override is not None else defaults
-
-    if isinstance(res, list):
-        # `n` dates are sorted in ascending order (d1, d2, ..., dn)
-        # d1 is valid from from (epoch to d2)
-        # d2 is valid from (d2 to d3)
-        # dn is valid from (dn to end_of_time)
+class Co2eqParameterLookup:
+    """
+    Lookups into a co2eq parameters dict (e.g. CO2EQ_PARAMETERS_DIRECT).
 
-        if len(res) == 0:
-            raise ValueError(
-                f"Error in given co2eq_parameters. List is empty for [{zone_key}, {key}, {sub_key}]"
-            )
+    Each parameter of a zone is compiled once, on first use, so later lookups
+    only bisect its sorted timestamps. The compiled parameters do not follow
+    later changes to the dict.
+    """
 
-        res.sort(key=itemgetter("datetime"))
-        dt = dt.replace(tzinfo=timezone.utc)
-        for co2eq in reversed(res):
-            co2eq_dt = datetime.fromisoformat(co2eq["datetime"]).replace(
-                tzinfo=timezone.utc
+    def __init__(self, co2eq_parameters: dict):
+        self.co2eq_parameters = co2eq_parameters
+        self._compiled: dict[tuple[ZoneKey, str, str], CompiledCo2eqParameter] = {}
+
+    def compile(self, zone_key: str, key: str, sub_key: str) -> CompiledCo2eqParameter:
+        """
+        Returns the compiled parameter of a zone. The zoneOverride is used if
+        available, then the one of the parent zone, then the default value.
+        """
+        zone_key = ZoneKey(zone_key)
+        compiled = self._compiled.get((zone_key, key, sub_key))
+        if compiled is None:
+            params = self.co2eq_parameters[key]
+            defaults = params["defaults"][sub_key]
+            zone_override = params["zoneOverrides"].get(zone_key, {}).get(sub_key, None)
+            # If no entry was found, use the parent if it exists
+            if ZONE_PARENT.get(zone_key) and not zone_override:
+                zone_override = (
+                    params["zoneOverrides"]
+                    .get(ZONE_PARENT[zone_key], {})
+                    .get(sub_key, None)
+                )
+            compiled = CompiledCo2eqParameter.compile(
+                zone_key,
+                key,
+                sub_key,
+                zone_override if zone_override is not None else defaults,
+                is_zone_override=bool(zone_override),
             )
-            if co2eq_dt <= dt:
-                return co2eq  # type: ignore[no-any-return]
-        return res[0]  # type: ignore[no-any-return]
-
-    else:
-        return res  # type: ignore[no-any-return]
+            self._compiled[(zone_key, key, sub_key)] = compiled
+        return compiled
+
+    def get(
+        self,
+        zone_key: str,
+        key: str,
+        sub_key: str,
+        dt: datetime,
+        metadata: bool = False,
+    ) -> Any:
+        """
+        Returns the parameter valid at `dt`.
+
+        `n` dates are sorted in ascending order (d1, d2, ..., dn)
+        d1 is valid from from (epoch to d2)
+        d2 is valid from (d2 to d3)
+        dn is valid from (dn to end_of_time)
+
+        With `metadata`, a copy of the entry is returned with a 'variant' field
+        that provides context about where an emission factor comes from:
+
+        GLOBAL/ZONE -> defined in config/defaults.yaml or config/zones/<zone_key>.yaml
+
+        *_EXACT_TIMELESS -> no "datetime"
+        *_EXACT_TIMELY -> has "datetime" and "datetime".year == dt.year
+        *_FALLBACK_LATEST -> has "datetime" and max("datetime").year < dt.year
+        *_FALLBACK_OLDER -> has "datetime" and max("datetime").year < dt.year < min("datetime").year and is not EXACT
+        *_FALLBACK_OLDEST -> has "datetime" and dt.year < min("datetime").year
+        """
+        compiled = self.compile(zone_key, key, sub_key)
+        if not metadata:
+            if not compiled.is_list:
+                return compiled.entries[0]
+            return compiled.get(dt)[0]
+        entry, how = compiled.get(dt)
+        return {**entry, "variant": compiled.variants[HOWS.index(how)].value}
+
+    def emission_factors(self, zone_key: str, mode: str, datetimes) -> np.ndarray:
+        """Returns the emission factor of a mode valid at each of the datetimes."""
+        return self.compile(zone_key, "emissionFactors", mode).values_at(datetimes)
+
+
+# The lookups into the co2eq parameters of the config, which are not modified.
+CO2EQ_PARAMETER_LOOKUP_DIRECT = Co2eqParameterLookup(CO2EQ_PARAMETERS_DIRECT)
+CO2EQ_PARAMETER_LOOKUP_LIFECYCLE = Co2eqParameterLookup(CO2EQ_PARAMETERS_LIFECYCLE)
+
+
+def get_co2eq_parameter_lookup(co2eq_parameters: dict) -> Co2eqParameterLookup:
+    """
+    Returns the shared lookup if `co2eq_parameters` is one of the config's
+    co2eq parameters dicts. Other dicts get a new lookup, as the compiled
+    parameters would not follow their changes.
+    """
+    for lookup in (CO2EQ_PARAMETER_LOOKUP_DIRECT, CO2EQ_PARAMETER_LOOKUP_LIFECYCLE):
+        if co2eq_parameters is lookup.co2eq_parameters:
+            return lookup
+    return Co2eqParameterLookup(co2eq_parameters)
 
 
-def _get_zone_specific_co2eq_parameter_with_metadata(
+def get_zone_specific_co2eq_parameter(
     co2eq_parameters: dict,
     zone_key: str,
     key: str,
     sub_key: str,
     dt: datetime,
-) -> dict[str, Any]:
-    """
-    Lookup logic identical to get_zone_specific_co2eq_parameter.
-    Adds a 'variant' field that provides context about where an emission factor comes from.
-    Variant selection logic:
+    metadata: bool = False,
+) -> dict[str, float]:  # TODO: actually this returns Union[Dict, bool]
+    """Accessor for co2eq_parameters.
+    If Available, it will return the zoneOverride value. If not, it will return the default value.
 
-    GLOBAL/ZONE -> defined in config/defaults.yaml or config/zones/<zone_key>.yaml
+    Args:
+        co2eq_parameters (dict): The dictionary to read from.
+        zone_key (str): The zone_key to try and find a zoneOverride for.
+        key (str): The key of the parameter to find.
+        sub_key (str): The specific sub key inside the parameter that you want to access
+        dt (datetime): Will return the most recent co2eq for that dt. For the latest co2eq, pass `datetime.max`
+        metadata (bool): Whether to add a 'variant' field, see `Co2eqParameterLookup.get`.
 
-    *_EXACT_TIMELESS -> no "datetime"
-    *_EXACT_TIMELY -> has "datetime" and "datetime".year == dt.year
-    *_FALLBACK_LATEST -> has "datetime" and max("datetime").year < dt.year
-    *_FALLBACK_OLDER -> has "datetime" and max("datetime").year < dt.year < min("datetime").year and is not EXACT
-    *_FALLBACK_OLDEST -> has "datetime" and dt.year < min("datetime").year
+    Raises:
+        ValueError: Raised when the parameter is an empty list
     """
-    params = co2eq_parameters[key]
-    zone_key = ZoneKey(zone_key)
-
-    defaults = params["defaults"][sub_key]
-    zone_override = params["zoneOverrides"].get(zone_key, {}).get(sub_key, None)
-    # If no entry was found, use the parent if it exists
-    if ZONE_PARENT.get(zone_key) and not zone_override:
-        zone_override = (
-            params["zoneOverrides"].get(ZONE_PARENT[zone_key], {}).get(sub_key, None)
-        )
-
-    res = None
-    res = zone_override if zone_override is not None else defaults
-
-    if isinstance(res, list):
-        # `n` dates are sorted in ascending order (d1, d2, ..., dn)
-        # d1 is valid from from (epoch to d2)
-        # d2 is valid from (d2 to d3)
-        # dn is valid from (dn to end_of_time)
-
-        if len(res) == 0:
-            raise ValueError(
-                f"Error in given co2eq_parameters. List is empty for [{zone_key}, {key}, {sub_key}]"
-            )
-
-        res.sort(key=itemgetter("datetime"))
-        dt = dt.replace(tzinfo=timezone.utc)
-        for i, co2eq in enumerate(reversed(res)):
-            co2eq_dt = datetime.fromisoformat(co2eq["datetime"]).replace(
-                tzinfo=timezone.utc
-            )
-            if co2eq_dt <= dt:
-                ret = co2eq
-
-                ef_year = co2eq_dt.year
-                dt_year = dt.year
-                if ef_year == dt_year:
-                    if zone_override:
-                        variant = EmissionFactorVariant.ZONE_EXACT_TIMELY
-                    else:
-                        variant = EmissionFactorVariant.GLOBAL_EXACT_TIMELY
-                elif ef_year < dt_year:
-                    if i == 0:
-                        if zone_override:
-                            variant = EmissionFactorVariant.ZONE_FALLBACK_LATEST
-                        else:
-                            variant = EmissionFactorVariant.GLOBAL_FALLBACK_LATEST
-                    else:
-                        if zone_override:
-                            variant = EmissionFactorVariant.ZONE_FALLBACK_OLDER
-                        else:
-                            variant = EmissionFactorVariant.GLOBAL_FALLBACK_OLDER
-
-                ret["variant"] = variant.value
-                return ret
-
-        # res is sorted in ascending order, if we get here
-        # it means dt < res[0]["datetime"]
-        ret = res[0]
-        if zone_override:
-            variant = EmissionFactorVariant.ZONE_FALLBACK_OLDEST
-        else:
-            variant = EmissionFactorVariant.GLOBAL_FALLBACK_OLDEST
-        ret["variant"] = variant.value
-        return ret
-
-    else:
-        # res is not a list, which implies it's a dict
-        # there are two kinds of dicts
-        # if it has "datetime" then it's timely
-        # else it's timeless
-        ret = res
-        ret_dt = res.get("datetime")
-        if ret_dt is None:
-            if zone_override:
-                variant = EmissionFactorVariant.ZONE_EXACT_TIMELESS
-            else:
-                variant = EmissionFactorVariant.GLOBAL_EXACT_TIMELESS
-        else:
-            ret_dt_year = (
-                datetime.fromisoformat(ret_dt).replace(tzinfo=timezone.utc).year
-            )
-            dt_year = dt.year
-            if ret_dt_year == dt_year:
-                if zone_override:
-                    variant = EmissionFactorVariant.ZONE_EXACT_TIMELY
-                else:
-                    variant = EmissionFactorVariant.GLOBAL_EXACT_TIMELY
-            elif ret_dt_year < dt_year:
-                if zone_override:
-                    variant = EmissionFactorVariant.ZONE_FALLBACK_LATEST
-                else:
-                    variant = EmissionFactorVariant.GLOBAL_FALLBACK_LATEST
-            else:
-                if zone_override:
-                    variant = EmissionFactorVariant.ZONE_FALLBACK_OLDEST
-                else:
-                    variant = EmissionFactorVariant.GLOBAL_FALLBACK_OLDEST
-
-        ret["variant"] = variant.value
-        return ret
+    return get_co2eq_parameter_lookup(co2eq_parameters).get(
+        zone_key, key, sub_key, dt, metadata=metadata
+    )
 
 
 def _get_emission_factor_lifecycle_and_direct(
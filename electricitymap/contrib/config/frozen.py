@@ -0,0 +1,76 @@
+"""
+Read-only containers for the config shared through the config registry.
+
+Every user of `CONFIG_REGISTRY` gets the same objects, so a caller modifying its
+config would silently change it for all the others. `freeze` turns the parsed
+config into `FrozenDict`s and `FrozenList`s, which raise a TypeError on any
+modification. They are still dicts and lists, so that they serialize to JSON
+and compare equal to the plain containers they were made from. Their `copy()`,
+and `copy.deepcopy`, return plain (mutable) containers, see `thaw`.
+"""
+
+from typing import Any, NoReturn
+
+
+def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(
+        f"The config is shared and read-only, copy the {type(self).__name__} to modify it"
+    )
+
+
+class FrozenDict(dict):
+    """A dict that cannot be modified, see the module docstring."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def copy(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict:
+        return thaw(self)
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+class FrozenList(list):
+    """A list that cannot be modified, see the module docstring."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+
+    def copy(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list:
+        return thaw(self)
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+
+def freeze(value: Any) -> Any:
+    """Returns a read-only copy of the dicts and lists nested in `value`."""
+    if isinstance(value, dict):
+        if isinstance(value, FrozenDict):
+            return value
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        if isinstance(value, FrozenList):
+            return value
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Returns a mutable copy of the dicts and lists nested in `value`."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
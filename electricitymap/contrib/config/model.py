@@ -360,10 +360,13 @@ class CO2eqConfigModel(StrictBaseModel):
 
 
 def _load_config_model() -> ConfigModel:
-    for zone_key, zone in ZONES_CONFIG.items():
-        zone["key"] = zone_key
-
-    return ConfigModel(exchanges=EXCHANGES_CONFIG, zones=ZONES_CONFIG)
+    return ConfigModel(
+        exchanges=EXCHANGES_CONFIG,
+        zones={
+            zone_key: {**zone, "key": zone_key}
+            for zone_key, zone in ZONES_CONFIG.items()
+        },
+    )
 
 
 CONFIG_MODEL = _load_config_model()
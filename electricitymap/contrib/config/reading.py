@@ -1,4 +1,11 @@
+import contextlib
+import hashlib
 import json
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from pathlib import Path
 from typing import Any
 
 from ruamel.yaml import YAML
@@ -8,6 +15,247 @@ from electricitymap.contrib.types import ZoneKey
 
 yaml = YAML(typ="safe")
 
+# Bump when the parsed representation of the config files changes.
+SNAPSHOT_FORMAT_VERSION = 2
+# The directory holding the config snapshots. The snapshot cache is disabled
+# unless it is set.
+SNAPSHOT_CACHE_DIR_ENV = "ELECTRICITYMAP_CONFIG_CACHE_DIR"
+
+
+def snapshot_cache_dir() -> Path | None:
+    """Returns the directory holding the config snapshots, or None if disabled."""
+    cache_dir = os.environ.get(SNAPSHOT_CACHE_DIR_ENV)
+    return Path(cache_dir) if cache_dir else None
+
+
+def _snapshot_prefix(directory: Path) -> str:
+    path_hash = hashlib.sha1(str(directory.resolve()).encode()).hexdigest()[:12]
+    return f"{directory.name}-{path_hash}-"
+
+
+def _directory_fingerprint(directory: Path) -> str:
+    """Hashes the name, size and modification time of the yaml files of a directory."""
+    fingerprint = hashlib.sha1(f"v{SNAPSHOT_FORMAT_VERSION}".encode())
+    with os.scandir(directory) as entries:
+        for entry in sorted(entries, key=lambda entry: entry.name):
+            if entry.name.endswith(".yaml"):
+                stat = entry.stat()
+                fingerprint.update(
+                    f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns};".encode()
+                )
+    return fingerprint.hexdigest()
+
+
+def _snapshot_path(cache_dir: Path, directory: Path) -> Path:
+    return cache_dir.joinpath(
+        _snapshot_prefix(directory) + _directory_fingerprint(directory) + ".json"
+    )
+
+
+def load_snapshot(directory: Path) -> dict[str, Any] | None:
+    """
+    Returns the parsed files of a directory, by file stem, from the snapshot cache.
+    Returns None if there is no snapshot, if a file changed since it was taken, or
+    if the snapshot is not a valid one.
+    """
+    cache_dir = snapshot_cache_dir()
+    if cache_dir is None:
+        return None
+    try:
+        with open(_snapshot_path(cache_dir, directory), encoding="utf-8") as file:
+            snapshot = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or not all(
+        isinstance(stem, str) for stem in snapshot
+    ):
+        return None
+    return snapshot
+
+
+def save_snapshot(directory: Path, parsed_files: dict[str, Any]) -> None:
+    """
+    Saves the parsed files of a directory to the snapshot cache, replacing older
+    snapshots of the same directory. Failing to write the snapshot is not an error,
+    and files that JSON cannot represent exactly are not saved.
+    """
+    cache_dir = snapshot_cache_dir()
+    if cache_dir is None:
+        return
+    prefix = _snapshot_prefix(directory)
+    try:
+        content = json.dumps(parsed_files)
+        if json.loads(content) != parsed_files:
+            return
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        snapshot_path = _snapshot_path(cache_dir, directory)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_dir, prefix=prefix, suffix=".tmp", delete=False
+        ) as file:
+            file.write(content)
+        os.replace(file.name, snapshot_path)
+        for stale_path in cache_dir.glob(f"{prefix}*.json"):
+            if stale_path != snapshot_path:
+                stale_path.unlink(missing_ok=True)
+    except (OSError, TypeError, ValueError):
+        return
+
+
+class LazyConfigDirectory(Mapping[str, Any]):
+    """
+    Read-only mapping over the yaml files of a config directory.
+
+    Keys are known from the file names, and each file is only parsed the first
+    time its key is looked up. When the snapshot cache is enabled (see
+    `SNAPSHOT_CACHE_DIR_ENV`), a directory that has been fully parsed once is
+    saved to it as JSON, from which later processes load it without parsing any
+    yaml as long as no file changed.
+    `transform` is applied to the parsed files before they are returned, while
+    `raw_items` gives access to the files as parsed.
+    Files that cannot be parsed are reported and left out, if `skip_errors` is set.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        key_from_stem: Callable[[str], str] = ZoneKey,
+        transform: Callable[[Any], Any] | None = None,
+        skip_errors: bool = False,
+    ):
+        self.directory = directory
+        self._key_from_stem = key_from_stem
+        self._transform = transform
+        self._skip_errors = skip_errors
+        self._lock = threading.RLock()
+        self._paths: dict[str, Path] | None = None
+        self._raw: dict[str, Any] = {}
+        self._values: dict[str, Any] = {}
+        self._snapshot_checked = False
+
+    @property
+    def paths(self) -> dict[str, Path]:
+        if self._paths is None:
+            with self._lock:
+                if self._paths is None:
+                    self._paths = {
+                        self._key_from_stem(path.stem): path
+                        for path in sorted(self.directory.glob("*.yaml"))
+                    }
+        return self._paths
+
+    def _load_raw(self, key: str) -> Any:
+        """Returns the file of a key as parsed, raising a KeyError if it is unknown."""
+        if key in self._raw:
+            return self._raw[key]
+        with self._lock:
+            if not self._snapshot_checked:
+                self._snapshot_checked = True
+                snapshot = load_snapshot(self.directory)
+                if snapshot is not None:
+                    self._raw.update(
+                        (self._key_from_stem(stem), parsed)
+                        for stem, parsed in snapshot.items()
+                    )
+                    # Files that failed to parse are not in the snapshot.
+                    self._paths = {
+                        key: path
+                        for key, path in self.paths.items()
+                        if key in self._raw
+                    }
+            if key in self._raw:
+                return self._raw[key]
+            path = self.paths[key]
+            try:
+                with open(path, encoding="utf-8") as file:
+                    parsed = yaml.load(file)
+            except Exception as e:
+                if not self._skip_errors:
+                    raise
+                print(f"Error reading config for {path.stem}: {e}")
+                self._paths = {k: p for k, p in self.paths.items() if k != key}
+                raise KeyError(key) from e
+            self._raw[key] = parsed
+            if len(self._raw) == len(self.paths):
+                save_snapshot(
+                    self.directory,
+                    {path.stem: self._raw[key] for key, path in self.paths.items()},
+                )
+            return parsed
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        raw = self._load_raw(key)
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = (
+                    raw if self._transform is None else self._transform(raw)
+                )
+            return self._values[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key not in self.paths:
+            return False
+        if not self._skip_errors:
+            return True
+        # Files that cannot be parsed are left out, which takes parsing them.
+        try:
+            self._load_raw(key)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        self.load_all()
+        return iter(list(self.paths))
+
+    def __len__(self) -> int:
+        self.load_all()
+        return len(self.paths)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.directory})"
+
+    def load_all(self) -> None:
+        """Parses all the files, dropping those that cannot be parsed."""
+        for key in list(self.paths):
+            with contextlib.suppress(KeyError):
+                self._load_raw(key)
+
+    def raw_items(self) -> Iterator[tuple[str, Any]]:
+        """Iterates over the files as parsed, before `transform` is applied."""
+        self.load_all()
+        for key in list(self.paths):
+            yield key, self._raw[key]
+
+
+def _exchange_key_from_stem(stem: str) -> str:
+    zone_keys = stem.split(EXCHANGE_FILENAME_ZONE_SEPARATOR)
+    assert len(zone_keys) == 2
+    return "->".join(zone_keys)
+
+
+def lazy_zones_config(
+    config_dir, retired=False, transform: Callable[[Any], Any] | None = None
+) -> LazyConfigDirectory:
+    """Returns a mapping reading the zone config files on demand."""
+    return LazyConfigDirectory(
+        config_dir.joinpath("retired_zones" if retired is True else "zones"),
+        transform=transform,
+        skip_errors=True,
+    )
+
+
+def lazy_exchanges_config(
+    config_dir, transform: Callable[[Any], Any] | None = None
+) -> LazyConfigDirectory:
+    """Returns a mapping reading the exchange config files on demand."""
+    return LazyConfigDirectory(
+        config_dir.joinpath("exchanges"),
+        key_from_stem=_exchange_key_from_stem,
+        transform=transform,
+    )
+
 
 def read_defaults(config_dir) -> dict[str, Any]:
     """Reads the defaults.yaml file."""
@@ -18,30 +266,12 @@ def read_defaults(config_dir) -> dict[str, Any]:
 
 def read_zones_config(config_dir, retired=False) -> dict[ZoneKey, Any]:
     """Reads all the zone config files."""
-    zones_config: dict[ZoneKey, Any] = {}
-    for zone_path in config_dir.joinpath(
-        "retired_zones" if retired is True else "zones"
-    ).glob("*.yaml"):
-        try:
-            zone_key = ZoneKey(zone_path.stem)
-            with open(zone_path, encoding="utf-8") as file:
-                zones_config[zone_key] = yaml.load(file)
-        except Exception as e:
-            print(f"Error reading zone config for {zone_path.stem}: {e}")
-    return zones_config
+    return dict(lazy_zones_config(config_dir, retired=retired).raw_items())
 
 
 def read_exchanges_config(config_dir) -> dict[ZoneKey, Any]:
     """Reads all the exchange config files."""
-    exchanges_config = {}
-    for exchange_path in config_dir.joinpath("exchanges").glob("*.yaml"):
-        exchange_key_unicode = exchange_path.stem
-        zone_keys = exchange_key_unicode.split(EXCHANGE_FILENAME_ZONE_SEPARATOR)
-        assert len(zone_keys) == 2
-        exchange_key = "->".join(zone_keys)
-        with open(exchange_path, encoding="utf-8") as file:
-            exchanges_config[exchange_key] = yaml.load(file)
-    return exchanges_config
+    return dict(lazy_exchanges_config(config_dir).raw_items())
 
 
 def read_data_centers_config(config_dir):
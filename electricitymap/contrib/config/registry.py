@@ -0,0 +1,145 @@
+"""
+The config registry, the single place where the config directory is loaded.
+
+Both `electricitymap.contrib.config` and `electricitymap.contrib.config.capacity`
+expose the data of the same `CONFIG_REGISTRY`, so each file is parsed at most
+once per process and every derived index is computed once.
+"""
+
+import gc
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from electricitymap.contrib.config.co2eq_parameters import (
+    generate_co2eq_parameters,
+    without_co2eq_parameters,
+)
+from electricitymap.contrib.config.frozen import freeze
+from electricitymap.contrib.config.reading import (
+    lazy_exchanges_config,
+    lazy_zones_config,
+    read_data_centers_config,
+    read_defaults,
+)
+from electricitymap.contrib.config.zones import (
+    capacity_parser_source_zones,
+    generate_all_neighbours,
+    generate_zone_neighbours,
+    zone_bounding_boxes,
+    zone_parents,
+)
+from electricitymap.contrib.types import BoundingBox, ZoneKey
+
+
+def _frozen_zone_config(zone_config: dict[str, Any]) -> dict[str, Any]:
+    # The co2eq parameters of the zones are moved to the co2eq parameters dicts.
+    return freeze(without_co2eq_parameters(zone_config))
+
+
+CONFIG_DIR = Path(__file__).parent.parent.parent.parent.joinpath("config").resolve()
+
+
+class ConfigRegistry:
+    """
+    The config files, and the indexes derived from them.
+
+    The config files are parsed on first access (see `LazyConfigDirectory`) and
+    each index is computed the first time it is used. They are shared by every
+    user of the registry, so zone and exchange configs, co2eq parameters and
+    indexes are returned frozen (see `electricitymap.contrib.config.frozen`):
+    callers needing to modify them work on a copy.
+
+    Processes that fork workers can call `preload` beforehand, so that the
+    workers share the parent's config instead of each parsing their own copy.
+    """
+
+    def __init__(self, config_dir: Path):
+        self.config_dir = config_dir
+        self.zones = lazy_zones_config(config_dir, transform=_frozen_zone_config)
+        self.retired_zones = lazy_zones_config(
+            config_dir, retired=True, transform=freeze
+        )
+        self.exchanges = lazy_exchanges_config(config_dir, transform=freeze)
+
+    @cached_property
+    def defaults(self) -> dict[str, Any]:
+        return freeze(read_defaults(self.config_dir))
+
+    @cached_property
+    def co2eq_parameters(
+        self,
+    ) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+        """The co2eq parameters for all zones, direct and lifecycle emissions."""
+        return tuple(
+            freeze(co2eq_parameters)
+            for co2eq_parameters in generate_co2eq_parameters(
+                self.defaults, dict(self.zones.raw_items())
+            )
+        )
+
+    @cached_property
+    def co2eq_parameters_direct(self) -> dict[str, Any]:
+        co2eq_parameters_all, co2eq_parameters_direct, _ = self.co2eq_parameters
+        return freeze({**co2eq_parameters_all, **co2eq_parameters_direct})
+
+    @cached_property
+    def co2eq_parameters_lifecycle(self) -> dict[str, Any]:
+        co2eq_parameters_all, _, co2eq_parameters_lifecycle = self.co2eq_parameters
+        return freeze({**co2eq_parameters_all, **co2eq_parameters_lifecycle})
+
+    @cached_property
+    def data_centers(self):
+        return read_data_centers_config(self.config_dir)
+
+    @cached_property
+    def zone_bounding_boxes(self) -> dict[ZoneKey, BoundingBox]:
+        return freeze(zone_bounding_boxes(self.zones))
+
+    @cached_property
+    def zone_parents(self) -> dict[ZoneKey, ZoneKey]:
+        return freeze(zone_parents(self.zones))
+
+    @cached_property
+    def zone_neighbours(self) -> dict[ZoneKey, list[ZoneKey]]:
+        return freeze(generate_zone_neighbours(self.zones, self.exchanges))
+
+    @cached_property
+    def all_neighbours(self) -> dict[ZoneKey, list[ZoneKey]]:
+        return freeze(generate_all_neighbours(self.exchanges))
+
+    @cached_property
+    def capacity_parser_source_to_zones(
+        self,
+    ) -> dict[str, list[ZoneKey]]:
+        return freeze(capacity_parser_source_zones(self.zones))
+
+    @cached_property
+    def zone_to_capacity_parser_source(self) -> dict[ZoneKey, str]:
+        return freeze(
+            {
+                zone: source
+                for source, zones in self.capacity_parser_source_to_zones.items()
+                for zone in zones
+            }
+        )
+
+    def preload(self, freeze: bool = True) -> None:
+        """
+        Loads every config file and computes every index.
+        With `freeze`, the loaded objects are moved out of the garbage collector's
+        reach, so that collections in forked workers do not write to (and thereby
+        copy) the memory pages they share with the parent.
+        """
+        for name, value in vars(type(self)).items():
+            if isinstance(value, cached_property):
+                getattr(self, name)
+        for config in (self.zones, self.retired_zones, self.exchanges):
+            # Applies the transforms of every file.
+            for _ in config.values():
+                pass
+        if freeze:
+            gc.freeze()
+
+
+CONFIG_REGISTRY = ConfigRegistry(CONFIG_DIR)
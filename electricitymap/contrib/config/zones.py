@@ -69,3 +69,15 @@ def generate_all_neighbours(
             zone_neighbours[zone_name_1].add(zone_name_2)
     # Sort the lists of neighbours for each zone.
     return {k: sorted(v) for k, v in zone_neighbours.items()}
+
+
+def capacity_parser_source_zones(
+    zones_config: dict[ZoneKey, Any],
+) -> dict[str, list[ZoneKey]]:
+    """Returns a dict mapping each productionCapacity parser source to its zones."""
+    source_zones: dict[str, list[ZoneKey]] = defaultdict(list)
+    for zone_id, zone_config in zones_config.items():
+        capacity_parser = zone_config.get("parsers", {}).get("productionCapacity")
+        if capacity_parser is not None:
+            source_zones[capacity_parser.split(".")[0]].append(zone_id)
+    return dict(source_zones)
@@ -0,0 +1,601 @@
+"""
+Columnar representations of event lists.
+
+Events are turned into NumPy arrays, with one row per event, so that operations
+spanning many events (e.g. merging the production of several sub-zones) can be
+vectorized instead of going through pydantic objects one timestamp at a time.
+Rows are only turned back into events at the end.
+"""
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime, tzinfo
+from logging import Logger
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pydantic import ValidationError
+
+from electricitymap.contrib.lib.models.events import (
+    LOWER_DATETIME_BOUND,
+    BatchErrors,
+    EventSourceType,
+    LocationalMarginalPrice,
+    Mix,
+    ProductionBreakdown,
+    ProductionMix,
+    StorageMix,
+    _as_float_array,
+    _flag_rows,
+)
+from electricitymap.contrib.lib.models.instrumentation import (
+    SERIALIZATION,
+    VALIDATION,
+    current_metrics,
+    timed,
+)
+from electricitymap.contrib.parsers.lib.config import ProductionModes, StorageModes
+from electricitymap.contrib.types import ZoneKey
+
+PRODUCTION_MODES: tuple[str, ...] = tuple(mode.value for mode in ProductionModes)
+STORAGE_MODES: tuple[str, ...] = tuple(mode.value for mode in StorageModes)
+
+# Sorts after any real end datetime, so that the minimum ignores missing ends.
+_NO_END_TIMESTAMP = np.iinfo(np.int64).max
+
+
+@dataclass(slots=True)
+class ModeColumns:
+    """
+    One float column per mode, stored as a (rows, modes) array.
+    A mode can be unset, set to None or set to a value. `values` holds NaN
+    for both unset and None modes, `is_set` tells them apart.
+    `is_int` flags values given as integers, so that they are returned as such.
+    """
+
+    modes: tuple[str, ...]
+    values: np.ndarray
+    is_set: np.ndarray
+    is_int: np.ndarray
+
+    @classmethod
+    def from_mixes(
+        cls, modes: tuple[str, ...], mixes: Sequence[Mix | None]
+    ) -> "ModeColumns":
+        values = np.full((len(mixes), len(modes)), np.nan)
+        is_set = np.zeros((len(mixes), len(modes)), dtype=bool)
+        is_int = np.zeros((len(mixes), len(modes)), dtype=bool)
+        for row, mix in enumerate(mixes):
+            if mix is None:
+                continue
+            for mode, value in mix._set_values():
+                column = modes.index(mode)
+                is_set[row, column] = True
+                if value is not None:
+                    values[row, column] = value
+                    is_int[row, column] = isinstance(value, int)
+        return cls(modes=modes, values=values, is_set=is_set, is_int=is_int)
+
+    def column(self, mode: str) -> np.ndarray:
+        """Returns the values of a mode, NaN where it is unset or None."""
+        return self.values[:, self.modes.index(mode)]
+
+    def mix_kwargs(self, row: int) -> dict[str, float | None]:
+        """Returns the set modes of a row, as keyword arguments for a Mix."""
+        return {
+            mode: None if np.isnan(value) else int(value) if is_int else float(value)
+            for mode, value, is_set, is_int in zip(
+                self.modes,
+                self.values[row],
+                self.is_set[row],
+                self.is_int[row],
+                strict=True,
+            )
+            if is_set
+        }
+
+
+@dataclass(slots=True)
+class ProductionBreakdownColumns:
+    """
+    Columnar representation of production breakdowns from a single zone and source type.
+    Rows are aligned on `timestamps`, the epoch seconds of `datetimes`.
+    """
+
+    zone_key: ZoneKey
+    source_type: EventSourceType
+    datetimes: np.ndarray
+    timestamps: np.ndarray
+    end_datetimes: np.ndarray
+    sources: np.ndarray
+    production: ModeColumns
+    storage: ModeColumns
+    corrected_modes: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def from_events(
+        cls,
+        events: Sequence[ProductionBreakdown],
+        zone_key: ZoneKey,
+        source_type: EventSourceType,
+    ) -> "ProductionBreakdownColumns":
+        """
+        Builds the columns from events, which should all belong to `zone_key`
+        and be of `source_type`.
+        """
+        corrected_modes = np.zeros((len(events), len(PRODUCTION_MODES)), dtype=bool)
+        for row, event in enumerate(events):
+            if event.production is not None:
+                for mode in event.production.corrected_negative_modes:
+                    corrected_modes[row, PRODUCTION_MODES.index(mode)] = True
+        return cls(
+            zone_key=zone_key,
+            source_type=source_type,
+            datetimes=np.array([event.datetime for event in events], dtype=object),
+            # Datetimes are truncated to the minute, so whole seconds are exact.
+            timestamps=np.array(
+                [int(event.datetime.timestamp()) for event in events], dtype=np.int64
+            ),
+            end_datetimes=np.array(
+                [event.end_datetime for event in events], dtype=object
+            ),
+            sources=np.array([event.source for event in events], dtype=object),
+            production=ModeColumns.from_mixes(
+                PRODUCTION_MODES, [event.production for event in events]
+            ),
+            storage=ModeColumns.from_mixes(
+                STORAGE_MODES, [event.storage for event in events]
+            ),
+            corrected_modes=corrected_modes,
+        )
+
+    def sum_by_datetime(
+        self, row_count: int | None = None
+    ) -> "ProductionBreakdownColumns":
+        """
+        Sums the rows sharing a datetime, one row per datetime in chronological order.
+        This follows the merging rules of `ProductionBreakdown.aggregate`:
+        - a mode is set if it is set in any row and is None if it is None in all rows,
+        - corrected modes are the union of the rows' corrected modes,
+        - sources are the sorted union of the rows' sources,
+        - the end datetime is the earliest known one.
+        If `row_count` is given, only datetimes with exactly as many rows are kept.
+        """
+        if len(self) == 0:
+            return self
+        unique_timestamps, group_of_row, counts = np.unique(
+            self.timestamps, return_inverse=True, return_counts=True
+        )
+        order = np.argsort(group_of_row, kind="stable")
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+        def _sum(columns: ModeColumns) -> ModeColumns:
+            values = columns.values[order]
+            has_value = ~np.isnan(values)
+            sums = np.add.reduceat(np.where(has_value, values, 0.0), starts, axis=0)
+            return ModeColumns(
+                modes=columns.modes,
+                values=np.where(
+                    np.logical_or.reduceat(has_value, starts, axis=0), sums, np.nan
+                ),
+                is_set=np.logical_or.reduceat(columns.is_set[order], starts, axis=0),
+                # A sum stays an integer as long as all of its terms are.
+                is_int=np.logical_and.reduceat(
+                    columns.is_int[order] | ~has_value, starts, axis=0
+                ),
+            )
+
+        end_timestamps = np.array(
+            [
+                _NO_END_TIMESTAMP if end is None else int(end.timestamp())
+                for end in self.end_datetimes
+            ],
+            dtype=np.int64,
+        )
+        earliest_end_rows = np.lexsort((end_timestamps, group_of_row))[starts]
+
+        summed = ProductionBreakdownColumns(
+            zone_key=self.zone_key,
+            source_type=self.source_type,
+            datetimes=self.datetimes[order[starts]],
+            timestamps=unique_timestamps,
+            end_datetimes=self.end_datetimes[earliest_end_rows],
+            sources=self._sum_sources(group_of_row, len(unique_timestamps)),
+            production=_sum(self.production),
+            storage=_sum(self.storage),
+            corrected_modes=np.logical_or.reduceat(
+                self.corrected_modes[order], starts, axis=0
+            ),
+        )
+        if row_count is not None:
+            summed = summed._take(np.flatnonzero(counts == row_count))
+        return summed
+
+    def _sum_sources(self, group_of_row: np.ndarray, n_groups: int) -> np.ndarray:
+        """Joins the sources of each group, computing each distinct combination once."""
+        unique_sources, source_of_row = np.unique(
+            self.sources.astype(str), return_inverse=True
+        )
+        sources_in_group = np.zeros((n_groups, len(unique_sources)), dtype=bool)
+        sources_in_group[group_of_row, source_of_row] = True
+        combinations, combination_of_group = np.unique(
+            sources_in_group, axis=0, return_inverse=True
+        )
+        joined_combinations = [
+            ", ".join(
+                sorted(
+                    {
+                        source.strip()
+                        for sources in unique_sources[combination]
+                        for source in sources.split(",")
+                    }
+                )
+            )
+            for combination in combinations
+        ]
+        return np.array(joined_combinations, dtype=object)[
+            combination_of_group.reshape(-1)
+        ]
+
+    def _take(self, rows: np.ndarray) -> "ProductionBreakdownColumns":
+        return ProductionBreakdownColumns(
+            zone_key=self.zone_key,
+            source_type=self.source_type,
+            datetimes=self.datetimes[rows],
+            timestamps=self.timestamps[rows],
+            end_datetimes=self.end_datetimes[rows],
+            sources=self.sources[rows],
+            production=ModeColumns(
+                self.production.modes,
+                self.production.values[rows],
+                self.production.is_set[rows],
+                self.production.is_int[rows],
+            ),
+            storage=ModeColumns(
+                self.storage.modes,
+                self.storage.values[rows],
+                self.storage.is_set[rows],
+                self.storage.is_int[rows],
+            ),
+            corrected_modes=self.corrected_modes[rows],
+        )
+
+    def to_events(self) -> list[ProductionBreakdown]:
+        """
+        Turns the rows back into events. Each row gets a production mix, like
+        aggregated events do, so a row without any production raises a ValidationError.
+        """
+        events = []
+        for row in range(len(self)):
+            production_mix = ProductionMix(**self.production.mix_kwargs(row))
+            production_mix._corrected_negative_values.update(
+                mode
+                for mode, corrected in zip(
+                    PRODUCTION_MODES, self.corrected_modes[row], strict=True
+                )
+                if corrected
+            )
+            events.append(
+                ProductionBreakdown(
+                    zoneKey=self.zone_key,
+                    datetime=self.datetimes[row],
+                    end_datetime=self.end_datetimes[row],
+                    source=self.sources[row],
+                    production=production_mix,
+                    storage=StorageMix(**self.storage.mix_kwargs(row)),
+                    sourceType=self.source_type,
+                )
+            )
+        return events
+
+
+def _epoch_seconds(
+    datetimes: Sequence[datetime] | pd.Index | pd.Series,
+) -> tuple[np.ndarray, np.ndarray, tzinfo | None]:
+    """
+    Returns the epoch seconds of tz-aware datetimes, a mask of the naive ones
+    (whose seconds are 0) and the timezone of the first aware datetime.
+    """
+    if isinstance(datetimes, pd.Index | pd.Series):
+        index = pd.DatetimeIndex(datetimes)
+        if index.tz is None:
+            return np.zeros(len(index), np.int64), np.ones(len(index), bool), None
+        # Missing datetimes (NaT) are reported like naive ones.
+        missing = np.asarray(index.isna())
+        seconds = (index - pd.Timestamp(0, tz="UTC")) // pd.Timedelta(seconds=1)
+        return (
+            np.asarray(seconds.fillna(0), dtype=np.int64),
+            missing,
+            index.tz,
+        )
+    offsets = [t.utcoffset() for t in datetimes]
+    naive = np.array([offset is None for offset in offsets], dtype=bool)
+    seconds = np.array(
+        [
+            0 if offset is None else int(t.timestamp())
+            for t, offset in zip(datetimes, offsets, strict=True)
+        ],
+        dtype=np.int64,
+    )
+    aware = np.flatnonzero(~naive)
+    return seconds, naive, datetimes[aware[0]].tzinfo if len(aware) else None
+
+
+class LocationalMarginalPriceColumns:
+    """
+    Columnar store of locational marginal prices from a single zone, source,
+    currency and source type, for node-level feeds publishing thousands of nodes
+    per interval. Instead of one pydantic event per (node, interval), rows are held as
+    - `timestamps`: the epoch seconds of the datetimes, truncated to the minute,
+    - `end_timestamps`: the same for the end datetimes, `_NO_END_TIMESTAMP` when missing,
+    - `node_codes`: indexes into `nodes`, the dictionary of the distinct nodes,
+    - `prices`: the prices as float64.
+
+    The shared fields are validated once, when the store is created, and the rows
+    of each batch through vectorized checks following the validators of
+    `LocationalMarginalPrice`. Each distinct node is validated once.
+
+    `to_list()` gives the same dicts, in the same order, as a
+    `LocationalMarginalPriceList` built from the same rows. Datetimes are given
+    back in the timezone of the first batch.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        zoneKey: ZoneKey,
+        source: str,
+        currency: str,
+        *,
+        sourceType: EventSourceType = EventSourceType.measured,
+    ):
+        errors = []
+        for name, value in (
+            ("zoneKey", zoneKey),
+            ("source", source),
+            ("currency", currency),
+            ("sourceType", sourceType),
+        ):
+            _, error = LocationalMarginalPrice.__fields__[name].validate(
+                value, {}, loc=name, cls=LocationalMarginalPrice
+            )
+            if error is not None:
+                errors.append(error)
+        if errors:
+            raise ValidationError(errors, LocationalMarginalPrice)
+        self.logger = logger
+        self.zone_key = zoneKey
+        self.source = source
+        self.currency = currency
+        self.source_type = sourceType
+        self.tz: tzinfo | None = None
+        self.nodes: list[str] = []
+        self._node_codes: dict[str, int] = {}
+        self._chunks: list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = []
+        self._columns = (
+            np.empty(0, np.int64),
+            np.empty(0, np.int64),
+            np.empty(0, np.int32),
+            np.empty(0, np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self._consolidated()[0])
+
+    @timed(VALIDATION)
+    def append_many(
+        self,
+        datetimes: Sequence[datetime] | pd.Index | pd.Series,
+        nodes: Sequence[str] | pd.Index | pd.Series | np.ndarray,
+        prices: Sequence[float | None] | pd.Series | np.ndarray,
+        *,
+        end_datetimes: Sequence[datetime | None] | pd.Index | pd.Series | None = None,
+    ) -> None:
+        """
+        Adds a batch of rows. Datetimes should be timezone aware, as a sequence or
+        a pandas datetime index or series. Invalid rows are logged and skipped,
+        like `LocationalMarginalPriceList.append` does.
+        """
+        if isinstance(datetimes, pd.Series):
+            datetimes = pd.DatetimeIndex(datetimes)
+        nodes = np.asarray(nodes, dtype=object)
+        if end_datetimes is not None:
+            end_datetimes = list(end_datetimes)
+        n_rows = len(datetimes)
+        for name, values in (
+            ("nodes", nodes),
+            ("prices", prices),
+            ("end_datetimes", end_datetimes),
+        ):
+            if values is not None and len(values) != n_rows:
+                raise ValueError(
+                    f"Expected one value per datetime for {name}, got {len(values)} values for {n_rows} datetimes"
+                )
+        errors: BatchErrors = [[] for _ in range(n_rows)]
+
+        timestamps, naive, tz = _epoch_seconds(datetimes)
+        timestamps -= timestamps % 60
+        _flag_rows(
+            errors,
+            "datetime",
+            [
+                (naive, lambda row: f"Missing timezone: {datetimes[row]}"),
+                (
+                    timestamps < LOWER_DATETIME_BOUND.timestamp(),
+                    lambda row: (
+                        f"Date is before 2000, this is not plausible: {datetimes[row]}"
+                    ),
+                ),
+            ],
+        )
+        if self.tz is None:
+            self.tz = tz
+
+        end_timestamps = np.full(n_rows, _NO_END_TIMESTAMP, dtype=np.int64)
+        if end_datetimes is not None:
+            has_end = np.asarray(pd.notna(np.array(end_datetimes, dtype=object)))
+            rows_with_end = np.flatnonzero(has_end)
+            ends, end_naive, _ = _epoch_seconds(
+                [end_datetimes[row] for row in rows_with_end]
+            )
+            end_timestamps[rows_with_end] = ends - ends % 60
+            naive_ends = np.zeros(n_rows, dtype=bool)
+            naive_ends[rows_with_end] = end_naive
+            _flag_rows(
+                errors,
+                "end_datetime",
+                [
+                    (naive_ends, lambda row: f"Missing timezone: {end_datetimes[row]}"),
+                    (
+                        has_end & ~naive_ends & ~naive & (end_timestamps <= timestamps),
+                        lambda row: (
+                            f"end_datetime ({end_datetimes[row]}) must be after datetime ({datetimes[row]})"
+                        ),
+                    ),
+                ],
+            )
+
+        # Each distinct node is validated once. Missing nodes are factorized to
+        # -1, which indexes the last entry of the arrays below.
+        codes, distinct_nodes = pd.factorize(nodes)
+        empty_nodes = np.zeros(len(distinct_nodes) + 1, dtype=bool)
+        empty_nodes[-1] = True
+        padded_nodes = np.zeros(len(distinct_nodes) + 1, dtype=bool)
+        node_code_of_distinct = np.zeros(len(distinct_nodes) + 1, dtype=np.int32)
+        for position, node in enumerate(distinct_nodes):
+            clean_node = node.strip() if isinstance(node, str) else ""
+            empty_nodes[position] = not clean_node
+            padded_nodes[position] = bool(clean_node) and clean_node != node
+            if empty_nodes[position] or padded_nodes[position]:
+                continue
+            if node not in self._node_codes:
+                self._node_codes[node] = len(self.nodes)
+                self.nodes.append(node)
+            node_code_of_distinct[position] = self._node_codes[node]
+        _flag_rows(
+            errors,
+            "node",
+            [
+                (
+                    empty_nodes[codes],
+                    lambda row: f"Node cannot be an invalid string: {nodes[row]}",
+                ),
+                (
+                    padded_nodes[codes],
+                    lambda row: (
+                        f"Node should not contain leading or trailing spaces: {nodes[row]}"
+                    ),
+                ),
+            ],
+        )
+
+        price_values = _as_float_array(prices)
+        LocationalMarginalPrice._validate_values_batch(price_values, errors)
+
+        self._log_errors(errors, datetimes)
+        valid_rows = np.array(
+            [row for row, row_errors in enumerate(errors) if not row_errors],
+            dtype=np.intp,
+        )
+        self._chunks.append(
+            (
+                timestamps[valid_rows],
+                end_timestamps[valid_rows],
+                node_code_of_distinct[codes][valid_rows],
+                price_values[valid_rows],
+            )
+        )
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.count_event(LocationalMarginalPrice.__name__, len(valid_rows))
+
+    def _log_errors(
+        self, errors: BatchErrors, datetimes: Sequence[datetime] | pd.Index | pd.Series
+    ) -> None:
+        metrics = current_metrics()
+        for row, row_errors in enumerate(errors):
+            if not row_errors:
+                continue
+            error = ValidationError(row_errors, LocationalMarginalPrice)
+            if metrics is not None:
+                metrics.count_validation_failures(
+                    LocationalMarginalPrice.__name__, error.errors()
+                )
+            self.logger.error(
+                f"Error(s) creating Locational Marginal Price Event {datetimes[row]}: {error}",
+                extra={
+                    "zoneKey": self.zone_key,
+                    "datetime": pd.Timestamp(datetimes[row]).strftime(
+                        "%Y-%m-%dT%H:%M:%SZ"
+                    ),
+                    "kind": "Locational Marginal Price",
+                },
+            )
+
+    def _consolidated(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        if self._chunks:
+            self._columns = tuple(  # type: ignore[assignment]
+                np.concatenate([column, *chunk_columns])
+                for column, *chunk_columns in zip(
+                    self._columns, *self._chunks, strict=True
+                )
+            )
+            self._chunks = []
+        return self._columns
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """
+        Returns the rows as arrays, in insertion order, without copying them:
+        the arrays are only valid until the next `append_many`, and should not
+        be modified. `node_code` indexes into `nodes`.
+        """
+        timestamps, end_timestamps, node_codes, prices = self._consolidated()
+        return {
+            "timestamp": timestamps,
+            "end_timestamp": end_timestamps,
+            "node_code": node_codes,
+            "price": prices,
+        }
+
+    def _datetimes(self, timestamps: np.ndarray) -> list[datetime | None]:
+        """Turns timestamps into datetimes, building each distinct datetime once."""
+        distinct_timestamps, inverse = np.unique(timestamps, return_inverse=True)
+        distinct_datetimes = [
+            None
+            if timestamp == _NO_END_TIMESTAMP
+            else datetime.fromtimestamp(timestamp, self.tz)
+            for timestamp in distinct_timestamps.tolist()
+        ]
+        return [distinct_datetimes[position] for position in inverse.tolist()]
+
+    def iter_dicts(self) -> Iterator[dict[str, Any]]:
+        """Yields the dicts of `to_list()` one at a time, in the same order."""
+        timestamps, end_timestamps, node_codes, prices = self._consolidated()
+        order = np.argsort(timestamps, kind="stable")
+        starts = self._datetimes(timestamps[order])
+        ends = self._datetimes(end_timestamps[order])
+        for start, end, node_code, price in zip(
+            starts,
+            ends,
+            node_codes[order].tolist(),
+            prices[order].tolist(),
+            strict=True,
+        ):
+            yield {
+                "datetime": start,
+                "end_datetime": end,
+                "zoneKey": self.zone_key,
+                "currency": self.currency,
+                "price": price,
+                "node": self.nodes[node_code],
+                "source": self.source,
+                "sourceType": self.source_type,
+            }
+
+    @timed(SERIALIZATION)
+    def to_list(self) -> list[dict[str, Any]]:
+        return list(self.iter_dicts())
@@ -1,14 +1,20 @@
+import json
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from datetime import datetime
-from itertools import pairwise
+from enum import Enum
+from itertools import islice
 from logging import Logger
-from operator import itemgetter
-from typing import Any, Generic, TypeVar
+from operator import attrgetter
+from typing import Any, Generic, TextIO, TypeVar
 
+import numpy as np
 import pandas as pd
+from pydantic import ValidationError
 
+from electricitymap.contrib.lib.models.columnar import ProductionBreakdownColumns
 from electricitymap.contrib.lib.models.events import (
+    BatchErrors,
     Event,
     EventSourceType,
     Exchange,
@@ -25,16 +31,58 @@ from electricitymap.contrib.lib.models.events import (
     StorageMix,
     TotalConsumption,
     TotalProduction,
+    _as_float_array,
+    _none_safe_round,
+)
+from electricitymap.contrib.lib.models.instrumentation import (
+    MERGE,
+    SERIALIZATION,
+    current_metrics,
+    timed,
 )
 from electricitymap.contrib.types import AtcType, MarketAgreementType, ZoneKey
 
 EventType = TypeVar("EventType", bound="Event")
+EventListType = TypeVar("EventListType", bound="EventList")
+
+# Number of events serialized at once by the chunked exports.
+DEFAULT_EXPORT_CHUNK_SIZE = 10_000
+
+
+def _as_datetimes(datetimes: Sequence[datetime] | pd.Index | pd.Series) -> list:
+    """Converts a sequence of datetimes, or a pandas datetime index or series, to a list of datetimes."""
+    if isinstance(datetimes, pd.Index | pd.Series):
+        return list(pd.DatetimeIndex(datetimes).to_pydatetime())
+    return list(datetimes)
+
+
+def _json_default(value: Any) -> Any:
+    """Serializes the values of event dicts that are not natively JSON serializable."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _check_batch_lengths(datetimes: Sequence, **columns: Sequence | None) -> None:
+    """Raises if a column of a batch does not have one value per datetime."""
+    for name, values in columns.items():
+        if values is not None and len(values) != len(datetimes):
+            raise ValueError(
+                f"Expected one value per datetime for {name}, got {len(values)} values for {len(datetimes)} datetimes"
+            )
 
 
 class EventList(ABC, Generic[EventType]):
     """
     A wrapper around Events lists.
     Events are indexed by datetimes.
+
+    Lookups by datetime go through an index mapping each datetime to the
+    position of the first event holding it. The index is kept up to date by
+    the list's own methods and catches up lazily on events appended directly
+    to `events`, or on `events` being reassigned altogether.
     """
 
     logger: Logger
@@ -43,15 +91,22 @@ class EventList(ABC, Generic[EventType]):
     def __init__(self, logger: Logger):
         self.events = []
         self.logger = logger
+        self._index: dict[datetime, int] = {}
+        self._indexed_events: list[EventType] | None = self.events
+        self._indexed_count = 0
 
     def __len__(self):
         return len(self.events)
 
     def __contains__(self, datetime) -> bool:
-        return any(event.datetime == datetime for event in self.events)
+        return datetime in self._positions()
 
     def __setitem__(self, datetime, event: EventType):
-        self.events[self.events.index(self[datetime])] = event
+        position = self._positions()[datetime]
+        self.events[position] = event
+        if event.datetime != datetime:
+            # The replaced datetime may still be held by a later event, rebuild.
+            self._indexed_events = None
 
     def __add__(self, other: "EventList") -> "EventList":
         new_list = self.__class__(self.logger)
@@ -59,21 +114,125 @@ class EventList(ABC, Generic[EventType]):
         return new_list
 
     def __getitem__(self, datetime) -> EventType:
-        return next(event for event in self.events if event.datetime == datetime)
+        return self.events[self._positions()[datetime]]
 
     def __iter__(self):
         return iter(self.events)
 
+    def _positions(self) -> dict[datetime, int]:
+        """Returns the datetime -> position index, bringing it up to date first."""
+        if self._indexed_events is not self.events or self._indexed_count > len(
+            self.events
+        ):
+            self._index = {}
+            self._indexed_events = self.events
+            self._indexed_count = 0
+        for position in range(self._indexed_count, len(self.events)):
+            self._index.setdefault(self.events[position].datetime, position)
+        self._indexed_count = len(self.events)
+        return self._index
+
+    def _add_event(self, event: EventType) -> None:
+        """Adds an already validated event to the list, keeping the index in sync."""
+        index = self._positions()
+        index.setdefault(event.datetime, len(self.events))
+        self.events.append(event)
+        self._indexed_count = len(self.events)
+
+    def upsert(
+        self,
+        event: EventType,
+        update: Callable[[EventType, EventType], EventType] | None = None,
+    ) -> None:
+        """
+        Inserts an already validated event, or replaces the event sharing its datetime.
+        When `update` is provided, the replacement is `update(existing, event)`
+        instead of `event` itself, e.g. `Exchange._update`.
+        The list is modified in place and the event is not validated again.
+        """
+        position = self._positions().get(event.datetime)
+        if position is None:
+            self._add_event(event)
+        else:
+            existing_event = self.events[position]
+            self.events[position] = (
+                event if update is None else update(existing_event, event)
+            )
+
     @abstractmethod
     def append(self, **kwargs):
         """Handles creation of events and adding it to the batch."""
         # TODO Handle one day the creation of mixed batches.
         pass
 
+    def _sorted_events(self) -> list[EventType]:
+        """Returns the events in the order of `to_list()`."""
+        return sorted(self.events, key=attrgetter("datetime"))
+
+    def iter_dicts(self) -> Iterator[dict[str, Any]]:
+        """
+        Yields the dicts of `to_list()` one at a time, in the same order.
+        Only the sorted references to the events are copied upfront, so the
+        dicts can be consumed without holding all of them in memory.
+        The list should not be modified while iterating.
+        """
+        metrics = current_metrics()
+        if metrics is None:
+            for event in self._sorted_events():
+                yield event.to_dict()
+            return
+        # The consumer runs between the dicts, so each step is timed on its own.
+        with metrics.timer(SERIALIZATION):
+            events = self._sorted_events()
+        for event in events:
+            with metrics.timer(SERIALIZATION):
+                event_dict = event.to_dict()
+            yield event_dict
+
+    @timed(SERIALIZATION)
     def to_list(self) -> list[dict[str, Any]]:
-        return sorted(
-            [event.to_dict() for event in self.events], key=itemgetter("datetime")
-        )
+        return list(self.iter_dicts())
+
+    def iter_chunks(
+        self, chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yields the dicts of `to_list()` in lists of at most `chunk_size` dicts."""
+        dicts = self.iter_dicts()
+        while chunk := list(islice(dicts, chunk_size)):
+            yield chunk
+
+    def iter_column_batches(
+        self, chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE
+    ) -> Iterator[dict[str, list[Any]]]:
+        """
+        Yields the dicts of `to_list()` as columnar batches of at most `chunk_size` rows,
+        mapping each key to its list of values, e.g. for `pyarrow.RecordBatch.from_pydict`.
+        Keys missing from some dicts of a batch are None in their rows.
+        """
+        for chunk in self.iter_chunks(chunk_size):
+            columns: dict[str, list[Any]] = {}
+            for row, event in enumerate(chunk):
+                for key, value in event.items():
+                    if key not in columns:
+                        columns[key] = [None] * len(chunk)
+                    columns[key][row] = value
+            yield columns
+
+    @timed(SERIALIZATION)
+    def to_ndjson(
+        self, file: TextIO, chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE
+    ) -> int:
+        """
+        Writes the dicts of `to_list()` to `file` as newline-delimited JSON, one chunk at a time.
+        Datetimes are written in ISO 8601 format. Returns the number of events written.
+        """
+        count = 0
+        for chunk in self.iter_chunks(chunk_size):
+            file.writelines(
+                json.dumps(event, default=_json_default) + "\n" for event in chunk
+            )
+            count += len(chunk)
+        return count
 
     @property
     def dataframe(self) -> pd.DataFrame:
@@ -93,6 +252,61 @@ class EventList(ABC, Generic[EventType]):
         ).set_index("datetime")
 
 
+class BatchableEventList(EventList[EventType], ABC, Generic[EventType]):
+    """An abstract class to supercharge event lists with batch construction from arrays."""
+
+    @abstractmethod
+    def append_many(self, *args, **kwargs) -> None:
+        """
+        Batch counterpart of `append`, taking arrays of datetimes and values instead of single ones.
+        Fields shared by the batch (zone, source, source type...) are validated once,
+        datetimes and values through vectorized checks, and the events are then built without revalidation.
+        Invalid rows are logged and skipped, like `append` does.
+        """
+        pass
+
+    @classmethod
+    def from_arrays(
+        cls: type[EventListType], logger: Logger, *args, **kwargs
+    ) -> EventListType:
+        """Creates a list from arrays of datetimes and values, see `append_many`."""
+        event_list = cls(logger)
+        event_list.append_many(*args, **kwargs)
+        return event_list
+
+    def _add_batch(
+        self,
+        event_class: type[EventType],
+        description: str,
+        kind: str,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime],
+        errors: BatchErrors,
+        build_event: Callable[[int], EventType],
+    ) -> None:
+        """Builds and adds the valid rows of a batch, and logs the errors of the others like `Event.create` does."""
+        metrics = current_metrics()
+        for row, row_errors in enumerate(errors):
+            if row_errors:
+                error = ValidationError(row_errors, event_class)
+                if metrics is not None:
+                    metrics.count_validation_failures(
+                        event_class.__name__, error.errors()
+                    )
+                self.logger.error(
+                    f"Error(s) creating {description} Event {datetimes[row]}: {error}",
+                    extra={
+                        "zoneKey": zoneKey,
+                        "datetime": datetimes[row].strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        "kind": kind,
+                    },
+                )
+            else:
+                self._add_event(build_event(row))
+                if metrics is not None:
+                    metrics.count_event(event_class.__name__)
+
+
 class AggregatableEventList(EventList[EventType], ABC, Generic[EventType]):
     """An abstract class to supercharge event lists with aggregation capabilities."""
 
@@ -180,13 +394,24 @@ class NonOverlappingEventList(EventList[EventType], ABC, Generic[EventType]):
     this mixin.
     """
 
-    def to_list(self) -> list[dict[str, Any]]:
-        return self._resolve_overlaps(super().to_list())
-
-    def _resolve_overlaps(self, events: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Clamps overlapping `[datetime, end_datetime)` intervals in place.
-
-        `events` is sorted by start (`datetime`); a pair overlaps when the
+    def iter_dicts(self) -> Iterator[dict[str, Any]]:
+        """Overlaps are resolved on the fly, each dict being held back until the next one is known."""
+        previous = None
+        for current in super().iter_dicts():
+            if previous is not None:
+                self._resolve_overlap(previous, current)
+                yield previous
+            previous = current
+        if previous is not None:
+            yield previous
+
+    @timed(SERIALIZATION)
+    def _resolve_overlap(
+        self, previous: dict[str, Any], current: dict[str, Any]
+    ) -> None:
+        """Clamps the `[datetime, end_datetime)` interval of `previous` in place if it overlaps `current`.
+
+        Events come sorted by start (`datetime`); a pair overlaps when the
         earlier event's `end_datetime` is strictly after the later event's
         `datetime`. Events without an `end_datetime` are treated as
         instantaneous points at `datetime`. Because the events are
@@ -194,25 +419,27 @@ class NonOverlappingEventList(EventList[EventType], ABC, Generic[EventType]):
         overlap. Clamping always leaves a positive duration, as the earlier
         event starts strictly before the later one.
         """
-        for previous, current in pairwise(events):
-            if previous["datetime"] == current["datetime"]:
-                self.logger.warning(
-                    f"{type(self).__name__} has two events sharing datetime "
-                    f"{current['datetime']}; keeping both."
-                )
-                continue
-            previous_end = previous["end_datetime"]
-            if previous_end is not None and previous_end > current["datetime"]:
-                self.logger.warning(
-                    f"{type(self).__name__} interval ending {previous_end} "
-                    f"overlaps the event starting {current['datetime']}; "
-                    f"clamping its end to {current['datetime']}."
-                )
-                previous["end_datetime"] = current["datetime"]
-        return events
+        if previous["datetime"] == current["datetime"]:
+            self.logger.warning(
+                f"{type(self).__name__} has two events sharing datetime "
+                f"{current['datetime']}; keeping both."
+            )
+            return
+        previous_end = previous["end_datetime"]
+        if previous_end is not None and previous_end > current["datetime"]:
+            self.logger.warning(
+                f"{type(self).__name__} interval ending {previous_end} "
+                f"overlaps the event starting {current['datetime']}; "
+                f"clamping its end to {current['datetime']}."
+            )
+            previous["end_datetime"] = current["datetime"]
 
 
-class ExchangeList(NonOverlappingEventList[Exchange], AggregatableEventList[Exchange]):
+class ExchangeList(
+    NonOverlappingEventList[Exchange],
+    AggregatableEventList[Exchange],
+    BatchableEventList[Exchange],
+):
     def append(
         self,
         zoneKey: ZoneKey,
@@ -227,9 +454,49 @@ class ExchangeList(NonOverlappingEventList[Exchange], AggregatableEventList[Exch
             self.logger, zoneKey, datetime, end_datetime, source, netFlow, sourceType
         )
         if event:
-            self.events.append(event)
+            self._add_event(event)
+
+    def append_many(
+        self,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime] | pd.Index | pd.Series,
+        source: str,
+        netFlows: Sequence[float | None],
+        *,
+        end_datetimes: Sequence[datetime | None] | None = None,
+        sourceType: EventSourceType = EventSourceType.measured,
+    ) -> None:
+        datetimes = _as_datetimes(datetimes)
+        _check_batch_lengths(datetimes, netFlows=netFlows, end_datetimes=end_datetimes)
+        net_flows = _as_float_array(netFlows)
+        starts, ends, errors = Exchange._validate_batch(
+            datetimes,
+            end_datetimes,
+            zoneKey=zoneKey,
+            source=source,
+            sourceType=sourceType,
+        )
+        Exchange._validate_values_batch(net_flows, errors)
+        values = net_flows.tolist()
+        self._add_batch(
+            Exchange,
+            "exchange",
+            "exchange",
+            zoneKey,
+            datetimes,
+            errors,
+            lambda row: Exchange.construct(
+                zoneKey=zoneKey,
+                datetime=starts[row],
+                end_datetime=ends[row],
+                source=source,
+                netFlow=_none_safe_round(values[row]),
+                sourceType=sourceType,
+            ),
+        )
 
     @staticmethod
+    @timed(MERGE)
     def merge_exchanges(
         ungrouped_exchanges: list["ExchangeList"], logger: Logger
     ) -> "ExchangeList":
@@ -282,29 +549,18 @@ class ExchangeList(NonOverlappingEventList[Exchange], AggregatableEventList[Exch
         return exchanges
 
     @staticmethod
+    @timed(MERGE)
     def update_exchanges(
         exchanges: "ExchangeList", new_exchanges: "ExchangeList", logger: Logger
     ) -> "ExchangeList":
-        """Given a new batch of exchanges, update the existing ones."""
+        """Given a new batch of exchanges, update the existing ones in place."""
         if len(new_exchanges) == 0:
             return exchanges
         elif len(exchanges) == 0:
             return new_exchanges
 
         for new_event in new_exchanges.events:
-            if new_event.datetime in exchanges:
-                existing_event = exchanges[new_event.datetime]
-                updated_event = Exchange._update(existing_event, new_event)
-                exchanges[new_event.datetime] = updated_event
-            else:
-                exchanges.append(
-                    new_event.zoneKey,
-                    new_event.datetime,
-                    new_event.source,
-                    new_event.netFlow,
-                    end_datetime=new_event.end_datetime,
-                    sourceType=new_event.sourceType,
-                )
+            exchanges.upsert(new_event, Exchange._update)
 
         return exchanges
 
@@ -332,7 +588,7 @@ class ExchangeCapacityList(NonOverlappingEventList[ExchangeCapacity]):
             sourceType,
         )
         if event:
-            self.events.append(event)
+            self._add_event(event)
 
 
 class ExchangeAtcList(EventList[ExchangeAtc]):
@@ -360,7 +616,7 @@ class ExchangeAtcList(EventList[ExchangeAtc]):
             sourceType,
         )
         if event:
-            self.events.append(event)
+            self._add_event(event)
 
 
 class ForecastTransferCapacityList(EventList[ForecastTransferCapacity]):
@@ -388,12 +644,13 @@ class ForecastTransferCapacityList(EventList[ForecastTransferCapacity]):
             sourceType,
         )
         if event:
-            self.events.append(event)
+            self._add_event(event)
 
 
 class ProductionBreakdownList(
     NonOverlappingEventList[ProductionBreakdown],
     AggregatableEventList[ProductionBreakdown],
+    BatchableEventList[ProductionBreakdown],
 ):
     def append(
         self,
@@ -417,9 +674,80 @@ class ProductionBreakdownList(
             sourceType,
         )
         if event:
-            self.events.append(event)
+            self._add_event(event)
+
+    def append_many(
+        self,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime] | pd.Index | pd.Series,
+        source: str,
+        *,
+        end_datetimes: Sequence[datetime | None] | None = None,
+        production: Mapping[str, Sequence[float | None]] | None = None,
+        storage: Mapping[str, Sequence[float | None]] | None = None,
+        sourceType: EventSourceType = EventSourceType.measured,
+        set_missing: bool = True,
+        correct_negative_with_zero: bool = False,
+    ) -> None:
+        """
+        `production` and `storage` map each mode to one value per datetime, or to a
+        (datetimes, columns) array of values summed like successive `add_value` calls.
+        Every mode given is set in the mixes, missing values (None or NaN) being set to None,
+        unless `set_missing` is False in which case they are left unset.
+        Negative production values are set to None, or to 0 if `correct_negative_with_zero` is True.
+        """
+        datetimes = _as_datetimes(datetimes)
+        _check_batch_lengths(
+            datetimes,
+            end_datetimes=end_datetimes,
+            **(production or {}),
+            **{f"{mode} storage": values for mode, values in (storage or {}).items()},
+        )
+        starts, ends, errors = ProductionBreakdown._validate_batch(
+            datetimes,
+            end_datetimes,
+            zoneKey=zoneKey,
+            source=source,
+            sourceType=sourceType,
+        )
+        production_mixes, storage_mixes = ProductionBreakdown._mixes_batch(
+            None
+            if production is None
+            else {
+                mode: np.asarray(values, dtype=float)
+                for mode, values in production.items()
+            },
+            None
+            if storage is None
+            else {
+                mode: np.asarray(values, dtype=float)
+                for mode, values in storage.items()
+            },
+            len(datetimes),
+            errors,
+            set_missing,
+            correct_negative_with_zero,
+        )
+        self._add_batch(
+            ProductionBreakdown,
+            "production breakdown",
+            "production breakdown",
+            zoneKey,
+            datetimes,
+            errors,
+            lambda row: ProductionBreakdown.construct(
+                zoneKey=zoneKey,
+                datetime=starts[row],
+                end_datetime=ends[row],
+                source=source,
+                production=production_mixes[row],
+                storage=storage_mixes[row],
+                sourceType=sourceType,
+            ),
+        )
 
     @staticmethod
+    @timed(MERGE)
     def merge_production_breakdowns(
         ungrouped_production_breakdowns: list["ProductionBreakdownList"],
         logger: Logger,
@@ -438,31 +766,37 @@ class ProductionBreakdownList(
         ):
             return production_breakdowns
         len_ungrouped_production_breakdowns = len(ungrouped_production_breakdowns)
-        df = pd.concat(
-            [
-                production_breakdowns.dataframe
-                for production_breakdowns in ungrouped_production_breakdowns
-                if len(production_breakdowns.events) > 0
-            ]
+        events = [
+            event
+            for production_breakdowns in ungrouped_production_breakdowns
+            for event in production_breakdowns.events
+        ]
+        zone_key, _, source_type = ProductionBreakdownList.get_zone_source_type(
+            pd.DataFrame.from_records(
+                [(event.zoneKey, event.source, event.sourceType) for event in events],
+                columns=["zoneKey", "source", "sourceType"],
+            )
         )
-        _, _, _ = ProductionBreakdownList.get_zone_source_type(df)
 
-        df = df.drop(columns=["source", "sourceType", "zoneKey"])
-        df = df.groupby(level=0, dropna=False)["data"].apply(list)
+        columns = ProductionBreakdownColumns.from_events(events, zone_key, source_type)
+        merged_columns = columns.sum_by_datetime()
         if matching_timestamps_only:
+            matching_columns = columns.sum_by_datetime(
+                row_count=len_ungrouped_production_breakdowns
+            )
             logger.info(
                 f"Filtering production breakdowns to keep \
                 only the timestamps where all the production breakdowns \
-                have data, {len(df[df.apply(lambda x: len(x) != len_ungrouped_production_breakdowns)])}\
+                have data, {len(merged_columns) - len(matching_columns)}\
                 points where discarded."
             )
-            df = df[df.apply(lambda x: len(x) == len_ungrouped_production_breakdowns)]
-        for row in df:
-            prod = ProductionBreakdown.aggregate(row)
-            production_breakdowns.events.append(prod)
+            merged_columns = matching_columns
+        for prod in merged_columns.to_events():
+            production_breakdowns._add_event(prod)
         return production_breakdowns
 
     @staticmethod
+    @timed(MERGE)
     def update_production_breakdowns(
         production_breakdowns: "ProductionBreakdownList",
         new_production_breakdowns: "ProductionBreakdownList",
@@ -471,6 +805,7 @@ class ProductionBreakdownList(
     ) -> "ProductionBreakdownList":
         """
         Given a new batch of production breakdowns, update the existing ones.
+        A new list is returned, neither of the given lists nor their events are modified.
 
         Params:
         - production_breakdowns: The existing production breakdowns to be updated.
@@ -484,56 +819,35 @@ class ProductionBreakdownList(
         elif len(production_breakdowns) == 0:
             return new_production_breakdowns
 
-        updated_production_breakdowns = ProductionBreakdownList(logger)
-
         if matching_timestamps_only:
             diff = abs(len(new_production_breakdowns) - len(production_breakdowns))
             logger.info(
                 f"Filtering production breakdowns to keep only the events where both the production breakdowns have matching datetimes, {diff} events where discarded."
             )
+            matching_production_breakdowns = ProductionBreakdownList(logger)
+            for new_event in new_production_breakdowns.events:
+                if new_event.datetime in production_breakdowns:
+                    matching_production_breakdowns._add_event(
+                        ProductionBreakdown._update(
+                            production_breakdowns[new_event.datetime], new_event
+                        )
+                    )
+            return matching_production_breakdowns
 
+        # The events are shared with the existing list, `_update` returning new ones.
+        updated_production_breakdowns = ProductionBreakdownList(logger)
+        for event in production_breakdowns.events:
+            updated_production_breakdowns._add_event(event)
         for new_event in new_production_breakdowns.events:
-            if new_event.datetime in production_breakdowns:
-                existing_event = production_breakdowns[new_event.datetime]
-                updated_event = ProductionBreakdown._update(existing_event, new_event)
-                updated_production_breakdowns.append(
-                    updated_event.zoneKey,
-                    updated_event.datetime,
-                    updated_event.source,
-                    end_datetime=updated_event.end_datetime,
-                    production=updated_event.production,
-                    storage=updated_event.storage,
-                    sourceType=updated_event.sourceType,
-                )
-            elif matching_timestamps_only is False:
-                updated_production_breakdowns.append(
-                    new_event.zoneKey,
-                    new_event.datetime,
-                    new_event.source,
-                    end_datetime=new_event.end_datetime,
-                    production=new_event.production,
-                    storage=new_event.storage,
-                    sourceType=new_event.sourceType,
-                )
-
-        if matching_timestamps_only is False:
-            for existing_event in production_breakdowns.events:
-                if existing_event.datetime not in new_production_breakdowns:
-                    updated_production_breakdowns.append(
-                        existing_event.zoneKey,
-                        existing_event.datetime,
-                        existing_event.source,
-                        end_datetime=existing_event.end_datetime,
-                        production=existing_event.production,
-                        storage=existing_event.storage,
-                        sourceType=existing_event.sourceType,
-                    )
+            updated_production_breakdowns.upsert(new_event, ProductionBreakdown._update)
 
         return updated_production_breakdowns
 
 
 class TotalProductionList(
-    NonOverlappingEventList[TotalProduction], AggregatableEventList[TotalProduction]
+    NonOverlappingEventList[TotalProduction],
+    AggregatableEventList[TotalProduction],
+    BatchableEventList[TotalProduction],
 ):
     def append(
         self,
@@ -549,9 +863,49 @@ class TotalProductionList(
             self.logger, zoneKey, datetime, end_datetime, source, value, sourceType
         )
         if event:
-            self.events.append(event)
+            self._add_event(event)
+
+    def append_many(
+        self,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime] | pd.Index | pd.Series,
+        source: str,
+        values: Sequence[float | None],
+        *,
+        end_datetimes: Sequence[datetime | None] | None = None,
+        sourceType: EventSourceType = EventSourceType.measured,
+    ) -> None:
+        datetimes = _as_datetimes(datetimes)
+        _check_batch_lengths(datetimes, values=values, end_datetimes=end_datetimes)
+        production_values = _as_float_array(values)
+        starts, ends, errors = TotalProduction._validate_batch(
+            datetimes,
+            end_datetimes,
+            zoneKey=zoneKey,
+            source=source,
+            sourceType=sourceType,
+        )
+        TotalProduction._validate_values_batch(production_values, errors)
+        value_list = production_values.tolist()
+        self._add_batch(
+            TotalProduction,
+            "total production",
+            "production",
+            zoneKey,
+            datetimes,
+            errors,
+            lambda row: TotalProduction.construct(
+                zoneKey=zoneKey,
+                datetime=starts[row],
+                end_datetime=ends[row],
+                source=source,
+                value=_none_safe_round(value_list[row]),
+                sourceType=sourceType,
+            ),
+        )
 
     @staticmethod
+    @timed(MERGE)
     def merge_total_production_lists(
         ungrouped_production_lists: list["TotalProductionList"],
         logger: Logger,
@@ -608,7 +962,9 @@ class TotalProductionList(
 
 
 class TotalConsumptionList(
-    NonOverlappingEventList[TotalConsumption], AggregatableEventList[TotalConsumption]
+    NonOverlappingEventList[TotalConsumption],
+    AggregatableEventList[TotalConsumption],
+    BatchableEventList[TotalConsumption],
 ):
     def append(
         self,
@@ -630,9 +986,51 @@ class TotalConsumptionList(
             sourceType,
         )
         if event:
-            self.events.append(event)
+            self._add_event(event)
+
+    def append_many(
+        self,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime] | pd.Index | pd.Series,
+        source: str,
+        consumptions: Sequence[float | None],
+        *,
+        end_datetimes: Sequence[datetime | None] | None = None,
+        sourceType: EventSourceType = EventSourceType.measured,
+    ) -> None:
+        datetimes = _as_datetimes(datetimes)
+        _check_batch_lengths(
+            datetimes, consumptions=consumptions, end_datetimes=end_datetimes
+        )
+        consumption_values = _as_float_array(consumptions)
+        starts, ends, errors = TotalConsumption._validate_batch(
+            datetimes,
+            end_datetimes,
+            zoneKey=zoneKey,
+            source=source,
+            sourceType=sourceType,
+        )
+        TotalConsumption._validate_values_batch(consumption_values, errors)
+        value_list = consumption_values.tolist()
+        self._add_batch(
+            TotalConsumption,
+            "total consumption",
+            "consumption",
+            zoneKey,
+            datetimes,
+            errors,
+            lambda row: TotalConsumption.construct(
+                zoneKey=zoneKey,
+                datetime=starts[row],
+                end_datetime=ends[row],
+                source=source,
+                consumption=_none_safe_round(value_list[row]),
+                sourceType=sourceType,
+            ),
+        )
 
     @staticmethod
+    @timed(MERGE)
     def merge_consumption_lists(
         ungrouped_consumption_lists: list["TotalConsumptionList"],
         logger: Logger,
@@ -690,7 +1088,7 @@ class TotalConsumptionList(
         return consumption_list
 
 
-class PriceList(NonOverlappingEventList[Price]):
+class PriceList(NonOverlappingEventList[Price], BatchableEventList[Price]):
     def append(
         self,
         zoneKey: ZoneKey,
@@ -713,7 +1111,49 @@ class PriceList(NonOverlappingEventList[Price]):
             sourceType,
         )
         if event:
-            self.events.append(event)
+            self._add_event(event)
+
+    def append_many(
+        self,
+        zoneKey: ZoneKey,
+        datetimes: Sequence[datetime] | pd.Index | pd.Series,
+        source: str,
+        prices: Sequence[float | None],
+        currency: str,
+        *,
+        end_datetimes: Sequence[datetime | None] | None = None,
+        sourceType: EventSourceType = EventSourceType.measured,
+    ) -> None:
+        datetimes = _as_datetimes(datetimes)
+        _check_batch_lengths(datetimes, prices=prices, end_datetimes=end_datetimes)
+        price_values = _as_float_array(prices)
+        starts, ends, errors = Price._validate_batch(
+            datetimes,
+            end_datetimes,
+            zoneKey=zoneKey,
+            source=source,
+            currency=currency,
+            sourceType=sourceType,
+        )
+        Price._validate_values_batch(price_values, errors)
+        value_list = price_values.tolist()
+        self._add_batch(
+            Price,
+            "price",
+            "price",
+            zoneKey,
+            datetimes,
+            errors,
+            lambda row: Price.construct(
+                zoneKey=zoneKey,
+                datetime=starts[row],
+                end_datetime=ends[row],
+                source=source,
+                price=value_list[row],
+                currency=currency,
+                sourceType=sourceType,
+            ),
+        )
 
 
 class LocationalMarginalPriceList(EventList[LocationalMarginalPrice]):
@@ -741,7 +1181,7 @@ class LocationalMarginalPriceList(EventList[LocationalMarginalPrice]):
             sourceType,
         )
         if event:
-            self.events.append(event)
+            self._add_event(event)
 
 
 class GridAlertList(EventList[GridAlert]):
@@ -768,7 +1208,7 @@ class GridAlertList(EventList[GridAlert]):
             endTime,
         )
         if event:
-            self.events.append(event)
+            self._add_event(event)
 
 
 class IntradayContractStatisticsList(EventList[IntradayContractStatistics]):
@@ -831,11 +1271,10 @@ class IntradayContractStatisticsList(EventList[IntradayContractStatistics]):
             sourceType=sourceType,
         )
         if event:
-            self.events.append(event)
+            self._add_event(event)
 
-    def to_list(self) -> list[dict[str, Any]]:
+    def _sorted_events(self) -> list[IntradayContractStatistics]:
         """Sort by (deliveryStart, area, contractId) instead of 'datetime' key."""
         return sorted(
-            [event.to_dict() for event in self.events],
-            key=lambda d: (d["deliveryStart"], d["area"], d["contractId"]),
+            self.events, key=attrgetter("deliveryStart", "area", "contractId")
         )
@@ -2,14 +2,16 @@
 import datetime as dt
 import math
 from abc import ABC, abstractmethod
-from collections.abc import Set
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence, Set
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from logging import Logger
-from typing import Any
+from typing import Any, ClassVar
 
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, PrivateAttr, ValidationError, root_validator, validator
+from pydantic import BaseModel, ValidationError, root_validator, validator
+from pydantic.error_wrappers import ErrorWrapper
 
 from electricitymap.contrib.config import (
     EXCHANGES_CONFIG,
@@ -17,6 +19,12 @@ from electricitymap.contrib.config import (
     ZONES_CONFIG,
 )
 from electricitymap.contrib.lib.models.constants import VALID_CURRENCIES
+from electricitymap.contrib.lib.models.instrumentation import (
+    MERGE,
+    VALIDATION,
+    current_metrics,
+    timed,
+)
 from electricitymap.contrib.parsers.lib.config import ProductionModes, StorageModes
 from electricitymap.contrib.types import (
     AtcType,
@@ -41,7 +49,110 @@ def _none_safe_round(value: float | None, precision: int = 6) -> float | None:
     return None if value is None or math.isnan(value) else round(value, precision)
 
 
-class Mix(BaseModel, ABC):
+# The validation errors of each row of a batch of events.
+BatchErrors = list[list[ErrorWrapper]]
+
+
+def _flag_rows(
+    errors: BatchErrors,
+    field: str,
+    checks: Iterable[tuple[np.ndarray, Callable[[int], str]]],
+) -> np.ndarray:
+    """
+    Records the first failing check of each row as an error on `field`,
+    like a validator raising on its first failing condition.
+    Each check is a mask of failing rows and a function formatting the message of a row.
+    Returns the mask of rows that failed any check.
+    """
+    failed = np.zeros(len(errors), dtype=bool)
+    for mask, message in checks:
+        for row in np.flatnonzero(mask & ~failed):
+            errors[row].append(ErrorWrapper(ValueError(message(row)), loc=(field,)))
+        failed |= mask
+    return failed
+
+
+def _as_float_array(values: Sequence[float | None]) -> np.ndarray:
+    """Converts values to a float array, None becoming NaN."""
+    return np.asarray(values, dtype=float).reshape(-1)
+
+
+def _mode_columns(values: np.ndarray, n_rows: int) -> np.ndarray:
+    """Returns the values of a mode as a (rows, columns) array, see `Mix._construct_batch`."""
+    if n_rows == 0:
+        # The number of columns of an empty array cannot be inferred.
+        return values.reshape(0, values.shape[-1] if values.ndim == 2 else 1)
+    return values.reshape(n_rows, -1)
+
+
+def _nan_sum_rows(values: np.ndarray) -> np.ndarray:
+    """
+    Sums each row like successive `Mix.add_value` calls: missing values (NaN) are
+    skipped until a value is found and count as 0 after it, rows without any value
+    summing to NaN.
+    """
+    summed = values[:, 0]
+    for column in values[:, 1:].T:
+        summed = np.where(
+            np.isnan(summed), column, summed + np.where(np.isnan(column), 0, column)
+        )
+    return summed
+
+
+# Marks the modes of a mix that have not been set, as opposed to set to None.
+_UNSET: Any = object()
+
+
+class Mix(ABC):
+    """
+    The values of a set of modes, in MW.
+
+    Parsers build mixes by the hundred thousand, so they are plain objects
+    holding one value per mode in a list rather than pydantic models. A mode
+    can be unset, set to None or set to a value, and reads as None when unset.
+    Values are stored as given, and rounded to 6 decimal places when read,
+    NaNs reading as None.
+    """
+
+    __slots__ = ("_values",)
+
+    # The modes of the mix, in the order of its dict representation.
+    _modes: ClassVar[tuple[str, ...]] = ()
+    _mode_indices: ClassVar[dict[str, int]] = {}
+    _kind: ClassVar[str]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._mode_indices = {mode: index for index, mode in enumerate(cls._modes)}
+        for index, mode in enumerate(cls._modes):
+            setattr(cls, mode, property(cls._mode_getter(index)))
+
+    @staticmethod
+    def _mode_getter(index: int) -> Callable[["Mix"], float | None]:
+        def get(self: "Mix") -> float | None:
+            value = self._values[index]
+            return None if value is _UNSET else _none_safe_round(value)
+
+        return get
+
+    def __init__(self, **data: Any):
+        object.__setattr__(self, "_values", [_UNSET] * len(self._modes))
+        for mode, value in data.items():
+            self.__setattr__(mode, value)
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[[Any], "Mix"]]:
+        yield cls._validate
+
+    @classmethod
+    def _validate(cls, value: Any) -> "Mix":
+        """Validates a mix used as the field of a pydantic model."""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, Mapping):
+            return cls(**value)
+        raise TypeError(f"value is not a valid {cls.__name__}")
+
     def add_value(
         self,
         mode: str,
@@ -73,8 +184,10 @@ class Mix(BaseModel, ABC):
         """
         Overriding the setattr method to raise an error if the mode is unknown.
         """
-        # 6 decimal places gives us a precision of 1 W.
-        super().__setattr__(name, _none_safe_round(value))
+        index = self._mode_indices.get(name)
+        if index is None:
+            raise AttributeError(f"Unknown {self._kind} mode: {name}")
+        self._values[index] = value
 
     def __setitem__(self, key: str, value: float | None) -> None:
         """
@@ -82,6 +195,99 @@ class Mix(BaseModel, ABC):
         """
         self.__setattr__(key, value)
 
+    def __iter__(self) -> Iterator[tuple[str, float | None]]:
+        """Iterates over the modes and their values, like a pydantic model."""
+        for mode, value in zip(self._modes, self._values, strict=True):
+            yield mode, None if value is _UNSET else _none_safe_round(value)
+
+    def _set_values(self) -> Iterator[tuple[str, float | None]]:
+        """Iterates over the modes that have been set and their values."""
+        for mode, value in zip(self._modes, self._values, strict=True):
+            if value is not _UNSET:
+                # 6 decimal places gives us a precision of 1 W.
+                yield mode, _none_safe_round(value)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"values": dict(self._set_values())}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        object.__setattr__(self, "_values", [_UNSET] * len(self._modes))
+        for mode, value in state["values"].items():
+            self._values[self._mode_indices[mode]] = value
+
+    @property
+    def __fields_set__(self) -> set[str]:
+        """The modes that have been set, named after the pydantic model attribute."""
+        return {mode for mode, _ in self._set_values()}
+
+    def dict(  # noqa: A003
+        self,
+        *,
+        include: Set[str] | Mapping[str, Any] | None = None,
+        exclude: Set[str] | Mapping[str, Any] | None = None,
+        by_alias: bool = False,
+        skip_defaults: bool | None = None,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+    ) -> dict[str, Any]:
+        """Returns the modes and their values, with the options of pydantic's `dict`."""
+        exclude_unset = exclude_unset or bool(skip_defaults)
+        exclude_none = exclude_none or exclude_defaults
+        return {
+            mode: value
+            for mode, value in (self._set_values() if exclude_unset else self)
+            if (include is None or mode in include)
+            and (exclude is None or mode not in exclude)
+            and not (exclude_none and value is None)
+        }
+
+    def copy(self) -> "Mix":
+        """Returns a shallow copy of the mix."""
+        mix = type(self)()
+        mix._values[:] = self._values
+        return mix
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Mix):
+            return self.dict() == other.dict()
+        return self.dict() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{mode}={value!r}' for mode, value in self)})"
+
+    def __str__(self) -> str:
+        return " ".join(f"{mode}={value!r}" for mode, value in self)
+
+    @classmethod
+    def _construct_batch(
+        cls, columns: Mapping[str, np.ndarray], n_rows: int, set_missing: bool = True
+    ) -> list["Mix"]:
+        """
+        Builds one mix per row from one column of values per mode, skipping the per-field setattr.
+        A mode can also be given a (rows, columns) array, whose columns are summed like
+        successive `add_value` calls.
+        Missing values (NaN) set the mode to None, or leave it unset if `set_missing` is False.
+        """
+        for mode in columns:
+            if mode not in cls._mode_indices:
+                raise AttributeError(f"Unknown mode for {cls.__name__}: {mode}")
+        if n_rows == 0:
+            return []
+        mixes = [cls() for _ in range(n_rows)]
+        for mode, values in columns.items():
+            index = cls._mode_indices[mode]
+            summed = _nan_sum_rows(_mode_columns(values, n_rows))
+            if set_missing:
+                for mix, value in zip(mixes, summed.tolist(), strict=True):
+                    mix._values[index] = value
+            else:
+                for row in np.flatnonzero(~np.isnan(summed)):
+                    mixes[row]._values[index] = summed[row].item()
+        return mixes
+
 
 class ProductionMix(Mix):
     """
@@ -91,39 +297,48 @@ class ProductionMix(Mix):
     All values are in MW.
     """
 
-    # We use a private attribute to keep track of the modes that have been set to None.
-    _corrected_negative_values: set = PrivateAttr(set())
-    biomass: float | None = None
-    coal: float | None = None
-    gas: float | None = None
-    geothermal: float | None = None
-    hydro: float | None = None
-    nuclear: float | None = None
-    oil: float | None = None
-    solar: float | None = None
-    unknown: float | None = None
-    wind: float | None = None
+    # We keep track of the modes that have been set to None, the set being created on the first one.
+    __slots__ = ("_corrected_modes",)
+
+    _modes = tuple(sorted(mode.value for mode in ProductionModes))
+    _kind = "production"
 
     def __init__(self, **data: Any):
         """
-        Overriding the constructor to check for negative values and set them to None.
-        This method also keeps track of the modes that have been corrected.
+        Negative values are set to None, and the modes that have been corrected are kept track of.
         Note: This method does NOT allow to set negative values to zero for self consumption.
         As we want self consumption to be set to zero, on a fine grained level with the `add_value` method.
         """
-        super().__init__(**data)
-        for attr, value in data.items():
+        object.__setattr__(self, "_corrected_modes", None)
+        values = [_UNSET] * len(self._modes)
+        object.__setattr__(self, "_values", values)
+        for mode, value in data.items():
+            index = self._mode_indices.get(mode)
+            if index is None:
+                raise AttributeError(f"Unknown production mode: {mode}")
             if value is not None and value < 0:
-                self._corrected_negative_values.add(attr)
+                self._corrected_negative_values.add(mode)
                 value = None
-            # Ensure that the value is rounded to 6 decimal places and set to None if it is NaN.
-            self.__setattr__(attr, value)
+            values[index] = value
+
+    @property
+    def _corrected_negative_values(self) -> set[str]:
+        if self._corrected_modes is None:
+            object.__setattr__(self, "_corrected_modes", set())
+        return self._corrected_modes
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {**super().__getstate__(), "corrected_modes": self._corrected_modes}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        object.__setattr__(self, "_corrected_modes", state["corrected_modes"])
 
     def dict(  # noqa: A003
         self,
         *,
-        include: set | dict | None = None,
-        exclude: set | dict | None = None,
+        include: Set[str] | Mapping[str, Any] | None = None,
+        exclude: Set[str] | Mapping[str, Any] | None = None,
         by_alias: bool = False,
         skip_defaults: bool | None = None,
         exclude_unset: bool = False,
@@ -141,8 +356,8 @@ class ProductionMix(Mix):
             exclude_defaults=exclude_defaults,
             exclude_none=exclude_none,
         )
-        if keep_corrected_negative_values:
-            for corrected_negative_mode in self._corrected_negative_values:
+        if keep_corrected_negative_values and self._corrected_modes:
+            for corrected_negative_mode in self._corrected_modes:
                 if corrected_negative_mode not in production_mix:
                     production_mix[corrected_negative_mode] = None
         return production_mix
@@ -157,12 +372,13 @@ class ProductionMix(Mix):
         and to check for negative values and set them to None.
         This method also keeps track of the modes that have been corrected.
         """
-        if name not in ProductionModes.values():
+        index = self._mode_indices.get(name)
+        if index is None:
             raise AttributeError(f"Unknown production mode: {name}")
         if value is not None and value < 0:
             self._corrected_negative_values.add(name)
             value = None
-        return super().__setattr__(name, value)
+        self._values[index] = value
 
     def _correct_negative_value(
         self, mode: str, value: float | None, correct_negative_with_zero: bool
@@ -189,13 +405,65 @@ class ProductionMix(Mix):
         value = self._correct_negative_value(mode, value, correct_negative_with_zero)
         super().add_value(mode, value)
 
+    def copy(self) -> "ProductionMix":
+        production_mix = super().copy()
+        if self._corrected_modes:
+            object.__setattr__(
+                production_mix, "_corrected_modes", set(self._corrected_modes)
+            )
+        return production_mix
+
+    @classmethod
+    def _construct_batch(
+        cls,
+        columns: Mapping[str, np.ndarray],
+        n_rows: int,
+        set_missing: bool = True,
+        correct_negative_with_zero: bool = False,
+    ) -> list["ProductionMix"]:
+        """
+        Batch counterpart of the constructor and `add_value`: negative values are set to None,
+        or to 0 if `correct_negative_with_zero` is True, and tracked as corrected.
+        """
+        negatives = {
+            mode: _mode_columns(values, n_rows) < 0 for mode, values in columns.items()
+        }
+        production_mixes = super()._construct_batch(
+            {
+                mode: np.where(
+                    negatives[mode],
+                    0 if correct_negative_with_zero else np.nan,
+                    _mode_columns(values, n_rows),
+                )
+                for mode, values in columns.items()
+            },
+            n_rows,
+            set_missing,
+        )
+        for mode, negative in negatives.items():
+            index = cls._mode_indices[mode]
+            for row in np.flatnonzero(negative.any(axis=1)):
+                production_mixes[row]._corrected_negative_values.add(mode)
+                # Corrected modes are set, to None if nothing else was added.
+                if production_mixes[row]._values[index] is _UNSET:
+                    production_mixes[row]._values[index] = None
+            if correct_negative_with_zero:
+                # `add_value` corrects to the integer 0, which stays so when
+                # all the values of the mode were corrected.
+                corrected = negative.any(axis=1) & (
+                    negative | np.isnan(_mode_columns(columns[mode], n_rows))
+                ).all(axis=1)
+                for row in np.flatnonzero(corrected):
+                    production_mixes[row]._values[index] = 0
+        return production_mixes
+
     @property
     def has_corrected_negative_values(self) -> bool:
-        return len(self._corrected_negative_values) > 0
+        return bool(self._corrected_modes)
 
     @property
     def corrected_negative_modes(self) -> Set[str]:
-        return self._corrected_negative_values
+        return self._corrected_modes or frozenset()
 
     @classmethod
     def merge(cls, production_mixes: list["ProductionMix"]) -> "ProductionMix":
@@ -207,14 +475,14 @@ class ProductionMix(Mix):
         merged_production_mix = cls()
         for production_mix in production_mixes:
             # Process all set production modes
-            for mode in ProductionModes.values():
-                if mode in production_mix.__fields_set__:
-                    merged_production_mix.add_value(mode, getattr(production_mix, mode))
+            for mode, value in production_mix._set_values():
+                merged_production_mix.add_value(mode, value)
 
             # Update corrected negative values
-            merged_production_mix._corrected_negative_values.update(
-                production_mix.corrected_negative_modes
-            )
+            if production_mix._corrected_modes:
+                merged_production_mix._corrected_negative_values.update(
+                    production_mix._corrected_modes
+                )
         return merged_production_mix
 
     @classmethod
@@ -227,7 +495,7 @@ class ProductionMix(Mix):
         if production_mix is None:
             return new_production_mix
         elif new_production_mix is not None:
-            for mode, value in new_production_mix:
+            for mode, value in new_production_mix._set_values():
                 if value is not None:
                     production_mix[mode] = value
         return production_mix
@@ -240,24 +508,10 @@ class StorageMix(Mix):
     Values can be both positive (when storing energy) or negative (when the storage is discharged).
     """
 
-    battery: float | None = None
-    hydro: float | None = None
-
-    def __init__(self, **data: Any):
-        """
-        Overriding the constructor to check for NaN values and set them to None.
-        """
-        super().__init__(**data)
-        for attr, value in data.items():
-            self.__setattr__(attr, value)
+    __slots__ = ()
 
-    def __setattr__(self, name: str, value: float | None) -> None:
-        """
-        Overriding the setattr method to raise an error if the mode is unknown.
-        """
-        if name not in StorageModes.values():
-            raise AttributeError(f"Unknown storage mode: {name}")
-        return super().__setattr__(name, value)
+    _modes = tuple(sorted(mode.value for mode in StorageModes))
+    _kind = "storage"
 
     @classmethod
     def merge(cls, storage_mixes: list["StorageMix"]) -> "StorageMix":
@@ -267,9 +521,8 @@ class StorageMix(Mix):
         """
         merged_storage_mix = cls()
         for storage_mix in storage_mixes:
-            for mode in StorageModes.values():
-                if mode in storage_mix.__fields_set__:
-                    merged_storage_mix.add_value(mode, getattr(storage_mix, mode))
+            for mode, value in storage_mix._set_values():
+                merged_storage_mix.add_value(mode, value)
 
         return merged_storage_mix
 
@@ -281,7 +534,7 @@ class StorageMix(Mix):
         if storage_mix is None:
             return new_storage_mix
         elif new_storage_mix is not None:
-            for mode, value in new_storage_mix:
+            for mode, value in new_storage_mix._set_values():
                 if value is not None:
                     storage_mix[mode] = value
         return storage_mix
@@ -362,6 +615,113 @@ class Event(BaseModel, ABC):
             raise ValueError(f"end_datetime ({v}) must be after datetime ({start})")
         return v
 
+    def __init__(self, **data: Any):
+        """Overriding the constructor to count and time the validation when metrics are collected."""
+        metrics = current_metrics()
+        if metrics is None:
+            super().__init__(**data)
+            return
+        kind = type(self).__name__
+        with metrics.timer(VALIDATION):
+            try:
+                super().__init__(**data)
+            except ValidationError as e:
+                metrics.count_validation_failures(kind, e.errors())
+                raise
+        metrics.count_event(kind)
+
+    # Whether `datetime` may be arbitrarily far in the future, regardless of the source type.
+    _future_datetimes_allowed: ClassVar[bool] = False
+
+    @classmethod
+    @timed(VALIDATION)
+    def _validate_batch(
+        cls,
+        datetimes: Sequence[dt.datetime],
+        end_datetimes: Sequence[dt.datetime | None] | None,
+        **constant_fields: Any,
+    ) -> tuple[list[dt.datetime | None], list[dt.datetime | None], BatchErrors]:
+        """
+        Batch counterpart of the datetime validators, for events sharing `constant_fields` (zoneKey, source, sourceType...).
+        The constant fields are validated once, and all datetimes are checked against a single "now".
+        Returns the truncated datetimes and end datetimes along with the validation errors of each row.
+        """
+        errors: BatchErrors = [[] for _ in datetimes]
+        constant_errors = []
+        for name, value in constant_fields.items():
+            _, error = cls.__fields__[name].validate(value, {}, loc=name, cls=cls)
+            if error is not None:
+                constant_errors.append(error)
+        for row_errors in errors:
+            row_errors.extend(constant_errors)
+
+        naive = np.array([_is_naive(t) for t in datetimes], dtype=bool)
+        timestamps = np.array(
+            [
+                np.nan if is_naive else t.timestamp()
+                for t, is_naive in zip(datetimes, naive, strict=True)
+            ],
+            dtype=float,
+        )
+        checks = [
+            (naive, lambda row: f"Missing timezone: {datetimes[row]}"),
+            (
+                timestamps < LOWER_DATETIME_BOUND.timestamp(),
+                lambda row: (
+                    f"Date is before 2000, this is not plausible: {datetimes[row]}"
+                ),
+            ),
+        ]
+        source_type = constant_fields.get("sourceType", EventSourceType.measured)
+        future_ok = {EventSourceType.forecasted, EventSourceType.published}
+        if not cls._future_datetimes_allowed and source_type not in future_ok:
+            now = datetime.now(timezone.utc) + timedelta(days=1)
+            checks.append(
+                (
+                    timestamps > now.timestamp(),
+                    lambda row: (
+                        f"Date is in the future and this is not a forecasted or published point: {datetimes[row]}"
+                    ),
+                )
+            )
+        failed = _flag_rows(errors, "datetime", checks)
+        starts = [
+            None if is_failed else t.replace(second=0, microsecond=0)
+            for t, is_failed in zip(datetimes, failed, strict=True)
+        ]
+
+        if end_datetimes is None:
+            return starts, [None] * len(starts), errors
+        end_naive = np.array(
+            [end is not None and _is_naive(end) for end in end_datetimes], dtype=bool
+        )
+        ends = [
+            None if end is None or is_naive else end.replace(second=0, microsecond=0)
+            for end, is_naive in zip(end_datetimes, end_naive, strict=True)
+        ]
+        # Like the validator, the comparison is skipped when `datetime` is invalid.
+        before_start = np.array(
+            [
+                end is not None and start is not None and end <= start
+                for end, start in zip(ends, starts, strict=True)
+            ],
+            dtype=bool,
+        )
+        _flag_rows(
+            errors,
+            "end_datetime",
+            [
+                (end_naive, lambda row: f"Missing timezone: {end_datetimes[row]}"),
+                (
+                    before_start,
+                    lambda row: (
+                        f"end_datetime ({ends[row]}) must be after datetime ({starts[row]})"
+                    ),
+                ),
+            ],
+        )
+        return starts, ends, errors
+
     @staticmethod
     @abstractmethod
     def create(*args, **kwargs) -> "Event":
@@ -479,6 +839,23 @@ class Exchange(Event):
             raise ValueError(f"Exchange is implausibly high, above 100GW: {v}")
         return v
 
+    @staticmethod
+    def _validate_values_batch(net_flows: np.ndarray, errors: BatchErrors) -> None:
+        """Batch counterpart of `_validate_value`, NaNs being rounded to None beforehand."""
+        _flag_rows(
+            errors,
+            "netFlow",
+            [
+                (np.isnan(net_flows), lambda row: "Exchange cannot be None: None"),
+                (
+                    np.abs(net_flows) > 100000,
+                    lambda row: (
+                        f"Exchange is implausibly high, above 100GW: {net_flows[row]}"
+                    ),
+                ),
+            ],
+        )
+
     @staticmethod
     def create(
         logger: Logger,
@@ -683,6 +1060,27 @@ class TotalProduction(Event):
             raise ValueError(f"Total production is implausibly high, above 500GW: {v}")
         return v
 
+    @staticmethod
+    def _validate_values_batch(values: np.ndarray, errors: BatchErrors) -> None:
+        """Batch counterpart of `_validate_value`, NaNs being rounded to None beforehand."""
+        _flag_rows(
+            errors,
+            "value",
+            [
+                (np.isnan(values), lambda row: "Total production cannot be None: None"),
+                (
+                    values < 0,
+                    lambda row: f"Total production cannot be negative: {values[row]}",
+                ),
+                (
+                    values > 500000,
+                    lambda row: (
+                        f"Total production is implausibly high, above 500GW: {values[row]}"
+                    ),
+                ),
+            ],
+        )
+
     @staticmethod
     def create(
         logger: Logger,
@@ -753,6 +1151,14 @@ class TotalProduction(Event):
         }
 
 
+def _nested_items(
+    items: Set[str] | Mapping[str, Any] | None, field: str
+) -> Set[str] | Mapping[str, Any] | None:
+    """Returns the items of pydantic's `include` / `exclude` that apply within a field."""
+    nested = items.get(field) if isinstance(items, Mapping) else None
+    return nested if isinstance(nested, Set | Mapping) else None
+
+
 class ProductionBreakdown(AggregatableEvent):
     production: ProductionMix | None = None
     storage: StorageMix | None = None
@@ -761,6 +1167,10 @@ class ProductionBreakdown(AggregatableEvent):
     If a production mix is supplied it should not be fully empty.
     """
 
+    class Config:
+        # The mixes are not pydantic models, see `Mix`.
+        json_encoders = {Mix: lambda mix: mix.dict()}
+
     @validator("production")
     def _validate_production_mix(cls, v):
         if (
@@ -779,6 +1189,52 @@ class ProductionBreakdown(AggregatableEvent):
             return None
         return v
 
+    @staticmethod
+    @timed(VALIDATION)
+    def _mixes_batch(
+        production: Mapping[str, np.ndarray] | None,
+        storage: Mapping[str, np.ndarray] | None,
+        n_rows: int,
+        errors: BatchErrors,
+        set_missing: bool = True,
+        correct_negative_with_zero: bool = False,
+    ) -> tuple[list[ProductionMix | None], list[StorageMix | None]]:
+        """
+        Batch counterpart of the mix validators, given the values of each mode, see `Mix._construct_batch`.
+        Returns the production and storage mix of each row.
+        """
+        production_mixes: list[ProductionMix | None] = [None] * n_rows
+        storage_mixes: list[StorageMix | None] = [None] * n_rows
+        if production is not None:
+            production_mixes = ProductionMix._construct_batch(
+                production, n_rows, set_missing, correct_negative_with_zero
+            )
+            empty = np.ones(n_rows, dtype=bool)
+            for values in production.values():
+                empty &= np.isnan(_mode_columns(values, n_rows)).all(axis=1)
+            corrected = np.array(
+                [mix.has_corrected_negative_values for mix in production_mixes],
+                dtype=bool,
+            )
+            _flag_rows(
+                errors,
+                "production",
+                [(empty & ~corrected, lambda row: "Mix is completely empty")],
+            )
+        if storage is not None:
+            empty = np.ones(n_rows, dtype=bool)
+            for values in storage.values():
+                empty &= np.isnan(_mode_columns(values, n_rows)).all(axis=1)
+            storage_mixes = [
+                None if is_empty else storage_mix
+                for storage_mix, is_empty in zip(
+                    StorageMix._construct_batch(storage, n_rows, set_missing),
+                    empty,
+                    strict=True,
+                )
+            ]
+        return production_mixes, storage_mixes
+
     def get_value(self, mode: str) -> float | None:
         """Returns the value of the provided mode this can be production or storage.
         To retrieve the value of a storage mode, the mode should be suffixed with storage.
@@ -832,6 +1288,7 @@ class ProductionBreakdown(AggregatableEvent):
             )
 
     @staticmethod
+    @timed(MERGE)
     def aggregate(events: list["ProductionBreakdown"]) -> "ProductionBreakdown":
         """Merge ProductionBreakdown events into one."""
         if len(events) == 0:
@@ -890,8 +1347,15 @@ class ProductionBreakdown(AggregatableEvent):
             raise ValueError(
                 f"Cannot update events from different source types: {event.sourceType} and {new_event.sourceType}"
             )
-        production_mix = ProductionMix._update(event.production, new_event.production)
-        storage_mix = StorageMix._update(event.storage, new_event.storage)
+        # The mixes are updated in place, the ones of `event` are copied to leave it untouched.
+        production_mix = ProductionMix._update(
+            event.production.copy() if event.production is not None else None,
+            new_event.production,
+        )
+        storage_mix = StorageMix._update(
+            event.storage.copy() if event.storage is not None else None,
+            new_event.storage,
+        )
         source = ", ".join(
             sorted(set(event.source.split(", ")) | set(new_event.source.split(", ")))
         )
@@ -923,6 +1387,69 @@ class ProductionBreakdown(AggregatableEvent):
             else sorted(map(str, self.production._corrected_negative_values)),
         }
 
+    def dict(  # noqa: A003
+        self,
+        *,
+        include: Set[str] | Mapping[str, Any] | None = None,
+        exclude: Set[str] | Mapping[str, Any] | None = None,
+        by_alias: bool = False,
+        skip_defaults: bool | None = None,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+    ) -> dict[str, Any]:
+        """Returns the fields like pydantic's `dict`, with the mixes as dicts of their modes."""
+        event = super().dict(
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            skip_defaults=skip_defaults,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+        )
+        for field in ("production", "storage"):
+            mix = event.get(field)
+            if isinstance(mix, Mix):
+                event[field] = mix.dict(
+                    include=_nested_items(include, field),
+                    exclude=_nested_items(exclude, field),
+                    skip_defaults=skip_defaults,
+                    exclude_unset=exclude_unset,
+                    exclude_defaults=exclude_defaults,
+                    exclude_none=exclude_none,
+                )
+        return event
+
+    def json(
+        self,
+        *,
+        include: Set[str] | Mapping[str, Any] | None = None,
+        exclude: Set[str] | Mapping[str, Any] | None = None,
+        by_alias: bool = False,
+        skip_defaults: bool | None = None,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        encoder: Callable[[Any], Any] | None = None,
+        models_as_dict: bool = True,
+        **dumps_kwargs: Any,
+    ) -> str:
+        """Serializes `dict()`, which pydantic's `json` does not go through."""
+        return self.__config__.json_dumps(
+            self.dict(
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                skip_defaults=skip_defaults,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+            ),
+            default=encoder or self.__json_encoder__,
+            **dumps_kwargs,
+        )
+
 
 class TotalConsumption(Event):
     """Reprensent the total consumption of a zone. The total consumption is expressed in MW."""
@@ -944,6 +1471,38 @@ class TotalConsumption(Event):
             raise ValueError(f"Total consumption cannot be 0 MW: {v}")
         return v
 
+    @staticmethod
+    def _validate_values_batch(consumptions: np.ndarray, errors: BatchErrors) -> None:
+        """Batch counterpart of `_validate_consumption`, NaNs being rounded to None beforehand."""
+        _flag_rows(
+            errors,
+            "consumption",
+            [
+                (
+                    np.isnan(consumptions),
+                    lambda row: "Total consumption cannot be None: None",
+                ),
+                (
+                    consumptions < 0,
+                    lambda row: (
+                        f"Total consumption cannot be negative: {consumptions[row]}"
+                    ),
+                ),
+                (
+                    consumptions > 500000,
+                    lambda row: (
+                        f"Total consumption is implausibly high, above 500GW: {consumptions[row]}"
+                    ),
+                ),
+                (
+                    consumptions == 0,
+                    lambda row: (
+                        f"Total consumption cannot be 0 MW: {consumptions[row]}"
+                    ),
+                ),
+            ],
+        )
+
     @staticmethod
     def create(
         logger: Logger,
@@ -1018,6 +1577,8 @@ class Price(Event):
     price: float | None
     currency: str
 
+    _future_datetimes_allowed: ClassVar[bool] = True
+
     @validator("currency")
     def _validate_currency(cls, v: str) -> str:
         if v not in VALID_CURRENCIES:
@@ -1044,6 +1605,15 @@ class Price(Event):
             raise ValueError(f"Price cannot be NaN: {v}")
         return v
 
+    @staticmethod
+    def _validate_values_batch(prices: np.ndarray, errors: BatchErrors) -> None:
+        """Batch counterpart of `_validate_price`, where None values are NaNs."""
+        _flag_rows(
+            errors,
+            "price",
+            [(np.isnan(prices), lambda row: "Price cannot be None or NaN")],
+        )
+
     @staticmethod
     def create(
         logger: Logger,
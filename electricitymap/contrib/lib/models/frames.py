@@ -0,0 +1,167 @@
+"""
+Conversion of pandas DataFrames to event lists.
+
+Parsers often end up with a tidy DataFrame, one row per datetime and one column
+per value, that they used to turn into events row by row with `iterrows()` or
+`apply(axis=1)`. The functions below take the columns as a whole instead, and
+build the events through the batch constructors of the event lists
+(`append_many`): the fields shared by the events are validated once, and the
+datetimes and values through vectorized checks.
+
+The datetimes are read from `datetime_column`, or from the index by default.
+Naive datetimes are localized to `tz` when given, like `datetime.replace(tzinfo=tz)`
+does: the first of two ambiguous wall times is used, and wall times skipped by a
+DST change are shifted forward by the change. Missing values (None or NaN) become None.
+"""
+
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timedelta, tzinfo
+from logging import Logger
+
+import numpy as np
+import pandas as pd
+
+from electricitymap.contrib.lib.models.event_lists import (
+    PriceList,
+    ProductionBreakdownList,
+    TotalConsumptionList,
+)
+from electricitymap.contrib.lib.models.events import EventSourceType
+from electricitymap.contrib.types import ZoneKey
+
+# The DST changes localized datetimes are shifted by, see the module docstring.
+_DST_CHANGE = timedelta(hours=1)
+
+
+def localize_datetimes(
+    values: pd.Series | pd.Index | Sequence[datetime], tz: tzinfo | None
+) -> pd.DatetimeIndex:
+    """
+    Localizes naive datetimes to `tz` like `datetime.replace(tzinfo=tz)` does, see the module docstring.
+    Aware datetimes, and all datetimes when `tz` is None, are returned as they are.
+    """
+    datetimes = pd.DatetimeIndex(values)
+    if tz is None or datetimes.tz is not None:
+        return datetimes
+    return datetimes.tz_localize(
+        tz,
+        ambiguous=np.ones(len(datetimes), dtype=bool),
+        nonexistent=_DST_CHANGE,
+    )
+
+
+def _datetimes(
+    df: pd.DataFrame, column: str | None, tz: tzinfo | None
+) -> pd.DatetimeIndex:
+    return localize_datetimes(df.index if column is None else df[column], tz)
+
+
+def _end_datetimes(
+    df: pd.DataFrame, column: str | None, tz: tzinfo | None
+) -> list[datetime | None] | None:
+    if column is None:
+        return None
+    end_datetimes = localize_datetimes(df[column], tz)
+    return [
+        None if is_missing else end_datetime
+        for end_datetime, is_missing in zip(
+            end_datetimes.to_pydatetime(), end_datetimes.isna(), strict=True
+        )
+    ]
+
+
+def _values(df: pd.DataFrame, columns: str | Sequence[str]) -> np.ndarray:
+    """Returns the values of a column, or a (rows, columns) array of several ones."""
+    return df[columns].to_numpy(dtype=float, na_value=np.nan)
+
+
+def production_breakdowns_from_frame(
+    df: pd.DataFrame,
+    logger: Logger,
+    zoneKey: ZoneKey,
+    source: str,
+    *,
+    production: Mapping[str, str | Sequence[str]] | None = None,
+    storage: Mapping[str, str | Sequence[str]] | None = None,
+    datetime_column: str | None = None,
+    end_datetime_column: str | None = None,
+    tz: tzinfo | None = None,
+    sourceType: EventSourceType = EventSourceType.measured,
+    set_missing: bool = True,
+    correct_negative_with_zero: bool = False,
+) -> ProductionBreakdownList:
+    """
+    Builds one production breakdown per row of `df`.
+    `production` and `storage` map each mode to its column, or to several columns
+    that are summed like successive `add_value` calls.
+    See `ProductionBreakdownList.append_many` for `set_missing` and `correct_negative_with_zero`.
+    """
+    production_list = ProductionBreakdownList(logger)
+    production_list.append_many(
+        zoneKey,
+        _datetimes(df, datetime_column, tz),
+        source,
+        end_datetimes=_end_datetimes(df, end_datetime_column, tz),
+        production=None
+        if production is None
+        else {mode: _values(df, columns) for mode, columns in production.items()},
+        storage=None
+        if storage is None
+        else {mode: _values(df, columns) for mode, columns in storage.items()},
+        sourceType=sourceType,
+        set_missing=set_missing,
+        correct_negative_with_zero=correct_negative_with_zero,
+    )
+    return production_list
+
+
+def total_consumptions_from_frame(
+    df: pd.DataFrame,
+    logger: Logger,
+    zoneKey: ZoneKey,
+    source: str,
+    consumption_column: str,
+    *,
+    datetime_column: str | None = None,
+    end_datetime_column: str | None = None,
+    tz: tzinfo | None = None,
+    sourceType: EventSourceType = EventSourceType.measured,
+) -> TotalConsumptionList:
+    """Builds one total consumption per row of `df`."""
+    consumption_list = TotalConsumptionList(logger)
+    consumption_list.append_many(
+        zoneKey,
+        _datetimes(df, datetime_column, tz),
+        source,
+        _values(df, consumption_column),
+        end_datetimes=_end_datetimes(df, end_datetime_column, tz),
+        sourceType=sourceType,
+    )
+    return consumption_list
+
+
+def prices_from_frame(
+    df: pd.DataFrame,
+    logger: Logger,
+    zoneKey: ZoneKey,
+    source: str,
+    price_column: str,
+    currency: str,
+    *,
+    datetime_column: str | None = None,
+    end_datetime_column: str | None = None,
+    tz: tzinfo | None = None,
+    sourceType: EventSourceType = EventSourceType.measured,
+) -> PriceList:
+    """Builds one price per row of `df`."""
+    price_list = PriceList(logger)
+    price_list.append_many(
+        zoneKey,
+        _datetimes(df, datetime_column, tz),
+        source,
+        _values(df, price_column),
+        currency,
+        end_datetimes=_end_datetimes(df, end_datetime_column, tz),
+        sourceType=sourceType,
+    )
+    return price_list
@@ -0,0 +1,204 @@
+"""
+Opt-in instrumentation of the event models.
+
+Counts the events created and the validation failures by reason, and times the
+hot paths of a parser run:
+- network: the requests sent through the sessions of `parsers.lib.session`,
+- validation: the construction of events, and the batch validation,
+- merge: the merge, update and aggregation of event lists,
+- serialization: `EventList.to_list()`, and the consumption of `EventList.iter_dicts()`.
+The remaining time of a collection is reported as `other`, mostly parsing.
+
+Durations are exclusive: the validation of the events created while merging
+lists is counted as validation, not as merge.
+
+Collection is off by default, and costs a single global lookup per hook then.
+It is enabled for the calls made within `collect_model_metrics()`, e.g.
+
+    with collect_model_metrics() as metrics:
+        fetch_production(zone_key, session, logger=logger)
+    print(metrics.report())
+
+Collections are tied to the current context, so that concurrent parser calls
+each get their own metrics.
+"""
+
+import functools
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+NETWORK = "network"
+VALIDATION = "validation"
+MERGE = "merge"
+SERIALIZATION = "serialization"
+CATEGORIES = (NETWORK, VALIDATION, MERGE, SERIALIZATION)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Number of collections in progress in the process, checked before the context
+# variable so that the hooks cost as little as possible when nothing collects.
+_active_collections = 0
+_active_collections_lock = threading.Lock()
+_current_metrics: ContextVar["ModelMetrics | None"] = ContextVar(
+    "model_metrics", default=None
+)
+
+
+def _failure_reason(error: dict[str, Any]) -> str:
+    """Returns the reason of a validation error, without the offending value."""
+    location = ".".join(str(loc) for loc in error["loc"])
+    message = re.split(r"[:(]", error["msg"], maxsplit=1)[0].strip()
+    return f"{location}: {message}"
+
+
+@dataclass
+class ModelMetrics:
+    """The metrics collected over the calls made within `collect_model_metrics()`."""
+
+    events_created: Counter[str] = field(default_factory=Counter)
+    validation_failures: Counter[str] = field(default_factory=Counter)
+    durations: defaultdict[str, float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
+    wall_time: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _local: threading.local = field(default_factory=threading.local, repr=False)
+
+    def count_event(self, kind: str, count: int = 1) -> None:
+        with self._lock:
+            self.events_created[kind] += count
+
+    def count_validation_failures(
+        self, kind: str, errors: Sequence[dict[str, Any]]
+    ) -> None:
+        """Counts the errors of a pydantic `ValidationError.errors()` by reason."""
+        with self._lock:
+            for error in errors:
+                self.validation_failures[f"{kind}.{_failure_reason(error)}"] += 1
+
+    @contextmanager
+    def timer(self, category: str) -> Iterator[None]:
+        """Adds the time spent in the block to `category`, excluding nested timers."""
+        stack = self._local.__dict__.setdefault("stack", [])
+        # The time spent in nested timers, accumulated by them.
+        frame = [0.0]
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += elapsed
+            with self._lock:
+                self.durations[category] += elapsed - frame[0]
+
+    def merge(self, other: "ModelMetrics") -> None:
+        with self._lock:
+            self.events_created.update(other.events_created)
+            self.validation_failures.update(other.validation_failures)
+            for category, duration in other.durations.items():
+                self.durations[category] += duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Returns the metrics as plain types, to be exported by a scheduler."""
+        return {
+            "wall_time": self.wall_time,
+            "durations": {
+                **{category: self.durations[category] for category in CATEGORIES},
+                "other": self.other_time,
+            },
+            "events_created": dict(self.events_created),
+            "validation_failures": dict(self.validation_failures),
+        }
+
+    @property
+    def other_time(self) -> float:
+        """The time not spent in any category, clamped to 0 as threads overlap."""
+        return max(self.wall_time - sum(self.durations.values()), 0.0)
+
+    def report(self) -> str:
+        lines = [f"took {self.wall_time:.3f}s"]
+        for category in (*CATEGORIES, "other"):
+            duration = (
+                self.other_time if category == "other" else self.durations[category]
+            )
+            share = duration / self.wall_time if self.wall_time else 0
+            lines.append(f"  {category:<14}{duration:>9.3f}s {share:>6.1%}")
+        lines.append(f"events created: {sum(self.events_created.values())}")
+        lines += [
+            f"  {kind}: {count}" for kind, count in self.events_created.most_common()
+        ]
+        lines.append(f"validation failures: {sum(self.validation_failures.values())}")
+        lines += [
+            f"  {reason}: {count}"
+            for reason, count in self.validation_failures.most_common()
+        ]
+        return "\n".join(lines)
+
+
+def current_metrics() -> ModelMetrics | None:
+    """Returns the metrics being collected in the current context, if any."""
+    if not _active_collections:
+        return None
+    return _current_metrics.get()
+
+
+@contextmanager
+def collect_model_metrics() -> Iterator[ModelMetrics]:
+    """
+    Collects the metrics of the model calls made within the block.
+    The metrics of a nested collection are also added to the enclosing one.
+    """
+    global _active_collections
+    metrics = ModelMetrics()
+    outer_metrics = _current_metrics.get()
+    token = _current_metrics.set(metrics)
+    with _active_collections_lock:
+        _active_collections += 1
+    start = time.perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.wall_time = time.perf_counter() - start
+        with _active_collections_lock:
+            _active_collections -= 1
+        _current_metrics.reset(token)
+        if outer_metrics is not None:
+            outer_metrics.merge(metrics)
+
+
+@contextmanager
+def timed_section(category: str) -> Iterator[None]:
+    """Times the block under `category` when metrics are being collected."""
+    metrics = current_metrics()
+    if metrics is None:
+        yield
+        return
+    with metrics.timer(category):
+        yield
+
+
+def timed(category: str) -> Callable[[F], F]:
+    """Decorator timing the calls of a function under `category` when metrics are being collected."""
+
+    def decorator(function: F) -> F:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            metrics = current_metrics()
+            if metrics is None:
+                return function(*args, **kwargs)
+            with metrics.timer(category):
+                return function(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,178 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from electricitymap.contrib.lib.models.columnar import (
+    LocationalMarginalPriceColumns,
+    ProductionBreakdownColumns,
+)
+from electricitymap.contrib.lib.models.event_lists import (
+    LocationalMarginalPriceList,
+    ProductionBreakdownList,
+)
+from electricitymap.contrib.lib.models.events import (
+    EventSourceType,
+    ProductionBreakdown,
+    ProductionMix,
+    StorageMix,
+)
+from electricitymap.contrib.types import ZoneKey
+
+
+def test_columns_keep_unset_and_none_apart():
+    production_list = ProductionBreakdownList(logging.Logger("test"))
+    production_list.append(
+        zoneKey=ZoneKey("AT"),
+        datetime=datetime(2023, 1, 1, tzinfo=timezone.utc),
+        production=ProductionMix(wind=10, coal=None),
+        storage=StorageMix(hydro=-1.5),
+        source="trust.me",
+    )
+    columns = ProductionBreakdownColumns.from_events(
+        production_list.events, ZoneKey("AT"), EventSourceType.measured
+    )
+    assert columns.production.column("wind")[0] == 10
+    assert np.isnan(columns.production.column("coal")[0])
+    assert np.isnan(columns.production.column("solar")[0])
+    assert columns.production.mix_kwargs(0) == {"coal": None, "wind": 10}
+    assert columns.storage.mix_kwargs(0) == {"hydro": -1.5}
+
+
+def test_sum_by_datetime_matches_aggregate():
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    events = [
+        ProductionBreakdown(
+            zoneKey=ZoneKey("AT"),
+            datetime=start,
+            end_datetime=start + timedelta(hours=1),
+            production=ProductionMix(wind=1.5, coal=-2, solar=None),
+            source="trust.me",
+        ),
+        ProductionBreakdown(
+            zoneKey=ZoneKey("AT"),
+            datetime=start,
+            end_datetime=start + timedelta(minutes=15),
+            production=ProductionMix(wind=2, gas=3),
+            storage=StorageMix(battery=-1),
+            source="trust.me.too, trust.me",
+        ),
+        ProductionBreakdown(
+            zoneKey=ZoneKey("AT"),
+            datetime=start + timedelta(hours=1),
+            production=ProductionMix(wind=4),
+            source="trust.me",
+        ),
+    ]
+    columns = ProductionBreakdownColumns.from_events(
+        events, ZoneKey("AT"), EventSourceType.measured
+    )
+    merged = columns.sum_by_datetime().to_events()
+
+    assert [event.to_dict() for event in merged] == [
+        ProductionBreakdown.aggregate(events[:2]).to_dict(),
+        ProductionBreakdown.aggregate(events[2:]).to_dict(),
+    ]
+    assert merged[0].to_dict()["correctedModes"] == ["coal"]
+    assert merged[0].source == "trust.me, trust.me.too"
+    assert merged[0].end_datetime == start + timedelta(minutes=15)
+
+
+def test_sum_by_datetime_with_row_count():
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    events = [
+        ProductionBreakdown(
+            zoneKey=ZoneKey("AT"),
+            datetime=start + timedelta(hours=hour),
+            production=ProductionMix(wind=1),
+            source="trust.me",
+        )
+        for hour in (0, 0, 1)
+    ]
+    columns = ProductionBreakdownColumns.from_events(
+        events, ZoneKey("AT"), EventSourceType.measured
+    )
+    merged = columns.sum_by_datetime(row_count=2).to_events()
+    assert len(merged) == 1
+    assert merged[0].datetime == start
+    assert merged[0].production.wind == 2
+
+
+def test_lmp_columns_match_the_event_list():
+    tz = ZoneInfo("America/Chicago")
+    start = datetime(2023, 1, 1, 12, 30, 15, tzinfo=tz)
+    rows = [
+        (start + timedelta(minutes=5), "NODE_A", 31.5, None),
+        (start, "NODE_B", -2, start + timedelta(minutes=5)),
+        (start, "NODE_A", 30.0, None),
+        (start, " NODE_C", 10.0, None),
+        (start, "", 10.0, None),
+        (start, "NODE_B", None, None),
+        (datetime(2023, 1, 1, 12, 30), "NODE_B", 10.0, None),
+        (start, "NODE_B", 10.0, start),
+    ]
+    logger = logging.Logger("test")
+    expected = LocationalMarginalPriceList(logger)
+    for dt, node, price, end in rows:
+        expected.append(
+            zoneKey=ZoneKey("US-CENT-SWPP"),
+            datetime=dt,
+            source="spp.org",
+            price=price,
+            currency="USD",
+            node=node,
+            end_datetime=end,
+        )
+
+    prices = LocationalMarginalPriceColumns(
+        logger, ZoneKey("US-CENT-SWPP"), "spp.org", "USD"
+    )
+    prices.append_many(
+        [row[0] for row in rows[:4]],
+        [row[1] for row in rows[:4]],
+        [row[2] for row in rows[:4]],
+        end_datetimes=[row[3] for row in rows[:4]],
+    )
+    prices.append_many(
+        [row[0] for row in rows[4:]],
+        [row[1] for row in rows[4:]],
+        [row[2] for row in rows[4:]],
+        end_datetimes=[row[3] for row in rows[4:]],
+    )
+
+    assert len(prices) == 3
+    assert repr(prices.to_list()) == repr(expected.to_list())
+
+
+def test_lmp_columns_export_dictionary_encoded_arrays():
+    prices = LocationalMarginalPriceColumns(
+        logging.Logger("test"), ZoneKey("US-CENT-SWPP"), "spp.org", "USD"
+    )
+    prices.append_many(
+        pd.to_datetime(
+            ["2023-01-01 00:00", "2023-01-01 00:00", "2023-01-01 00:05"], utc=True
+        ),
+        pd.Series(["NODE_A", "NODE_B", "NODE_A"]),
+        np.array([1.0, 2.0, 3.0]),
+    )
+
+    columns = prices.columns()
+    assert prices.nodes == ["NODE_A", "NODE_B"]
+    assert columns["node_code"].tolist() == [0, 1, 0]
+    assert columns["timestamp"].tolist() == [1672531200, 1672531200, 1672531500]
+    assert columns["price"].tolist() == [1.0, 2.0, 3.0]
+    assert prices.columns()["price"] is columns["price"]
+    assert prices.to_list()[2]["datetime"] == datetime(
+        2023, 1, 1, 0, 5, tzinfo=timezone.utc
+    )
+
+
+def test_lmp_columns_validate_shared_fields_once():
+    with pytest.raises(ValidationError):
+        LocationalMarginalPriceColumns(
+            logging.Logger("test"), ZoneKey("US-CENT-SWPP"), "spp.org", "XYZ"
+        )
@@ -1,11 +1,15 @@
+import io
+import json
 import logging
 import math
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
+import pandas as pd
 import pytest
 
 from electricitymap.contrib.lib.models.event_lists import (
+    BatchableEventList,
     ExchangeCapacityList,
     ExchangeList,
     GridAlertList,
@@ -210,6 +214,64 @@ def test_update_exchange_list_with_longer_new_list():
     assert updated_list.events[1].source == "trust.me"
 
 
+def test_event_list_index_follows_direct_mutations():
+    exchange_list = ExchangeList(logging.Logger("test"))
+    exchange_list.append(
+        zoneKey=ZoneKey("AT->DE"),
+        datetime=datetime(2023, 1, 1, tzinfo=timezone.utc),
+        netFlow=1,
+        source="trust.me",
+    )
+    other_list = ExchangeList(logging.Logger("test"))
+    other_list.append(
+        zoneKey=ZoneKey("AT->DE"),
+        datetime=datetime(2023, 1, 2, tzinfo=timezone.utc),
+        netFlow=2,
+        source="trust.me",
+    )
+    assert datetime(2023, 1, 2, tzinfo=timezone.utc) not in exchange_list
+
+    # Events appended to or assigned as the raw list are picked up by lookups.
+    exchange_list.events.append(other_list.events[0])
+    assert exchange_list[datetime(2023, 1, 2, tzinfo=timezone.utc)].netFlow == 2
+    exchange_list.events = list(other_list.events)
+    assert datetime(2023, 1, 1, tzinfo=timezone.utc) not in exchange_list
+
+    combined_list = exchange_list + other_list
+    assert combined_list[datetime(2023, 1, 2, tzinfo=timezone.utc)].netFlow == 2
+    with pytest.raises(KeyError):
+        combined_list[datetime(2023, 1, 1, tzinfo=timezone.utc)]
+
+
+def test_event_list_upsert():
+    exchange_list = ExchangeList(logging.Logger("test"))
+    exchange_list.append(
+        zoneKey=ZoneKey("AT->DE"),
+        datetime=datetime(2023, 1, 1, tzinfo=timezone.utc),
+        netFlow=1,
+        source="trust.me",
+    )
+    new_list = ExchangeList(logging.Logger("test"))
+    new_list.append(
+        zoneKey=ZoneKey("AT->DE"),
+        datetime=datetime(2023, 1, 1, tzinfo=timezone.utc),
+        netFlow=2,
+        source="trust.me",
+    )
+    new_list.append(
+        zoneKey=ZoneKey("AT->DE"),
+        datetime=datetime(2023, 1, 2, tzinfo=timezone.utc),
+        netFlow=3,
+        source="trust.me",
+    )
+    for event in new_list:
+        exchange_list.upsert(event)
+
+    assert len(exchange_list) == 2
+    assert exchange_list[datetime(2023, 1, 1, tzinfo=timezone.utc)].netFlow == 2
+    assert exchange_list[datetime(2023, 1, 2, tzinfo=timezone.utc)].netFlow == 3
+
+
 def test_consumption_list():
     consumption_list = TotalConsumptionList(logging.Logger("test"))
     consumption_list.append(
@@ -697,6 +759,39 @@ def test_update_production_list_with_production():
     assert updated_list.events[1].source == "trust.me"
 
 
+def test_update_production_list_does_not_modify_its_inputs():
+    production_list1 = ProductionBreakdownList(logging.Logger("test"))
+    production_list1.append(
+        zoneKey=ZoneKey("AT"),
+        datetime=datetime(2023, 1, 1, tzinfo=timezone.utc),
+        production=ProductionMix(wind=10, coal=10),
+        storage=StorageMix(hydro=1),
+        source="trust.me",
+    )
+    production_list2 = ProductionBreakdownList(logging.Logger("test"))
+    for day in (1, 2):
+        production_list2.append(
+            zoneKey=ZoneKey("AT"),
+            datetime=datetime(2023, 1, day, tzinfo=timezone.utc),
+            production=ProductionMix(wind=20),
+            storage=StorageMix(hydro=2),
+            source="other.source",
+        )
+    expected_list1 = production_list1.to_list()
+    expected_list2 = production_list2.to_list()
+
+    updated_list = ProductionBreakdownList.update_production_breakdowns(
+        production_list1, production_list2, logging.Logger("test")
+    )
+
+    assert updated_list is not production_list1
+    assert len(updated_list) == 2
+    assert updated_list.events[0].production.wind == 20
+    assert updated_list.events[0].production.coal == 10
+    assert production_list1.to_list() == expected_list1
+    assert production_list2.to_list() == expected_list2
+
+
 def test_update_production_list_with_new_list_being_longer():
     production_list1 = ProductionBreakdownList(logging.Logger("test"))
     production_list1.append(
@@ -1320,3 +1415,163 @@ def test_price_list_keeps_and_warns_on_duplicate_datetimes():
         result = price_list.to_list()
     assert len(result) == 2
     mock_warning.assert_called_once()
+
+
+def test_exchange_list_from_arrays_matches_append():
+    datetimes = [
+        datetime(2023, 1, 1, hour, 0, 30, tzinfo=timezone.utc) for hour in range(3)
+    ]
+    net_flows = [1.1234567, -2, 3]
+    exchange_list = ExchangeList(logging.Logger("test"))
+    for dt, net_flow in zip(datetimes, net_flows, strict=True):
+        exchange_list.append(
+            zoneKey=ZoneKey("AT->DE"),
+            datetime=dt,
+            netFlow=net_flow,
+            source="trust.me",
+            end_datetime=dt + timedelta(hours=1),
+        )
+    batch_list = ExchangeList.from_arrays(
+        logging.Logger("test"),
+        zoneKey=ZoneKey("AT->DE"),
+        datetimes=datetimes,
+        source="trust.me",
+        netFlows=net_flows,
+        end_datetimes=[dt + timedelta(hours=1) for dt in datetimes],
+    )
+    assert batch_list.to_list() == exchange_list.to_list()
+    assert datetime(2023, 1, 1, 1, tzinfo=timezone.utc) in batch_list
+
+
+def test_append_many_logs_error_per_invalid_row():
+    consumption_list = TotalConsumptionList(logging.Logger("test"))
+    with patch.object(consumption_list.logger, "error") as mock_error:
+        consumption_list.append_many(
+            zoneKey=ZoneKey("AT"),
+            datetimes=[
+                datetime(2023, 1, 1, tzinfo=timezone.utc),
+                datetime(2023, 1, 2),
+                datetime(1999, 1, 1, tzinfo=timezone.utc),
+                datetime.now(timezone.utc) + timedelta(days=2),
+                datetime(2023, 1, 3, tzinfo=timezone.utc),
+            ],
+            source="trust.me",
+            consumptions=[1, 1, 1, 1, -1],
+        )
+    assert mock_error.call_count == 4
+    assert len(consumption_list) == 1
+    assert "Missing timezone" in mock_error.call_args_list[0].args[0]
+    assert "cannot be negative" in mock_error.call_args_list[3].args[0]
+
+
+def test_append_many_validates_shared_fields_once():
+    price_list = PriceList(logging.Logger("test"))
+    with patch.object(price_list.logger, "error") as mock_error:
+        price_list.append_many(
+            zoneKey=ZoneKey("AT"),
+            datetimes=[datetime.now(timezone.utc) + timedelta(days=2)],
+            source="trust.me",
+            prices=[1],
+            currency="XXX",
+        )
+    mock_error.assert_called_once()
+    assert "Unknown currency" in mock_error.call_args.args[0]
+    with pytest.raises(ValueError):
+        price_list.append_many(
+            zoneKey=ZoneKey("AT"),
+            datetimes=[datetime(2023, 1, 1, tzinfo=timezone.utc)],
+            source="trust.me",
+            prices=[1, 2],
+            currency="EUR",
+        )
+
+
+def test_production_list_append_many_without_rows():
+    production_list = ProductionBreakdownList(logging.Logger("test"))
+    production_list.append_many(
+        zoneKey=ZoneKey("DE"),
+        datetimes=[],
+        source="trust.me",
+        production={"wind": []},
+        storage={"hydro": []},
+    )
+    assert len(production_list) == 0
+
+
+def test_production_list_from_arrays():
+    production_list = ProductionBreakdownList.from_arrays(
+        logging.Logger("test"),
+        zoneKey=ZoneKey("AT"),
+        datetimes=pd.date_range("2023-01-01", periods=3, freq="h", tz="UTC"),
+        source="trust.me",
+        production={"wind": [10, -1, None], "coal": [1.0, None, math.nan]},
+        storage={"hydro": [None, -1, None]},
+    )
+    assert len(production_list) == 2
+    first, second = production_list.to_list()
+    assert first["production"] == {"wind": 10, "coal": 1}
+    assert first["storage"] == {}
+    assert second["production"] == {"wind": None, "coal": None}
+    assert second["correctedModes"] == ["wind"]
+    assert second["storage"] == {"hydro": -1}
+
+
+def test_only_batchable_lists_have_from_arrays():
+    for list_class in (
+        ExchangeList,
+        PriceList,
+        ProductionBreakdownList,
+        TotalConsumptionList,
+        TotalProductionList,
+    ):
+        assert issubclass(list_class, BatchableEventList)
+    for list_class in (
+        ExchangeCapacityList,
+        GridAlertList,
+        LocationalMarginalPriceList,
+    ):
+        assert not hasattr(list_class, "from_arrays")
+        assert not hasattr(list_class, "append_many")
+
+
+def _overlapping_exchanges(count: int) -> ExchangeList:
+    exchange_list = ExchangeList(logging.Logger("test"))
+    dt = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    # Appended in reverse, each event overlapping the next one by an hour.
+    for hour in reversed(range(count)):
+        exchange_list.append(
+            zoneKey=ZoneKey("AT->DE"),
+            datetime=dt + timedelta(hours=hour),
+            end_datetime=dt + timedelta(hours=hour + 2),
+            netFlow=hour,
+            source="trust.me",
+        )
+    return exchange_list
+
+
+def test_iter_dicts_streams_to_list():
+    exchange_list = _overlapping_exchanges(5)
+    streamed = list(exchange_list.iter_dicts())
+    assert streamed == exchange_list.to_list()
+    assert [event["netFlow"] for event in streamed] == [0, 1, 2, 3, 4]
+    assert [event["end_datetime"].hour for event in streamed] == [1, 2, 3, 4, 6]
+    assert [len(chunk) for chunk in exchange_list.iter_chunks(2)] == [2, 2, 1]
+
+
+def test_iter_column_batches():
+    exchange_list = _overlapping_exchanges(3)
+    batches = list(exchange_list.iter_column_batches(2))
+    assert [batch["netFlow"] for batch in batches] == [[0, 1], [2]]
+    assert batches[0]["sortedZoneKeys"] == ["AT->DE", "AT->DE"]
+
+
+def test_to_ndjson():
+    exchange_list = _overlapping_exchanges(3)
+    file = io.StringIO()
+    assert exchange_list.to_ndjson(file, chunk_size=2) == 3
+    lines = [json.loads(line) for line in file.getvalue().splitlines()]
+    assert len(lines) == 3
+    assert lines[0]["datetime"] == "2023-01-01T00:00:00+00:00"
+    assert lines[0]["end_datetime"] == "2023-01-01T01:00:00+00:00"
+    assert lines[0]["sourceType"] == "measured"
+    assert lines[2]["netFlow"] == 2
@@ -1,5 +1,7 @@
+import json
 import logging
 import math
+import pickle
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 from zoneinfo import ZoneInfo
@@ -1089,6 +1091,88 @@ def test_production_with_nan_init():
     assert mix.wind is None
 
 
+def test_mix_values_are_rounded_when_read():
+    mix = ProductionMix(wind=1.23456789, solar=-1, coal=math.nan)
+    mix.add_value("wind", 1e-7)
+    assert mix.wind == 1.234568
+    assert mix.dict(exclude_unset=True) == {
+        "coal": None,
+        "solar": None,
+        "wind": 1.234568,
+    }
+    assert mix.dict(exclude_unset=True, keep_corrected_negative_values=True) == {
+        "coal": None,
+        "solar": None,
+        "wind": 1.234568,
+    }
+    assert mix.__fields_set__ == {"coal", "solar", "wind"}
+    assert dict(mix)["gas"] is None
+
+
+def test_mix_copies_are_independent():
+    mix = ProductionMix(wind=10, solar=-1)
+    for copied in (mix.copy(), pickle.loads(pickle.dumps(mix))):
+        assert copied == mix
+        assert copied.corrected_negative_modes == {"solar"}
+        copied.add_value("wind", 5)
+        copied.add_value("hydro", -1)
+        assert mix.wind == 10
+        assert mix.corrected_negative_modes == {"solar"}
+
+
+def test_production_breakdown_dict_and_json_serialize_mixes():
+    breakdown = ProductionBreakdown(
+        zoneKey=ZoneKey("DE"),
+        datetime=datetime(2023, 1, 1, tzinfo=timezone.utc),
+        production=ProductionMix(wind=1, coal=2),
+        storage=StorageMix(hydro=-1),
+        source="trust.me",
+    )
+    breakdown_dict = breakdown.dict()
+    assert breakdown_dict["production"] == {
+        **dict.fromkeys(PRODUCTION_MODES),
+        "coal": 2,
+        "wind": 1,
+    }
+    assert breakdown_dict["storage"] == {"battery": None, "hydro": -1}
+    assert json.loads(breakdown.json()) == {
+        **breakdown_dict,
+        "sourceType": "measured",
+        "datetime": "2023-01-01T00:00:00+00:00",
+    }
+    assert json.loads(breakdown.json(exclude_unset=True)) == {
+        "zoneKey": "DE",
+        "datetime": "2023-01-01T00:00:00+00:00",
+        "production": {"coal": 2, "wind": 1},
+        "storage": {"hydro": -1},
+        "source": "trust.me",
+    }
+    excluded = breakdown.dict(exclude={"production": {"coal"}, "storage": True})
+    assert "storage" not in excluded
+    assert excluded["production"] == {
+        **dict.fromkeys(set(PRODUCTION_MODES) - {"coal"}),
+        "wind": 1,
+    }
+
+
+def test_production_breakdown_validates_mixes():
+    breakdown = ProductionBreakdown(
+        zoneKey=ZoneKey("DE"),
+        datetime=datetime(2023, 1, 1, tzinfo=timezone.utc),
+        production={"wind": 10},
+        storage=StorageMix(hydro=1),
+        source="trust.me",
+    )
+    assert breakdown.production == ProductionMix(wind=10)
+    with pytest.raises(ValueError):
+        ProductionBreakdown(
+            zoneKey=ZoneKey("DE"),
+            datetime=datetime(2023, 1, 1, tzinfo=timezone.utc),
+            production=[10],
+            source="trust.me",
+        )
+
+
 def test_production_with_nan_using_numpy_init():
     mix = ProductionMix(wind=math.nan)
     assert mix.wind is None
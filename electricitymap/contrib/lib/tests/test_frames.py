@@ -0,0 +1,152 @@
+import logging
+import math
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownList
+from electricitymap.contrib.lib.models.events import (
+    EventSourceType,
+    ProductionMix,
+    StorageMix,
+)
+from electricitymap.contrib.lib.models.frames import (
+    localize_datetimes,
+    prices_from_frame,
+    production_breakdowns_from_frame,
+    total_consumptions_from_frame,
+)
+from electricitymap.contrib.types import ZoneKey
+
+
+def test_production_breakdowns_from_frame_matches_add_value():
+    df = pd.DataFrame(
+        {
+            "gas": [1.5, None, -1.0, 2.0],
+            "other": [-2.0, None, None, 0.5],
+            "other_self": [3.0, None, -1.0, None],
+            "wind": [-0.5, 4.0, None, math.nan],
+            "pumped": [-0.0, None, 2.0, None],
+        },
+        index=pd.date_range("2023-01-01", periods=4, freq="h", tz="UTC"),
+    )
+    production = {"gas": ["gas"], "unknown": ["other", "other_self"], "wind": ["wind"]}
+    logger = logging.Logger("test")
+    for set_missing in (True, False):
+        for correct_negative_with_zero in (True, False):
+            expected = ProductionBreakdownList(logger)
+            for dt, row in zip(df.index, df.itertuples(index=False), strict=True):
+                row = row._asdict()
+                production_mix = ProductionMix()
+                storage_mix = StorageMix()
+                for mode, columns in production.items():
+                    for column in columns:
+                        if set_missing or not pd.isna(row[column]):
+                            production_mix.add_value(
+                                mode,
+                                row[column],
+                                correct_negative_with_zero=correct_negative_with_zero,
+                            )
+                if set_missing or not pd.isna(row["pumped"]):
+                    storage_mix.add_value("hydro", row["pumped"])
+                expected.append(
+                    zoneKey=ZoneKey("AT"),
+                    datetime=dt.to_pydatetime(),
+                    production=production_mix,
+                    storage=storage_mix,
+                    source="trust.me",
+                )
+
+            production_list = production_breakdowns_from_frame(
+                df,
+                logger,
+                ZoneKey("AT"),
+                "trust.me",
+                production=production,
+                storage={"hydro": "pumped"},
+                set_missing=set_missing,
+                correct_negative_with_zero=correct_negative_with_zero,
+            )
+            assert repr(production_list.to_list()) == repr(expected.to_list())
+
+
+def test_production_breakdowns_from_empty_frame():
+    df = pd.DataFrame(
+        {"gas": [], "other": [], "pumped": []},
+        index=pd.DatetimeIndex([], tz="UTC"),
+    )
+    production_list = production_breakdowns_from_frame(
+        df,
+        logging.Logger("test"),
+        ZoneKey("AT"),
+        "trust.me",
+        production={"gas": "gas", "unknown": ["gas", "other"]},
+        storage={"hydro": "pumped"},
+    )
+    assert production_list.to_list() == []
+
+
+def test_frame_datetimes_are_localized_like_replace():
+    tz = ZoneInfo("Europe/Paris")
+    df = pd.DataFrame(
+        {
+            "start": pd.to_datetime(
+                ["2023-03-26 02:30", "2023-06-01 12:00", "2023-10-29 02:30"]
+            ),
+            "end": pd.to_datetime(["2023-03-26 04:00", "2023-06-01 13:00", None]),
+            "load": [1.0, 2.0, 3.0],
+        }
+    )
+    consumption_list = total_consumptions_from_frame(
+        df,
+        logging.Logger("test"),
+        ZoneKey("FR"),
+        "trust.me",
+        "load",
+        datetime_column="start",
+        end_datetime_column="end",
+        tz=tz,
+        sourceType=EventSourceType.forecasted,
+    )
+    events = consumption_list.to_list()
+    for event, start in zip(events, df["start"], strict=True):
+        expected = start.to_pydatetime().replace(tzinfo=tz)
+        assert event["datetime"].timestamp() == expected.timestamp()
+        assert event["sourceType"] == EventSourceType.forecasted
+    assert events[0]["end_datetime"] == datetime(2023, 3, 26, 4, tzinfo=tz)
+    assert events[2]["end_datetime"] is None
+
+
+def test_localize_datetimes():
+    tz = ZoneInfo("Europe/Paris")
+    naive = [datetime(2023, 10, 29, 2, 30), datetime(2023, 3, 26, 2, 30)]
+    localized = localize_datetimes(naive, tz)
+    assert [dt.timestamp() for dt in localized] == [
+        dt.replace(tzinfo=tz).timestamp() for dt in naive
+    ]
+    aware = [datetime(2023, 1, 1, tzinfo=timezone.utc)]
+    assert list(localize_datetimes(aware, tz)) == aware
+    assert localize_datetimes(naive, None).tz is None
+
+
+def test_prices_from_frame():
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    df = pd.DataFrame(
+        {
+            "datetime": [start + timedelta(hours=hour) for hour in range(3)],
+            "price": [10.5, -3, None],
+        }
+    )
+    price_list = prices_from_frame(
+        df,
+        logging.Logger("test"),
+        ZoneKey("DE"),
+        "trust.me",
+        "price",
+        "EUR",
+        datetime_column="datetime",
+    )
+    # Prices are required, the rows without one are logged and skipped.
+    assert [event["price"] for event in price_list.to_list()] == [10.5, -3]
+    assert price_list.to_list()[0]["datetime"] == start
@@ -0,0 +1,112 @@
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownList
+from electricitymap.contrib.lib.models.events import (
+    ProductionBreakdown,
+    ProductionMix,
+    TotalConsumption,
+)
+from electricitymap.contrib.lib.models.instrumentation import (
+    MERGE,
+    SERIALIZATION,
+    VALIDATION,
+    collect_model_metrics,
+    current_metrics,
+)
+from electricitymap.contrib.parsers.lib.concurrency import fetch_concurrently
+from electricitymap.contrib.types import ZoneKey
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def test_nothing_is_collected_outside_of_a_collection():
+    assert current_metrics() is None
+    with collect_model_metrics() as metrics:
+        assert current_metrics() is metrics
+    assert current_metrics() is None
+    TotalConsumption(zoneKey=ZoneKey("DE"), datetime=START, consumption=1, source="a")
+    assert metrics.events_created == {}
+
+
+def test_collects_events_failures_and_durations():
+    logger = logging.getLogger(__name__)
+    with collect_model_metrics() as metrics:
+        production = ProductionBreakdownList(logger)
+        production.append(
+            zoneKey=ZoneKey("DE"),
+            datetime=START,
+            production=ProductionMix(wind=1),
+            source="trust.me",
+        )
+        production.append(
+            zoneKey=ZoneKey("DE"),
+            datetime=datetime(2023, 1, 1),
+            production=ProductionMix(wind=1),
+            source="trust.me",
+        )
+        production.append_many(
+            ZoneKey("DE"),
+            [START + timedelta(hours=1), datetime(1999, 1, 1, tzinfo=timezone.utc)],
+            "trust.me",
+            production={"wind": [2, 3]},
+        )
+        merged = ProductionBreakdownList.merge_production_breakdowns(
+            [production, production], logger
+        )
+        merged.to_list()
+
+    assert metrics.events_created["ProductionBreakdown"] == 2 + len(merged)
+    assert metrics.validation_failures == {
+        "ProductionBreakdown.datetime: Missing timezone": 1,
+        "ProductionBreakdown.datetime: Date is before 2000, this is not plausible": 1,
+    }
+    for category in (VALIDATION, MERGE, SERIALIZATION):
+        assert metrics.durations[category] > 0
+    assert sum(metrics.durations.values()) <= metrics.wall_time
+    assert metrics.as_dict()["events_created"] == dict(metrics.events_created)
+
+
+def test_nested_collections_add_up_to_the_outer_one():
+    with collect_model_metrics() as outer, collect_model_metrics() as inner:
+        TotalConsumption(
+            zoneKey=ZoneKey("DE"), datetime=START, consumption=1, source="a"
+        )
+    assert inner.events_created == {"TotalConsumption": 1}
+    assert outer.events_created == {"TotalConsumption": 1}
+
+
+def test_collection_follows_concurrent_fetches():
+    def create(hour: int) -> TotalConsumption:
+        return TotalConsumption(
+            zoneKey=ZoneKey("DE"),
+            datetime=START + timedelta(hours=hour),
+            consumption=1,
+            source="a",
+        )
+
+    with collect_model_metrics() as metrics:
+        fetch_concurrently(create, range(8), "https://example.com")
+    assert metrics.events_created == {"TotalConsumption": 8}
+
+
+def test_times_the_consumption_of_exported_dicts(monkeypatch):
+    production = ProductionBreakdownList(logging.getLogger(__name__))
+    production.append_many(
+        ZoneKey("DE"),
+        [START + timedelta(hours=hour) for hour in range(20)],
+        "trust.me",
+        production={"wind": list(range(20))},
+    )
+    to_dict = ProductionBreakdown.to_dict
+
+    def slow_to_dict(self):
+        time.sleep(0.001)
+        return to_dict(self)
+
+    monkeypatch.setattr(ProductionBreakdown, "to_dict", slow_to_dict)
+    with collect_model_metrics() as metrics:
+        chunks = list(production.iter_chunks(chunk_size=5))
+    assert len(chunks) == 4
+    assert metrics.durations[SERIALIZATION] >= 0.02
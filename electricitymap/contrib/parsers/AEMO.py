@@ -13,6 +13,7 @@ from requests import Session
 
 from electricitymap.contrib.lib.models.event_lists import TotalConsumptionList
 from electricitymap.contrib.lib.models.events import EventSourceType
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 SOURCE = "aemo.com.au"
@@ -80,7 +81,7 @@ def fetch_consumption_forecast(
 ) -> list[dict[str, Any]]:
     """Consumption forecast in MW every half an hour for 10 days ahead.
     Only for NSW1, QND1, SA1, TAS1, VIC1 zones."""
-    session = session or Session()
+    session = session or create_session()
 
     if target_datetime is None:
         target_datetime = datetime.now(tz=ZONE_KEY_TO_TIMEZONE[zone_key])
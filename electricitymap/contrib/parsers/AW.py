@@ -12,6 +12,7 @@ from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.types import ZoneKey
 
 from .lib.exceptions import ParserException
+from .lib.session import create_session
 
 FUEL_MAPPING = {
     "Fossil": "oil",
@@ -35,7 +36,7 @@ def fetch_production(
     if target_datetime:
         raise NotImplementedError("This parser is not yet able to parse past dates")
 
-    r = session or Session()
+    r = session or create_session()
     # User agent is mandatory or services answers 404
     headers = {
         "user-agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko)"
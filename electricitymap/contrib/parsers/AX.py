@@ -15,6 +15,7 @@ from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.types import ZoneKey
 
 from .lib.exceptions import ParserException
+from .lib.session import create_session
 
 IFRAME_URL = "https://grafik.kraftnat.ax/grafer/tot_inm_24h_15.php"
 TIME_ZONE = ZoneInfo("Europe/Mariehamn")
@@ -155,7 +156,7 @@ def formatted_data(
 
 def fetch_production(
     zone_key: ZoneKey = ZoneKey("AX"),
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict]:
@@ -178,7 +179,7 @@ def fetch_production(
 
 def fetch_consumption(
     zone_key: ZoneKey = ZoneKey("AX"),
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict]:
@@ -202,7 +203,7 @@ def fetch_consumption(
 def fetch_exchange(
     zone_key1: ZoneKey,
     zone_key2: ZoneKey,
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict]:
@@ -17,6 +17,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 from electricitymap.contrib.lib.models.events import ProductionMix, StorageMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 SOURCE = "energy.gov.bb"
@@ -117,7 +118,7 @@ def fetch_operational_data(
 @refetch_frequency(timedelta(days=1))
 def fetch_production(
     zone_key: ZoneKey = ZoneKey("BB"),
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict] | dict:
@@ -150,7 +151,7 @@ def fetch_production(
 @refetch_frequency(timedelta(days=1))
 def fetch_consumption(
     zone_key: ZoneKey,
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> dict[str, Any] | list[dict[str, Any]]:
@@ -12,6 +12,7 @@ from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers import ENTSOE
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 # API is limited to 100 items per query
@@ -64,7 +65,7 @@ def fetch_elia(
     end_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> ProductionBreakdownList:
-    session = session or Session()
+    session = session or create_session()
 
     if start_datetime is not None and end_datetime is not None:
         start_brussels = start_datetime.astimezone(TIMEZONE).replace(tzinfo=None)
@@ -123,7 +124,7 @@ def fetch_entsoe(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> ProductionBreakdownList:
-    session = session or Session()
+    session = session or create_session()
     domain = ENTSOE.ENTSOE_DOMAIN_MAPPINGS[zone_key]
     params = {
         "documentType": "A75",
@@ -167,7 +168,7 @@ def fetch_production(
     average power over the hour, so repeating it preserves hourly energy and
     avoids fabricating a 15-min shape.
     """
-    session = session or Session()
+    session = session or create_session()
 
     entsoe_data = fetch_entsoe(zone_key, session, target_datetime, logger)
 
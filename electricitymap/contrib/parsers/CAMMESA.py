@@ -14,6 +14,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 )
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 # Useful links.
@@ -79,7 +80,7 @@ def fetch_production(
     if target_datetime:
         raise NotImplementedError("This parser is not yet able to parse past dates")
 
-    current_session = session or Session()
+    current_session = session or create_session()
 
     conventional_production = non_renewables_production_mix(
         zone_key, current_session, logger
@@ -195,7 +196,7 @@ def fetch_exchange(
             zone_key=sorted_zone_keys,
         )
 
-    current_session = session or Session()
+    current_session = session or create_session()
 
     api_cammesa_response = current_session.get(CAMMESA_EXCHANGE_ENDPOINT)
     if not api_cammesa_response.ok:
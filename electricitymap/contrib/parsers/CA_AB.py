@@ -32,6 +32,7 @@ from electricitymap.contrib.lib.models.events import (
     ProductionMix,
     StorageMix,
 )
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 DEFAULT_ZONE_KEY = ZoneKey("CA-AB")
@@ -68,7 +69,7 @@ def fetch_exchange(
     """Request the last known power exchange (in MW) between two countries."""
     if target_datetime:
         raise NotImplementedError("Currently unable to scrape historical data")
-    session = session or Session()
+    session = session or create_session()
     response = session.get(
         f"{URL_STRING}/CSDReportServlet", params={"contentType": "csv"}
     )
@@ -101,7 +102,7 @@ def fetch_price(
     """Request the last known power price of a given country."""
     if target_datetime:
         raise NotImplementedError("Currently unable to scrape historical data")
-    session = session or Session()
+    session = session or create_session()
     response = session.get(
         f"{URL_STRING}/SMPriceReportServlet", params={"contentType": "csv"}
     )
@@ -131,7 +132,7 @@ def fetch_production(
     """Request the last known production mix (in MW) of a given country."""
     if target_datetime:
         raise NotImplementedError("This parser is not yet able to parse past dates")
-    session = session or Session()
+    session = session or create_session()
     response = session.get(
         f"{URL_STRING}/CSDReportServlet", params={"contentType": "csv"}
     )
@@ -190,7 +191,7 @@ def fetch_wind_solar_forecasts(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """Requests wind and solar production forecasts in hourly data (in MW) for 7 days ahead."""
-    session = session or Session()
+    session = session or create_session()
 
     # Requests
     # Wind 7 days
@@ -233,7 +234,7 @@ def fetch_grid_alerts(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
-    session = session or Session()
+    session = session or create_session()
 
     data = session.get(GRID_ALERTS_URL)
     soup = BeautifulSoup(data.text, "html.parser")
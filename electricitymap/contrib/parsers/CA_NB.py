@@ -13,6 +13,7 @@ from electricitymap.contrib.lib.models.event_lists import (
     ProductionBreakdownList,
 )
 from electricitymap.contrib.lib.models.events import ProductionMix
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 SOURCE = "tso.nbpower.com"
@@ -70,7 +71,7 @@ def fetch_production(
     if target_datetime:
         raise NotImplementedError("This parser is not yet able to parse past dates")
 
-    requests_obj = session or Session()
+    requests_obj = session or create_session()
     flows = _get_new_brunswick_flows(requests_obj)
 
     # nb_flows['NB Demand'] is the use of electricity in NB
@@ -116,7 +117,7 @@ def fetch_exchange(
 
     sorted_zone_keys = "->".join(sorted([zone_key1, zone_key2]))
 
-    requests_obj = session or Session()
+    requests_obj = session or create_session()
     flows = _get_new_brunswick_flows(requests_obj)
 
     # In this source, positive values are exports and negative are imports.
@@ -14,6 +14,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 )
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 
 # The table shown on the "Daily Report" page
 # (https://www.nspower.ca/oasis/system-reports-messages/daily-report) is inside
@@ -52,7 +53,7 @@ def fetch_production(
 
     # Request data from the source. Skip the first element of each JSON array
     # because the reported base load is always 0 MW.
-    session = session or Session()
+    session = session or create_session()
     loads = {  # A lookup table mapping timestamps to base loads (in MW)
         _parse_timestamp(load["datetime"]): load["Base Load"]
         for load in session.get(LOAD_URL).json()[1:]
@@ -130,7 +131,7 @@ def fetch_exchange(
     if sorted_zone_keys not in (ZoneKey("CA-NB->CA-NS"), ZoneKey("CA-NL->CA-NS")):
         raise ParserException(PARSER, "Unimplemented exchange pair", sorted_zone_keys)
 
-    session = session or Session()
+    session = session or create_session()
     soup = BeautifulSoup(session.get(EXCHANGE_URL).text, "html.parser")
 
     # Extract the timestamp from the table header.
@@ -22,6 +22,7 @@ from electricitymap.contrib.lib.models.events import (
     ProductionMix,
     StorageMix,
 )
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 # Some notes about timestamps:
@@ -101,7 +102,7 @@ def _fetch_xml(
 ) -> tuple[date, ElementTree.Element | None]:
     date_ = (target_datetime or datetime.now(TIMEZONE)).astimezone(TIMEZONE).date()
 
-    session = session or Session()
+    session = session or create_session()
     url = url_template.format(YYYYMMDD=date_.strftime("%Y%m%d"))
     response = session.get(url)
 
@@ -319,7 +320,7 @@ def fetch_consumption_forecast(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """Requests the demand forecast (in MW) of Canada Ontario zone for 7 days ahead hourly."""
-    session = session or Session()
+    session = session or create_session()
 
     if target_datetime is None:
         target_datetime = datetime.now(TIMEZONE)
@@ -508,7 +509,7 @@ def fetch_wind_solar_forecasts(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """Requests the forecasts for wind and solar (in MW) of Canada Ontario zone for 7 days ahead."""
-    session = session or Session()
+    session = session or create_session()
 
     if target_datetime is None:
         target_datetime = datetime.now(TIMEZONE)
@@ -553,7 +554,7 @@ def fetch_grid_alerts(
     For archive: in https://www.ieso.ca/Sector-Participants/RSS-Feeds/Advisory-Notices-Archive
     Url for archive table json: https://www.ieso.ca/ieso/api/table/data?source=958805C0C35B4BF3BB6A6EA429850C06&ctx=CF5ADB2D-E44E-4899-AFAF-E16C97A7A36F
     """
-    session = session or Session()
+    session = session or create_session()
 
     urls = [
         # Current Emergency Advisory Notices
@@ -11,6 +11,7 @@ from electricitymap.contrib.lib.models.event_lists import (
     TotalConsumptionList,
 )
 from electricitymap.contrib.lib.models.events import ProductionMix
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 US_PROXY = "https://us-ca-proxy-jfnx5klx2a-uw.a.run.app"
@@ -111,7 +112,7 @@ def fetch_consumption(
 def _fetch_quebec_production(
     session: Session | None = None, logger: Logger = getLogger(__name__)
 ) -> list[dict[str, str | dict[str, float]]]:
-    s = session or Session()
+    s = session or create_session()
     response = s.get(PRODUCTION_URL)
 
     if not response.ok:
@@ -124,7 +125,7 @@ def _fetch_quebec_production(
 def _fetch_quebec_consumption(
     session: Session | None = None, logger: Logger = getLogger(__name__)
 ) -> list[dict[str, Any]]:
-    s = session or Session()
+    s = session or create_session()
     response = s.get(CONSUMPTION_URL)
 
     if not response.ok:
@@ -12,6 +12,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 )
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 
 TIMEZONE = ZoneInfo("America/Regina")
 PRODUCTION_URL = (
@@ -46,7 +47,7 @@ def _request(
     # The zone key must be "CA-SK"; bail out otherwise.
     if zone_key != "CA-SK":
         raise ParserException("CA_SK.py", f"Cannot parse zone '{zone_key}'", zone_key)
-    session = session or Session()
+    session = session or create_session()
     # Mimic a user browser in the headers or the API will respond with a 403.
     response = session.get(url, headers={"user-agent": USER_AGENT})
     if not response.ok:
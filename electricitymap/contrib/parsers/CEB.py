@@ -17,6 +17,7 @@ from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownLis
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 TIMEZONE = ZoneInfo("Asia/Colombo")
@@ -46,7 +47,7 @@ def fetch_production(
         target_datetime = datetime.now(tz=TIMEZONE)
 
     if session is None:
-        session = Session()
+        session = create_session()
 
     params = {
         "date": target_datetime.strftime("%Y-%m-%d"),
@@ -21,6 +21,8 @@ from electricitymap.contrib.lib.models.event_lists import (
 from electricitymap.contrib.lib.models.events import EventSourceType, ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
+from electricitymap.contrib.parsers.lib.ttl_cache import TTLCache, month_ttl
 from electricitymap.contrib.types import ZoneKey
 
 CAISO_PROXY = "https://us-ca-proxy-jfnx5klx2a-uw.a.run.app"
@@ -80,8 +82,12 @@ MAPPING = {
 SOURCE = "cenace.gob.mx"
 TIMEZONE = ZoneInfo("America/Mexico_City")
 
-# cache where the data for whole months is stored as soon as it has been fetched once
-DATA_CACHE = {}
+# cache where the data for whole months is stored as soon as it has been fetched once,
+# the data of the current month being refreshed as CENACE publishes new days
+DATA_CACHE: TTLCache[str, pd.DataFrame] = TTLCache(
+    "CENACE.monthly_data", max_entries=12
+)
+CURRENT_MONTH_TTL = timedelta(hours=1).total_seconds()
 
 
 def parse_date(date, hour):
@@ -97,7 +103,7 @@ def fetch_csv_for_date(dt, session: Session | None = None):
     returns the data as a DataFrame.
     throws an exception data is not available.
     """
-    session = session or Session()
+    session = session or create_session()
 
     response = session.get(MX_PRODUCTION_URL)
     response.raise_for_status()
@@ -196,13 +202,17 @@ def fetch_production(
     up_to_months = 6  # Try up to 6 previous months
     for _ in range(up_to_months):
         cache_key = target_datetime.strftime("%Y-%m")
-        if cache_key in DATA_CACHE:
-            df = DATA_CACHE[cache_key]
+        df = DATA_CACHE.get(cache_key)
+        if df is not None:
             break
         else:
             df = fetch_csv_for_date(target_datetime, session=session)
             if df is not None and not df.empty:
-                DATA_CACHE[cache_key] = df
+                DATA_CACHE.set(
+                    cache_key,
+                    df,
+                    ttl=month_ttl(target_datetime, CURRENT_MONTH_TTL),
+                )
                 break
             else:
                 logger.warning(f"No data found for {cache_key}. Trying previous month.")
@@ -265,7 +275,7 @@ def fetch_exchange(
     if sorted_zone_keys not in EXCHANGES:
         raise NotImplementedError(f"Exchange pair not supported: {sorted_zone_keys}")
 
-    s = session or Session()
+    s = session or create_session()
 
     netflow = fetch_MX_exchange(sorted_zone_keys, s)
     exchange = ExchangeList(logger)
@@ -289,7 +299,7 @@ def fetch_consumption(
     """Gets the consumption data for a region using the live dashboard."""
     # TODO the calls could be improved since we can get all the data in one call.
     if session is None:
-        session = Session()
+        session = create_session()
     if target_datetime is not None:
         raise NotImplementedError("This parser is not yet able to parse past dates")
     response: Response = session.get(
@@ -418,7 +428,7 @@ def fetch_generation_forecast(
     if target_datetime is not None:
         raise NotImplementedError("This parser is not yet able to parse past dates")
 
-    s = session or Session()
+    s = session or create_session()
 
     raw_data = fetch_generation_forecast_data(session=s)
     forecast = parse_generation_forecast(
@@ -7,6 +7,7 @@ from requests import Session
 
 from electricitymap.contrib.parsers import ENTSOE
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 
@@ -109,7 +110,7 @@ def fetch_production(
         else target_datetime.astimezone(timezone.utc)
     )
 
-    r = session or Session()
+    r = session or create_session()
 
     exchanges = fetch_swiss_exchanges(r, target_datetime, logger)
     consumptions = fetch_swiss_consumption(r, target_datetime, logger)
@@ -15,6 +15,7 @@ from electricitymap.contrib.config import ZoneKey
 from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownList
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
+from electricitymap.contrib.parsers.lib.session import create_session
 
 # Historical API
 API_BASE_URL = "https://sipub.coordinador.cl/api/v1/recursos/generacion_centrales_tecnologia_horario?"
@@ -84,7 +85,7 @@ def fetch_production(
         "Origin": "https://www.coordinador.cl",
     }
 
-    s = session or Session()
+    s = session or create_session()
     url = API_BASE_URL + date_component
 
     req = s.get(url, headers=headers)
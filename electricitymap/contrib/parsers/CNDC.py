@@ -8,8 +8,7 @@ from zoneinfo import ZoneInfo
 
 from requests import Session
 
-from electricitymap.contrib.config import CONFIG_DIR
-from electricitymap.contrib.config.reading import read_zones_config
+from electricitymap.contrib.config import ZONES_CONFIG
 from electricitymap.contrib.lib.models.event_lists import (
     EventSourceType,
     ProductionBreakdownList,
@@ -18,11 +17,11 @@ from electricitymap.contrib.lib.models.event_lists import (
 )
 from electricitymap.contrib.parsers.lib.config import use_proxy
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 tz_bo = ZoneInfo("America/La_Paz")
 
-ZONES_CONFIG = read_zones_config(config_dir=CONFIG_DIR)
 gas_oil_ratio = ZONES_CONFIG["BO"]["capacity"]["gas"][-1]["value"] / (
     ZONES_CONFIG["BO"]["capacity"]["gas"][-1]["value"]
     + ZONES_CONFIG["BO"]["capacity"]["oil"][-1]["value"]
@@ -73,7 +72,7 @@ def _check_response(response, context: str = ""):
 def fetch_data(
     session: Session | None = None, target_datetime: datetime | None = None
 ) -> tuple[list[dict], datetime]:
-    session = session or Session()
+    session = session or create_session()
     target_datetime = (target_datetime or datetime.now()).astimezone(tz_bo)
     formatted_dt = target_datetime.strftime("%Y-%m-%d")
 
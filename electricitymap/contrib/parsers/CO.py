@@ -16,6 +16,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency, use_proxy
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 
 # The production, price, and historical consumption parser makes use of a third
 # party library called pydataxm, for details on what data is available, refer to
@@ -64,7 +65,7 @@ def fetch_consumption(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     if target_datetime is None:
-        session = session or Session()
+        session = session or create_session()
         return _fetch_live_consumption(zone_key, session, logger)
     else:
         target_datetime = target_datetime.astimezone(ZONE_INFO)
@@ -12,6 +12,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 PARSER = "CR.py"
@@ -87,7 +88,7 @@ def fetch_production(
             zone_key=zone_key,
         )
 
-    session = session or Session()
+    session = session or create_session()
     url = f"{PRODUCTION_URL}?{target_datetime.strftime('anno=%Y&mes=%m&dia=%d')}"
     response = session.get(url)
     if not response.ok:
@@ -148,7 +149,7 @@ def fetch_exchange(
             sorted_zone_keys,
         )
 
-    session = session or Session()
+    session = session or create_session()
     dt = datetime.now(TIMEZONE)
     response = session.get(EXCHANGE_URL)
     if not response.ok:
@@ -17,6 +17,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 )
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency, use_proxy
+from electricitymap.contrib.parsers.lib.session import create_session
 
 REALTIME_SOURCE = "https://tsoc.org.cy/electrical-system/total-daily-system-generation-on-the-transmission-system/"
 HISTORICAL_SOURCE = "https://tsoc.org.cy/electrical-system/archive-total-daily-system-generation-on-the-transmission-system/?startdt={}&enddt=%2B1days"
@@ -132,7 +133,7 @@ def fetch_production(
     """Requests the last known production mix (in MW) of a given country."""
     assert zone_key == ZoneKey("CY")
 
-    parser = CyprusParser(session or Session(), logger)
+    parser = CyprusParser(session or create_session(), logger)
     return parser.fetch_production(target_datetime)
 
 
@@ -14,6 +14,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 )
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 # please try to write PEP8 compliant code (use a linter). One of PEP8's
@@ -77,7 +78,7 @@ def get_target_datetime(dt: datetime | None) -> datetime:
 def __get_exchange_data(
     zone_key1: ZoneKey = ZoneKey("CZ"),
     zone_key2: ZoneKey = ZoneKey("DE"),
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
     mode: str = "Actual",
@@ -143,7 +144,7 @@ def __get_exchange_data(
 @refetch_frequency(timedelta(days=2))
 def fetch_production(
     zone_key: ZoneKey = ZoneKey("CZ"),
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list:
@@ -207,7 +208,7 @@ def fetch_production(
 def fetch_exchange(
     zone_key1: ZoneKey = ZoneKey("CZ"),
     zone_key2: ZoneKey = ZoneKey("DE"),
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict]:
@@ -219,7 +220,7 @@ def fetch_exchange(
 def fetch_exchange_forecast(
     zone_key1: ZoneKey = ZoneKey("CZ"),
     zone_key2: ZoneKey = ZoneKey("DE"),
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict]:
@@ -12,6 +12,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 from electricitymap.contrib.lib.models.events import EventSourceType, ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 EXCHANGE_MAPPING = {
@@ -56,7 +57,7 @@ def fetch_data(
     """
     Helper function to fetch data from the API.
     """
-    ses = session or Session()
+    ses = session or create_session()
 
     if target_datetime and target_datetime.tzinfo:
         # Data source doesn't support timezone aware
@@ -119,7 +120,7 @@ def flow(sorted_keys: ZoneKey, datapoint: dict) -> int | float | None:
 def fetch_exchange(
     zone_key1: ZoneKey,
     zone_key2: ZoneKey,
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict]:
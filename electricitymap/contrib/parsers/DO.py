@@ -11,6 +11,7 @@ from requests import Session
 from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownList
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.config import use_proxy
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 # This parser gets hourly electricity generation data from oc.org.do for the Dominican Republic.
@@ -102,7 +103,7 @@ def get_data(session: Session | None = None) -> list[list[str]]:
     Finds main table and creates a list of all table elements in string format.
     """
 
-    s = session or Session()
+    s = session or create_session()
     data_req = s.get(URL)
     soup = BeautifulSoup(data_req.content, "lxml")
 
@@ -32,6 +32,7 @@ from electricitymap.contrib.lib.models.event_lists import (
     TotalConsumptionList,
 )
 from electricitymap.contrib.lib.models.events import ProductionMix
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 # CENACE has an incomplete SSL certificate chain — suppress the warning.
@@ -147,7 +148,7 @@ def fetch_production(
     Fetch real-time production breakdown for Ecuador (30-min resolution).
     Only current-day data is available. target_datetime is ignored.
     """
-    s = session or Session()
+    s = session or create_session()
     logger.info(f"Fetching Ecuador production from {URL}")
 
     resp = s.get(URL, timeout=30, verify=False)
@@ -204,7 +205,7 @@ def fetch_consumption(
     """
     Fetch real-time national demand (DEMANDA NACIONAL) for Ecuador.
     """
-    s = session or Session()
+    s = session or create_session()
     logger.info(f"Fetching Ecuador consumption from {URL}")
 
     resp = s.get(URL, timeout=30, verify=False)
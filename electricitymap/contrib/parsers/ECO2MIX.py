@@ -14,6 +14,7 @@ from electricitymap.contrib.config import ZONES_CONFIG
 from electricitymap.contrib.lib.models.event_lists import ExchangeList
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 # from .lib.validation import validate, validate_production_diffs
@@ -306,7 +307,7 @@ def fetch_exchange(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ):
-    session = session or Session()
+    session = session or create_session()
     sorted_zone_keys = ZoneKey("->".join(sorted([zone_key1, zone_key2])))
 
     datapoints = format_exchange_df(
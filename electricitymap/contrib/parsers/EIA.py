@@ -13,7 +13,7 @@ from datetime import datetime, timedelta, timezone
 from logging import Logger, getLogger
 from typing import Any
 
-from dateutil import parser
+import numpy as np
 from requests import Session
 
 from electricitymap.contrib.lib.models.event_lists import (
@@ -21,12 +21,10 @@ from electricitymap.contrib.lib.models.event_lists import (
     ProductionBreakdownList,
     TotalConsumptionList,
 )
-from electricitymap.contrib.lib.models.events import (
-    EventSourceType,
-    ProductionMix,
-    StorageMix,
-)
+from electricitymap.contrib.lib.models.events import EventSourceType
+from electricitymap.contrib.parsers.lib.concurrency import fetch_concurrently
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.parsers.lib.utils import get_token
 from electricitymap.contrib.types import ZoneKey
 
@@ -386,6 +384,14 @@ PRODUCTION_MIX = (
 )
 EXCHANGE = f"{BASE_URL}/interchange-data/data/?data[]=value{{}}&frequency=hourly"
 
+EIA_TS_FORMAT = "%Y-%m-%dT%H"
+# The API returns at most this many rows per request, longer windows are
+# requested page by page.
+EIA_PAGE_LENGTH = 5000
+# The fuel types of a production mix are requested concurrently, up to this many
+# at once.
+EIA_MAX_CONCURRENT_REQUESTS = 4
+
 
 @refetch_frequency(timedelta(days=1))
 def fetch_production(
@@ -410,7 +416,6 @@ def fetch_consumption(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
-    consumption_list = TotalConsumptionList(logger)
     consumption = _fetch_historical(
         zone_key,
         CONSUMPTION.format(REGIONS[zone_key]),
@@ -418,15 +423,9 @@ def fetch_consumption(
         target_datetime=target_datetime,
         logger=logger,
     )
-    for point in consumption:
-        consumption_list.append(
-            zoneKey=zone_key,
-            datetime=point["datetime"],
-            consumption=point["value"],
-            source="eia.gov",
-        )
-
-    return consumption_list.to_list()
+    return _consumption_list(
+        zone_key, consumption, EventSourceType.measured, logger
+    ).to_list()
 
 
 @refetch_frequency(timedelta(days=1))
@@ -436,7 +435,6 @@ def fetch_consumption_forecast(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ):
-    consumptions = TotalConsumptionList(logger)
     consumption_forecasts = _fetch_forecast(
         zone_key,
         CONSUMPTION_FORECAST.format(REGIONS[zone_key]),
@@ -444,53 +442,138 @@ def fetch_consumption_forecast(
         target_datetime=target_datetime,
         logger=logger,
     )
-    for forecast in consumption_forecasts:
-        consumptions.append(
-            zoneKey=zone_key,
-            datetime=forecast["datetime"],
-            consumption=forecast["value"],
-            source="eia.gov",
-            sourceType=EventSourceType.forecasted,
+    return _consumption_list(
+        zone_key, consumption_forecasts, EventSourceType.forecasted, logger
+    ).to_list()
+
+
+@refetch_frequency(timedelta(days=1))
+def fetch_production_for_zones(
+    zone_keys: list[ZoneKey],
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict[ZoneKey, list[dict[str, Any]]]:
+    """Bulk counterpart of `fetch_production`, with one request for all the zones."""
+    return _fetch_any_for_zones(
+        zone_keys,
+        PRODUCTION,
+        *_historical_window(target_datetime),
+        session=session,
+        logger=logger,
+    )
+
+
+@refetch_frequency(timedelta(days=1))
+def fetch_consumption_for_zones(
+    zone_keys: list[ZoneKey],
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict[ZoneKey, list[dict[str, Any]]]:
+    """Bulk counterpart of `fetch_consumption`, with one request for all the zones."""
+    consumptions = _fetch_any_for_zones(
+        zone_keys,
+        CONSUMPTION,
+        *_historical_window(target_datetime),
+        session=session,
+        logger=logger,
+    )
+    return {
+        zone_key: _consumption_list(
+            zone_key, points, EventSourceType.measured, logger
+        ).to_list()
+        for zone_key, points in consumptions.items()
+    }
+
+
+@refetch_frequency(timedelta(days=1))
+def fetch_consumption_forecast_for_zones(
+    zone_keys: list[ZoneKey],
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict[ZoneKey, list[dict[str, Any]]]:
+    """Bulk counterpart of `fetch_consumption_forecast`, with one request for all the zones."""
+    consumption_forecasts = _fetch_any_for_zones(
+        zone_keys,
+        CONSUMPTION_FORECAST,
+        *_forecast_window(target_datetime),
+        session=session,
+        logger=logger,
+    )
+    return {
+        zone_key: _consumption_list(
+            zone_key, points, EventSourceType.forecasted, logger
+        ).to_list()
+        for zone_key, points in consumption_forecasts.items()
+    }
+
+
+def _consumption_list(
+    zone_key: ZoneKey,
+    points: list[dict[str, Any]],
+    source_type: EventSourceType,
+    logger: Logger,
+) -> TotalConsumptionList:
+    return TotalConsumptionList.from_arrays(
+        logger,
+        zoneKey=zone_key,
+        datetimes=[point["datetime"] for point in points],
+        source="eia.gov",
+        consumptions=[point["value"] for point in points],
+        sourceType=source_type,
+    )
+
+
+def _append_production_storage(
+    production_breakdown: ProductionBreakdownList,
+    zone_key: ZoneKey,
+    fuel_type: str,
+    points: list[dict[str, Any]],
+    negative_threshold: float,
+) -> None:
+    """Appends the production or storage of a fuel type, handling the special
+    cases of hydro storage and self consumption"""
+    datetimes = np.array([point["datetime"] for point in points], dtype=object)
+    values = np.array([point["value"] for point in points], dtype=float)
+    if fuel_type in ("hydro_storage", "battery_storage"):
+        production_breakdown.append_many(
+            zone_key,
+            datetimes,
+            "eia.gov",
+            storage={fuel_type.removesuffix("_storage"): -values},
         )
-    return consumptions.to_list()
-
-
-def create_production_storage(
-    fuel_type: str, production_point: dict[str, float | None], negative_threshold: float
-) -> tuple[ProductionMix | None, StorageMix | None]:
-    """Create a production mix or a storage mix from a production point
-    handling the special cases of hydro storage and self consumption"""
-    production_value = production_point["value"]
-    production_mix = ProductionMix()
-    storage_mix = StorageMix()
-    if production_value is not None and production_value < 0 and fuel_type == "hydro":
+        return
+    if fuel_type == "hydro":
         # Negative hydro is reported by some BAs, according to the EIA those are pumped storage.
         # https://www.eia.gov/electricity/gridmonitor/about
-        storage_mix.add_value("hydro", abs(production_value))
-        return None, storage_mix
-    # production_value > negative_threshold, this is considered to be self consumption and should be reported as 0.
-    # Lower values are set to None as they are most likely outliers.
-
-    # have to have early returns because of downstream validation in ProductionBreakdownList
-    if fuel_type == "hydro_storage":
-        storage_mix.add_value(
-            "hydro",
-            -production_value if production_value is not None else production_value,
+        pumping = values < 0
+        production_breakdown.append_many(
+            zone_key,
+            datetimes[pumping],
+            "eia.gov",
+            storage={"hydro": -values[pumping]},
         )
-        return None, storage_mix
-    elif fuel_type == "battery_storage":
-        storage_mix.add_value(
-            "battery",
-            -production_value if production_value is not None else production_value,
+        production_breakdown.append_many(
+            zone_key,
+            datetimes[~pumping],
+            "eia.gov",
+            production={"hydro": values[~pumping]},
         )
-        return None, storage_mix
-    else:
-        production_mix.add_value(
-            fuel_type,
-            production_value,
-            production_value > negative_threshold if bool(production_value) else False,
+        return
+    # Negative values above the threshold are considered to be self consumption and reported as 0.
+    # Lower values are set to None as they are most likely outliers.
+    self_consumption = values > negative_threshold
+    for correct_negative_with_zero in (True, False):
+        rows = self_consumption == correct_negative_with_zero
+        production_breakdown.append_many(
+            zone_key,
+            datetimes[rows],
+            "eia.gov",
+            production={fuel_type: values[rows]},
+            correct_negative_with_zero=correct_negative_with_zero,
         )
-        return production_mix, None
 
 
 @refetch_frequency(timedelta(days=1))
@@ -500,21 +583,32 @@ def fetch_production_mix(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ):
+    session = session or create_session()
     all_production_breakdowns: list[ProductionBreakdownList] = []
+    # Every fuel type of the zone and of the zones supplying it is fetched
+    # concurrently, the values are then consumed in the same order.
     # TODO: We could be smarter in the future and only fetch the expected production types.
-    for production_mode, code in TYPES.items():
-        negative_threshold = NEGATIVE_PRODUCTION_THRESHOLDS_TYPE.get(
-            production_mode, NEGATIVE_PRODUCTION_THRESHOLDS_TYPE["default"]
-        )
-        production_breakdown = ProductionBreakdownList(logger)
-        url_prefix = PRODUCTION_MIX.format(REGIONS[zone_key], code)
-        production_and_storage_values = _fetch_historical(
-            zone_key,
-            url_prefix,
+    fetched_values = iter(
+        _fetch_historical_many(
+            [
+                (ZoneKey(zone), PRODUCTION_MIX.format(REGIONS[zone], code))
+                for production_mode, code in TYPES.items()
+                for zone in [
+                    zone_key,
+                    *_supplying_zones(zone_key, production_mode),
+                ]
+            ],
             session=session,
             target_datetime=target_datetime,
             logger=logger,
         )
+    )
+    for production_mode in TYPES:
+        negative_threshold = NEGATIVE_PRODUCTION_THRESHOLDS_TYPE.get(
+            production_mode, NEGATIVE_PRODUCTION_THRESHOLDS_TYPE["default"]
+        )
+        production_breakdown = ProductionBreakdownList(logger)
+        production_and_storage_values = next(fetched_values)
         # EIA does not currently split production from the Virgil Summer C
         # plant across the two owning/ utilizing BAs:
         # US-CAR-SCEG and US-CAR-SC,
@@ -562,47 +656,27 @@ def fetch_production_mix(
                 ):
                     event["value"] = 0.0
 
-        for point in production_and_storage_values:
-            production_mix, storage_mix = create_production_storage(
-                production_mode, point, negative_threshold
-            )
-            production_breakdown.append(
-                zoneKey=zone_key,
-                datetime=point["datetime"],
-                production=production_mix,
-                storage=storage_mix,
-                source="eia.gov",
-            )
+        _append_production_storage(
+            production_breakdown,
+            zone_key,
+            production_mode,
+            production_and_storage_values,
+            negative_threshold,
+        )
         all_production_breakdowns.append(production_breakdown)
         # Integrate the supplier zones in the zones they supply
-
-        supplying_zones = PRODUCTION_ZONES_TRANSFERS.get(zone_key, {})
-        zones_to_integrate = {
-            **supplying_zones.get("all", {}),
-            **supplying_zones.get(production_mode, {}),
-        }
-        for zone, percentage in zones_to_integrate.items():
-            url_prefix = PRODUCTION_MIX.format(REGIONS[zone], code)
+        for percentage in _supplying_zones(zone_key, production_mode).values():
             additional_breakdown = ProductionBreakdownList(logger)
-            additional_production = _fetch_historical(
-                ZoneKey(zone),
-                url_prefix,
-                session=session,
-                target_datetime=target_datetime,
-                logger=logger,
-            )
+            additional_production = next(fetched_values)
             for point in additional_production:
                 point.update({"value": point["value"] * percentage})
-                production_mix, storage_mix = create_production_storage(
-                    production_mode, point, negative_threshold
-                )
-                additional_breakdown.append(
-                    zoneKey=zone_key,
-                    datetime=point["datetime"],
-                    production=production_mix,
-                    storage=storage_mix,
-                    source="eia.gov",
-                )
+            _append_production_storage(
+                additional_breakdown,
+                zone_key,
+                production_mode,
+                additional_production,
+                negative_threshold,
+            )
             all_production_breakdowns.append(additional_breakdown)
 
     all_production_breakdowns = list(
@@ -616,18 +690,18 @@ def fetch_production_mix(
     # Fx the latest oil data could be 6 months old.
     # In this case we want to discard the old data as we won't be able to merge it
     timeframes = [
-        sorted(x.datetime for x in breakdowns.events)
+        {x.datetime for x in breakdowns.events}
         for breakdowns in all_production_breakdowns
         if len(breakdowns.events) > 0
     ]
-    latest_timeframe = max(timeframes, key=lambda x: x[-1])
+    latest_timeframe = max(timeframes, key=max)
 
     for production_list in all_production_breakdowns:
-        correct_mix = []
-        for production_mix in production_list.events:
-            if production_mix.datetime in latest_timeframe:
-                correct_mix.append(production_mix)
-        production_list.events = correct_mix
+        production_list.events = [
+            production_mix
+            for production_mix in production_list.events
+            if production_mix.datetime in latest_timeframe
+        ]
     events = ProductionBreakdownList.merge_production_breakdowns(
         all_production_breakdowns, logger
     )
@@ -635,6 +709,16 @@ def fetch_production_mix(
     return events.to_list()
 
 
+def _supplying_zones(zone_key: ZoneKey, production_mode: str) -> dict[str, float]:
+    """Returns the zones whose `production_mode` production is integrated in
+    `zone_key`, with the share of it that is integrated."""
+    supplying_zones = PRODUCTION_ZONES_TRANSFERS.get(zone_key, {})
+    return {
+        **supplying_zones.get("all", {}),
+        **supplying_zones.get(production_mode, {}),
+    }
+
+
 @refetch_frequency(timedelta(days=1))
 def fetch_exchange(
     zone_key1: ZoneKey,
@@ -652,15 +736,12 @@ def fetch_exchange(
         target_datetime=target_datetime,
         logger=logger,
     )
-    for point in exchange:
-        exchange_list.append(
-            zoneKey=ZoneKey(point["zoneKey"]),
-            datetime=point["datetime"],
-            netFlow=-point["value"]
-            if sortedcodes in REVERSE_EXCHANGES
-            else point["value"],
-            source="eia.gov",
-        )
+    exchange_list.append_many(
+        sortedcodes,
+        [point["datetime"] for point in exchange],
+        "eia.gov",
+        _net_flows(exchange, reverse=sortedcodes in REVERSE_EXCHANGES),
+    )
 
     # Integrate remapped exchanges
     remapped_exchanges = EXCHANGE_TRANSFERS.get(sortedcodes, {})
@@ -673,15 +754,12 @@ def fetch_exchange(
             target_datetime=target_datetime,
             logger=logger,
         )
-        for point in exchange:
-            remapped_exchange_list.append(
-                zoneKey=sortedcodes,
-                datetime=point["datetime"],
-                netFlow=-point["value"]
-                if remapped_exchange in REVERSE_EXCHANGES
-                else point["value"],
-                source="eia.gov",
-            )
+        remapped_exchange_list.append_many(
+            sortedcodes,
+            [point["datetime"] for point in exchange],
+            "eia.gov",
+            _net_flows(exchange, reverse=remapped_exchange in REVERSE_EXCHANGES),
+        )
 
     exchange_list = ExchangeList.merge_exchanges(
         [exchange_list, remapped_exchange_list], logger
@@ -690,25 +768,48 @@ def fetch_exchange(
     return exchange_list.to_list()
 
 
-def _fetch_any(
-    zone_key: ZoneKey,
+def _net_flows(points: list[dict[str, Any]], reverse: bool) -> np.ndarray:
+    values = np.array([point["value"] for point in points], dtype=float)
+    return -values if reverse else values
+
+
+def _fetch_datapoints(
     url_prefix: str,
     start_datetime: datetime,
     end_datetime: datetime,
     session: Session | None = None,
-    logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
+    """Fetches the raw rows of a series, page by page."""
     # get EIA API key
     API_KEY = get_token("EIA_KEY")
 
-    eia_ts_format = "%Y-%m-%dT%H"
-    url = f"{url_prefix}&api_key={API_KEY}&start={start_datetime.strftime(eia_ts_format)}&end={end_datetime.strftime(eia_ts_format)}"
+    # Sorted so that the pages of a long window neither overlap nor miss rows.
+    url = (
+        f"{url_prefix}&api_key={API_KEY}"
+        f"&start={start_datetime.strftime(EIA_TS_FORMAT)}"
+        f"&end={end_datetime.strftime(EIA_TS_FORMAT)}"
+        "&sort[0][column]=period&sort[0][direction]=asc"
+    )
 
-    s = session or Session()
-    req = s.get(url)
-    raw_data = req.json()
-    if raw_data.get("response", {}).get("data", None) is None:
-        return []
+    s = session or create_session()
+    datapoints: list[dict[str, Any]] = []
+    while True:
+        req = s.get(f"{url}&offset={len(datapoints)}&length={EIA_PAGE_LENGTH}")
+        response = req.json().get("response", {})
+        page = response.get("data", None)
+        if page is None:
+            break
+        datapoints += page
+        if len(page) < EIA_PAGE_LENGTH or len(datapoints) >= int(
+            response.get("total", len(datapoints))
+        ):
+            break
+    return datapoints
+
+
+def _to_points(
+    zone_key: ZoneKey, datapoints: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
     return [
         {
             "zoneKey": zone_key,
@@ -716,18 +817,59 @@ def _fetch_any(
             "value": float(datapoint["value"]) if datapoint["value"] else None,
             "source": "eia.gov",
         }
-        for datapoint in raw_data["response"]["data"]
+        for datapoint in datapoints
     ]
 
 
-def _fetch_historical(
+def _fetch_any(
     zone_key: ZoneKey,
     url_prefix: str,
+    start_datetime: datetime,
+    end_datetime: datetime,
     session: Session | None = None,
-    target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
-    start, end = None, None
+    return _to_points(
+        zone_key,
+        _fetch_datapoints(url_prefix, start_datetime, end_datetime, session),
+    )
+
+
+def _fetch_any_for_zones(
+    zone_keys: list[ZoneKey],
+    url_format: str,
+    start_datetime: datetime,
+    end_datetime: datetime,
+    session: Session | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict[ZoneKey, list[dict[str, Any]]]:
+    """
+    Fetches the series of several zones with a single (paginated) request
+    filtering on all of their respondents, and splits the rows by respondent.
+    Zones sharing a respondent (e.g. MX-BC and MX-NO) get the same values.
+    """
+    respondents = list(dict.fromkeys(REGIONS[zone_key] for zone_key in zone_keys))
+    # The rows of a period are also sorted by respondent, for stable pages.
+    url_prefix = (
+        url_format.format("&facets[respondent][]=".join(respondents))
+        + "&sort[1][column]=respondent&sort[1][direction]=asc"
+    )
+    datapoints_by_respondent: dict[str, list[dict[str, Any]]] = {
+        respondent: [] for respondent in respondents
+    }
+    for datapoint in _fetch_datapoints(
+        url_prefix, start_datetime, end_datetime, session
+    ):
+        datapoints_by_respondent.setdefault(datapoint["respondent"], []).append(
+            datapoint
+        )
+    return {
+        zone_key: _to_points(zone_key, datapoints_by_respondent[REGIONS[zone_key]])
+        for zone_key in zone_keys
+    }
+
+
+def _historical_window(target_datetime: datetime | None) -> tuple[datetime, datetime]:
     if target_datetime:
         end = target_datetime.astimezone(timezone.utc) + timedelta(hours=1)
         start = end - timedelta(days=1)
@@ -736,34 +878,66 @@ def _fetch_historical(
             minute=0, second=0, microsecond=0
         ) + timedelta(hours=1)
         start = end - timedelta(hours=72)
-
-    return _fetch_any(zone_key, url_prefix, start, end, session, logger)
+    return start, end
 
 
-def _fetch_forecast(
-    zone_key: ZoneKey,
-    url_prefix: str,
-    session: Session | None = None,
-    target_datetime: datetime | None = None,
-    logger: Logger = getLogger(__name__),
-) -> list[dict[str, Any]]:
+def _forecast_window(target_datetime: datetime | None) -> tuple[datetime, datetime]:
     LOOKAHEAD = timedelta(days=15)
 
-    start, end = None, None
     if target_datetime:
         start = target_datetime.astimezone(timezone.utc).replace(
             minute=0, second=0, microsecond=0
         )
-        end = start + LOOKAHEAD
     else:
         start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
-        end = start + LOOKAHEAD
+    return start, start + LOOKAHEAD
+
+
+def _fetch_historical(
+    zone_key: ZoneKey,
+    url_prefix: str,
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> list[dict[str, Any]]:
+    start, end = _historical_window(target_datetime)
+    return _fetch_any(zone_key, url_prefix, start, end, session, logger)
 
+
+def _fetch_historical_many(
+    zones_and_url_prefixes: list[tuple[ZoneKey, str]],
+    session: Session,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> list[list[dict[str, Any]]]:
+    """Fetches the historical values of several series concurrently, see
+    `_fetch_historical`, and returns them in the order of the series."""
+    return fetch_concurrently(
+        lambda zone_and_url_prefix: _fetch_historical(
+            *zone_and_url_prefix,
+            session=session,
+            target_datetime=target_datetime,
+            logger=logger,
+        ),
+        zones_and_url_prefixes,
+        BASE_URL,
+        EIA_MAX_CONCURRENT_REQUESTS,
+    )
+
+
+def _fetch_forecast(
+    zone_key: ZoneKey,
+    url_prefix: str,
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> list[dict[str, Any]]:
+    start, end = _forecast_window(target_datetime)
     return _fetch_any(zone_key, url_prefix, start, end, session, logger)
 
 
 def _parse_hourly_interval(period: str):
-    interval_end_naive = parser.parse(period)
+    interval_end_naive = datetime.strptime(period, EIA_TS_FORMAT)
 
     # NB: the EIA API can respond with time intervals relative to either UTC
     # or local-time.  We request UTC times using the 'frequency=hourly'
@@ -28,6 +28,7 @@ from electricitymap.contrib.lib.models.events import (
 )
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 ELEXON_API_ENDPOINT = "https://data.elexon.co.uk/bmrs/api/v1"
@@ -457,7 +458,7 @@ def fetch_consumption(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict]:
-    session = session or Session()
+    session = session or create_session()
     if target_datetime is None:
         target_datetime = datetime.now(tz=timezone.utc)
     else:
@@ -486,7 +487,7 @@ def fetch_exchange(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ):
-    session = session or Session()
+    session = session or create_session()
     if target_datetime is None:
         target_datetime = datetime.now(tz=timezone.utc)
 
@@ -515,7 +516,7 @@ def fetch_production(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict]:
-    session = session or Session()
+    session = session or create_session()
     if target_datetime is None:
         target_datetime = datetime.now(tz=timezone.utc)
     else:
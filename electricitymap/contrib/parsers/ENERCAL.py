@@ -10,6 +10,7 @@ from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.types import ZoneKey
 
 from .lib.exceptions import ParserException
+from .lib.session import create_session
 
 TZ = ZoneInfo("Pacific/Noumea")
 
@@ -24,7 +25,7 @@ def fetch_production(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list:
-    session = session or Session()
+    session = session or create_session()
 
     if target_datetime and target_datetime.tzinfo is None:
         target_datetime = target_datetime.replace(tzinfo=TZ)
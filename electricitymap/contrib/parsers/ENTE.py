@@ -13,6 +13,7 @@ from electricitymap.contrib.lib.models.event_lists import (
     ProductionBreakdownList,
 )
 from electricitymap.contrib.lib.models.events import ProductionMix
+from electricitymap.contrib.parsers.lib.session import create_session
 
 # This parser gets all real time interconnection flows from the
 # Central American Electrical Interconnection System (SIEPAC).
@@ -46,7 +47,7 @@ def fetch_production(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
-    r = session or Session()
+    r = session or create_session()
     response = r.get(DATA_URL).json()
 
     # Total production data for HN from the ENTE-data is the 57th element in the JSON ('4SISTEMA.GTOT.OSYMGENTOTR.-.MW')
@@ -100,7 +101,7 @@ def fetch_exchange(
     if sorted_zones not in JSON_MAPPING:
         raise NotImplementedError("This exchange is not implemented.")
 
-    s = session or Session()
+    s = session or create_session()
 
     raw_data = s.get(DATA_URL).json()
     flow = round(extract_exchange(raw_data, sorted_zones), 1)
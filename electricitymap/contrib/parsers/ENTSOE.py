@@ -15,18 +15,22 @@ Link to the API documentation:
 https://documenter.getpostman.com/view/7009892/2s93JtP3F6
 """
 
-from collections.abc import Generator, Iterable
+from collections.abc import Callable, Generator, Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from functools import cache, lru_cache
+from io import BytesIO
 from itertools import chain, groupby, pairwise
 from logging import Logger, getLogger
 from operator import attrgetter, itemgetter
+from os import environ
 from re import fullmatch
-from typing import Any, Literal, NamedTuple
+from typing import Any, Literal, NamedTuple, get_args
 
+import numpy as np
 from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from requests import Response, Session
 
 from electricitymap.contrib.config import ZoneKey
@@ -40,22 +44,25 @@ from electricitymap.contrib.lib.models.event_lists import (
 )
 from electricitymap.contrib.lib.models.events import (
     EventSourceType,
-    ProductionMix,
     ScheduledExchange,
-    StorageMix,
 )
+from electricitymap.contrib.parsers.lib.concurrency import fetch_concurrently
 from electricitymap.contrib.parsers.lib.config import (
     ProductionModes,
     StorageModes,
     refetch_frequency,
 )
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.parsers.lib.utils import get_token
 from electricitymap.contrib.types import MarketAgreementType
 
 SOURCE = "entsoe.eu"
 
 ENTSOE_URL = "https://entsoe-proxy-jfnx5klx2a-ew.a.run.app"
+# ENTSO-E allows 400 requests per minute per token: requests that fan out over
+# domain pairs or aggregated zones are sent concurrently, up to this many at once.
+ENTSOE_MAX_CONCURRENT_REQUESTS = 4
 
 DEFAULT_LOOKBACK_HOURS_REALTIME = timedelta(hours=72)
 DEFAULT_TARGET_HOURS_REALTIME = (-DEFAULT_LOOKBACK_HOURS_REALTIME, timedelta(hours=0))
@@ -74,6 +81,24 @@ EXCHANGE_CAPACITY_TARGET_DAYS_FORECAST_WEEK_AND_MONTH_AHEAD = (
 STRAINER_TIMESERIES = SoupStrainer("timeseries")
 STRAINER_TEXT = SoupStrainer("text")
 
+# The decoders of the time series of ENTSOE documents: "lxml" streams the
+# documents with lxml, "soup" parses them whole with BeautifulSoup.
+XmlDecoder = Literal["lxml", "soup"]
+XML_DECODERS: tuple[XmlDecoder, ...] = get_args(XmlDecoder)
+
+
+def _xml_decoder_from_environment() -> XmlDecoder:
+    """Returns the decoder selected by the ENTSOE_XML_DECODER environment variable, lxml by default."""
+    decoder = environ.get("ENTSOE_XML_DECODER", "lxml")
+    if decoder not in XML_DECODERS:
+        raise ValueError(
+            f"Invalid ENTSOE_XML_DECODER {decoder!r}, valid decoders are {', '.join(XML_DECODERS)}"
+        )
+    return decoder
+
+
+XML_DECODER: XmlDecoder = _xml_decoder_from_environment()
+
 
 # TODO: Switch this to a string enum when we migrate to Python 3.11
 class EntsoeTypeEnum(str, Enum):
@@ -584,18 +609,16 @@ def parse_scalar(
 ) -> Generator[tuple[datetime, datetime, float], None, None]:
     if not xml_text:
         return None
-    soup = BeautifulSoup(xml_text, "html.parser", parse_only=STRAINER_TIMESERIES)
-    # Get all points
-    for timeseries in soup.find_all("timeseries"):
+    for header, point in iter_timeseries_points(xml_text, "quantity"):
         if (
             only_inBiddingZone_Domain
-            and not timeseries.find("inBiddingZone_Domain.mRID".lower())
+            and "inBiddingZone_Domain.mRID".lower() not in header
         ) or (
             only_outBiddingZone_Domain
-            and not timeseries.find("outBiddingZone_Domain.mRID".lower())
+            and "outBiddingZone_Domain.mRID".lower() not in header
         ):
             continue
-        yield from _get_datetime_value_from_timeseries(timeseries, "quantity")
+        yield point
 
 
 def parse_production(
@@ -608,77 +631,72 @@ def parse_production(
     source_type = EventSourceType.forecasted if forecasted else EventSourceType.measured
     if not xml:
         return production_breakdowns
-    soup = BeautifulSoup(xml, "html.parser", parse_only=STRAINER_TIMESERIES)
-    list_of_raw_data = _get_raw_production_events(soup)
+    list_of_raw_data = _get_raw_production_events(xml)
 
     grouped_data = _group_production_data_by_datetime(list_of_raw_data)
 
     expected_length = _get_expected_production_group_length(grouped_data)
 
-    # Loop over the grouped data and create production and storage mixes for each datetime.
-    for datetimes, values in grouped_data.items():
-        production, storage = _create_production_and_storage_mixes(
+    # Incomplete datapoints are considered invalid and are skipped in order to not crash the parser.
+    complete_data = {
+        datetimes: values
+        for datetimes, values in grouped_data.items()
+        if _has_expected_production_length(
             zoneKey, datetimes.start, values, expected_length, logger
         )
-        # If production and storage are None, the datapoint is considered invalid and is skipped
-        # in order to not crash the parser.
-        if production is None and storage is None:
-            continue
-
-        production_breakdowns.append(
-            zoneKey=zoneKey,
-            datetime=datetimes.start,
-            end_datetime=datetimes.end,
-            source=SOURCE,
-            sourceType=source_type,
-            production=production,
-            storage=storage,
-        )
+    }
+    production, storage = _production_and_storage_columns(list(complete_data.values()))
+    production_breakdowns.append_many(
+        zoneKey,
+        [datetimes.start for datetimes in complete_data],
+        SOURCE,
+        end_datetimes=[datetimes.end for datetimes in complete_data],
+        production=production,
+        storage=storage,
+        sourceType=source_type,
+        # Only the modes reported for a datetime are set in its mixes.
+        set_missing=False,
+        correct_negative_with_zero=True,
+    )
 
     return production_breakdowns
 
 
-def _get_raw_production_events(soup: BeautifulSoup) -> list[dict[str, Any]]:
+def _get_raw_production_events(xml: str | bytes) -> list[dict[str, Any]]:
     """
-    Extracts the raw production events from the soup object and returns a list of dictionaries containing the raw production events.
+    Extracts the raw production events from the XML document and returns a list of dictionaries containing the raw production events.
     """
     list_of_raw_data = []
     # Each timeserie is dedicated to a different fuel type.
-    for timeseries in soup.find_all("timeseries"):
-        # The fuel code is the ENTSOE code for the fuel type.
-        fuel_code = str(timeseries.find("mktpsrtype").find("psrtype").contents[0])
-        points = _get_datetime_value_from_timeseries(
-            timeseries, "quantity", production_parsing=True
+    for header, (dt, dt_end, quantity) in iter_timeseries_points(
+        xml, "quantity", production_parsing=True
+    ):
+        # Appends the raw data to a master list so it later can be sorted and grouped by datetime.
+        list_of_raw_data.append(
+            {
+                "datetime": dt,
+                "end_datetime": dt_end,
+                # The fuel code is the ENTSOE code for the fuel type.
+                "fuel_code": header["psrtype"],
+                "quantity": quantity,
+            }
         )
 
-        # Loop over all the points in the timeseries.
-        for dt, dt_end, quantity in points:
-            # Appends the raw data to a master list so it later can be sorted and grouped by datetime.
-            list_of_raw_data.append(
-                {
-                    "datetime": dt,
-                    "end_datetime": dt_end,
-                    "fuel_code": fuel_code,
-                    "quantity": quantity,
-                }
-            )
-
     return list_of_raw_data
 
 
-def _create_production_and_storage_mixes(
+def _has_expected_production_length(
     zoneKey: ZoneKey,
     dt: datetime,
     values: list[dict[str, Any]],
     expected_length: int,
     logger: Logger,
-) -> tuple[ProductionMix, StorageMix] | tuple[None, None]:
+) -> bool:
     """
-    Creates a populated ProductionMix and StorageMix object from a list of production values and ensures that the expected length is met.
-    If the expected length is not met, the datapoint is discarded. And the function returns (None, None).
+    Checks that the number of production values of a datapoint has the expected length.
+    If the expected length is not met, the datapoint should be discarded.
     """
     value_length = len(values)
-    # Checks that the number of values have the expected length and skips the datapoint if not.
     if value_length < expected_length:
         if zoneKey == "BE" and value_length == expected_length - 1:
             logger.warning(
@@ -688,20 +706,43 @@ def _create_production_and_storage_mixes(
             logger.warning(
                 f"Expected {expected_length} production values for {dt}, received {value_length} instead. Discarding datapoint..."
             )
-            return None, None
-    production = ProductionMix()
-    storage = StorageMix()
-    for production_mode in values:
-        _datetime, _end_datetime, fuel_code, quantity = production_mode.values()
-        fuel_em_type = ENTSOE_PARAMETER_BY_GROUP[fuel_code]
-        if fuel_code in ENTSOE_STORAGE_PARAMETERS:
-            storage.add_value(fuel_em_type, -quantity)
-        else:
-            production.add_value(
-                fuel_em_type, quantity, correct_negative_with_zero=True
-            )
+            return False
+    return True
 
-    return production, storage
+
+def _production_and_storage_columns(
+    grouped_values: list[list[dict[str, Any]]],
+) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+    """
+    Returns the production and storage values of each mode as a (datetimes, fuel codes) array,
+    the values of the fuel codes grouped under a mode being summed by `ProductionBreakdownList.append_many`.
+    Storage values are negated, and modes not reported for a datetime are padded with NaN.
+    """
+    production: dict[str, list[list[float]]] = {}
+    storage: dict[str, list[list[float]]] = {}
+    for row, values in enumerate(grouped_values):
+        for value in values:
+            fuel_code = value["fuel_code"]
+            fuel_em_type = ENTSOE_PARAMETER_BY_GROUP[fuel_code]
+            if fuel_code in ENTSOE_STORAGE_PARAMETERS:
+                storage.setdefault(fuel_em_type, [[] for _ in grouped_values])[
+                    row
+                ].append(-value["quantity"])
+            else:
+                production.setdefault(fuel_em_type, [[] for _ in grouped_values])[
+                    row
+                ].append(value["quantity"])
+
+    def to_array(rows: list[list[float]]) -> np.ndarray:
+        width = max(len(row) for row in rows)
+        return np.array(
+            [row + [np.nan] * (width - len(row)) for row in rows], dtype=float
+        )
+
+    return (
+        {mode: to_array(rows) for mode, rows in production.items()},
+        {mode: to_array(rows) for mode, rows in storage.items()},
+    )
 
 
 def _get_expected_production_group_length(
@@ -861,6 +902,16 @@ def _get_datetime_value_from_timeseries(
         periods=periods_generator,
     )
 
+    yield from _iter_datetime_points(ts_object)
+
+
+def _iter_datetime_points(
+    ts_object: TimeSeries,
+) -> Generator[DateTimePoint, None, None]:
+    """
+    Converts the positioned points of a TimeSeries to DateTimePoints,
+    according to its curve type.
+    """
     if ts_object.curve_type == "A01":
         for period in ts_object.periods:
             for point in period.points:
@@ -908,27 +959,179 @@ def _reverse_A3_curve_compression_for_period(
         yield DateTimePoint(dt, dt_end, last_point.value)
 
 
+def _soup_timeseries_header(element: Any, header: dict[str, str]) -> dict[str, str]:
+    """
+    Collects the text of the leaf elements of a <TimeSeries> outside its periods,
+    keyed by lowercase tag name.
+    """
+    for child in element.find_all(recursive=False):
+        if child.name == "period":
+            continue
+        if child.find() is None:
+            header[child.name] = child.get_text()
+        else:
+            _soup_timeseries_header(child, header)
+    return header
+
+
+def _iter_timeseries_points_soup(
+    xml_text: str | bytes,
+    target_str: str,
+    production_parsing: bool,
+) -> Generator[tuple[dict[str, str], DateTimePoint], None, None]:
+    soup = BeautifulSoup(xml_text, "html.parser", parse_only=STRAINER_TIMESERIES)
+    for timeseries in soup.find_all("timeseries"):
+        header = _soup_timeseries_header(timeseries, {})
+        for point in _get_datetime_value_from_timeseries(
+            timeseries, target_str, production_parsing
+        ):
+            yield header, point
+
+
+@cache
+def _lowercase_local_name(tag: str) -> str:
+    """Strips the namespace of an lxml tag, e.g. '{urn:...}TimeSeries' -> 'timeseries'."""
+    return tag.rpartition("}")[2].lower()
+
+
+def _lxml_timeseries_header(timeseries: etree._Element) -> dict[str, str]:
+    """
+    Collects the text of the leaf elements of a <TimeSeries> outside its periods,
+    keyed by lowercase tag name like the BeautifulSoup decoder.
+    """
+    header = {}
+    for child in timeseries.iterchildren(etree.Element):
+        if _lowercase_local_name(child.tag) == "period":
+            continue
+        for leaf in child.iter(etree.Element):
+            if len(leaf) == 0:
+                header[_lowercase_local_name(leaf.tag)] = leaf.text or ""
+    return header
+
+
+def _release(element: etree._Element) -> None:
+    """Frees a parsed element, and the elements parsed before it, from the tree."""
+    element.clear()
+    while element.getprevious() is not None:
+        del element.getparent()[0]
+
+
+def _iter_timeseries_points_lxml(
+    xml_text: str | bytes,
+    target_str: str,
+    production_parsing: bool,
+) -> Generator[tuple[dict[str, str], DateTimePoint], None, None]:
+    if isinstance(xml_text, str):
+        xml_text = xml_text.encode()
+    timeseries = None
+    header: dict[str, str] = {}
+    is_consumption = False
+    # Only complete <Period> and <TimeSeries> elements are handled. Each period is
+    # converted and released once parsed, so memory does not grow with the
+    # document.
+    for _, element in etree.iterparse(
+        BytesIO(xml_text),
+        events=("end",),
+        tag=("{*}Period", "{*}TimeSeries"),
+        recover=True,
+        resolve_entities=False,
+        huge_tree=True,
+    ):
+        if _lowercase_local_name(element.tag) == "timeseries":
+            timeseries = None
+            _release(element)
+            continue
+        if element.getparent() is not timeseries:
+            timeseries = element.getparent()
+            # The header elements of a time series precede its periods.
+            header = _lxml_timeseries_header(timeseries)
+            is_consumption = production_parsing and (
+                "inBiddingZone_Domain.mRID".lower() not in header
+            )
+        namespace = element.tag[: element.tag.find("}") + 1]
+        points = []
+        for point in element.iterchildren(namespace + "Point"):
+            value = float(point.findtext(namespace + target_str))
+            points.append(
+                IntPoint(
+                    position=int(point.findtext(namespace + "position")),
+                    value=-value if is_consumption else value,
+                )
+            )
+        period = Period(
+            datetime_start=datetime.fromisoformat(
+                zulu_to_utc(element.findtext(f".//{namespace}start"))
+            ),
+            end_datetime=datetime.fromisoformat(
+                zulu_to_utc(element.findtext(f".//{namespace}end"))
+            ),
+            resolution=_resolution_to_timedelta(
+                element.findtext(namespace + "resolution")
+            ),
+            points=points,
+        )
+        _release(element)
+        for point in _iter_datetime_points(
+            TimeSeries(curve_type=header["curvetype"], periods=(period,))
+        ):
+            yield header, point
+
+
+def iter_timeseries_points(
+    xml_text: str | bytes,
+    target_str: str,
+    production_parsing: bool = False,
+) -> Generator[tuple[dict[str, str], DateTimePoint], None, None]:
+    """
+    Extracts the DateTimePoints of every <TimeSeries> of an ENTSOE document.
+
+    Each point is yielded along with the header of its time series: the text of
+    the time series' fields outside of its periods, keyed by lowercase tag name
+    (e.g. "curvetype", "psrtype", "currency_unit.name").
+
+    The document is decoded with the decoder selected by `XML_DECODER`.
+    """
+    if not xml_text:
+        return
+    if XML_DECODER == "soup":
+        yield from _iter_timeseries_points_soup(
+            xml_text, target_str, production_parsing
+        )
+    else:
+        yield from _iter_timeseries_points_lxml(
+            xml_text, target_str, production_parsing
+        )
+
+
+def _point_columns(
+    points: Iterable[tuple[datetime, datetime, float]],
+) -> tuple[list[datetime], list[datetime], np.ndarray]:
+    """Splits points into their datetimes, end datetimes and values, for `append_many`."""
+    datetimes: list[datetime] = []
+    end_datetimes: list[datetime] = []
+    values: list[float] = []
+    for dt, dt_end, value in points:
+        datetimes.append(dt)
+        end_datetimes.append(dt_end)
+        values.append(value)
+    return datetimes, end_datetimes, np.array(values, dtype=float)
+
+
 def parse_exchange(
     xml_text: str,
     is_import: bool,
     sorted_zone_keys: ZoneKey,
     logger: Logger,
 ) -> ExchangeList:
-    exchange_list = ExchangeList(logger)
-    points = parse_scalar(xml_text)
-    for dt, dt_end, quantity in points:
-        if is_import:
-            quantity *= -1
-        # Find out whether or not we should update the net production
-        exchange_list.append(
-            zoneKey=sorted_zone_keys,
-            datetime=dt,
-            end_datetime=dt_end,
-            source=SOURCE,
-            netFlow=quantity,
-        )
-
-    return exchange_list
+    datetimes, end_datetimes, quantities = _point_columns(parse_scalar(xml_text))
+    return ExchangeList.from_arrays(
+        logger,
+        sorted_zone_keys,
+        datetimes,
+        SOURCE,
+        -quantities if is_import else quantities,
+        end_datetimes=end_datetimes,
+    )
 
 
 def parse_exchange_forecast(
@@ -939,33 +1142,18 @@ def parse_exchange_forecast(
     market_type: EntsoeTypeEnum,
     source_type: EventSourceType = EventSourceType.forecasted,
 ) -> ExchangeList:
-    exchange_list = ExchangeList(logger)
-
-    soup = BeautifulSoup(xml_text, "html.parser", parse_only=STRAINER_TIMESERIES)
-    # Get all points
-    for timeseries in soup.find_all("timeseries"):
-        marketAgreementType = timeseries.find("contract_marketagreement.type").contents[
-            0
-        ]
-        if marketAgreementType and marketAgreementType != market_type:
-            continue
-
-        points = _get_datetime_value_from_timeseries(timeseries, "quantity")
-
-        for dt, dt_end, quantity in points:
-            if is_import:
-                quantity *= -1
-            # Find out whether or not we should update the net production
-            exchange_list.append(
-                zoneKey=sorted_zone_keys,
-                datetime=dt,
-                end_datetime=dt_end,
-                source=SOURCE,
-                netFlow=quantity,
-                sourceType=source_type,
-            )
-
-    return exchange_list
+    datetimes, end_datetimes, quantities = _point_columns(
+        _parse_scheduled_exchange_points(xml_text, market_type)
+    )
+    return ExchangeList.from_arrays(
+        logger,
+        sorted_zone_keys,
+        datetimes,
+        SOURCE,
+        -quantities if is_import else quantities,
+        end_datetimes=end_datetimes,
+        sourceType=source_type,
+    )
 
 
 def _parse_scheduled_exchange_points(
@@ -979,14 +1167,11 @@ def _parse_scheduled_exchange_points(
     unsigned (no import negation) so callers can retain both directional flows
     separately instead of netting them into a single value.
     """
-    soup = BeautifulSoup(xml_text, "html.parser", parse_only=STRAINER_TIMESERIES)
-    for timeseries in soup.find_all("timeseries"):
-        marketAgreementType = timeseries.find("contract_marketagreement.type").contents[
-            0
-        ]
+    for header, point in iter_timeseries_points(xml_text, "quantity"):
+        marketAgreementType = header["contract_marketagreement.type"]
         if marketAgreementType and marketAgreementType != market_type:
             continue
-        yield from _get_datetime_value_from_timeseries(timeseries, "quantity")
+        yield point
 
 
 def _merge_forecast_transfer_capacities(
@@ -1055,32 +1240,28 @@ def parse_forecast_transfer_capacity(
         direction
     """
     try:
-        soup = BeautifulSoup(xml_text, "html.parser", parse_only=STRAINER_TIMESERIES)
         forecasts = ForecastTransferCapacityList(logger)
-        for timeseries in soup.find_all("timeseries"):
-            for dt, dt_end, quantity in _get_datetime_value_from_timeseries(
-                timeseries, "quantity"
-            ):
-                if direction == "export":
-                    forecasts.append(
-                        zoneKey=sorted_zone_keys,
-                        datetime=dt,
-                        end_datetime=dt_end,
-                        source=SOURCE,
-                        capacityExport=quantity,
-                        capacityImport=None,
-                        marketAgreementType=market_agreement_type,
-                    )
-                else:
-                    forecasts.append(
-                        zoneKey=sorted_zone_keys,
-                        datetime=dt,
-                        end_datetime=dt_end,
-                        source=SOURCE,
-                        capacityExport=None,
-                        capacityImport=quantity,
-                        marketAgreementType=market_agreement_type,
-                    )
+        for _, (dt, dt_end, quantity) in iter_timeseries_points(xml_text, "quantity"):
+            if direction == "export":
+                forecasts.append(
+                    zoneKey=sorted_zone_keys,
+                    datetime=dt,
+                    end_datetime=dt_end,
+                    source=SOURCE,
+                    capacityExport=quantity,
+                    capacityImport=None,
+                    marketAgreementType=market_agreement_type,
+                )
+            else:
+                forecasts.append(
+                    zoneKey=sorted_zone_keys,
+                    datetime=dt,
+                    end_datetime=dt_end,
+                    source=SOURCE,
+                    capacityExport=None,
+                    capacityImport=quantity,
+                    marketAgreementType=market_agreement_type,
+                )
         return forecasts
     except Exception as e:
         raise ParserException(
@@ -1097,24 +1278,148 @@ def parse_prices(
 ) -> PriceList:
     if not xml_text:
         return PriceList(logger)
-    soup = BeautifulSoup(xml_text, "html.parser", parse_only=STRAINER_TIMESERIES)
+    points_by_currency: dict[str, list[DateTimePoint]] = {}
+    for header, point in iter_timeseries_points(xml_text, "price.amount"):
+        points_by_currency.setdefault(header["currency_unit.name"], []).append(point)
     prices = PriceList(logger)
-    for timeseries in soup.find_all("timeseries"):
-        currency = str(timeseries.find("currency_unit.name").contents[0])
-        points = _get_datetime_value_from_timeseries(timeseries, "price.amount")
-        for dt, dt_end, value in points:
-            prices.append(
-                zoneKey=zoneKey,
-                datetime=dt,
-                end_datetime=dt_end,
-                price=value,
-                source="entsoe.eu",
-                currency=currency,
-            )
+    for currency, points in points_by_currency.items():
+        datetimes, end_datetimes, values = _point_columns(points)
+        prices.append_many(
+            zoneKey,
+            datetimes,
+            "entsoe.eu",
+            values,
+            currency,
+            end_datetimes=end_datetimes,
+        )
 
     return prices
 
 
+def _query_domain(
+    query: Callable[[str], str | None],
+    domain: str,
+    data_label: str,
+    queried_zone_key: ZoneKey,
+    zone_key: ZoneKey,
+) -> str:
+    """Query `domain`, raising a ParserException naming `queried_zone_key` on failure."""
+    try:
+        raw_data = query(domain)
+    except Exception as e:
+        raise ParserException(
+            parser="ENTSOE.py",
+            message=f"Failed to fetch {data_label} for {queried_zone_key}",
+            zone_key=zone_key,
+        ) from e
+    if raw_data is None:
+        raise ParserException(
+            parser="ENTSOE.py",
+            message=f"No {data_label} data found for {queried_zone_key}",
+            zone_key=zone_key,
+        )
+    return raw_data
+
+
+def _query_zone_aggregate(
+    query: Callable[[str], str | None],
+    zone_key: ZoneKey,
+    data_label: str,
+) -> list[tuple[ZoneKey, str]]:
+    """Query the domain of each zone aggregated into `zone_key`.
+
+    Zones listed in `ZONE_KEY_AGGREGATES` are queried concurrently, other zones
+    are queried on their own. Returns `(zone_key, raw_data)` tuples in the order
+    of the aggregate, and raises a ParserException naming the first zone that
+    could not be fetched.
+    """
+
+    def fetch(_zone_key: ZoneKey) -> tuple[ZoneKey, str]:
+        domain = ENTSOE_DOMAIN_MAPPINGS[_zone_key]
+        return _zone_key, _query_domain(query, domain, data_label, _zone_key, zone_key)
+
+    return fetch_concurrently(
+        fetch,
+        ZONE_KEY_AGGREGATES.get(zone_key, [zone_key]),
+        ENTSOE_URL,
+        ENTSOE_MAX_CONCURRENT_REQUESTS,
+    )
+
+
+def _query_domains_for_zones(
+    query: Callable[[str], str | None],
+    zone_key_to_domain: dict[ZoneKey, str],
+    data_label: str,
+) -> dict[str, str]:
+    """Query each distinct domain of `zone_key_to_domain` once, concurrently.
+
+    Returns the raw data by domain, and raises a ParserException naming the
+    first zone whose domain could not be fetched.
+    """
+    domain_to_zone_key = {
+        domain: zone_key for zone_key, domain in reversed(zone_key_to_domain.items())
+    }
+
+    def fetch(domain: str) -> tuple[str, str]:
+        zone_key = domain_to_zone_key[domain]
+        return domain, _query_domain(query, domain, data_label, zone_key, zone_key)
+
+    return dict(
+        fetch_concurrently(
+            fetch,
+            list(dict.fromkeys(zone_key_to_domain.values())),
+            ENTSOE_URL,
+            ENTSOE_MAX_CONCURRENT_REQUESTS,
+        )
+    )
+
+
+def _query_directed_domain_pairs(
+    query: Callable[[str, str, Session, datetime | None], str | None],
+    domain_pairs: list[list[str]],
+    sorted_zone_keys: ZoneKey,
+    session: Session,
+    target_datetime: datetime | None,
+) -> list[tuple[bool, str]]:
+    """Query both directions of each domain pair concurrently.
+
+    Returns `(is_import, xml_text)` tuples, the import direction of each pair
+    first, and raises a ParserException naming the first pair and direction
+    that could not be fetched.
+    """
+    directed_pairs = [
+        (is_import, *(domain_pair if is_import else domain_pair[::-1]))
+        for domain_pair in domain_pairs
+        for is_import in (True, False)
+    ]
+
+    def fetch(directed_pair: tuple[bool, str, str]) -> tuple[bool, str]:
+        is_import, domain1, domain2 = directed_pair
+        try:
+            xml = query(domain1, domain2, session, target_datetime)
+        except Exception as e:
+            raise ParserException(
+                parser="ENTSOE.py",
+                message=(
+                    f"Failed to query "
+                    f"{'import' if is_import else 'export'} "
+                    f"for {domain1} -> {domain2}"
+                ),
+                zone_key=sorted_zone_keys,
+            ) from e
+        if xml is None:
+            raise ParserException(
+                parser="ENTSOE.py",
+                message=f"No exchange data found for {domain1} -> {domain2}",
+                zone_key=sorted_zone_keys,
+            )
+        return is_import, xml
+
+    return fetch_concurrently(
+        fetch, directed_pairs, ENTSOE_URL, ENTSOE_MAX_CONCURRENT_REQUESTS
+    )
+
+
 @refetch_frequency(DEFAULT_LOOKBACK_HOURS_REALTIME)
 def fetch_production(
     zone_key: ZoneKey,
@@ -1127,26 +1432,15 @@ def fetch_production(
     Removes any values that are in the future or don't have a datetime associated with them.
     """
     if not session:
-        session = Session()
+        session = create_session()
     non_aggregated_data: list[ProductionBreakdownList] = []
-    for _zone_key in ZONE_KEY_AGGREGATES.get(zone_key, [zone_key]):
-        domain = ENTSOE_DOMAIN_MAPPINGS[_zone_key]
-        try:
-            raw_production = query_production(
-                domain, session, target_datetime=target_datetime
-            )
-        except Exception as e:
-            raise ParserException(
-                parser="ENTSOE.py",
-                message=f"Failed to fetch production for {_zone_key}",
-                zone_key=zone_key,
-            ) from e
-        if raw_production is None:
-            raise ParserException(
-                parser="ENTSOE.py",
-                message=f"No production data found for {_zone_key}",
-                zone_key=zone_key,
-            )
+    for _zone_key, raw_production in _query_zone_aggregate(
+        lambda domain: query_production(
+            domain, session, target_datetime=target_datetime
+        ),
+        zone_key,
+        "production",
+    ):
         # Aggregated data are regrouped unde the same zone key.
         non_aggregated_data.append(parse_production(raw_production, logger, zone_key))
 
@@ -1155,6 +1449,52 @@ def fetch_production(
     ).to_list()
 
 
+@refetch_frequency(DEFAULT_LOOKBACK_HOURS_REALTIME)
+def fetch_production_for_zones(
+    zone_keys: list[ZoneKey],
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict[ZoneKey, list]:
+    """
+    Bulk counterpart of `fetch_production`.
+    The API takes a single domain per request: the zones shared by several
+    requested aggregates are only queried once.
+    """
+    if not session:
+        session = create_session()
+    aggregates = {
+        zone_key: ZONE_KEY_AGGREGATES.get(zone_key, [zone_key])
+        for zone_key in zone_keys
+    }
+    raw_productions = _query_domains_for_zones(
+        lambda domain: query_production(
+            domain, session, target_datetime=target_datetime
+        ),
+        {
+            _zone_key: ENTSOE_DOMAIN_MAPPINGS[_zone_key]
+            for aggregate in aggregates.values()
+            for _zone_key in aggregate
+        },
+        "production",
+    )
+
+    return {
+        zone_key: ProductionBreakdownList.merge_production_breakdowns(
+            [
+                parse_production(
+                    raw_productions[ENTSOE_DOMAIN_MAPPINGS[_zone_key]],
+                    logger,
+                    zone_key,
+                )
+                for _zone_key in aggregate
+            ],
+            logger,
+        ).to_list()
+        for zone_key, aggregate in aggregates.items()
+    }
+
+
 def _resolve_exchange_domain_pairs(
     zone_key1: ZoneKey,
     zone_key2: ZoneKey,
@@ -1184,32 +1524,13 @@ def _fetch_a09_xml_for_pairs(
     pair. Returns a list of `(is_import, xml_text)` tuples for callers to
     parse however they need (filter by market_type, etc.).
     """
-    results: list[tuple[bool, str]] = []
-    for domain_pair in domain_pairs:
-        for is_import in (True, False):
-            domain1, domain2 = domain_pair if is_import else domain_pair[::-1]
-            try:
-                xml = query_scheduled_exchanges(
-                    domain1, domain2, session, target_datetime
-                )
-            except Exception as e:
-                raise ParserException(
-                    parser="ENTSOE.py",
-                    message=(
-                        f"Failed to query "
-                        f"{'import' if is_import else 'export'} "
-                        f"for {domain1} -> {domain2}"
-                    ),
-                    zone_key=sorted_zone_keys,
-                ) from e
-            if xml is None:
-                raise ParserException(
-                    parser="ENTSOE.py",
-                    message=f"No exchange data found for {domain1} -> {domain2}",
-                    zone_key=sorted_zone_keys,
-                )
-            results.append((is_import, xml))
-    return results
+    return _query_directed_domain_pairs(
+        query_scheduled_exchanges,
+        domain_pairs,
+        sorted_zone_keys,
+        session,
+        target_datetime,
+    )
 
 
 def get_physical_flows(
@@ -1227,42 +1548,22 @@ def get_physical_flows(
     removed by the underlying parser.
     """
     if not session:
-        session = Session()
+        session = create_session()
     sorted_zone_keys = ZoneKey("->".join(sorted([zone_key1, zone_key2])))
     domain_pairs = _resolve_exchange_domain_pairs(zone_key1, zone_key2)
 
     raw_exchange_lists: list[ExchangeList] = []
-    for domain_pair in domain_pairs:
-        for is_import in (True, False):
-            domain1, domain2 = domain_pair if is_import else domain_pair[::-1]
-            try:
-                raw_exchange = query_exchange(
-                    domain1, domain2, session, target_datetime
-                )
-            except Exception as e:
-                raise ParserException(
-                    parser="ENTSOE.py",
-                    message=(
-                        f"Failed to query "
-                        f"{'import' if is_import else 'export'} "
-                        f"for {domain1} -> {domain2}"
-                    ),
-                    zone_key=sorted_zone_keys,
-                ) from e
-            if raw_exchange is None:
-                raise ParserException(
-                    parser="ENTSOE.py",
-                    message=f"No exchange data found for {domain1} -> {domain2}",
-                    zone_key=sorted_zone_keys,
-                )
-            raw_exchange_lists.append(
-                parse_exchange(
-                    raw_exchange,
-                    is_import=is_import,
-                    sorted_zone_keys=sorted_zone_keys,
-                    logger=logger,
-                )
+    for is_import, raw_exchange in _query_directed_domain_pairs(
+        query_exchange, domain_pairs, sorted_zone_keys, session, target_datetime
+    ):
+        raw_exchange_lists.append(
+            parse_exchange(
+                raw_exchange,
+                is_import=is_import,
+                sorted_zone_keys=sorted_zone_keys,
+                logger=logger,
             )
+        )
     return ExchangeList.merge_exchanges(raw_exchange_lists, logger)
 
 
@@ -1285,7 +1586,7 @@ def get_raw_exchange_forecast(
     Events are tagged `sourceType=forecasted`.
     """
     if not session:
-        session = Session()
+        session = create_session()
     sorted_zone_keys = ZoneKey("->".join(sorted([zone_key1, zone_key2])))
     domain_pairs = _resolve_exchange_domain_pairs(zone_key1, zone_key2)
     xml_pairs = _fetch_a09_xml_for_pairs(
@@ -1383,7 +1684,7 @@ def _get_scheduled_exchanges(
     across domain pairs within each direction (for aggregate borders).
     """
     if not session:
-        session = Session()
+        session = create_session()
     sorted_zone_keys = ZoneKey("->".join(sorted([zone_key1, zone_key2])))
     domain_pairs = _resolve_exchange_domain_pairs(zone_key1, zone_key2)
     xml_pairs = _fetch_a09_xml_for_pairs(
@@ -1484,7 +1785,7 @@ def fetch_price(
 ) -> list:
     """Gets day-ahead price for specified zone."""
     if not session:
-        session = Session()
+        session = create_session()
 
     domain = ENTSOE_PRICE_DOMAIN_MAPPINGS[zone_key]
     try:
@@ -1504,6 +1805,33 @@ def fetch_price(
     return parse_prices(raw_price_data, zone_key, logger).to_list()
 
 
+@refetch_frequency(DEFAULT_LOOKBACK_HOURS_REALTIME)
+def fetch_price_for_zones(
+    zone_keys: list[ZoneKey],
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict[ZoneKey, list]:
+    """
+    Bulk counterpart of `fetch_price`.
+    Zones sharing a bidding zone (e.g. DE and DE-LU) are only queried once.
+    """
+    if not session:
+        session = create_session()
+    zone_key_to_domain = {
+        zone_key: ENTSOE_PRICE_DOMAIN_MAPPINGS[zone_key] for zone_key in zone_keys
+    }
+    raw_prices = _query_domains_for_zones(
+        lambda domain: query_price(domain, session, target_datetime=target_datetime),
+        zone_key_to_domain,
+        "price",
+    )
+    return {
+        zone_key: parse_prices(raw_prices[domain], zone_key, logger).to_list()
+        for zone_key, domain in zone_key_to_domain.items()
+    }
+
+
 # ------------------- #
 #  Generation
 # ------------------- #
@@ -1517,27 +1845,16 @@ def fetch_generation_forecast(
     logger: Logger = getLogger(__name__),
 ) -> list:
     """Gets generation forecast for specified zone."""
-    session = session or Session()
+    session = session or create_session()
     non_aggregated_data: list[TotalProductionList] = []
-    for _zone_key in ZONE_KEY_AGGREGATES.get(zone_key, [zone_key]):
+    for _zone_key, raw_generation_forecast in _query_zone_aggregate(
+        lambda domain: query_generation_forecast(
+            domain, session, target_datetime=target_datetime
+        ),
+        zone_key,
+        "generation forecast",
+    ):
         generation_list = TotalProductionList(logger)
-        domain = ENTSOE_DOMAIN_MAPPINGS[_zone_key]
-        try:
-            raw_generation_forecast = query_generation_forecast(
-                domain, session, target_datetime=target_datetime
-            )
-        except Exception as e:
-            raise ParserException(
-                parser="ENTSOE.py",
-                message=f"Failed to fetch generation forecast for {_zone_key}",
-                zone_key=zone_key,
-            ) from e
-        if raw_generation_forecast is None:
-            raise ParserException(
-                parser="ENTSOE.py",
-                message=f"No generation forecast data found for {_zone_key}",
-                zone_key=zone_key,
-            )
         parsed = parse_scalar(
             raw_generation_forecast,
             only_inBiddingZone_Domain=True,
@@ -1548,15 +1865,15 @@ def fetch_generation_forecast(
                 message=f"No generation forecast data found for {_zone_key}",
                 zone_key=zone_key,
             )
-        for dt, dt_end, value in parsed:
-            generation_list.append(
-                zoneKey=zone_key,
-                datetime=dt,
-                end_datetime=dt_end,
-                source=SOURCE,
-                value=value,
-                sourceType=EventSourceType.forecasted,
-            )
+        datetimes, end_datetimes, values = _point_columns(parsed)
+        generation_list.append_many(
+            zone_key,
+            datetimes,
+            SOURCE,
+            values,
+            end_datetimes=end_datetimes,
+            sourceType=EventSourceType.forecasted,
+        )
         # Aggregated data are regrouped under the same zone key.
         non_aggregated_data.append(generation_list)
 
@@ -1578,26 +1895,15 @@ def fetch_consumption(
     logger: Logger = getLogger(__name__),
 ):
     """Gets consumption for a specified zone."""
-    session = session or Session()
+    session = session or create_session()
     non_aggregated_data: list[TotalConsumptionList] = []
-    for _zone_key in ZONE_KEY_AGGREGATES.get(zone_key, [zone_key]):
-        domain = ENTSOE_DOMAIN_MAPPINGS[_zone_key]
-        try:
-            raw_consumption = query_consumption(
-                domain, session, target_datetime=target_datetime
-            )
-        except Exception as e:
-            raise ParserException(
-                parser="ENTSOE.py",
-                message=f"Failed to fetch consumption for {_zone_key}",
-                zone_key=zone_key,
-            ) from e
-        if raw_consumption is None:
-            raise ParserException(
-                parser="ENTSOE.py",
-                message=f"No consumption data found for {_zone_key}",
-                zone_key=zone_key,
-            )
+    for _zone_key, raw_consumption in _query_zone_aggregate(
+        lambda domain: query_consumption(
+            domain, session, target_datetime=target_datetime
+        ),
+        zone_key,
+        "consumption",
+    ):
         parsed = parse_scalar(raw_consumption, only_outBiddingZone_Domain=True)
         if parsed is None:
             raise ParserException(
@@ -1606,16 +1912,16 @@ def fetch_consumption(
                 zone_key=zone_key,
             )
 
-        consumption_list = TotalConsumptionList(logger)
-        for dt, dt_end, value in parsed:
-            consumption_list.append(
-                zoneKey=zone_key,
-                datetime=dt,
-                end_datetime=dt_end,
-                source=SOURCE,
-                consumption=value,
-                sourceType=EventSourceType.measured,
-            )
+        datetimes, end_datetimes, values = _point_columns(parsed)
+        consumption_list = TotalConsumptionList.from_arrays(
+            logger,
+            zone_key,
+            datetimes,
+            SOURCE,
+            values,
+            end_datetimes=end_datetimes,
+            sourceType=EventSourceType.measured,
+        )
 
         # Aggregated data are regrouped under the same zone key.
         non_aggregated_data.append(consumption_list)
@@ -1633,26 +1939,15 @@ def fetch_consumption_forecast(
     logger: Logger = getLogger(__name__),
 ) -> list:
     """Gets consumption forecast for specified zone."""
-    session = session or Session()
+    session = session or create_session()
     non_aggregated_data: list[TotalConsumptionList] = []
-    for _zone_key in ZONE_KEY_AGGREGATES.get(zone_key, [zone_key]):
-        domain = ENTSOE_DOMAIN_MAPPINGS[_zone_key]
-        try:
-            raw_consumption = query_consumption_forecast(
-                domain, session, target_datetime=target_datetime
-            )
-        except Exception as e:
-            raise ParserException(
-                parser="ENTSOE.py",
-                message=f"Failed to fetch consumption forecast for {_zone_key}",
-                zone_key=zone_key,
-            ) from e
-        if raw_consumption is None:
-            raise ParserException(
-                parser="ENTSOE.py",
-                message=f"No consumption forecast data found for {_zone_key}",
-                zone_key=zone_key,
-            )
+    for _zone_key, raw_consumption in _query_zone_aggregate(
+        lambda domain: query_consumption_forecast(
+            domain, session, target_datetime=target_datetime
+        ),
+        zone_key,
+        "consumption forecast",
+    ):
         parsed = parse_scalar(raw_consumption, only_outBiddingZone_Domain=True)
         if parsed is None:
             raise ParserException(
@@ -1661,16 +1956,16 @@ def fetch_consumption_forecast(
                 zone_key=zone_key,
             )
 
-        consumption_list = TotalConsumptionList(logger)
-        for dt, dt_end, value in parsed:
-            consumption_list.append(
-                zoneKey=zone_key,
-                datetime=dt,
-                end_datetime=dt_end,
-                source=SOURCE,
-                consumption=value,
-                sourceType=EventSourceType.forecasted,
-            )
+        datetimes, end_datetimes, values = _point_columns(parsed)
+        consumption_list = TotalConsumptionList.from_arrays(
+            logger,
+            zone_key,
+            datetimes,
+            SOURCE,
+            values,
+            end_datetimes=end_datetimes,
+            sourceType=EventSourceType.forecasted,
+        )
 
         # Aggregated data are regrouped under the same zone key.
         non_aggregated_data.append(consumption_list)
@@ -1689,27 +1984,16 @@ def _fetch_wind_solar_forecasts(
     """Shared logic for the 3 type-specific wind/solar forecast fetchers."""
     label = forecast_type.name.lower().replace("_", "-")
     non_aggregated_data: list[ProductionBreakdownList] = []
-    for _zone_key in ZONE_KEY_AGGREGATES.get(zone_key, [zone_key]):
-        domain = ENTSOE_DOMAIN_MAPPINGS[_zone_key]
-        try:
-            raw_forecast = query_wind_solar_production_forecast(
-                domain,
-                session,
-                forecast_type,
-                target_datetime=target_datetime,
-            )
-        except Exception as e:
-            raise ParserException(
-                parser="ENTSOE.py",
-                message=f"Failed to fetch {label} wind and solar forecast for {_zone_key}",
-                zone_key=zone_key,
-            ) from e
-        if raw_forecast is None:
-            raise ParserException(
-                parser="ENTSOE.py",
-                message=f"No {label} wind and solar forecast data found for {_zone_key}",
-                zone_key=zone_key,
-            )
+    for _zone_key, raw_forecast in _query_zone_aggregate(
+        lambda domain: query_wind_solar_production_forecast(
+            domain,
+            session,
+            forecast_type,
+            target_datetime=target_datetime,
+        ),
+        zone_key,
+        f"{label} wind and solar forecast",
+    ):
         parsed = parse_production(raw_forecast, logger, zone_key, forecasted=True)
         # Aggregated data are regrouped under the same zone key.
         non_aggregated_data.append(parsed)
@@ -1728,7 +2012,7 @@ def fetch_wind_solar_forecasts(
     """
     Gets values and corresponding datetimes for all production types in the specified zone.
     """
-    session = session or Session()
+    session = session or create_session()
     forecast_breakdown_list = ProductionBreakdownList(logger)
     # Order matters: later types override earlier ones at matching datetimes
     # (intraday overrides day-ahead, current overrides intraday).
@@ -1772,7 +2056,7 @@ def fetch_wind_solar_forecasts_day_ahead(
     return _fetch_wind_solar_forecasts(
         zone_key,
         EntsoeTypeEnum.DAY_AHEAD,
-        session or Session(),
+        session or create_session(),
         target_datetime,
         logger,
     ).to_list()
@@ -1788,7 +2072,7 @@ def fetch_wind_solar_forecasts_intraday(
     return _fetch_wind_solar_forecasts(
         zone_key,
         EntsoeTypeEnum.INTRADAY,
-        session or Session(),
+        session or create_session(),
         target_datetime,
         logger,
     ).to_list()
@@ -1804,7 +2088,7 @@ def fetch_wind_solar_forecasts_current(
     return _fetch_wind_solar_forecasts(
         zone_key,
         EntsoeTypeEnum.CURRENT,
-        session or Session(),
+        session or create_session(),
         target_datetime,
         logger,
     ).to_list()
@@ -2014,7 +2298,7 @@ def fetch_exchange_capacity_forecasts_day_ahead(
         zone_key1,
         zone_key2,
         EntsoeTypeEnum.DAY_AHEAD,
-        session or Session(),
+        session or create_session(),
         target_datetime,
         logger,
     )
@@ -2033,7 +2317,7 @@ def fetch_exchange_capacity_forecasts_week_ahead(
         zone_key1,
         zone_key2,
         EntsoeTypeEnum.WEEK_AHEAD,
-        session or Session(),
+        session or create_session(),
         target_datetime,
         logger,
     )
@@ -2052,7 +2336,7 @@ def fetch_exchange_capacity_forecasts_month_ahead(
         zone_key1,
         zone_key2,
         EntsoeTypeEnum.MONTH_AHEAD,
-        session or Session(),
+        session or create_session(),
         target_datetime,
         logger,
     )
@@ -7,6 +7,7 @@ from electricitymap.contrib.parsers import ENTSOE
 from electricitymap.contrib.types import ZoneKey
 
 from .lib.exceptions import ParserException
+from .lib.session import create_session
 
 # Zones that do not have their own ENTSOE bidding zone domain for
 # day-ahead prices, mapped to the domain they share instead.
@@ -25,7 +26,7 @@ def fetch_price(
 ) -> list[dict]:
     """Gets day-ahead price for a zone via the ENTSOE domain it shares with another zone."""
     if not session:
-        session = Session()
+        session = create_session()
 
     domain = PRICE_DOMAIN_OVERRIDES[zone_key]
     try:
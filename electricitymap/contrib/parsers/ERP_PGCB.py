@@ -16,6 +16,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 # Power Grid Company of Bangladesh: erp.pgcb.gov.bd
@@ -199,7 +200,7 @@ def fetch_production(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
-    session = session or Session()
+    session = session or create_session()
 
     row_data = query(session, target_datetime, logger)
     production_data_list = ProductionBreakdownList(logger)
@@ -251,7 +252,7 @@ def fetch_consumption(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
-    session = session or Session()
+    session = session or create_session()
 
     row_data = query(session, target_datetime, logger)
 
@@ -287,7 +288,7 @@ def fetch_exchange(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
-    session = session or Session()
+    session = session or create_session()
 
     # Query table, contains import from india.
     row_data = query(session, target_datetime, logger)
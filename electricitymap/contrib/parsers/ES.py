@@ -18,6 +18,7 @@ from electricitymap.contrib.types import ZoneKey
 
 from .lib.config import refetch_frequency
 from .lib.exceptions import ParserException
+from .lib.session import create_session
 
 #    Zone name Cheat Sheet
 
@@ -352,7 +353,7 @@ def fetch_consumption(
 ) -> list[dict]:
     check_valid_parameters(zone_key, session, target_datetime)
 
-    ses = session or Session()
+    ses = session or create_session()
     data = fetch_and_preprocess_data(zone_key, ses, logger, target_datetime)
     consumption = TotalConsumptionList(logger)
     for event in data:
@@ -373,7 +374,7 @@ def fetch_production(
     logger: Logger = getLogger(__name__),
 ) -> list[dict]:
     check_valid_parameters(zone_key, session, target_datetime)
-    ses = session or Session()
+    ses = session or create_session()
     data_mapping = PRODUCTION_PARSE_MAPPING.copy()
 
     ## Production mapping override for Canary Islands
@@ -426,7 +427,7 @@ def fetch_exchange(
 ) -> list[dict]:
     sorted_zone_keys = ZoneKey("->".join(sorted([zone_key1, zone_key2])))
     check_valid_parameters(sorted_zone_keys, session, target_datetime)
-    ses = session or Session()
+    ses = session or create_session()
 
     data = fetch_and_preprocess_data(
         EXCHANGE_MAPPING[sorted_zone_keys]["zone_ref"],
@@ -13,7 +13,7 @@ from electricitymap.contrib.lib.models.event_lists import ExchangeList
 from electricitymap.contrib.types import ZoneKey
 
 from .lib.exceptions import ParserException
-from .lib.session import mount_retry
+from .lib.session import create_session, mount_retry
 from .lib.utils import get_token
 
 TIMEZONE = ZoneInfo("Europe/Madrid")
@@ -72,7 +72,7 @@ def fetch_exchange(
     # Get ESIOS token
     token = get_token("ESIOS_TOKEN")
 
-    ses = mount_retry(session or Session())
+    ses = mount_retry(session or create_session())
 
     if target_datetime is None:
         target_datetime = datetime.now(tz=TIMEZONE)
@@ -10,6 +10,7 @@ from requests import Response, Session
 from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownList
 from electricitymap.contrib.lib.models.events import ProductionMix, StorageMix
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 pp = PrettyPrinter(indent=4)
@@ -59,7 +60,7 @@ def get_url() -> str:
 
 def fetch_production(
     zone_key: ZoneKey = ZoneKey("ZA"),
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict]:
@@ -14,6 +14,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 )
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 # This parser gets hourly electricity generation data from ut.com.sv for El Salvador.
@@ -184,7 +185,7 @@ def fetch_production(
 ) -> list:
     """Requests the last known production mix (in MW) of a given country."""
     if session is None:
-        session = Session()
+        session = create_session()
 
     data = _fetch_data(session, target_datetime)
     parsed_data = _parse_data(data)
@@ -10,6 +10,7 @@ from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownLis
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 PARSER = "FO.py"
@@ -210,7 +211,7 @@ def fetch_production(
         now if target_datetime is None else target_datetime.astimezone(timezone.utc)
     )
 
-    session = session or Session()
+    session = session or create_session()
 
     historical_production_breakdown_list = _fetch_production_historical(
         zone_key=zone_key,
@@ -13,6 +13,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 )
 from electricitymap.contrib.lib.models.events import ProductionMix, StorageMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.parsers.lib.utils import get_token
 from electricitymap.contrib.types import ZoneKey
 
@@ -85,7 +86,7 @@ def request_data(
     session: Session | None = None,
 ) -> pd.DataFrame:
     """Returns a DataFrame with the data from the API for the [dt_from, dt_to] window."""
-    r = session or Session()
+    r = session or create_session()
     params = {
         "dataset": dataset,
         "q": (
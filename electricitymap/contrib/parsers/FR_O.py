@@ -16,6 +16,7 @@ from electricitymap.contrib.types import ZoneKey
 
 from .lib.config import refetch_frequency
 from .lib.exceptions import ParserException
+from .lib.session import create_session
 
 DOMAIN_MAPPING = {
     "FR-COR": "https://opendata-corse.edf.fr",
@@ -120,7 +121,7 @@ def fetch_data(
     session: Session | None = None,
     target_datetime: datetime | None = None,
 ) -> tuple[list, str, str]:
-    ses = session or Session()
+    ses = session or create_session()
 
     if target_datetime is None and zone_key not in LIVE_DATASETS:
         raise ParserException(
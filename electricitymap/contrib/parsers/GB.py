@@ -15,6 +15,7 @@ from io import BytesIO
 from logging import Logger, getLogger
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
 from openpyxl import load_workbook
 from requests import Response, Session
@@ -31,6 +32,7 @@ from electricitymap.contrib.lib.models.events import (
 )
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 PARSER = "GB.py"
@@ -108,7 +110,7 @@ def fetch_price(
     )
     url = f"http://eco2mix.rte-france.com/curves/getDonneesMarche?dateDeb={day_start}&dateFin={day_end}&mode=NORM"
 
-    session = session or Session()
+    session = session or create_session()
     response = session.get(url)
 
     if not response.ok:
@@ -186,7 +188,7 @@ def fetch_wind_forecasts_day_ahead(
     back to NESO's historical day-ahead forecast archive, which lags the live
     dataset by about a day.
     """
-    session = session or Session()
+    session = session or create_session()
 
     if target_datetime is None:
         sql_query = f"""SELECT * FROM "{NESO_WIND_DAY_AHEAD_FORECAST_DATASET_ID}" ORDER BY "Datetime_GMT" ASC"""
@@ -246,7 +248,7 @@ def fetch_consumption_forecast(
     1-day-ahead horizon, but keeps the same half-hourly granularity as the
     live dataset (the 2-14 day forecast has no matching half-hourly archive).
     """
-    session = session or Session()
+    session = session or create_session()
 
     if target_datetime is None:
         sql_query = f"""SELECT * FROM "{NESO_DEMAND_HALF_HOURLY_FORECAST_DATASET_ID}" ORDER BY "GDATETIME" ASC"""
@@ -299,7 +301,7 @@ def fetch_production(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict] | dict:
-    session = session or Session()
+    session = session or create_session()
 
     if target_datetime is None:
         start_datetime = datetime.now(tz=ZoneInfo("UTC")) - timedelta(hours=72)
@@ -349,8 +351,14 @@ def fetch_production(
         session, hydro_units + battery_units, start_datetime, end_datetime
     )
 
-    storage_lookup = _build_storage_lookup(
-        pn_df, mels_df, mils_df, boalf_df, rows_to_process
+    storage_mixes = _compute_storage_mixes(
+        _settlement_periods([ts for ts, _ in rows_to_process]),
+        hydro_units,
+        battery_units,
+        pn_df,
+        mels_df,
+        mils_df,
+        boalf_df,
     )
 
     production_list = ProductionBreakdownList(logger=logger)
@@ -359,25 +367,11 @@ def fetch_production(
         for neso_key, emaps_key in NESO_TO_PRODUCTION_MIX_MAPPING.items():
             production_mix.add_value(emaps_key, float(row[neso_key]))
 
-        pn_by_unit, mels_by_unit, mils_by_unit, boalf_by_unit, period_end = (
-            storage_lookup[period_start]
-        )
-        storage_mix = _compute_storage_mix(
-            period_start,
-            period_end,
-            hydro_units,
-            battery_units,
-            pn_by_unit,
-            mels_by_unit,
-            mils_by_unit,
-            boalf_by_unit,
-        )
-
         production_list.append(
             zoneKey=zone_key,
             datetime=period_start,
             production=production_mix,
-            storage=storage_mix,
+            storage=storage_mixes[period_start],
             # No space after comma so source names stay clean when split on ","
             # (avoids a leading-space " elexon.co.uk" / https://%20… link; #8779).
             source="neso.energy,elexon.co.uk",
@@ -460,251 +454,167 @@ def _rows_to_df(rows: list[dict]) -> pd.DataFrame:
     return df[["unit", "time_from", "time_to", "level_from", "acceptance_number"]]
 
 
-_UnitRecords = dict[str, list[dict]]
-_StorageLookup = dict[
-    datetime,
-    tuple[_UnitRecords, _UnitRecords, _UnitRecords, _UnitRecords, datetime],
-]
-
+def _settlement_periods(timestamps: list[datetime]) -> dict[datetime, datetime]:
+    """Map each settlement period start to its end, the next timestamp.
 
-def _build_storage_lookup(
-    pn_df: pd.DataFrame,
-    mels_df: pd.DataFrame,
-    mils_df: pd.DataFrame,
-    boalf_df: pd.DataFrame,
-    rows_to_process: list[tuple[datetime, datetime]],
-) -> _StorageLookup:
-    """Pre-filter and group storage data for each timestamp's window.
-
-    For each timestamp performs a vectorised boolean filter on the DataFrames
-    (datetimes already parsed), then groups the matching rows by unit.
-    The returned records have pre-parsed datetime fields so per-minute lookups
-    require only simple comparisons.
+    The last period is assumed to be as long as the first one.
     """
-    lookup: _StorageLookup = {}
-
-    timestamps = [ts for ts, _ in rows_to_process]
+    periods: dict[datetime, datetime] = {}
     period_duration = timestamps[1] - timestamps[0] if len(timestamps) >= 2 else None
-
     for i, period_start in enumerate(timestamps):
         if i + 1 < len(timestamps):
-            period_end = timestamps[i + 1]
+            periods[period_start] = timestamps[i + 1]
         elif period_duration is not None:
-            period_end = period_start + period_duration
+            periods[period_start] = period_start + period_duration
         else:
             raise ParserException(
                 PARSER,
                 "Cannot determine settlement period duration: only one NESO timestamp returned.",
                 ZONE_KEY,
             )
-        ps_pd = pd.Timestamp(period_start)
-        pe_pd = pd.Timestamp(period_end)
-
-        def filter_and_group(
-            df: pd.DataFrame, _ts: pd.Timestamp, _pe: pd.Timestamp
-        ) -> _UnitRecords:
-            window = df[(df["time_from"] < _pe) & (df["time_to"] > _ts)]
-            grouped: _UnitRecords = {}
-            for row in window.itertuples(index=False):
-                unit = row.unit
-                if not isinstance(unit, str):
-                    continue
-                grouped.setdefault(unit, []).append(
-                    {
-                        "time_from": row.time_from.to_pydatetime(),
-                        "time_to": row.time_to.to_pydatetime(),
-                        "level_from": (
-                            None if pd.isna(row.level_from) else float(row.level_from)
-                        ),
-                        "acceptance_number": int(row.acceptance_number),
-                    }
-                )
-            return grouped
-
-        lookup[period_start] = (
-            filter_and_group(pn_df, ps_pd, pe_pd),
-            filter_and_group(mels_df, ps_pd, pe_pd),
-            filter_and_group(mils_df, ps_pd, pe_pd),
-            filter_and_group(boalf_df, ps_pd, pe_pd),
-            period_end,
-        )
-
-    return lookup
+    return periods
 
 
-def _compute_storage_mix(
-    period_start: datetime,
-    period_end: datetime,
-    hydro_units: list[str],
-    battery_units: list[str],
-    pn_by_unit: _UnitRecords,
-    mels_by_unit: _UnitRecords,
-    mils_by_unit: _UnitRecords,
-    boalf_by_unit: _UnitRecords,
-) -> StorageMix:
-    """Compute hydro and battery storage mixes for a given timestamp from pre-fetched data."""
-    debug = os.environ.get("PRINT_DETAILS", "").lower()
-    storage_mix = StorageMix()
-    period_minutes = int((period_end - period_start).total_seconds() / 60)
-
-    hydro_storage = _compute_storage_for_units(
-        hydro_units,
-        period_start,
-        pn_by_unit,
-        mels_by_unit,
-        mils_by_unit,
-        boalf_by_unit,
-        period_minutes,
-        print_details=debug == "hydro_storage",
-        print_minute_details=debug == "hydro_storage",
-    )
-    storage_mix.add_value("hydro", -hydro_storage)
+def _to_epoch_ns(datetimes) -> np.ndarray:
+    """Convert timezone-aware datetimes to nanoseconds since the epoch."""
+    index = pd.DatetimeIndex(datetimes).tz_convert("UTC").tz_localize(None)
+    return index.values.astype("datetime64[ns]").view(np.int64)
 
-    battery_storage = _compute_storage_for_units(
-        battery_units,
-        period_start,
-        pn_by_unit,
-        mels_by_unit,
-        mils_by_unit,
-        boalf_by_unit,
-        period_minutes,
-        print_details=debug == "battery_storage",
-        print_minute_details=False,
-    )
-    storage_mix.add_value("battery", -battery_storage)
-    return storage_mix
 
+class _MinuteGrid:
+    """The minutes of all settlement periods, resolved together.
 
-def _compute_storage_for_units(
-    units: list[str],
-    period_start: datetime,
-    pn_by_unit: _UnitRecords,
-    mels_by_unit: _UnitRecords,
-    mils_by_unit: _UnitRecords,
-    boalf_by_unit: _UnitRecords,
-    period_minutes: int,
-    print_details: bool = False,
-    print_minute_details: bool = False,
-) -> float:
-    """Compute the aggregate storage MW for a list of units at a given timestamp.
-
-    Uses pre-filtered, pre-parsed records from _build_storage_lookup.
+    Minutes are laid out period after period, so that the minutes of period
+    `i` are `minutes[period_offsets[i]:period_offsets[i + 1]]`.
     """
-    if print_details:
-        total_boalf = sum(len(boalf_by_unit.get(u, [])) for u in units)
-        total_pn = sum(len(pn_by_unit.get(u, [])) for u in units)
-        print(
-            f"\n  [{period_start.strftime('%Y-%m-%d %H:%M')}] {len(units)} units, "
-            f"pre-fetched: {total_boalf} BOALF, {total_pn} PN rows"
-        )
 
-    total_storage = 0.0
-    for unit in units:
-        if print_details:
-            n_boalf = len(boalf_by_unit.get(unit, []))
-            n_pn = len(pn_by_unit.get(unit, []))
-            print(f"  {unit}: {n_boalf} BOALF recs, {n_pn} PN recs", end="")
-        unit_mw = _compute_unit_storage_mw(
-            boalf_records=boalf_by_unit.get(unit, []),
-            pn_records=pn_by_unit.get(unit, []),
-            mels_records=mels_by_unit.get(unit, []),
-            mils_records=mils_by_unit.get(unit, []),
-            period_start=period_start,
-            period_minutes=period_minutes,
-            print_details=print_details,
-            print_minute_details=print_minute_details,
+    def __init__(self, periods: dict[datetime, datetime]):
+        self.period_starts = list(periods)
+        self.period_minutes = np.array(
+            [
+                int((period_end - period_start).total_seconds() / 60)
+                for period_start, period_end in periods.items()
+            ],
+            dtype=np.int64,
         )
-        total_storage += unit_mw
-
-    if print_details:
-        print(f"  TOTAL: {total_storage:.1f} MW")
-    return total_storage
-
-
-def _extract_data_rows(payload: dict | list) -> list[dict]:
-    if isinstance(payload, dict):
-        data = payload.get("data")
-        return data if isinstance(data, list) else []
-    return payload if isinstance(payload, list) else []
-
-
-def _get_boalf_value_at_minute(
-    records: list[dict], minute_dt: datetime
-) -> float | None:
-    """Determine the BOALF MW level for a single unit at a specific minute.
-
-    BOALF (Bid-Offer Acceptance Level Flagged) records represent instructions
-    from the System Operator to a generation/storage unit. Multiple BOALF
-    records can cover the same minute — each identified by an acceptanceNumber.
-    A higher acceptanceNumber represents a more recent instruction that
-    supersedes earlier ones.
-
-    Algorithm:
-      1. Find all BOALF records whose [timeFrom, timeTo) interval covers
-         the minute.
-      2. Among those, pick the record with the highest acceptanceNumber.
-      3. Return its levelFrom (the MW level at the start of the interval).
+        self.period_offsets = np.concatenate(([0], np.cumsum(self.period_minutes)))
+        self.period_of_minute = np.repeat(
+            np.arange(len(self.period_starts)), self.period_minutes
+        )
+        minute_in_period = (
+            np.arange(len(self.period_of_minute))
+            - self.period_offsets[self.period_of_minute]
+        )
+        self.minutes = (
+            _to_epoch_ns(self.period_starts)[self.period_of_minute]
+            + minute_in_period * 60 * 10**9
+        )
+        # Settlement periods are not assumed to be sorted nor disjoint.
+        self._sort_order = np.argsort(self.minutes, kind="stable")
+        self._sorted_minutes = self.minutes[self._sort_order]
+
+    def __len__(self) -> int:
+        return len(self.minutes)
+
+    def covered_minutes(
+        self, time_from: np.ndarray, time_to: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Expand [time_from, time_to) intervals into the minutes they cover.
+
+        Returns pairs of (interval index, minute index), one per covered minute.
+        """
+        starts = np.searchsorted(self._sorted_minutes, time_from, side="left")
+        ends = np.searchsorted(self._sorted_minutes, time_to, side="left")
+        lengths = np.maximum(ends - starts, 0)
+        interval_of_pair = np.repeat(np.arange(len(starts)), lengths)
+        pair_offsets = np.arange(len(interval_of_pair)) - np.repeat(
+            np.cumsum(lengths) - lengths, lengths
+        )
+        return interval_of_pair, self._sort_order[
+            starts[interval_of_pair] + pair_offsets
+        ]
 
-    We use levelFrom rather than interpolating between levelFrom and levelTo.
-    In practice, "body" records (spanning many minutes) have
-    levelFrom == levelTo, and "ramp" records are only 1 minute long, so
-    the error from not interpolating is negligible.
 
-    Returns None if no BOALF record covers this minute, signalling the
-    caller to fall back to PN data.
+def _winning_levels(
+    df: pd.DataFrame,
+    units: list[str],
+    grid: _MinuteGrid,
+    priority_column: str,
+    skip_missing_levels: bool,
+) -> np.ndarray:
+    """Resolve, for each unit and minute, the level of the winning record.
+
+    Among the records covering a minute ([time_from, time_to) contains it),
+    the one with the highest `priority_column` wins, ties going to the record
+    that comes first. Records without a level can be skipped, otherwise a
+    winning record without a level yields NaN, as do minutes without records.
+
+    Returns an array of shape (len(units), len(grid)).
     """
-    best_acceptance = -1
-    best_value: float | None = None
+    levels = np.full((len(units), len(grid)), np.nan)
+    if df.empty:
+        return levels
+    unit_index = {unit: i for i, unit in enumerate(units)}
+    record_units = df["unit"].map(unit_index)
+    keep = record_units.notna().to_numpy()
+    if skip_missing_levels:
+        keep &= df["level_from"].notna().to_numpy()
+    df = df[keep]
+    if df.empty:
+        return levels
+    record_units = record_units[keep].to_numpy(dtype=np.int64)
+    record_levels = df["level_from"].to_numpy(dtype=float)
+    # Rank the records by priority, then by reversed position.
+    rank_order = np.lexsort(
+        (-np.arange(len(df)), df[priority_column].to_numpy(dtype=np.int64))
+    )
+    ranks = np.empty(len(df), dtype=np.int64)
+    ranks[rank_order] = np.arange(len(df))
 
-    for rec in records:
-        if rec["time_from"] <= minute_dt < rec["time_to"]:
-            acceptance = rec["acceptance_number"]
-            if acceptance > best_acceptance:
-                level = rec["level_from"]
-                if level is not None:
-                    best_acceptance = acceptance
-                    best_value = level
+    record_of_pair, minute_of_pair = grid.covered_minutes(
+        _to_epoch_ns(df["time_from"]), _to_epoch_ns(df["time_to"])
+    )
+    best_ranks = np.full(len(units) * len(grid), -1, dtype=np.int64)
+    np.maximum.at(
+        best_ranks,
+        record_units[record_of_pair] * len(grid) + minute_of_pair,
+        ranks[record_of_pair],
+    )
+    has_record = best_ranks >= 0
+    levels.reshape(-1)[has_record] = record_levels[rank_order[best_ranks[has_record]]]
+    return levels
 
-    return best_value
 
+class _MinuteLevels:
+    """Per unit and minute levels of each dataset, NaN where there is none."""
 
-def _get_level_at_minute(records: list[dict], minute_dt: datetime) -> float | None:
-    """Determine the MW level from a PN/MELS/MILS dataset at a specific minute.
+    def __init__(
+        self, boalf: np.ndarray, pn: np.ndarray, mels: np.ndarray, mils: np.ndarray
+    ):
+        self.boalf = boalf
+        self.pn = pn
+        self.has_boalf = ~np.isnan(boalf)
+        self.has_pn = ~np.isnan(pn)
+        # Clamp PN to [MILS, MELS], ignoring missing limits.
+        self.clamped_pn = np.fmax(np.fmin(pn, mels), mils)
+        self.values = np.where(
+            self.has_boalf, boalf, np.where(self.has_pn, self.clamped_pn, 0.0)
+        )
 
-    Physical Notification (PN), Maximum Export Limit (MELS), and Minimum
-    Import Limit (MILS) datasets share the same record structure with
-    timeFrom/timeTo and levelFrom/levelTo fields. Their intervals typically
-    align to settlement period boundaries but are not guaranteed to.
 
-    For a given minute, finds all records whose [timeFrom, timeTo) interval
-    covers it and returns the levelFrom of the one with the latest timeFrom,
-    making the result deterministic when overlapping records exist.
+def _compute_storage_mixes(
+    periods: dict[datetime, datetime],
+    hydro_units: list[str],
+    battery_units: list[str],
+    pn_df: pd.DataFrame,
+    mels_df: pd.DataFrame,
+    mils_df: pd.DataFrame,
+    boalf_df: pd.DataFrame,
+) -> dict[datetime, StorageMix]:
+    """Compute hydro and battery storage mixes for all settlement periods.
 
-    Returns None if no record covers this minute.
-    """
-    best_rec = None
-    for rec in records:
-        if rec["time_from"] <= minute_dt < rec["time_to"] and (
-            best_rec is None or rec["time_from"] > best_rec["time_from"]
-        ):
-            best_rec = rec
-    return best_rec["level_from"] if best_rec is not None else None
-
-
-def _compute_unit_storage_mw(
-    boalf_records: list[dict],
-    pn_records: list[dict],
-    mels_records: list[dict],
-    mils_records: list[dict],
-    period_start: datetime,
-    period_minutes: int,
-    print_details: bool = False,
-    print_minute_details: bool = False,
-) -> float:
-    """Compute the average MW output for one storage unit over a period.
-
-    Resolves the effective MW value at each minute in [period_start,
-    period_start + period_minutes) using the following precedence:
+    Resolves the effective MW value of each unit at each minute of each period,
+    for all units and periods at once, using the following precedence:
 
       1. BOALF available  → use it directly. If multiple BOALF records
          cover a minute, the highest acceptanceNumber wins.
@@ -715,60 +625,156 @@ def _compute_unit_storage_mw(
       3. PN available, no limits → use PN as-is.
       4. No data at all → assume 0 MW.
 
-    Returns the average MW over the period (sum of per-minute values
-    divided by period_minutes).
+    Records give their levelFrom (the MW level at the start of the interval)
+    rather than an interpolation towards levelTo. In practice, "body" records
+    (spanning many minutes) have levelFrom == levelTo, and "ramp" records are
+    only 1 minute long, so the error from not interpolating is negligible.
+
+    The storage of a unit over a period is the average MW over its minutes.
     """
-    total = 0.0
-    boalf_minutes = 0
-    pn_minutes = 0
-    zero_minutes = 0
-    minute_details: list[str] = []
-
-    for m in range(period_minutes):
-        minute_dt = period_start + timedelta(minutes=m)
-        ts = minute_dt.strftime("%H:%M")
-
-        boalf_value = _get_boalf_value_at_minute(boalf_records, minute_dt)
-        pn_value = _get_level_at_minute(pn_records, minute_dt)
-        mels_value = _get_level_at_minute(mels_records, minute_dt)
-        mils_value = _get_level_at_minute(mils_records, minute_dt)
-
-        if boalf_value is not None:
-            total += boalf_value
-            boalf_minutes += 1
-            if boalf_value != 0 or (pn_value is not None and pn_value != 0):
-                pn_str = f"|PN:{pn_value:.0f}" if pn_value is not None else ""
-                minute_details.append(f"{ts}=BOALF:{boalf_value:.0f}{pn_str}")
-            continue
+    if any(period_end <= period_start for period_start, period_end in periods.items()):
+        raise ParserException(
+            PARSER,
+            "Cannot compute storage: NESO timestamps are not in increasing order.",
+            ZONE_KEY,
+        )
+    grid = _MinuteGrid(periods)
+    units = list(dict.fromkeys(hydro_units + battery_units))
+
+    levels = _MinuteLevels(
+        boalf=_winning_levels(
+            boalf_df, units, grid, "acceptance_number", skip_missing_levels=True
+        ),
+        # For PN, MELS and MILS, the record starting last wins.
+        pn=_winning_levels(pn_df, units, grid, "time_from", skip_missing_levels=False),
+        mels=_winning_levels(
+            mels_df, units, grid, "time_from", skip_missing_levels=False
+        ),
+        mils=_winning_levels(
+            mils_df, units, grid, "time_from", skip_missing_levels=False
+        ),
+    )
+    unit_storage = {
+        unit: np.bincount(
+            grid.period_of_minute,
+            weights=levels.values[i],
+            minlength=len(grid.period_starts),
+        )
+        / grid.period_minutes
+        for i, unit in enumerate(units)
+    }
 
-        if pn_value is not None:
-            clamped = pn_value
-            if mels_value is not None:
-                clamped = min(clamped, mels_value)
-            if mils_value is not None:
-                clamped = max(clamped, mils_value)
-            total += clamped
-            pn_minutes += 1
-            if clamped != 0:
-                extra = ""
-                if clamped != pn_value:
-                    extra = f"(raw:{pn_value:.0f})"
-                minute_details.append(f"{ts}=PN:{clamped:.0f}{extra}")
-            continue
+    def total_storage(group_units: list[str]) -> np.ndarray:
+        total = np.zeros(len(grid.period_starts))
+        for unit in group_units:
+            total += unit_storage[unit]
+        return total
 
-        zero_minutes += 1
+    hydro_storage = total_storage(hydro_units)
+    battery_storage = total_storage(battery_units)
 
-    avg_mw = total / period_minutes
-    if print_details:
-        summary = (
-            f"    {boalf_minutes}xBOALF {pn_minutes}xPN {zero_minutes}xNODATA"
-            f" → avg={avg_mw:.1f} MW"
+    debug = os.environ.get("PRINT_DETAILS", "").lower()
+    if debug in ("hydro_storage", "battery_storage"):
+        _print_storage_details(
+            grid,
+            units,
+            hydro_units if debug == "hydro_storage" else battery_units,
+            unit_storage,
+            levels,
+            pn_df,
+            boalf_df,
+            print_minute_details=debug == "hydro_storage",
+        )
+
+    storage_mixes = {}
+    for i, period_start in enumerate(grid.period_starts):
+        storage_mix = StorageMix()
+        storage_mix.add_value("hydro", -float(hydro_storage[i]))
+        storage_mix.add_value("battery", -float(battery_storage[i]))
+        storage_mixes[period_start] = storage_mix
+    return storage_mixes
+
+
+def _record_counts(
+    df: pd.DataFrame, period_start: datetime, period_end: datetime
+) -> pd.Series:
+    """Count the records of each unit overlapping a settlement period."""
+    if df.empty:
+        return pd.Series(dtype=int)
+    window = df[
+        (df["time_from"] < pd.Timestamp(period_end))
+        & (df["time_to"] > pd.Timestamp(period_start))
+    ]
+    return window["unit"].value_counts()
+
+
+def _print_storage_details(
+    grid: _MinuteGrid,
+    units: list[str],
+    group_units: list[str],
+    unit_storage: dict[str, np.ndarray],
+    levels: _MinuteLevels,
+    pn_df: pd.DataFrame,
+    boalf_df: pd.DataFrame,
+    print_minute_details: bool,
+) -> None:
+    """Print the storage computation of a group of units, period by period."""
+    unit_index = {unit: i for i, unit in enumerate(units)}
+    for period, period_start in enumerate(grid.period_starts):
+        period_end = period_start + timedelta(minutes=int(grid.period_minutes[period]))
+        minutes = slice(grid.period_offsets[period], grid.period_offsets[period + 1])
+
+        boalf_counts = _record_counts(boalf_df, period_start, period_end)
+        pn_counts = _record_counts(pn_df, period_start, period_end)
+        print(
+            f"\n  [{period_start.strftime('%Y-%m-%d %H:%M')}] {len(group_units)} units, "
+            f"pre-fetched: {sum(boalf_counts.get(u, 0) for u in group_units)} BOALF, "
+            f"{sum(pn_counts.get(u, 0) for u in group_units)} PN rows"
         )
-        print(summary)
-        if print_minute_details and minute_details:
-            for m in minute_details:
-                print(f"      {m}")
-    return avg_mw
+        total_storage = 0.0
+        for unit in group_units:
+            i = unit_index[unit]
+            print(
+                f"  {unit}: {boalf_counts.get(unit, 0)} BOALF recs, "
+                f"{pn_counts.get(unit, 0)} PN recs",
+                end="",
+            )
+            has_boalf = levels.has_boalf[i, minutes]
+            has_pn = levels.has_pn[i, minutes] & ~has_boalf
+            avg_mw = unit_storage[unit][period]
+            print(
+                f"    {has_boalf.sum()}xBOALF {has_pn.sum()}xPN "
+                f"{(~has_boalf & ~has_pn).sum()}xNODATA → avg={avg_mw:.1f} MW"
+            )
+            if print_minute_details:
+                for m, minute in enumerate(range(minutes.start, minutes.stop)):
+                    ts = (period_start + timedelta(minutes=m)).strftime("%H:%M")
+                    pn_value = levels.pn[i, minute]
+                    if levels.has_boalf[i, minute]:
+                        boalf_value = levels.boalf[i, minute]
+                        if boalf_value != 0 or (
+                            not np.isnan(pn_value) and pn_value != 0
+                        ):
+                            pn_str = (
+                                f"|PN:{pn_value:.0f}" if not np.isnan(pn_value) else ""
+                            )
+                            print(f"      {ts}=BOALF:{boalf_value:.0f}{pn_str}")
+                    elif levels.has_pn[i, minute]:
+                        clamped = levels.clamped_pn[i, minute]
+                        if clamped != 0:
+                            extra = (
+                                f"(raw:{pn_value:.0f})" if clamped != pn_value else ""
+                            )
+                            print(f"      {ts}=PN:{clamped:.0f}{extra}")
+            total_storage += avg_mw
+        print(f"  TOTAL: {total_storage:.1f} MW")
+
+
+def _extract_data_rows(payload: dict | list) -> list[dict]:
+    if isinstance(payload, dict):
+        data = payload.get("data")
+        return data if isinstance(data, list) else []
+    return payload if isinstance(payload, list) else []
 
 
 def _fetch_storage_dataset(
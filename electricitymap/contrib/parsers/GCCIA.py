@@ -22,6 +22,7 @@ from requests import Session
 from electricitymap.contrib.lib.models.event_lists import TotalConsumptionList
 
 from .lib.exceptions import ParserException
+from .lib.session import create_session
 
 CONSUMPTION_URL = "https://www.gccia.com.sa/"
 SOURCE = "www.gccia.com.sa"
@@ -54,7 +55,7 @@ def fetch_consumption(
     if target_datetime:
         raise NotImplementedError("This parser is not yet able to parse past dates")
 
-    r = session or Session()
+    r = session or create_session()
     response = r.get(CONSUMPTION_URL)
 
     pattern = COUNTRY_CODE_MAPPING[zone_key] + r'-mw-val">\s*(\d+)'
@@ -24,6 +24,7 @@ from electricitymap.contrib.lib.models.events import ProductionMix
 
 # Local library imports
 from electricitymap.contrib.parsers.lib.config import refetch_frequency, use_proxy
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 DEFAULT_ZONE_KEY = ZoneKey("MY-WM")
@@ -56,7 +57,7 @@ def get_api_data(session: Session, url, data):
 @use_proxy(country_code="MY")
 def fetch_consumption(
     zone_key: ZoneKey = DEFAULT_ZONE_KEY,
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list:
@@ -68,7 +69,7 @@ def fetch_consumption(
 
     date_string = target_datetime.strftime("%d/%m/%Y")
     consumption_data = get_api_data(
-        session or Session(),
+        session or create_session(),
         CONSUMPTION_URL,
         {
             "Fromdate": date_string,
@@ -92,7 +93,7 @@ def fetch_consumption(
 def fetch_exchange(
     zone_key1: ZoneKey,
     zone_key2: ZoneKey,
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list:
@@ -165,7 +166,7 @@ def fetch_exchange(
 @use_proxy(country_code="MY")
 def fetch_production(
     zone_key: ZoneKey = DEFAULT_ZONE_KEY,
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list:
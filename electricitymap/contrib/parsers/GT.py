@@ -15,6 +15,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 PARSER = "GT.py"
@@ -138,7 +139,7 @@ def fetch_consumption(
 ) -> list[dict]:
     """Fetch a list of hourly consumption data, in MW, for the UTC day of the requested date-time."""
 
-    session = session or Session()
+    session = session or create_session()
     target_datetime = (
         datetime.now(timezone.utc)
         if target_datetime is None
@@ -175,7 +176,7 @@ def fetch_production(
 ) -> list[dict]:
     """Fetch a list of hourly production data, in MW, for the UTC day of the requested date-time."""
 
-    session = session or Session()
+    session = session or create_session()
     target_datetime = (
         datetime.now(timezone.utc)
         if target_datetime is None
@@ -18,6 +18,7 @@ from electricitymap.contrib.lib.models.events import (
 )
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 REPORTS_ADMIN_URL = "https://www.iemop.ph/wp-admin/admin-ajax.php"
@@ -721,7 +722,7 @@ def fetch_production(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list:
-    session = session or Session()
+    session = session or create_session()
     _validate_resource_name_to_mode_mapping()
     reports_items = get_all_market_reports_items(
         session, zone_key, "production", logger
@@ -766,7 +767,7 @@ def fetch_exchange(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict] | dict:
-    session = session or Session()
+    session = session or create_session()
     sorted_zone_keys = ZoneKey("->".join(sorted([zone_key1, zone_key2])))
 
     all_exchange_items = get_all_market_reports_items(
@@ -25,6 +25,7 @@ from electricitymap.contrib.lib.models.event_lists import (
     TotalProductionList,
 )
 from electricitymap.contrib.lib.models.events import ProductionMix
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 URL = "https://www.noga-iso.co.il/Umbraco/Api/Documents/GetElectricalData"
@@ -88,7 +89,7 @@ def fetch_production(
     if target_datetime:
         raise NotImplementedError("This parser is not yet able to parse past dates")
 
-    session = session or Session()
+    session = session or create_session()
 
     data = fetch_noga_iso_data(session, logger)
     eventList = ProductionBreakdownList(logger=logger)
@@ -118,7 +119,7 @@ def fetch_total_production(
     if target_datetime:
         raise NotImplementedError("This parser is not yet able to parse past dates")
 
-    session = session or Session()
+    session = session or create_session()
 
     data = fetch_noga_iso_data(session, logger)
 
@@ -17,8 +17,11 @@ from electricitymap.contrib.lib.models.event_lists import (
     TotalConsumptionList,
 )
 from electricitymap.contrib.lib.models.events import ProductionMix
+from electricitymap.contrib.lib.models.frames import production_breakdowns_from_frame
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.response_cache import RESPONSE_CACHE
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 # TODO 1 Migrate the IN_WE and IN_EA consumption fetching to this parser, using the grid india data.
@@ -70,6 +73,8 @@ GRID_INDIA_REGION_MAPPING = {
 }
 
 GRID_INDIA_SOURCE = "grid-india.in"
+# Seconds the Grid India daily reports are cached, a published report is final.
+GRID_INDIA_REPORT_CACHE_TTL = 24 * 60 * 60
 
 CEA_REGION_MAPPING = {
     "northern region": "IN-NO",
@@ -157,7 +162,7 @@ STATES_MAPPING = {
 
 def fetch_consumption_from_meritindia(
     zone_key: ZoneKey,
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> TotalConsumptionList:
@@ -200,7 +205,7 @@ def fetch_consumption_from_meritindia(
 def fetch_npp_production(
     zone_key: str,
     target_datetime: datetime,
-    session: Session = Session(),
+    session: Session = create_session(),
     logger: Logger = getLogger(__name__),
 ) -> dict[str, Any]:
     """Gets production for conventional thermal, nuclear and hydro from NPP daily reports
@@ -246,7 +251,7 @@ def fetch_npp_production(
 
 def fetch_consumption(
     zone_key: ZoneKey,
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
@@ -313,7 +318,7 @@ def format_ren_production_data(
 def fetch_cea_production(
     zone_key: str,
     target_datetime: datetime,
-    session: Session = Session(),
+    session: Session = create_session(),
     logger: Logger = getLogger(__name__),
 ) -> dict[str, Any] | None:
     """Gets production data for wind, solar and other renewables
@@ -442,8 +447,11 @@ def fetch_grid_india_report(
 
         if latest_file_url is not None:
             file_full_url = f"{INDIA_PROXY_NO_VPC_CONNECTOR}/{latest_file_url}?host={GRID_INDIA_CDN_URL}"
-            r: Response = session.get(file_full_url, headers=headers)
-            return latest_file_date, r.content
+            # Backfills read the same daily report for every datetime of its day.
+            report = RESPONSE_CACHE.fetch(
+                session, file_full_url, ttl=GRID_INDIA_REPORT_CACHE_TTL, headers=headers
+            )
+            return latest_file_date, report.content
         else:
             raise ParserException(
                 parser="IN.py",
@@ -615,18 +623,14 @@ def parse_daily_production_grid_india_report(
     # Set this as the index of your new DataFrame
     df_hourly.index = hourly_index
 
-    all_data_points = ProductionBreakdownList(logger)
-    for timestamp, production_series in df_hourly.iterrows():
-        production_dict = production_series.dropna().to_dict()
-        production_mix = ProductionMix()
-        for mode, value in production_dict.items():
-            production_mix.add_value(mode, value)
-        all_data_points.append(
-            zoneKey=ZoneKey(zone_key),
-            datetime=timestamp.to_pydatetime(),
-            production=production_mix,
-            source=GRID_INDIA_SOURCE,
-        )
+    all_data_points = production_breakdowns_from_frame(
+        df_hourly,
+        logger,
+        ZoneKey(zone_key),
+        GRID_INDIA_SOURCE,
+        production={mode: mode for mode in df_hourly.columns},
+        set_missing=False,
+    )
     return all_data_points.to_list()
 
 
@@ -689,18 +693,14 @@ def parse_15m_production_grid_india_report(
     )
     _15min_scaled_generation_df = _15min_scaled_generation_df.drop(columns=["TIME"])
 
-    all_data_points = ProductionBreakdownList(logger)
-    for timestamp, production_series in _15min_scaled_generation_df.iterrows():
-        production_dict = production_series.dropna().to_dict()
-        production_mix = ProductionMix()
-        for mode, value in production_dict.items():
-            production_mix.add_value(mode, value)
-        all_data_points.append(
-            zoneKey=ZoneKey(zone_key),
-            datetime=timestamp.to_pydatetime(),
-            production=production_mix,
-            source=GRID_INDIA_SOURCE,
-        )
+    all_data_points = production_breakdowns_from_frame(
+        _15min_scaled_generation_df,
+        logger,
+        ZoneKey(zone_key),
+        GRID_INDIA_SOURCE,
+        production={mode: mode for mode in _15min_scaled_generation_df.columns},
+        set_missing=False,
+    )
     return all_data_points.to_list()
 
 
@@ -871,7 +871,7 @@ def fetch_production(
     Indian parser has a long history. There have been many sources being used, with different formats and different periods of availability.
     Here we try to resolve how to fetch and parse the production data for the given zone key and target datetime.
     """
-    session = session or Session()
+    session = session or create_session()
     if target_datetime is None:
         _target_datetime = datetime.now(tz=IN_TZ)
     else:
@@ -924,7 +924,7 @@ def fetch_production(
 def parse_production_from_cea_npp(
     zone_key: str,
     target_datetime: datetime,
-    session: Session = Session(),
+    session: Session = create_session(),
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """
@@ -10,6 +10,8 @@ from zoneinfo import ZoneInfo
 from bs4 import BeautifulSoup
 from requests import Session
 
+from electricitymap.contrib.parsers.lib.session import create_session
+
 # This URL is called from within the
 # https://hpsldc.com/intra-state-power-transaction/
 # page to load the data.
@@ -78,7 +80,7 @@ def fetch_production(
     logger: Logger = getLogger(__name__),
 ) -> dict:
     """Requests the last known production mix (in MW) of Himachal Pradesh (India)"""
-    r = session or Session()
+    r = session or create_session()
     if target_datetime is None:
         url = DATA_URL
     else:
@@ -4,12 +4,12 @@ from zoneinfo import ZoneInfo
 
 import cv2
 import numpy as np
-import pytesseract
-from imageio import imread
 from PIL import Image, ImageOps
 from requests import Session
 
 from .lib.exceptions import ParserException
+from .lib.ocr import OCR_ENGINE, OCRRegion
+from .lib.session import create_session
 
 url = "https://mahasldc.in/wp-content/reports/sldc/mvrreport3.jpg"
 
@@ -109,14 +109,25 @@ def RGBtoBW(pil_image):
     return Image.fromarray(image)
 
 
-# returns image section
-def read_image_sections(location, source):
-    img = source.crop(location)
+# prepares an image section for OCR
+def preprocess_image_section(img):
     img = RGBtoBW(img)
     img = ImageOps.invert(img)
     return img
 
 
+# the image sections of the values, read at once by the OCR engine
+value_regions = {
+    key: OCRRegion(
+        loc["value"],
+        lang="digits_comma",
+        config="--psm 7",
+        preprocess=preprocess_image_section,
+    )
+    for key, loc in locations.items()
+}
+
+
 # TODO: this function actually fetches consumption data
 def fetch_production(
     zone_key: str = "IN-MH",
@@ -148,26 +159,22 @@ def fetch_production(
         "source": "mahasldc.in",
     }
 
-    image = imread(url)
+    session = session or create_session()
+    image_content = session.get(url).content
     # In certain scenario, the URL returns a blank image. Let's verify if the image was read is of proper size
-    if image.size == 0:
+    if not image_content:
         raise ParserException(
             "IN_MH.py",
             "Invalid data read from the source, the source might not be available",
         )
 
-    image = Image.fromarray(image)  # create PIL image
-
     # Read small images for each loaction's bounding box from the main image
-    imgs = [read_image_sections(loc["value"], image) for loc in locations.values()]
+    texts = OCR_ENGINE.read(image_content, value_regions)
 
     values = {}
 
     # for each location, convert the image to a float integer and add it in the map corresponding to the key
-    for index, key in enumerate(locations):
-        digit_text = pytesseract.image_to_string(
-            imgs[index], lang="digits_comma", config="--psm 7"
-        )
+    for key, digit_text in texts.items():
         try:
             val = float(digit_text)
         except ValueError:
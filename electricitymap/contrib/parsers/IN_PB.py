@@ -5,9 +5,10 @@ from datetime import datetime
 from logging import Logger, getLogger
 from zoneinfo import ZoneInfo
 
-import requests
 from requests import Session
 
+from electricitymap.contrib.parsers.lib.session import create_session
+
 GENERATION_URL = "https://sldcapi.pstcl.org/wsDataService.asmx/pbGenData2"
 DATE_URL = "https://sldcapi.pstcl.org/wsDataService.asmx/dynamicData"
 ZONE_INFO = ZoneInfo("Asia/Kolkata")
@@ -33,7 +34,7 @@ def fetch_production(
             "The IN-PB production parser is not yet able to parse past dates"
         )
 
-    s = session or Session()
+    s = session or create_session()
     data_req = s.get(GENERATION_URL)
     timestamp_req = s.get(DATE_URL)
 
@@ -74,7 +75,7 @@ def fetch_consumption(
             "The IN-PB consumption parser is not yet able to parse past dates"
         )
 
-    s = session or requests.Session()
+    s = session or create_session()
     req = s.get(GENERATION_URL)
     raw_data = req.json()
 
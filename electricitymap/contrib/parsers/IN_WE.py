@@ -16,6 +16,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 )
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 IN_WE_PROXY = "https://in-proxy-jfnx5klx2a-el.a.run.app"
@@ -167,7 +168,7 @@ def fetch_exchange(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     if session is None:
-        session = Session()
+        session = create_session()
     if target_datetime is None:
         target_datetime = datetime.now(ZONE_INFO)
     else:
@@ -205,7 +206,7 @@ def fetch_consumption(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     if session is None:
-        session = Session()
+        session = create_session()
     if target_datetime is None:
         target_datetime = datetime.now(ZONE_INFO)
     else:
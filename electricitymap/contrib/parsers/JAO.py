@@ -46,7 +46,7 @@ from electricitymap.contrib.lib.models.events import (
 )
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
-from electricitymap.contrib.parsers.lib.session import mount_retry
+from electricitymap.contrib.parsers.lib.session import create_session, mount_retry
 from electricitymap.contrib.types import AtcType, MarketAgreementType
 
 SOURCE = "jao.eu"
@@ -342,7 +342,9 @@ def _fetch_jao_rows(
     """
     sorted_zone_keys = ZoneKey("->".join(sorted([zone_key1, zone_key2])))
     from_utc, to_utc = _target_window(target_datetime)
-    rows = _query_jao(session or Session(), region, dataset, from_utc, to_utc, logger)
+    rows = _query_jao(
+        session or create_session(), region, dataset, from_utc, to_utc, logger
+    )
     return sorted_zone_keys, rows
 
 
@@ -43,7 +43,7 @@ from electricitymap.contrib.config import ZoneKey
 from electricitymap.contrib.lib.models.event_lists import ExchangeAtcList
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
-from electricitymap.contrib.parsers.lib.session import mount_retry
+from electricitymap.contrib.parsers.lib.session import create_session, mount_retry
 from electricitymap.contrib.parsers.lib.utils import get_token
 from electricitymap.contrib.types import AtcType
 
@@ -367,7 +367,7 @@ def fetch_auction_atc_day_ahead(
     """
     sorted_zone_keys = ZoneKey("->".join(sorted([zone_key1, zone_key2])))
     from_utc, to_utc = _target_window(target_datetime)
-    session = session or Session()
+    session = session or create_session()
     mount_retry(session)
     return _extract_atc(
         sorted_zone_keys,
@@ -25,7 +25,14 @@ from electricitymap.contrib.lib.models.events import (
     ProductionMix,
     StorageMix,
 )
+from electricitymap.contrib.lib.models.frames import (
+    prices_from_frame,
+    production_breakdowns_from_frame,
+)
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
+from electricitymap.contrib.parsers.lib.response_cache import RESPONSE_CACHE
+from electricitymap.contrib.parsers.lib.session import create_session
+from electricitymap.contrib.parsers.lib.ttl_cache import day_ttl, month_ttl
 from electricitymap.contrib.types import ZoneKey
 
 # Zone key → OCCTO zone number → TSO name
@@ -99,6 +106,14 @@ def _fiscal_quarter(dt: datetime) -> int:
     return ((dt.month - 4) % 12) // 3 + 1
 
 
+# The files of past periods are final (beyond rare corrections), so they are
+# downloaded at most once a day, see `parsers.lib.response_cache`. The files of
+# the current period are updated through the day: they are revalidated on every
+# fetch, which only saves the download when the TSO's server supports it.
+# Monthly, quarterly and yearly files use `month_ttl`, daily files `day_ttl`.
+_ARCHIVE_TTL = timedelta(days=1).total_seconds()
+
+
 _AREA_CSV_CONFIGS: dict[str, _AreaCsvConfig] = {
     "JP-HKD": _AreaCsvConfig(
         start=datetime(2024, 4, 1, tzinfo=ZONE_INFO),
@@ -567,22 +582,35 @@ def _df_to_production_breakdown_list(
     if df.empty:
         return production_list.to_list()
 
-    for _, row in df.iterrows():
-        # pandas coerces the _datetime column to datetime64 when no rows were
-        # skipped, and row access then yields pandas.Timestamp — events must
-        # carry native datetime objects.
-        event_datetime = row["_datetime"]
-        if hasattr(event_datetime, "to_pydatetime"):
-            event_datetime = event_datetime.to_pydatetime()
-
-        _append_breakdown(
-            production_list,
-            zone_key,
-            event_datetime,
-            source,
-            ((target, _parse_value(row[col])) for col, target in col_targets),
-            _AREA_RESOLUTION,
-        )
+    # Parse the cells column by column; several columns can map to one mode
+    # (e.g. 火力(その他) and その他 both → "unknown") and are summed, and the
+    # storage columns are flipped from the TSO sign (positive = generating) to
+    # the EM convention, see `_append_breakdown`.
+    values = pd.DataFrame(
+        {
+            col: df[col].map(_parse_value).astype(float)
+            * (-1 if category == "storage" else 1)
+            for col, (_, category) in col_targets
+        },
+        index=df.index,
+    )
+    values["_datetime"] = df["_datetime"]
+    values["_end_datetime"] = df["_datetime"] + _AREA_RESOLUTION
+    columns: dict[str, dict[str, list[str]]] = {"production": {}, "storage": {}}
+    for col, (mode, category) in col_targets:
+        columns[category].setdefault(mode, []).append(col)
+    production_list = production_breakdowns_from_frame(
+        values,
+        logger,
+        ZoneKey(zone_key),
+        source,
+        production=columns["production"],
+        storage=columns["storage"],
+        datetime_column="_datetime",
+        end_datetime_column="_end_datetime",
+        set_missing=False,
+        correct_negative_with_zero=True,
+    )
 
     return production_list.to_list()
 
@@ -594,22 +622,34 @@ def _fetch_area_csv_content(
 
     Tries the monthly URL, then falls back to the fiscal-year ZIP (zones that
     archive older months, e.g. JP-CB) or the per-day realtime file (zones that
-    publish the monthly file late, e.g. JP-TH).
+    publish the monthly file late, e.g. JP-TH). The files of past periods are
+    cached, see `_ARCHIVE_TTL`.
     """
-    response = session.get(
-        config.url_builder(target_datetime), headers=_REQUEST_HEADERS
+    local_datetime = target_datetime.astimezone(ZONE_INFO)
+    response = RESPONSE_CACHE.fetch(
+        session,
+        config.url_builder(target_datetime),
+        ttl=month_ttl(local_datetime, 0, _ARCHIVE_TTL),
+        headers=_REQUEST_HEADERS,
     )
     if response.status_code == 404:
         if config.zip_url_builder is not None and config.zip_member_builder is not None:
-            zip_response = session.get(
-                config.zip_url_builder(target_datetime), headers=_REQUEST_HEADERS
+            zip_response = RESPONSE_CACHE.fetch(
+                session,
+                config.zip_url_builder(target_datetime),
+                ttl=month_ttl(local_datetime, 0, _ARCHIVE_TTL),
+                headers=_REQUEST_HEADERS,
             )
             zip_response.raise_for_status()
-            with ZipFile(BytesIO(zip_response.content)) as archive:
-                return archive.read(config.zip_member_builder(target_datetime))
+            return zip_response.read_zip_member(
+                config.zip_member_builder(target_datetime)
+            )
         if config.daily_url_builder is not None:
-            daily_response = session.get(
-                config.daily_url_builder(target_datetime), headers=_REQUEST_HEADERS
+            daily_response = RESPONSE_CACHE.fetch(
+                session,
+                config.daily_url_builder(target_datetime),
+                ttl=day_ttl(local_datetime, 0, _ARCHIVE_TTL),
+                headers=_REQUEST_HEADERS,
             )
             daily_response.raise_for_status()
             return daily_response.content
@@ -626,7 +666,7 @@ def _fetch_production_area_csv(
 ) -> list:
     """Fetch and parse the area supply-demand CSV for a zone."""
     config = _AREA_CSV_CONFIGS[zone_key]
-    session = session or Session()
+    session = session or create_session()
     content = _fetch_area_csv_content(config, target_datetime, session)
     df = _read_area_csv(content)
     return _df_to_production_breakdown_list(
@@ -774,13 +814,6 @@ def _legacy_df_to_breakdown(
     return production_list.to_list()
 
 
-# Legacy archives are immutable historical files that cover a quarter or a
-# whole fiscal year, but the parser is invoked one day at a time — without a
-# cache a year of backfill would re-download the same annual file ~365 times.
-_ARCHIVE_CACHE: dict[str, bytes] = {}
-_ARCHIVE_CACHE_MAX = 4
-
-
 def _fetch_production_legacy_area_csv(
     zone_key: str,
     target_datetime: datetime,
@@ -790,33 +823,36 @@ def _fetch_production_legacy_area_csv(
 ) -> list:
     """Fetch and parse a pre-new-format legacy area archive (hourly, ~2016+)."""
     config = _LEGACY_AREA_CONFIGS[zone_key]
-    session = session or Session()
+    session = session or create_session()
     url = config.url_builder(target_datetime)
-    content = _ARCHIVE_CACHE.get(url)
-    if content is None:
-        headers = dict(_REQUEST_HEADERS)
-        if config.referer:
-            headers["Referer"] = config.referer
-        response = session.get(url, headers=headers)
-        isep = _ISEP_CONFIGS.get(zone_key)
-        if (
-            response.status_code == 404
-            and isep is not None
-            and target_datetime >= isep.start
-        ):
-            # Some archive files simply don't exist (e.g. HEPCO never published
-            # FY2018 Q2, the Hokkaido-blackout quarter) — fill from ISEP.
-            logger.info(f"{zone_key}: {url} does not exist, falling back to ISEP")
-            return _fetch_production_isep(zone_key, target_datetime, session, logger)
-        response.raise_for_status()
-        content = response.content
-        while len(_ARCHIVE_CACHE) >= _ARCHIVE_CACHE_MAX:
-            _ARCHIVE_CACHE.pop(next(iter(_ARCHIVE_CACHE)))
-        _ARCHIVE_CACHE[url] = content
+    headers = dict(_REQUEST_HEADERS)
+    if config.referer:
+        headers["Referer"] = config.referer
+    # Legacy archives are immutable historical files that cover a quarter or a
+    # whole fiscal year, but the parser is invoked one day at a time — without
+    # the cache a year of backfill would re-download the same annual file ~365
+    # times.
+    response = RESPONSE_CACHE.fetch(
+        session,
+        url,
+        ttl=month_ttl(target_datetime.astimezone(ZONE_INFO), 0, _ARCHIVE_TTL),
+        headers=headers,
+    )
+    isep = _ISEP_CONFIGS.get(zone_key)
+    if (
+        response.status_code == 404
+        and isep is not None
+        and target_datetime >= isep.start
+    ):
+        # Some archive files simply don't exist (e.g. HEPCO never published
+        # FY2018 Q2, the Hokkaido-blackout quarter) — fill from ISEP.
+        logger.info(f"{zone_key}: {url} does not exist, falling back to ISEP")
+        return _fetch_production_isep(zone_key, target_datetime, session, logger)
+    response.raise_for_status()
     df = (
-        _read_legacy_area_xlsx(content)
+        _read_legacy_area_xlsx(response.content)
         if config.xlsx
-        else _read_legacy_area_csv(content)
+        else _read_legacy_area_csv(response.content)
     )
     return _legacy_df_to_breakdown(df, config, zone_key, target_datetime, logger)
 
@@ -881,7 +917,7 @@ def _fetch_production_isep(
 ) -> list:
     """Fetch one day of hourly production from ISEP energychart."""
     config = _ISEP_CONFIGS[zone_key]
-    session = session or Session()
+    session = session or create_session()
     url = _ISEP_URL.format(
         region=config.region,
         year=target_datetime.year,
@@ -999,29 +1035,22 @@ def fetch_price(
     df["Date"] = pd.to_datetime(df["Date"], format="%Y/%m/%d").dt.date
     df = df[(df["Date"] >= start.date()) & (df["Date"] <= target_datetime.date())]
 
-    df["datetime"] = df.apply(
-        lambda row: (
-            datetime.combine(row["Date"], datetime.min.time()).replace(tzinfo=ZONE_INFO)
-            + timedelta(minutes=30 * (row["Period"] - 1))
-        ),
-        axis=1,
+    df["datetime"] = pd.to_datetime(df["Date"]) + pd.to_timedelta(
+        30 * (df["Period"] - 1), unit="min"
     )
+    # Convert from JPY/kWh to JPY/MWh
+    df["price"] = (1000 * df[zone_key]).astype(int).round(-1)
 
-    data = []
-    for row in df.iterrows():
-        data.append(
-            {
-                "zoneKey": zone_key,
-                "currency": "JPY",
-                "datetime": row[1]["datetime"].to_pydatetime(),
-                "price": round(
-                    int(1000 * row[1][zone_key]), -1
-                ),  # Convert from JPY/kWh to JPY/MWh
-                "source": "jepx.jp",
-            }
-        )
-
-    return data
+    return prices_from_frame(
+        df,
+        logger,
+        ZoneKey(zone_key),
+        "jepx.jp",
+        "price",
+        "JPY",
+        datetime_column="datetime",
+        tz=ZONE_INFO,
+    ).to_list()
 
 
 SOURCES_FORECAST_DATA = {
@@ -1158,7 +1187,7 @@ def fetch_consumption_forecast(
 ) -> list[dict[str, Any]]:
     """Gets demand/consumption forecast for every half hour for the specified Japan zones in MW."""
     # Session
-    session = session or Session()
+    session = session or create_session()
 
     # Date
     # Currently past dates not implemented for areas with no date in their demand csv files
@@ -1224,7 +1253,7 @@ def fetch_generation_forecast(
     """Gets generation forecast for every half hour for the specified Japan zones in MW."""
 
     # Session
-    session = session or Session()
+    session = session or create_session()
 
     # Date
     # Currently past dates not implemented for areas with no date in their demand csv files
@@ -16,6 +16,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 from electricitymap.contrib.lib.models.events import ProductionMix, StorageMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency, use_proxy
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 
 TIMEZONE = ZoneInfo("Asia/Seoul")
 KR_CURRENCY = "KRW"
@@ -111,7 +112,7 @@ def fetch_consumption(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict]:
-    session = session or Session()
+    session = session or create_session()
     if target_datetime:
         raise ParserException(
             "KPX.py",
@@ -134,7 +135,7 @@ def fetch_price(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict]:
-    session = session or Session()
+    session = session or create_session()
     now = datetime.now(tz=TIMEZONE)
     target_datetime = (
         now if target_datetime is None else target_datetime.astimezone(TIMEZONE)
@@ -235,7 +236,7 @@ def get_real_time_prod_data(
     session: Session | None = None,
     logger: Logger = getLogger(__name__),
 ) -> ProductionBreakdownList:
-    session = session or Session()
+    session = session or create_session()
     res = session.get(REAL_TIME_URL, verify=False)
     return parse_chart_prod_data(res.text, zone_key, logger)
 
@@ -246,7 +247,7 @@ def get_historical_prod_data(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> ProductionBreakdownList:
-    session = session or Session()
+    session = session or create_session()
     target_datetime_formatted_daily = target_datetime.strftime("%Y-%m-%d")
 
     # CSRF token is needed to access the production data
@@ -279,7 +280,7 @@ def fetch_production(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict]:
-    session = session or Session()
+    session = session or create_session()
     first_available_date = datetime(2021, 12, 22, 0, 0, 0, tzinfo=TIMEZONE)
     if target_datetime is not None and target_datetime < first_available_date:
         raise ParserException(
@@ -21,6 +21,7 @@ from electricitymap.contrib.config import ZoneKey
 from electricitymap.contrib.lib.models.event_lists import (
     TotalConsumptionList,
 )
+from electricitymap.contrib.parsers.lib.session import create_session
 
 
 # A workaround is required to connect to the API as of 2025-01-14, to avoid the
@@ -61,7 +62,7 @@ def fetch_consumption(
 ) -> list[dict[str, Any]]:
     if target_datetime:
         raise NotImplementedError("This parser is not yet able to parse past dates")
-    r = _patch_session_for_legacy_connect(session or Session())
+    r = _patch_session_for_legacy_connect(session or create_session())
 
     url = "https://www.mew.gov.kw/en"
     response = r.get(url)
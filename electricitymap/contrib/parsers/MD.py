@@ -28,6 +28,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 from electricitymap.contrib.lib.models.events import EventSourceType, ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 PARSER = "MD.py"
@@ -109,7 +110,7 @@ def _get_archive_data(
     date2 = target_utc_timestamp_to.astimezone(TZ).strftime("%d.%m.%Y")
     archive_url = f"{ARCHIVE_BASE_URL}&date1={date1}&date2={date2}"
 
-    s = session or Session()
+    s = session or create_session()
     response = s.get(archive_url)
     if not response.ok:
         raise ParserException(
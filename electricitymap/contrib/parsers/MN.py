@@ -14,6 +14,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 )
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 
 NDC_API = "https://disnews.energy.mn/convertt.php"
 TZ = ZoneInfo("Asia/Ulaanbaatar")  # UTC+8
@@ -94,7 +95,7 @@ def _fetch_and_parse(session: Session) -> dict[str, Any]:
 
 def fetch_production(
     zone_key: ZoneKey = ZoneKey("MN"),
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ):
@@ -121,7 +122,7 @@ def fetch_production(
 
 def fetch_consumption(
     zone_key: ZoneKey = ZoneKey("MN"),
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ):
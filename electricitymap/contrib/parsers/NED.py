@@ -21,6 +21,7 @@ from electricitymap.contrib.parsers.ENTSOE import (
 )
 from electricitymap.contrib.parsers.lib.config import ProductionModes, refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.parsers.lib.utils import get_token
 from electricitymap.contrib.types import ZoneKey
 
@@ -275,7 +276,7 @@ def fetch_production(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list:
-    session = session or Session()
+    session = session or create_session()
     target_datetime = target_datetime or datetime.now(timezone.utc)
 
     json_data = call_api(target_datetime)
@@ -307,7 +308,7 @@ def fetch_production_forecast(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list:
-    session = session or Session()
+    session = session or create_session()
     target_datetime = target_datetime or datetime.now(timezone.utc)
     json_data = call_api(target_datetime, forecast=True)
     NED_data = format_data(json_data, logger, forecast=True)
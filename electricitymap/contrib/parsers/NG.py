@@ -14,6 +14,7 @@ from requests import Session
 from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownList
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib import config
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 API_URL = urllib.parse.urlparse("https://niggrid.org/GenerationProfile2")
@@ -90,7 +91,7 @@ def fetch_production(
         TIMEZONE
     )
 
-    session = session or Session()
+    session = session or create_session()
     production_dict = get_data(session=session, logger=logger, timestamp=timestamp)
 
     # Add data from previous day if few hours ago to update preliminary data
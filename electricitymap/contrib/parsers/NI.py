@@ -14,6 +14,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib import config
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 TIMEZONE = ZoneInfo("America/Managua")
@@ -71,7 +72,7 @@ def fetch_production(
 
     url = "https://www.cndc.org.ni/graficos/consultarGeneracionPorTipo"
 
-    requests_obj = session or Session()
+    requests_obj = session or create_session()
     response = requests_obj.get(url)
     if not response.ok:
         raise ParserException(
@@ -122,7 +123,7 @@ def fetch_exchange(
 
     url = "https://www.cndc.org.ni/Inicio/ConsultarTipoGeneracion"
 
-    requests_obj = session or Session()
+    requests_obj = session or create_session()
     response = requests_obj.get(url)
 
     if not response.ok:
@@ -175,7 +176,7 @@ def fetch_price(
         raise NotImplementedError("This parser is not yet able to parse past dates")
 
     url = "https://www.cndc.org.ni/Inicio/consultarInfoTecnicaRelevante"
-    requests_obj = session or Session()
+    requests_obj = session or create_session()
     response = requests_obj.get(url)
     if not response.ok:
         raise ParserException(
@@ -8,6 +8,7 @@ from requests import Session, get
 from electricitymap.contrib.config import ZONES_CONFIG
 from electricitymap.contrib.parsers import DK, ENTSOE
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 ZONE_CONFIG = ZONES_CONFIG["NL"]
@@ -27,7 +28,7 @@ def fetch_production(
         else target_datetime.astimezone(UTC)
     )
 
-    r = session or Session()
+    r = session or create_session()
 
     consumptions = ENTSOE.fetch_consumption(
         zone_key=zone_key, session=r, target_datetime=target_datetime, logger=logger
@@ -1,5 +1,4 @@
 import time
-from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from logging import Logger, getLogger
@@ -20,7 +19,8 @@ from electricitymap.contrib.parsers.lib.nordpool_intraday_schemas import (
 from electricitymap.contrib.types import AtcType, ZoneKey
 
 from .lib.config import refetch_frequency
-from .lib.session import mount_retry
+from .lib.session import create_session, mount_retry
+from .lib.token_cache import TOKEN_CACHE, CachedToken
 from .lib.utils import get_token
 
 """
@@ -31,17 +31,8 @@ API documentation: https://data-api.nordpoolgroup.com/index.html
 NORDPOOL_BASE_URL = "https://data-api.nordpoolgroup.com/api/v2/"
 
 
-@dataclass
-class NordpoolToken:
-    token: str
-    expiration: datetime
-
-    @property
-    def is_expired(self) -> bool:
-        return datetime.now(tz=timezone.utc) > self.expiration + timedelta(minutes=5)
-
-
-CURRENT_TOKEN: NordpoolToken | None = None
+# The provider of the Nordpool tokens in `TOKEN_CACHE`.
+TOKEN_PROVIDER = "nordpool"
 
 SOURCE = "nordpool.com"
 
@@ -134,7 +125,7 @@ NORDPOOL_BORDERS: dict[ZoneKey, tuple[str, str]] = {
 }
 
 
-def _generate_new_nordpool_token(session: Session) -> NordpoolToken:
+def _generate_new_nordpool_token(session: Session) -> CachedToken:
     URL = "https://sts.nordpoolgroup.com/connect/token"
     username = get_token("EMAPS_NORDPOOL_USERNAME")
     password = get_token("EMAPS_NORDPOOL_PASSWORD")
@@ -152,13 +143,7 @@ def _generate_new_nordpool_token(session: Session) -> NordpoolToken:
     response = session.post(URL, headers=headers, data=data)
     response = _handle_status_code(response, getLogger(__name__))
     token_data = response.json()
-    token = NordpoolToken(
-        token=token_data["access_token"],
-        expiration=datetime.now(tz=timezone.utc)
-        + timedelta(seconds=token_data["expires_in"]),
-    )
-
-    return token
+    return CachedToken.expiring_in(token_data["access_token"], token_data["expires_in"])
 
 
 def _handle_status_code(response: Response, logger: Logger) -> Response:
@@ -193,37 +178,53 @@ def _query_nordpool(
     logger: Logger,
     session: Session,
 ):
-    global CURRENT_TOKEN
-    if CURRENT_TOKEN is None or CURRENT_TOKEN.is_expired:
-        CURRENT_TOKEN = _generate_new_nordpool_token(session)
+    token = TOKEN_CACHE.get(
+        TOKEN_PROVIDER, lambda: _generate_new_nordpool_token(session)
+    )
     headers = {
-        "Authorization": f"Bearer {CURRENT_TOKEN.token}",
+        "Authorization": f"Bearer {token}",
     }
 
     response = session.get(
         f"{NORDPOOL_BASE_URL}{endpoint.value}", params=params, headers=headers
     )
+    if response.status_code == 401:
+        # The token was revoked before its expiry, the next query logs in again.
+        TOKEN_CACHE.invalidate(TOKEN_PROVIDER)
 
     response = _handle_status_code(response, logger)
     return response
 
 
-def _parse_price(response: Response, logger: Logger) -> PriceList:
-    price_list = PriceList(logger)
-    json = response.json()[0]
-    prices = json["prices"]
-    for price in prices:
+def _append_area_prices(price_list: PriceList, area: dict) -> None:
+    for price in area["prices"]:
         price_list.append(
-            zoneKey=ZoneKey(INVERTED_ZONE_MAPPING[json["deliveryArea"]]),
+            zoneKey=ZoneKey(INVERTED_ZONE_MAPPING[area["deliveryArea"]]),
             price=price["price"],
             datetime=datetime.fromisoformat(zulu_to_utc(price["deliveryStart"])),
             end_datetime=datetime.fromisoformat(zulu_to_utc(price["deliveryEnd"])),
-            currency=json["currency"],
+            currency=area["currency"],
             source=SOURCE,
         )
+
+
+def _parse_price(response: Response, logger: Logger) -> PriceList:
+    price_list = PriceList(logger)
+    _append_area_prices(price_list, response.json()[0])
     return price_list
 
 
+def _price_params(zone_key: ZoneKey) -> dict[str, str]:
+    return {
+        "currency": CURRENCY.EUR.value
+        if zone_key != ZoneKey("GB")  # GB uses GBP not EUR
+        else CURRENCY.GBP.value,
+        "market": MARKET_TYPE.DAY_AHEAD.value
+        if zone_key != ZoneKey("GB")  # GB uses it's own 30 minute TMU day ahead market
+        else MARKET_TYPE.GB_DAY_AHEAD.value,
+    }
+
+
 @refetch_frequency(timedelta(days=1))
 def fetch_price(
     zone_key: ZoneKey,
@@ -231,16 +232,11 @@ def fetch_price(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list:
-    session = mount_retry(session or Session(), retry=_NORDPOOL_RETRY)
+    session = mount_retry(session or create_session(), retry=_NORDPOOL_RETRY)
     target_datetime = target_datetime or datetime.now()
     params = {
         "areas": f"{ZONE_MAPPING[zone_key]}",
-        "currency": CURRENCY.EUR.value
-        if zone_key != ZoneKey("GB")  # GB uses GBP not EUR
-        else CURRENCY.GBP.value,
-        "market": MARKET_TYPE.DAY_AHEAD.value
-        if zone_key != ZoneKey("GB")  # GB uses it's own 30 minute TMU day ahead market
-        else MARKET_TYPE.GB_DAY_AHEAD.value,
+        **_price_params(zone_key),
         "date": target_datetime.date().isoformat(),
     }
     response_target = _query_nordpool(
@@ -258,6 +254,51 @@ def fetch_price(
     return (price_data_target + price_data_target_day_ahead).to_list()
 
 
+@refetch_frequency(timedelta(days=1))
+def fetch_price_for_zones(
+    zone_keys: list[ZoneKey],
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict[ZoneKey, list]:
+    """
+    Bulk counterpart of `fetch_price`: the areas sharing a currency and a market
+    are requested together, so that all zones cost two requests per market.
+    """
+    session = mount_retry(session or create_session(), retry=_NORDPOOL_RETRY)
+    target_datetime = target_datetime or datetime.now()
+    zone_keys_by_market: dict[tuple[str, str], list[ZoneKey]] = {}
+    for zone_key in zone_keys:
+        market_params = _price_params(zone_key)
+        zone_keys_by_market.setdefault(
+            (market_params["currency"], market_params["market"]), []
+        ).append(zone_key)
+
+    price_lists = {zone_key: PriceList(logger) for zone_key in zone_keys}
+    for (currency, market), market_zone_keys in zone_keys_by_market.items():
+        for date in (target_datetime, target_datetime + timedelta(days=1)):
+            params = {
+                "areas": ",".join(
+                    ZONE_MAPPING[zone_key] for zone_key in market_zone_keys
+                ),
+                "currency": currency,
+                "market": market,
+                "date": date.date().isoformat(),
+            }
+            response = _query_nordpool(
+                NORDPOOL_API_ENDPOINT.PRICE, params, logger, session
+            )
+            for area in response.json():
+                _append_area_prices(
+                    price_lists[ZoneKey(INVERTED_ZONE_MAPPING[area["deliveryArea"]])],
+                    area,
+                )
+
+    return {
+        zone_key: price_list.to_list() for zone_key, price_list in price_lists.items()
+    }
+
+
 def _parse_exchange(response: Response, logger: Logger, target_zone) -> ExchangeList:
     exchange_list = ExchangeList(logger)
     json = response.json()[0]
@@ -295,7 +336,7 @@ def fetch_exchange(
     Gets exchange status between two specified zones.
     Only supports Nordpool zones.
     """
-    session = mount_retry(session or Session(), retry=_NORDPOOL_RETRY)
+    session = mount_retry(session or create_session(), retry=_NORDPOOL_RETRY)
     target_datetime = target_datetime or datetime.now()
     params = {
         "areas": f"{ZONE_MAPPING[zone_key1]}",
@@ -353,7 +394,7 @@ def fetch_intraday_contract_statistics(
             f"fetch_intraday_contract_statistics is not yet implemented for zone: {zone_key}"
         )
 
-    session = mount_retry(session or Session(), retry=_NORDPOOL_RETRY)
+    session = mount_retry(session or create_session(), retry=_NORDPOOL_RETRY)
 
     # Convert to CET date for the API call.
     from zoneinfo import ZoneInfo
@@ -507,7 +548,7 @@ def fetch_exchange_available_transfer_capacity(
         )
     query_area, counterpart = border
 
-    session = mount_retry(session or Session(), retry=_NORDPOOL_RETRY)
+    session = mount_retry(session or create_session(), retry=_NORDPOOL_RETRY)
     target_datetime = target_datetime or datetime.now()
 
     params = {
@@ -6,12 +6,16 @@ https://territorygeneration.com.au/about-us/our-power-stations/
 """
 
 import collections
+import json
 import logging
 import math
 import re
 from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta, timezone
 from logging import Logger, getLogger
+from pathlib import Path
+from threading import Lock
 from typing import Any, TypedDict
 from zoneinfo import ZoneInfo
 
@@ -23,7 +27,9 @@ from requests.adapters import Retry
 from electricitymap.contrib.lib.models.event_lists import TotalConsumptionList
 from electricitymap.contrib.lib.models.events import EventSourceType
 from electricitymap.contrib.parsers.lib.config import refetch_frequency, retry_policy
+from electricitymap.contrib.parsers.lib.disk_cache import write_atomically
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 PARSER = "NTESMO.py"
@@ -119,47 +125,228 @@ def _scan_daily_report_urls(
                 yield dt, a["href"]
 
 
-def _find_link_to_daily_report(target_datetime: datetime, session: Session) -> str:
-    """Scrapes daily report cards to find the link to the data for the target date."""
+def _daily_trading_page_url(page_number: int) -> str:
+    return f"{API_URL}?result_70160_result_page={page_number}"
 
-    today_datetime = datetime.now(AUSTRALIA_TZ)
-    today_date = today_datetime.date()
-    target_datetime = target_datetime.astimezone(AUSTRALIA_TZ)
-    target_date = target_datetime.date()
-
-    is_this_year = target_date.year == today_date.year
-    if is_this_year:
-        # current year's report cards are paginated (9 per page) [and in reverse chronological order, latest data first]
-        maximum_possible_num_pages = int(math.ceil(365 / 9))
-        urls = (
-            f"{API_URL}?result_70160_result_page={page_number}"
-            # page 0 is a hidden page. Usually it's just a duplicate of page=1, but it seems like sometimes it's
-            # updated with new daily data before page 1 is.
-            for page_number in range(0, maximum_possible_num_pages + 1)
+
+def _historical_daily_trading_url(year: int) -> str:
+    return f"{API_URL}/historical-daily-trading-data/{year}-daily-trading-data"
+
+
+@dataclass
+class _Listing:
+    """The part of the current year's paginated report cards already indexed."""
+
+    year: int
+    # The reports of the dates in between are all indexed.
+    oldest_date: date
+    newest_date: date
+    last_page_number: int
+    exhausted: bool = False
+
+
+class DailyReportIndex:
+    """
+    An index of the links to the daily reports by date, filled incrementally.
+
+    Finding the report of one day takes scanning up to 41 pages of report cards.
+    The index keeps the links seen along the way, so that:
+    - the page of a past year, which never changes, is scanned once,
+    - the pages of the current year are scanned from the newest one only until
+      the newest date already indexed, or further back from where the previous
+      scan stopped, as reports are only ever added at the top.
+    """
+
+    # current year's report cards are paginated (9 per page) [and in reverse chronological order, latest data first]
+    MAXIMUM_NUM_PAGES = int(math.ceil(365 / 9))
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path is not None else None
+        self._links: dict[date, str] = {}
+        self._historical_years: set[int] = set()
+        self._listing: _Listing | None = None
+        self._loaded = False
+        self._lock = Lock()
+
+    def find(self, target_date: date, today_date: date, session: Session) -> str:
+        """Returns the link to the report of `target_date`, scanning the pages needed."""
+        with self._lock:
+            self._load()
+            link = self._links.get(target_date)
+            if link is None:
+                if target_date.year == today_date.year:
+                    link = self._find_in_listing(target_date, today_date.year, session)
+                else:
+                    link = self._find_in_historical_page(target_date, session)
+                self._save()
+        if link is None:
+            raise ParserException(
+                PARSER,
+                f"Cannot find link to daily report for date {target_date.strftime('%Y-%m-%d %Z')}",
+            )
+        return link
+
+    def enable_disk_cache(self, path: str | Path) -> None:
+        """
+        Keeps the index in the JSON file at `path`, reading the links stored
+        there on the next lookup. The days of a backfill split across runs
+        then only scan the pages no earlier run has indexed.
+        """
+        with self._lock:
+            self.path = Path(path)
+            self._loaded = False
+
+    def reset(self) -> None:
+        """Forgets the links indexed by this process, e.g. between tests.
+        The links stored on disk are read again on the next lookup."""
+        with self._lock:
+            self._links.clear()
+            self._historical_years.clear()
+            self._listing = None
+            self._loaded = False
+
+    def _find_in_historical_page(
+        self, target_date: date, session: Session
+    ) -> str | None:
+        if target_date.year not in self._historical_years:
+            # historical report cards are all on the same page
+            url = _historical_daily_trading_url(target_date.year)
+            self._links.update(_scan_daily_report_urls([url], session=session))
+            self._historical_years.add(target_date.year)
+        return self._links.get(target_date)
+
+    def _find_in_listing(
+        self, target_date: date, year: int, session: Session
+    ) -> str | None:
+        listing = self._listing
+        if listing is None or listing.year != year:
+            listing = None
+        if listing is None or target_date > listing.newest_date:
+            listing = self._scan_newest_pages(target_date, year, listing, session)
+            if listing is None:
+                return None
+            self._listing = listing
+
+        # cap target date if more recent than what the API makes available:
+        # data for a given day is published with a variable delay (+1-4 days)
+        if target_date >= listing.newest_date:
+            return self._links[listing.newest_date]
+
+        self._scan_older_pages(target_date, listing, session)
+        return self._links.get(target_date)
+
+    def _scan_newest_pages(
+        self,
+        target_date: date,
+        year: int,
+        listing: _Listing | None,
+        session: Session,
+    ) -> _Listing | None:
+        """Scans the newest pages down to the indexed ones, or to the target date."""
+        scanned: _Listing | None = None
+        # page 0 is a hidden page. Usually it's just a duplicate of page=1, but it seems like sometimes it's
+        # updated with new daily data before page 1 is.
+        for page_number in range(self.MAXIMUM_NUM_PAGES + 1):
+            dates = self._scan_listing_page(page_number, session)
+            if dates is None:
+                if scanned is not None:
+                    scanned.exhausted = True
+                break
+            oldest_date, newest_date = dates
+            if scanned is None:
+                scanned = _Listing(year, oldest_date, newest_date, page_number)
+            else:
+                scanned.oldest_date = min(scanned.oldest_date, oldest_date)
+                scanned.newest_date = max(scanned.newest_date, newest_date)
+                scanned.last_page_number = page_number
+            if listing is not None and oldest_date <= listing.newest_date:
+                # Joined with the pages indexed before.
+                return _Listing(
+                    year,
+                    min(listing.oldest_date, scanned.oldest_date),
+                    max(listing.newest_date, scanned.newest_date),
+                    max(listing.last_page_number, scanned.last_page_number),
+                    listing.exhausted,
+                )
+            if oldest_date <= target_date:
+                break
+        return scanned or listing
+
+    def _scan_older_pages(
+        self, target_date: date, listing: _Listing, session: Session
+    ) -> None:
+        """Scans the pages after the last one scanned until the target date is reached."""
+        while target_date < listing.oldest_date and not listing.exhausted:
+            page_number = listing.last_page_number + 1
+            dates = (
+                self._scan_listing_page(page_number, session)
+                if page_number <= self.MAXIMUM_NUM_PAGES
+                else None
+            )
+            if dates is None:
+                listing.exhausted = True
+                break
+            listing.oldest_date = min(listing.oldest_date, dates[0])
+            listing.last_page_number = page_number
+
+    def _scan_listing_page(
+        self, page_number: int, session: Session
+    ) -> tuple[date, date] | None:
+        """Indexes a page of the current year, returning its oldest and newest dates."""
+        links = dict(
+            _scan_daily_report_urls([_daily_trading_page_url(page_number)], session)
         )
-    else:
-        # historical report cards are all on the same page
-        urls = [
-            f"{API_URL}/historical-daily-trading-data/{target_date.year}-daily-trading-data"
-        ]
-
-    index = _scan_daily_report_urls(urls, session=session)
-
-    # cap target date if more recent than what the API makes available:
-    # data for a given day is published with a variable delay (+1-4 days)
-    if is_this_year:
-        date_of_latest_available_data, link = next(index)
-        if target_date >= date_of_latest_available_data:
-            return link
-
-    for dt, link in index:
-        if dt == target_date:
-            return link
-
-    raise ParserException(
-        PARSER,
-        f"Cannot find link to daily report for date {target_date.strftime('%Y-%m-%d %Z')}",
-    )
+        if not links:
+            return None
+        self._links.update(links)
+        return min(links), max(links)
+
+    # The index is stored on disk as a JSON file of the links by ISO date and of
+    # the historical years fully indexed. The current year's listing is not
+    # stored, and is scanned again by new processes when needed.
+
+    def _load(self) -> None:
+        if self._loaded or self.path is None:
+            return
+        self._loaded = True
+        try:
+            stored = json.loads(self.path.read_text())
+            links = {
+                date.fromisoformat(day): link for day, link in stored["links"].items()
+            }
+            historical_years = set(stored["historical_years"])
+        except (OSError, KeyError, TypeError, ValueError):
+            return
+        self._links.update(links)
+        self._historical_years.update(historical_years)
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        stored = {
+            "links": {day.isoformat(): link for day, link in self._links.items()},
+            "historical_years": sorted(self._historical_years),
+        }
+        write_atomically(self.path, json.dumps(stored).encode())
+
+
+# The report links found by the calls of the process, also read from and saved
+# to a file once `enable_daily_report_index_disk_cache` is called.
+DAILY_REPORT_INDEX = DailyReportIndex()
+
+
+def enable_daily_report_index_disk_cache(path: str | Path) -> None:
+    """Keep the links of `DAILY_REPORT_INDEX` in the JSON file at `path`,
+    see `DailyReportIndex.enable_disk_cache`."""
+    DAILY_REPORT_INDEX.enable_disk_cache(path)
+
+
+def _find_link_to_daily_report(target_datetime: datetime, session: Session) -> str:
+    """Finds the link to the data for the target date in the index of daily reports."""
+
+    today_date = datetime.now(AUSTRALIA_TZ).date()
+    target_date = target_datetime.astimezone(AUSTRALIA_TZ).date()
+    return DAILY_REPORT_INDEX.find(target_date, today_date, session)
 
 
 def get_daily_report_data(
@@ -167,7 +354,7 @@ def get_daily_report_data(
     session: Session | None,
     target_datetime: datetime,
 ) -> bytes:
-    session = session or Session()
+    session = session or create_session()
 
     link_to_daily_report = _find_link_to_daily_report(
         target_datetime=target_datetime, session=session
@@ -361,7 +548,7 @@ def fetch_consumption_forecast(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """Requests the latest demand forecast for every half an hour until 7 days ahead in MW."""
-    session = session or Session()
+    session = session or create_session()
 
     url_dk = "https://ntesmo.com.au/data/data-dashboard/2024-enhancements/demand-forecast/darwin-katherine/dk-7-days-forecast"
     url_as = "https://ntesmo.com.au/data/data-dashboard/2024-enhancements/demand-forecast/alice-springs/as-7-days-forecast"
@@ -17,6 +17,7 @@ from electricitymap.contrib.lib.models.event_lists import (
     ProductionBreakdownList,
 )
 from electricitymap.contrib.lib.models.events import ProductionMix, StorageMix
+from electricitymap.contrib.parsers.lib.session import create_session
 
 time_zone = "Pacific/Auckland"
 
@@ -26,7 +27,7 @@ PRICE_URL = "https://api.em6.co.nz/ords/em6/data_api/region/price/"
 
 
 def fetch(session: Session | None = None):
-    r = session or Session()
+    r = session or create_session()
     url = PRODUCTION_URL
     response = r.get(url)
     soup = BeautifulSoup(response.text, "html.parser")
@@ -54,7 +55,7 @@ def fetch_price(
             "This parser is not able to retrieve data for past dates"
         )
 
-    r = session or Session()
+    r = session or create_session()
     url = PRICE_URL
     response = r.get(url, verify=False)
     obj = response.json()
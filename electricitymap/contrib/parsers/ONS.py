@@ -9,6 +9,7 @@ from electricitymap.contrib.lib.models.event_lists import (
     ProductionBreakdownList,
 )
 from electricitymap.contrib.lib.models.events import ProductionMix
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 URL = "http://tr.ons.org.br/Content/GetBalancoEnergetico/null"
@@ -48,7 +49,7 @@ EXCHANGES = {
 
 def get_data(session: Session | None):
     """Requests generation data in json format."""
-    s = session or Session()
+    s = session or create_session()
     json_data = s.get(URL).json()
 
     return json_data
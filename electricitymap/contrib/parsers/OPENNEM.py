@@ -14,6 +14,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 from electricitymap.contrib.lib.models.events import ProductionMix, StorageMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.parsers.lib.utils import get_token
 from electricitymap.contrib.types import ZoneKey
 
@@ -28,6 +29,9 @@ ZONE_KEY_TO_REGION = {
     "AU-VIC": "VIC1",
     "AU-WA": "WEM",
 }
+REGION_TO_ZONE_KEY = {
+    region: ZoneKey(zone_key) for zone_key, region in ZONE_KEY_TO_REGION.items()
+}
 ZONE_KEY_TO_NETWORK = {
     "AU-NSW": "NEM",
     "AU-QLD": "NEM",
@@ -272,7 +276,7 @@ def process_production_datasets(
     # TODO: Remove this once the race condition between feeder-electricity and quality validation is fixed
     corrected_breakdown = ProductionBreakdownList(logger=logger)
     for event in merged_production:
-        for mode, value in event.production.__dict__.items():
+        for mode, value in event.production:
             if mode != "solar" and value is not None:
                 dt = event.datetime
                 production = event.production
@@ -298,7 +302,7 @@ def fetch_production(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
-    session = session or Session()
+    session = session or create_session()
 
     # Get network_region for the zone (will be included if available)
     network_region = ZONE_KEY_TO_REGION.get(zone_key)
@@ -329,7 +333,7 @@ def fetch_price(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list:
-    session = session or Session()
+    session = session or create_session()
     target_datetime = target_datetime or datetime.now(tz=timezone.utc)
 
     datasets = _fetch_network_datasets(
@@ -358,7 +362,7 @@ def fetch_consumption(
     (see opennem/opennem#500). Keep AEMO.fetch_consumption_forecast for
     forecasted demand; this parser covers observed load only.
     """
-    session = session or Session()
+    session = session or create_session()
     target_datetime = target_datetime or datetime.now(tz=timezone.utc)
 
     datasets = _fetch_network_datasets(
@@ -372,6 +376,85 @@ def fetch_consumption(
     return _build_consumption_list(datasets, zone_key, logger).to_list()
 
 
+@refetch_frequency(REFETCH_FREQUENCY)
+def fetch_production_for_zones(
+    zone_keys: list[ZoneKey],
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict[ZoneKey, list[dict[str, Any]]]:
+    """Bulk counterpart of `fetch_production`, with one request per network."""
+    session = session or create_session()
+
+    datasets_by_zone = _fetch_network_datasets_for_zones(
+        zone_keys=zone_keys,
+        session=session,
+        dataset_type="data",
+        target_datetime=target_datetime,
+        metrics=["power"],
+        secondary_grouping="fueltech",
+    )
+
+    return {
+        zone_key: process_production_datasets(
+            datasets=datasets,
+            zone_key=zone_key,
+            logger=logger,
+        ).to_list()
+        for zone_key, datasets in datasets_by_zone.items()
+    }
+
+
+@refetch_frequency(REFETCH_FREQUENCY)
+def fetch_price_for_zones(
+    zone_keys: list[ZoneKey],
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict[ZoneKey, list]:
+    """Bulk counterpart of `fetch_price`, with one request per network."""
+    session = session or create_session()
+    target_datetime = target_datetime or datetime.now(tz=timezone.utc)
+
+    datasets_by_zone = _fetch_network_datasets_for_zones(
+        zone_keys=zone_keys,
+        session=session,
+        dataset_type="market",
+        target_datetime=target_datetime,
+        metrics=["price"],
+    )
+
+    return {
+        zone_key: _build_price_list(datasets, zone_key, logger).to_list()
+        for zone_key, datasets in datasets_by_zone.items()
+    }
+
+
+@refetch_frequency(REFETCH_FREQUENCY)
+def fetch_consumption_for_zones(
+    zone_keys: list[ZoneKey],
+    session: Session | None = None,
+    target_datetime: datetime | None = None,
+    logger: Logger = getLogger(__name__),
+) -> dict[ZoneKey, list[dict[str, Any]]]:
+    """Bulk counterpart of `fetch_consumption`, with one request per network."""
+    session = session or create_session()
+    target_datetime = target_datetime or datetime.now(tz=timezone.utc)
+
+    datasets_by_zone = _fetch_network_datasets_for_zones(
+        zone_keys=zone_keys,
+        session=session,
+        dataset_type="market",
+        target_datetime=target_datetime,
+        metrics=["demand"],
+    )
+
+    return {
+        zone_key: _build_consumption_list(datasets, zone_key, logger).to_list()
+        for zone_key, datasets in datasets_by_zone.items()
+    }
+
+
 @refetch_frequency(REFETCH_FREQUENCY)
 def fetch_exchange(
     zone_key1: ZoneKey,
@@ -380,7 +463,7 @@ def fetch_exchange(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list:
-    session = session or Session()
+    session = session or create_session()
     exchange_key = ZoneKey("->".join([zone_key1, zone_key2]))
 
     try:
@@ -591,6 +674,7 @@ def _build_network_url(
     target_datetime: datetime | None,
     network_region: str | None = None,
     secondary_grouping: str | None = None,
+    primary_grouping: str | None = None,
 ) -> tuple[str, dict[str, Any]]:
     base_url = f"https://api.openelectricity.org.au/v4/{path}/network/{network_code}"
 
@@ -618,6 +702,10 @@ def _build_network_url(
     if secondary_grouping:
         params["secondary_grouping"] = secondary_grouping
 
+    # Add primary_grouping if provided (network_region for the results of each region)
+    if primary_grouping:
+        params["primary_grouping"] = primary_grouping
+
     return base_url, params
 
 
@@ -652,6 +740,12 @@ def _fetch_network_datasets(
         secondary_grouping=secondary_grouping,
     )
 
+    return _get_network_datasets(url, params, session)
+
+
+def _get_network_datasets(
+    url: str, params: dict[str, Any], session: Session
+) -> list[dict[str, Any]]:
     token = get_token("OPENELECTRICITY_TOKEN")
     headers = {
         "Authorization": f"Bearer {token}",
@@ -663,6 +757,68 @@ def _fetch_network_datasets(
     return response.json()["data"]
 
 
+def _fetch_network_datasets_for_zones(
+    zone_keys: list[ZoneKey],
+    session: Session,
+    dataset_type: str,
+    target_datetime: datetime | None,
+    metrics: list[str],
+    secondary_grouping: str | None = None,
+) -> dict[ZoneKey, list[dict[str, Any]]]:
+    """
+    Fetches the datasets of several zones with one request per network, grouped by
+    network region, and splits the results of the datasets by zone.
+    """
+    zone_keys_by_network: dict[str, list[ZoneKey]] = {}
+    for zone_key in zone_keys:
+        network_code = ZONE_KEY_TO_NETWORK.get(zone_key)
+        if not network_code:
+            raise ParserException(
+                parser="OPENNEM",
+                message=f"Invalid zone_key {zone_key}, valid keys are {list(ZONE_KEY_TO_NETWORK.keys())}",
+                zone_key=zone_key,
+            )
+        zone_keys_by_network.setdefault(network_code, []).append(zone_key)
+
+    datasets_by_zone: dict[ZoneKey, list[dict[str, Any]]] = {}
+    for network_code, network_zone_keys in zone_keys_by_network.items():
+        if len(network_zone_keys) == 1:
+            datasets_by_zone[network_zone_keys[0]] = _fetch_network_datasets(
+                zone_key=network_zone_keys[0],
+                session=session,
+                dataset_type=dataset_type,
+                target_datetime=target_datetime,
+                metrics=metrics,
+                secondary_grouping=secondary_grouping,
+            )
+            continue
+
+        url, params = _build_network_url(
+            path=dataset_type,
+            network_code=network_code,
+            metrics=metrics,
+            target_datetime=target_datetime or datetime.now(tz=timezone.utc),
+            secondary_grouping=secondary_grouping,
+            primary_grouping="network_region",
+        )
+        for zone_key in network_zone_keys:
+            datasets_by_zone[zone_key] = []
+        for dataset in _get_network_datasets(url, params, session):
+            results_by_zone: dict[ZoneKey, list[dict[str, Any]]] = {
+                zone_key: [] for zone_key in network_zone_keys
+            }
+            for result in dataset.get("results", []):
+                zone_key = REGION_TO_ZONE_KEY.get(
+                    result.get("columns", {}).get("region")
+                )
+                if zone_key in results_by_zone:
+                    results_by_zone[zone_key].append(result)
+            for zone_key, results in results_by_zone.items():
+                datasets_by_zone[zone_key].append({**dataset, "results": results})
+
+    return datasets_by_zone
+
+
 def _build_price_list(datasets, zone_key: ZoneKey, logger: Logger) -> PriceList:
     price_list = PriceList(logger=logger)
     for dataset in datasets:
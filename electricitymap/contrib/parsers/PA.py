@@ -15,6 +15,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 )
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 PARSER = "PA.py"
@@ -206,7 +207,7 @@ def fetch_production(
         )
 
     # Fetch page and load into BeautifulSoup
-    r = session or Session()
+    r = session or create_session()
     response = r.get(PRODUCTION_URL)
     if not response.ok:
         raise ParserException(
@@ -307,7 +308,7 @@ def fetch_exchange(
             sorted_zone_keys,
         )
 
-    session = session or Session()
+    session = session or create_session()
     timestamp = datetime.now(tz=TIMEZONE)
     response = session.get(EXCHANGE_URL)
     if not response.ok:
@@ -379,7 +380,7 @@ def fetch_consumption(
             PARSER, "This parser is not yet able to parse historical data", zone_key
         )
 
-    r = session or Session()
+    r = session or create_session()
     timestamp = datetime.now(tz=TIMEZONE)
     response = r.get(CONSUMPTION_URL)
     if not response.ok:
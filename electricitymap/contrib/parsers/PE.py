@@ -9,6 +9,7 @@ from requests import Response, Session
 from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownList
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 logger = getLogger(__name__)
@@ -85,7 +86,7 @@ def fetch_production(
 
 def _get_production_data(session: Session, target_datetime: datetime) -> pd.DataFrame:
     """Get the production data for the target datetime."""
-    r = session or Session()
+    r = session or create_session()
 
     # To guarantee a full 24 hours of data we must make 2 requests.
     response_url_current: Response = r.post(
@@ -12,6 +12,7 @@ from requests import Session
 from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownList
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 PARSER = "PF.py"
@@ -28,7 +29,7 @@ def fetch_production(
     logger: Logger = getLogger(__name__),
 ) -> list[dict]:
     """Requests the last known production mix (in MW) of a given country."""
-    session = session or Session()
+    session = session or create_session()
 
     if target_datetime is not None:
         raise ParserException(
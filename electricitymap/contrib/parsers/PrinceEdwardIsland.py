@@ -13,6 +13,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 )
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 SOURCE = "PrinceEdwardIsland.ca"
@@ -69,7 +70,7 @@ def fetch_production(
             "PrinceEdwardIsland.py", "Unable to fetch historical data", ZONE_KEY
         )
 
-    event = _get_event(session or Session())
+    event = _get_event(session or create_session())
 
     production_mix = ProductionMix()
 
@@ -127,7 +128,7 @@ def fetch_exchange(
     # detail that doesn't actually reflect what happens on the wires. Given
     # that NB is the only interconnection with PEI, physically exporting wind
     # power to NB while simultaneously importing the balance seems unlikely.
-    event = _get_event(session or Session())
+    event = _get_event(session or create_session())
     exchanges = ExchangeList(logger)
     exchanges.append(
         datetime=event["datetime"],
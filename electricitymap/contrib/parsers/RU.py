@@ -10,6 +10,7 @@ from requests import Session
 from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownList
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 # RU-1: European and Uralian Market Zone (Price Zone 1)
@@ -83,7 +84,7 @@ def fetch_production(
     logger: Logger = getLogger(__name__),
 ) -> list[dict] | dict:
     """Fetch production data for Russian zones (1st and 2nd synchronous zones)."""
-    session = session or Session()
+    session = session or create_session()
 
     # Zone configuration
     zone_key_price_zone_mapper = {
@@ -187,7 +188,7 @@ def fetch_exchange(
     today = target_datetime if target_datetime else datetime.now(timezone.utc)
 
     date = today.date().isoformat()
-    r = session or Session()
+    r = session or create_session()
     DATE = f"Date={date}"
 
     exchange_urls = []
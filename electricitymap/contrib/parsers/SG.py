@@ -6,8 +6,7 @@ from logging import Logger, getLogger
 from typing import Any
 from zoneinfo import ZoneInfo
 
-from PIL import Image, ImageOps
-from pytesseract import image_to_string
+from PIL import ImageOps
 from requests import Session
 
 from electricitymap.contrib.config import ZoneKey
@@ -16,6 +15,8 @@ from electricitymap.contrib.lib.models.event_lists import (
     ProductionBreakdownList,
 )
 from electricitymap.contrib.lib.models.events import ProductionMix
+from electricitymap.contrib.parsers.lib.ocr import OCR_ENGINE, OCRRegion
+from electricitymap.contrib.parsers.lib.session import create_session
 
 TIMEZONE = ZoneInfo("Asia/Singapore")
 
@@ -67,12 +68,12 @@ def get_solar(session: Session, logger: Logger) -> float | None:
     Fetches a graphic showing estimated solar production data.
     Uses OCR (tesseract) to extract MW value.
     """
-    requests_obj = session or Session()
+    requests_obj = session or create_session()
     requests_obj.headers.update({"User-Agent": "Mozilla/5.0"})
-    solar_image = Image.open(session.get(SOLAR_URL, stream=True).raw)
+    texts = OCR_ENGINE.read(session.get(SOLAR_URL).content, SOLAR_IMAGE_REGIONS)
 
-    solar_mw = __detect_output_from_solar_image(solar_image, logger)
-    solar_dt = __detect_datetime_from_solar_image(solar_image, logger)
+    solar_mw = __parse_output_from_solar_image_text(texts["output"], logger)
+    solar_dt = __parse_datetime_from_solar_image_text(texts["datetime"], logger)
 
     singapore_dt = datetime.now(tz=TIMEZONE)
     diff = singapore_dt - solar_dt
@@ -153,7 +154,7 @@ def fetch_production(
     if target_datetime:
         raise NotImplementedError("This parser is not yet able to parse past dates")
 
-    requests_obj = session or Session()
+    requests_obj = session or create_session()
     # TODO: restore verification when source fixes configuration or we manually install their chain
     requests_obj.verify = False
 
@@ -236,7 +237,7 @@ def fetch_price(
     if target_datetime:
         raise NotImplementedError("This parser is not yet able to parse past dates")
 
-    requests_obj = session or Session()
+    requests_obj = session or create_session()
     # TODO: restore verification when source fixes configuration or we manually install their chain
     requests_obj.verify = False
     response = requests_obj.get(TICKER_URL)
@@ -263,20 +264,7 @@ def fetch_price(
     return price_list.to_list()
 
 
-def __detect_datetime_from_solar_image(solar_image, logger: Logger):
-    w, h = solar_image.size
-    crop_left = int(w * 0.64)
-    crop_top = int(h * 0.80)
-    crop_right = int(w * 0.87)
-    crop_bottom = int(h * 0.86)
-    time_img = solar_image.crop((crop_left, crop_top, crop_right, crop_bottom))
-    processed_img = __preprocess_image_for_ocr(time_img)
-    text = image_to_string(
-        processed_img,
-        lang="eng",
-        config='--psm 7 -c tessedit_char_whitelist="0123456789:- "',
-    )
-
+def __parse_datetime_from_solar_image_text(text: str, logger: Logger):
     try:
         time_pattern = r"\d+-\d+-\d+\s+\d+:\d+"
         time_string = re.search(time_pattern, text, re.MULTILINE).group(0)
@@ -289,16 +277,7 @@ def __detect_datetime_from_solar_image(solar_image, logger: Logger):
     return solar_dt
 
 
-def __detect_output_from_solar_image(solar_image, logger: Logger):
-    w, h = solar_image.size
-    crop_left = int(w * 0.55)
-    crop_top = int(h * 0.70)
-    crop_right = int(w * 0.87)
-    crop_bottom = int(h * 0.75)
-    output_img = solar_image.crop((crop_left, crop_top, crop_right, crop_bottom))
-    processed_img = __preprocess_image_for_ocr(output_img)
-    text = image_to_string(processed_img, lang="eng", config="--psm 7")
-
+def __parse_output_from_solar_image_text(text: str, logger: Logger):
     try:
         pattern = r"Est. PV Output: (.*)MWac"
         val = re.search(pattern, text, re.MULTILINE).group(1)
@@ -342,6 +321,23 @@ def __preprocess_image_for_ocr(img):
     return img_with_border
 
 
+# The regions of the solar image read by OCR, as fractions of its size.
+SOLAR_IMAGE_REGIONS = {
+    "output": OCRRegion(
+        (0.55, 0.70, 0.87, 0.75),
+        config="--psm 7",
+        preprocess=__preprocess_image_for_ocr,
+        relative=True,
+    ),
+    "datetime": OCRRegion(
+        (0.64, 0.80, 0.87, 0.86),
+        config='--psm 7 -c tessedit_char_whitelist="0123456789:- "',
+        preprocess=__preprocess_image_for_ocr,
+        relative=True,
+    ),
+}
+
+
 if __name__ == "__main__":
     """Main method, never used by the Electricity Map backend, but handy for testing."""
 
@@ -14,6 +14,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 from electricitymap.contrib.lib.models.events import EventSourceType, ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 IE_TZ = ZoneInfo("Europe/Dublin")
@@ -103,7 +104,7 @@ def parse_consumption(
 ) -> list:
     """gets forecasted consumption values for ROI"""
 
-    session = session or Session()
+    session = session or create_session()
 
     if target_datetime is None:
         target_datetime = datetime.now(tz=IE_TZ)
@@ -140,7 +141,7 @@ def parse_consumption(
 @refetch_frequency(timedelta(days=1))
 def fetch_production(
     zone_key: ZoneKey,
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list:
@@ -226,7 +227,7 @@ def fetch_exchange(
     Fetches exchanges values for the East-West (GB->IE) and Moyle (GB->GB-NIR)
     interconnectors.
     """
-    session = session or Session()
+    session = session or create_session()
 
     if target_datetime is None:
         target_datetime = datetime.now(tz=IE_TZ)
@@ -321,7 +322,7 @@ def fetch_wind_solar_forecasts(
     Gets values and corresponding datetimes for forecasted wind produciton.
     """
 
-    session = session or Session()
+    session = session or create_session()
 
     if target_datetime is None:
         target_datetime = datetime.now(tz=IE_TZ)
@@ -380,7 +381,7 @@ def fetch_total_generation(
     This is the sum of all generation reported as a single value.
     """
 
-    session = session or Session()
+    session = session or create_session()
 
     if target_datetime is None:
         target_datetime = datetime.now(tz=IE_TZ)
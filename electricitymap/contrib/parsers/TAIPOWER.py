@@ -10,6 +10,7 @@ from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownLis
 from electricitymap.contrib.lib.models.events import ProductionMix, StorageMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 
 SOURCE = "taipower.com.tw"
 TIMEZONE = ZoneInfo("Asia/Taipei")
@@ -21,7 +22,7 @@ PRODUCTION_URL = (
 @refetch_frequency(timedelta(days=1))
 def fetch_production(
     zone_key: str = "TW",
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict]:
@@ -17,6 +17,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency, use_proxy
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 
 EGAT_GENERATION_URL = "https://www.sothailand.com/sysgen/ws/sysgen"
 EGAT_URL = "www.egat.co.th"
@@ -103,7 +104,7 @@ def fetch_production(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """Request the last known production mix (in MW) of a given country."""
-    session = session or Session()
+    session = session or create_session()
     data = _fetch_data(session, _as_localtime(target_datetime), "actual")
 
     production_breakdowns = ProductionBreakdownList(logger)
@@ -132,7 +133,7 @@ def fetch_consumption(
     We use the same value as the production for now.
     But it would be better to include exchanged electricity data if available.
     """
-    session = session or Session()
+    session = session or create_session()
     production_data = _fetch_data(session, _as_localtime(target_datetime), "actual")
     consumptions = TotalConsumptionList(logger)
 
@@ -154,7 +155,7 @@ def fetch_generation_forecast(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """Gets generation forecast for specified zone."""
-    session = session or Session()
+    session = session or create_session()
     data = _fetch_data(session, _as_localtime(target_datetime), "plan")
 
     production_breakdowns = ProductionBreakdownList(logger)
@@ -188,7 +189,7 @@ def fetch_price(
     **While actual BasePrice is done in a progressive manner, For Electricity Maps -
       we use "AmountDue" at 1MWh calculated at the highest pricing bracket for simplification.
     """
-    session = session or Session()
+    session = session or create_session()
     if target_datetime is not None:
         raise NotImplementedError("This parser is not yet able to parse past dates")
 
@@ -19,6 +19,7 @@ from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency, use_proxy
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
 
+from .lib.session import create_session
 from .lib.utils import get_token
 
 TR_TZ = ZoneInfo("Europe/Istanbul")
@@ -125,7 +126,7 @@ def fetch_production(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
-    session = session or Session()
+    session = session or create_session()
 
     # For real-time data, the last data point seems to but continously updated thoughout the hour and will be excluded as not final
     exclude_last_data_point = False
@@ -176,7 +177,7 @@ def fetch_consumption(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
-    session = session or Session()
+    session = session or create_session()
 
     if target_datetime is None:
         target_datetime = datetime.now(tz=TR_TZ).replace(
@@ -206,7 +207,7 @@ def fetch_price(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
-    session = session or Session()
+    session = session or create_session()
 
     if target_datetime is None:
         target_datetime = datetime.now(tz=TR_TZ)
@@ -22,6 +22,7 @@ from electricitymap.contrib.lib.models.events import (
     StorageMix,
 )
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 CAISO_PROXY = "https://us-ca-proxy-jfnx5klx2a-uw.a.run.app"
@@ -262,7 +263,7 @@ def fetch_consumption_forecast(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """Requests the total load forecast 7 days ahead (in MW) for a given date in hourly intervals."""
-    session = session or Session()
+    session = session or create_session()
 
     # Interval of time
     if target_datetime is None:
@@ -329,7 +330,7 @@ def fetch_wind_solar_forecasts(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """Requests the wind and solar forecast 7 days ahead (in MW) for a given date in hourly intervals."""
-    session = session or Session()
+    session = session or create_session()
 
     # Interval of time: datetime is in GMT
     if target_datetime is None:
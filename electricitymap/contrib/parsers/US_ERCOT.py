@@ -3,10 +3,8 @@
 import gzip
 import json
 import time
-import zipfile
 from datetime import datetime, timedelta
 from enum import Enum
-from io import BytesIO
 from logging import Logger, getLogger
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -17,17 +15,21 @@ from requests import Response, Session
 
 # import time
 import electricitymap.contrib.parsers.EIA as EIA
+from electricitymap.contrib.lib.models.columnar import LocationalMarginalPriceColumns
 from electricitymap.contrib.lib.models.event_lists import (
-    LocationalMarginalPriceList,
     ProductionBreakdownList,
     TotalConsumptionList,
 )
-from electricitymap.contrib.lib.models.events import (
-    EventSourceType,
-    ProductionMix,
-    StorageMix,
+from electricitymap.contrib.lib.models.events import EventSourceType
+from electricitymap.contrib.lib.models.frames import (
+    localize_datetimes,
+    production_breakdowns_from_frame,
+    total_consumptions_from_frame,
 )
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
+from electricitymap.contrib.parsers.lib.response_cache import RESPONSE_CACHE
+from electricitymap.contrib.parsers.lib.session import create_session
+from electricitymap.contrib.parsers.lib.token_cache import TOKEN_CACHE, CachedToken
 from electricitymap.contrib.parsers.lib.utils import get_token
 from electricitymap.contrib.parsers.lib.validation import validate_exchange
 from electricitymap.contrib.types import ZoneKey
@@ -49,8 +51,12 @@ RT_PRICES_URL = (
 )
 RT_STORAGE_URL = f"{US_PROXY}/api/1/services/read/dashboards/energy-storage-resources.json?{HOST_PARAMETER}"
 AUTH_URL_ERCOT = "https://ercotb2c.b2clogin.com/ercotb2c.onmicrosoft.com/B2C_1_PUBAPI-ROPC-FLOW/oauth2/v2.0/token"
+# The ID tokens of the ERCOT public API are valid for an hour.
+ID_TOKEN_LIFETIME = 60 * 60
 DAYAHEAD_LMP_URL = f"{US_PROXY}/api/public-reports/np4-190-cd/dam_stlmnt_pnt_prices"
 REALTIME_LMP_URL = f"{US_PROXY}/api/public-reports/np6-788-cd/lmp_node_zone_hub"
+# Seconds the downloaded report documents are cached, see _get_dataframe_from_url.
+DOCUMENT_CACHE_TTL = 24 * 60 * 60
 
 # These links are found at https://www.ercot.com/gridinfo/generation, and should be updated as new data is released
 # HISTORICAL_GENERATION_URL = {
@@ -95,7 +101,7 @@ def get_data(
 ):
     """requests ERCOT url and return json"""
     if not session:
-        session = Session()
+        session = create_session()
 
     resp: Response = session.get(url, verify=False, headers=headers, params=params)
     response_text = gzip.decompress(resp.content).decode("utf-8")
@@ -156,9 +162,8 @@ def fetch_live_production(
     Fetch the live production data from the ERCOT API at a 5 minute interval.
     The data is returned in 5 minute intervals.
     """
-    session = session or Session()
+    session = session or create_session()
     gen_data_json = get_data(url=RT_GENERATION_URL, session=session)["data"]
-    production_breakdowns = ProductionBreakdownList(logger)
 
     # Process storage data first - keep at 15-minute intervals
     df_storage = parse_storage_data_live(session)
@@ -176,41 +181,20 @@ def fetch_live_production(
 
     # Round up to 2 decimals
     df_generation_storage = df_generation_storage.round(2)
-    # Create production breakdowns for each timestamp - optimized version
-    timestamps = df_generation_storage.index
     production_columns = [
         col for col in df_generation_storage.columns if col != "battery_storage"
     ]
     has_storage = "battery_storage" in df_generation_storage.columns
 
-    # Use iloc for faster access instead of iterrows()
-    for i, timestamp in enumerate(timestamps):
-        production = ProductionMix()
-        storage = StorageMix()
-
-        # Get row data using iloc (faster than iterrows)
-        row_data = df_generation_storage.iloc[i]
-
-        # Add production values efficiently
-        for col in production_columns:
-            production.add_value(
-                col,
-                row_data[col],
-                correct_negative_with_zero=True,
-            )
-
-        # Add storage data if available
-        if has_storage:
-            storage.add_value("battery", row_data["battery_storage"])
-
-        # Add breakdown for each timestamp
-        production_breakdowns.append(
-            zoneKey=ZoneKey(zone_key),
-            datetime=timestamp,
-            source=SOURCE,
-            production=production,
-            storage=storage,
-        )
+    production_breakdowns = production_breakdowns_from_frame(
+        df_generation_storage,
+        logger,
+        ZoneKey(zone_key),
+        SOURCE,
+        production={col: col for col in production_columns},
+        storage={"battery": "battery_storage"} if has_storage else None,
+        correct_negative_with_zero=True,
+    )
 
     return production_breakdowns
 
@@ -341,7 +325,7 @@ def fetch_production(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list:
-    session = session or Session()
+    session = session or create_session()
     if target_datetime:
         raise NotImplementedError("This parser is not yet able to parse past dates.")
 
@@ -436,14 +420,13 @@ def _get_dataframe_from_url(url, session, target_date):
     doc_id = doc["Document"]["DocID"]
 
     doc_url = f"{US_PROXY}/misdownload/servlets/mirDownload?doclookupId={doc_id}&{HOST_PARAMETER}"
-    resp: Response = session.get(doc_url)  # verify=False
+    # A document never changes once published, and the forecasts fetch the same
+    # documents while they are the latest ones.
+    resp = RESPONSE_CACHE.fetch(session, doc_url, ttl=DOCUMENT_CACHE_TTL)
 
-    # Open the ZIP file
-    with zipfile.ZipFile(BytesIO(resp.content)) as z:
-        # Extract the first file in the ZIP (assuming it contains a CSV)
-        csv_filename = z.namelist()[0]
-        with z.open(csv_filename) as f:
-            df = pd.read_csv(f)
+    # Read the first file in the ZIP (assuming it contains a CSV)
+    with resp.open_zip_member() as f:
+        df = pd.read_csv(f)
 
     return df
 
@@ -456,7 +439,7 @@ def fetch_consumption_forecast(
 ) -> list[dict[str, Any]]:
     """Requests load forecast data in MW. target_datetime only date (takes the latest report on that date).
     If target_datetime is None, it takes the latest report created"""
-    session = session or Session()
+    session = session or create_session()
 
     url = f"{US_PROXY}/misapp/servlets/IceDocListJsonWS?reportTypeId={ReportTypeID.LOAD_FORECAST_REPORTID.value}&_{int(time.time())}&{HOST_PARAMETER}"
     df = _get_dataframe_from_url(url, session, target_datetime)
@@ -465,22 +448,19 @@ def fetch_consumption_forecast(
     df["HourStarting"] = df["HourEnding"].str.split(":", expand=True)[0].astype(int) - 1
     df["HourStarting"] = df["HourStarting"].astype(str) + ":00"
 
-    all_consumption_events = (
-        df.copy()
-    )  # all events with a datetime and a consumption value
-    consumption_list = TotalConsumptionList(logger)
-    for _, row in all_consumption_events.iterrows():
-        date_, time_ = row.DeliveryDate, row.HourStarting
-        datetime_object = datetime.strptime(
-            date_ + "T" + time_, "%m/%d/%YT%H:%M"
-        ).replace(tzinfo=TX_TZ)
-        consumption_list.append(
-            zoneKey=zone_key,
-            datetime=datetime_object,
-            consumption=row.SystemTotal,
-            source=SOURCE,
-            sourceType=EventSourceType.forecasted,
-        )
+    df["datetime"] = pd.to_datetime(
+        df["DeliveryDate"] + "T" + df["HourStarting"], format="%m/%d/%YT%H:%M"
+    )
+    consumption_list = total_consumptions_from_frame(
+        df,
+        logger,
+        zone_key,
+        SOURCE,
+        "SystemTotal",
+        datetime_column="datetime",
+        tz=TX_TZ,
+        sourceType=EventSourceType.forecasted,
+    )
     return consumption_list.to_list()
 
 
@@ -492,7 +472,7 @@ def fetch_wind_solar_forecasts(
 ) -> list[dict[str, Any]]:
     """Requests wind and solar power data in MW. target_datetime only date (takes the latest report on that date).
     If target_datetime is None, it takes the latest report created"""
-    session = session or Session()
+    session = session or create_session()
 
     # Request wind power data
     url_wind = f"{US_PROXY}/misapp/servlets/IceDocListJsonWS?reportTypeId={ReportTypeID.WIND_POWER_PRODUCTION_REPORTID.value}&_{int(time.time())}&{HOST_PARAMETER}"
@@ -513,31 +493,21 @@ def fetch_wind_solar_forecasts(
         df_wind, df_solar, on=["DELIVERY_DATE", "HOUR_STARTING"], how="outer"
     )
 
-    all_production_events = (
-        merged_df.copy()
-    )  # all events with a datetime and a production breakdown
-    production_list = ProductionBreakdownList(logger)
-    for _, event in all_production_events.iterrows():
-        date_, time_ = event.DELIVERY_DATE, event.HOUR_STARTING
-        datetime_object = datetime.strptime(
-            date_ + "T" + time_, "%m/%d/%YT%H:%M"
-        ).replace(tzinfo=TX_TZ)
-
-        production_mix = ProductionMix()
-        production_mix.add_value(
-            "solar", event["STPPF_SYSTEM_WIDE"], correct_negative_with_zero=True
-        )
-        production_mix.add_value(
-            "wind", event["STWPF_SYSTEM_WIDE"], correct_negative_with_zero=True
-        )
-
-        production_list.append(
-            zoneKey=ZoneKey(zone_key),
-            datetime=datetime_object,
-            production=production_mix,
-            source=SOURCE,
-            sourceType=EventSourceType.forecasted,
-        )
+    merged_df["datetime"] = pd.to_datetime(
+        merged_df["DELIVERY_DATE"] + "T" + merged_df["HOUR_STARTING"],
+        format="%m/%d/%YT%H:%M",
+    )
+    production_list = production_breakdowns_from_frame(
+        merged_df,
+        logger,
+        ZoneKey(zone_key),
+        SOURCE,
+        production={"solar": "STPPF_SYSTEM_WIDE", "wind": "STWPF_SYSTEM_WIDE"},
+        datetime_column="datetime",
+        tz=TX_TZ,
+        sourceType=EventSourceType.forecasted,
+        correct_negative_with_zero=True,
+    )
     return production_list.to_list()
 
 
@@ -572,24 +542,15 @@ def fetch_dayahead_locational_marginal_price(
 
     response = get_data(DAYAHEAD_LMP_URL, headers=headers, params=params)
 
-    prices = LocationalMarginalPriceList(logger)
-    for row in response["data"]:
-        if row[1] == "24:00":
-            date = datetime.strptime(f"{row[0]} 00:00", "%Y-%m-%d %H:%M").replace(
-                tzinfo=TX_TZ
-            ) + timedelta(days=1)
-        else:
-            date = datetime.strptime(f"{row[0]} {row[1]}", "%Y-%m-%d %H:%M").replace(
-                tzinfo=TX_TZ
-            )
-        prices.append(
-            zoneKey=zone_key,
-            datetime=date,
-            price=row[3],
-            currency="USD",
-            node=row[2],
-            source=SOURCE,
-        )
+    prices = LocationalMarginalPriceColumns(logger, zone_key, SOURCE, "USD")
+    if response["data"]:
+        rows = pd.DataFrame(response["data"])
+        # Hour ending 24:00 is midnight of the next day.
+        is_midnight = rows[1] == "24:00"
+        dates = pd.to_datetime(
+            rows[0] + " " + rows[1].mask(is_midnight, "00:00"), format="%Y-%m-%d %H:%M"
+        ) + pd.to_timedelta(is_midnight.astype(int), unit="D")
+        prices.append_many(localize_datetimes(dates, TX_TZ), rows[2], rows[3])
     return prices.to_list()
 
 
@@ -627,17 +588,11 @@ def fetch_realtime_locational_marginal_price(
 
     response = get_data(REALTIME_LMP_URL, headers=headers, params=params)
 
-    prices = LocationalMarginalPriceList(logger)
-    for row in response["data"]:
-        date = datetime.strptime(row[0], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=TX_TZ)
-        prices.append(
-            zoneKey=zone_key,
-            datetime=date,
-            price=row[3],
-            currency="USD",
-            node=row[2],
-            source=SOURCE,
-        )
+    prices = LocationalMarginalPriceColumns(logger, zone_key, SOURCE, "USD")
+    if response["data"]:
+        rows = pd.DataFrame(response["data"])
+        dates = pd.to_datetime(rows[0], format="%Y-%m-%dT%H:%M:%S")
+        prices.append_many(localize_datetimes(dates, TX_TZ), rows[2], rows[3])
     return prices.to_list()
 
 
@@ -691,16 +646,18 @@ def transform_historical_production(df):
         for col in df.columns
         if col not in ["Date", "Fuel", "Settlement Type", "Total"]
     ]
-    records = []
-    for _, row in df.iterrows():
-        fuel = row["Fuel"]
-        date_str = row["Date"].strftime("%Y-%m-%d")
-        for time_col in time_columns:
-            dt_str = f"{date_str} {time_col}"
-            dt = pd.to_datetime(dt_str, format="%Y-%m-%d %H:%M").tz_localize(TX_TZ)
-            value = row[time_col]
-            records.append({"datetime": dt, "fuel": fuel, "value": value})
-    df_records = pd.DataFrame(records)
+    df_records = df.melt(
+        id_vars=["Date", "Fuel"],
+        value_vars=time_columns,
+        var_name="time",
+        value_name="value",
+    ).rename(columns={"Fuel": "fuel"})
+    df_records["datetime"] = pd.to_datetime(
+        pd.to_datetime(df_records["Date"]).dt.strftime("%Y-%m-%d")
+        + " "
+        + df_records["time"].astype(str),
+        format="%Y-%m-%d %H:%M",
+    ).dt.tz_localize(TX_TZ)
     df_pivot = df_records.pivot(index="datetime", columns="fuel", values="value")
     column_mapping = pd.Series(
         {col: GENERATION_MAPPING.get(col, col) for col in df_pivot.columns}
@@ -719,7 +676,11 @@ def transform_historical_production(df):
     return df_result
 
 
-def get_id_token():
+def get_id_token() -> str:
+    return TOKEN_CACHE.get("ercot", _fetch_id_token)
+
+
+def _fetch_id_token() -> CachedToken:
     ERCOT_API_PASSWORD = get_token("ERCOT_API_PASSWORD")
     ERCOT_API_USERNAME = get_token("ERCOT_API_USERNAME")
 
@@ -729,7 +690,13 @@ def get_id_token():
     auth_url = f"{AUTH_URL_ERCOT}?username={ERCOT_API_USERNAME}&password={ERCOT_API_PASSWORD}&grant_type=password&scope=openid+fec253ea-0d06-4272-a5e6-b478baeecd70+offline_access&client_id=fec253ea-0d06-4272-a5e6-b478baeecd70&response_type=id_token"
 
     auth_response = requests.post(auth_url)
-    return auth_response.json().get("id_token")
+    token_data = auth_response.json()
+    if not token_data.get("id_token"):
+        raise ValueError(f"No ERCOT ID token received: {auth_response.text}")
+    return CachedToken.expiring_in(
+        token_data["id_token"],
+        token_data.get("id_token_expires_in", ID_TOKEN_LIFETIME),
+    )
 
 
 if __name__ == "__main__":
@@ -24,6 +24,7 @@ from electricitymap.contrib.lib.models.events import (
     GridAlertType,
     ProductionMix,
 )
+from electricitymap.contrib.parsers.lib.session import create_session
 
 SOURCE = "misoenergy.org"
 ZONE = "US-MIDW-MISO"
@@ -57,7 +58,7 @@ solar_forecast_url = "https://api.misoenergy.org/MISORTWDDataBroker/DataBrokerSe
 def get_json_data(logger: Logger, session: Session | None = None) -> dict:
     """Returns 5 minute generation data in json format."""
 
-    s = session or Session()
+    s = session or create_session()
     json_data = s.get(mix_url).json()
 
     return json_data
@@ -131,7 +132,7 @@ def fetch_consumption_forecast(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """Requests the 6 days ahead load (in MW) hourly data."""
-    session = session or Session()
+    session = session or create_session()
 
     # Datetime
     if target_datetime is None:
@@ -185,7 +186,7 @@ def fetch_wind_solar_forecasts(
     if target_datetime:
         raise NotImplementedError("This parser is not yet able to parse past dates")
 
-    s = session or Session()
+    s = session or create_session()
 
     # Request wind data
     req_wind = s.get(wind_forecast_url)
@@ -230,7 +231,7 @@ def fetch_grid_alerts(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """Fetch Grid Alerts from MISO"""
-    session = session or Session()
+    session = session or create_session()
 
     # API URL
     url = "https://www.misoenergy.org/api/topicnotifications/getrecentnotifications"
@@ -27,6 +27,7 @@ from electricitymap.contrib.lib.models.events import (
     StorageMix,
 )
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 US_NEISO_KEY = ZoneKey("US-NE-ISNE")
@@ -68,7 +69,7 @@ def get_json_data(
     }
     postdata.update(params)
 
-    s = session or Session()
+    s = session or create_session()
 
     req = s.post(url, data=postdata)
     json_data = req.json()
@@ -245,7 +246,7 @@ def fetch_consumption_forecast(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """Requests load forecast in MW for 1 day ahead (hourly)"""
-    session = session or Session()
+    session = session or create_session()
 
     target_datetime = (
         datetime.now(timezone.utc)
@@ -301,7 +302,7 @@ def fetch_wind_solar_forecasts(
     target_datetime_string = target_datetime.strftime("%Y%m%d")
 
     # Request url
-    session = session or Session()
+    session = session or create_session()
     merged_data = None
     for data_type in ["solar", "wind"]:
         # Get cookies by accessing the forecast pages
@@ -388,7 +389,7 @@ def fetch_grid_alerts(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """Fetch Grid Alerts from ISONE"""
-    session = session or Session()
+    session = session or create_session()
 
     # Make the request
     url = "https://www.iso-ne.com/markets-operations/system-forecast-status/current-system-status"
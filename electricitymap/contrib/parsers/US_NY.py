@@ -27,6 +27,7 @@ from electricitymap.contrib.lib.models.events import (
     ProductionMix,
 )
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
+from electricitymap.contrib.parsers.lib.session import create_session
 
 # Pumped storage is present but is not split into a separate category.
 
@@ -143,7 +144,7 @@ def fetch_production(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """Requests the last known production mix (in MW) of a given zone."""
-    session = session or Session()
+    session = session or create_session()
 
     if target_datetime is None:
         target_datetime = datetime.now(tz=TIMEZONE)
@@ -198,7 +199,7 @@ def fetch_exchange(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """Requests the last known power exchange (in MW) between two zones."""
-    session = session or Session()
+    session = session or create_session()
 
     sorted_zone_keys = ZoneKey("->".join(sorted([zone_key1, zone_key2])))
 
@@ -292,7 +293,7 @@ def fetch_consumption_forecast(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """Requests the load forecast (in MW) for a given date in hourly intervals."""
-    session = session or Session()
+    session = session or create_session()
 
     # Datetime
     if target_datetime is None:
@@ -345,7 +346,7 @@ def fetch_grid_alerts(
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
     """Fetch Grid Alerts from NYISO (http://mis.nyiso.com/public/P-35list.htm)"""
-    session = session or Session()
+    session = session or create_session()
 
     # Target Datetime
     if target_datetime is None:
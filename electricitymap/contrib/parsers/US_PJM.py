@@ -28,6 +28,7 @@ from electricitymap.contrib.lib.models.events import (
 )
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 PARSER = "US_PJM.py"
@@ -130,7 +131,7 @@ def fetch_consumption_forecast(
             PARSER, "This parser is not yet able to parse historical data", zone_key
         )
 
-    session = session or Session()
+    session = session or create_session()
     # startRow must be set if forecast_area is set. RTO_COMBINED is area for whole PJM zone.
     params = {"download": True, "startRow": 1, "forecast_area": "RTO_COMBINED"}
     data = _fetch_api_data(kind="load_frcstd_7_day", params=params, session=session)
@@ -165,7 +166,7 @@ def fetch_production(
         else target_datetime.astimezone(timezone.utc)
     )
 
-    session = session or Session()
+    session = session or create_session()
 
     params = {
         "startRow": 1,
@@ -215,7 +216,7 @@ def fetch_wind_solar_forecasts(
 ) -> list[dict[str, Any]]:
     """Uses PJM API to request the wind and solar forecast (in MW) for a given date in hourly intervals."""
 
-    session = session or Session()
+    session = session or create_session()
 
     # Datetime
     target_datetime = (
@@ -345,7 +346,7 @@ def fetch_exchange(
         )
 
     if not session:
-        session = Session()
+        session = create_session()
 
     # PJM reports exports as negative.
     direction = -1 if sorted_zone_keys.startswith(ZONE_KEY) else 1
@@ -354,7 +355,7 @@ def fetch_exchange(
     interfaces = ZONE_TO_PJM_INTERFACES[neighbour]
 
     # get flow data from each interface with neighbour and merge
-    session = session or Session()
+    session = session or create_session()
     ungrouped_exchange_lists = []
     for interface in interfaces:
         exchange_list = ExchangeList(logger)
@@ -389,7 +390,7 @@ def fetch_grid_alerts(
             zone_key,
         )
 
-    session = session or Session()
+    session = session or create_session()
 
     url = f"{US_PROXY}/{GRID_ALERTS_PATH}"
     headers = {
@@ -16,6 +16,8 @@ from zoneinfo import ZoneInfo
 
 from requests import Session
 
+from electricitymap.contrib.parsers.lib.session import create_session
+
 TIMEZONE = ZoneInfo("America/Puerto_Rico")
 
 US_PROXY = "https://us-ca-proxy-jfnx5klx2a-uw.a.run.app"
@@ -80,7 +82,7 @@ def fetch_production(
             "The datasource currently implemented is only real time"
         )
 
-    r = session or Session()
+    r = session or create_session()
 
     data = {  # To be returned as response data
         "zoneKey": zone_key,
@@ -2,7 +2,6 @@
 
 """Parser for the Southwest Power Pool area of the United States."""
 
-import math
 from datetime import datetime, timedelta, timezone
 from io import StringIO
 from logging import Logger, getLogger
@@ -13,17 +12,19 @@ import pandas as pd
 from dateutil import parser
 from requests import Session
 
+from electricitymap.contrib.lib.models.columnar import LocationalMarginalPriceColumns
 from electricitymap.contrib.lib.models.event_lists import (
     ExchangeList,
-    LocationalMarginalPriceList,
-    ProductionBreakdownList,
-    TotalConsumptionList,
 )
-from electricitymap.contrib.lib.models.events import (
-    EventSourceType,
-    ProductionMix,
+from electricitymap.contrib.lib.models.events import EventSourceType
+from electricitymap.contrib.lib.models.frames import (
+    production_breakdowns_from_frame,
+    total_consumptions_from_frame,
 )
+from electricitymap.contrib.parsers.lib.concurrency import fetch_concurrently
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
+from electricitymap.contrib.parsers.lib.session import create_session
+from electricitymap.contrib.parsers.lib.ttl_cache import TTLCache
 from electricitymap.contrib.parsers.lib.validation import validate_exchange
 from electricitymap.contrib.types import ZoneKey
 
@@ -89,6 +90,12 @@ EXCHANGE_MAPPING = {
     "NSP": "US-MIDW-MISO",
     "OTP": "US-MIDW-MISO",
 }
+# The LMPs of the real-time 5-minute interval files by URL. A file is final once
+# published, and successive calls share 6 of their 7 intervals.
+REALTIME_NODE_PRICES: TTLCache[str, pd.DataFrame] = TTLCache(
+    "US_SPP.realtime_node_prices", max_entries=36, max_bytes=64 * 1024**2
+)
+
 # NOTE
 # Data sources return timestamps in GMT.
 # Energy storage situation unclear as of 16/03/2018, likely to change quickly in future.
@@ -97,7 +104,7 @@ EXCHANGE_MAPPING = {
 def get_data(url, session: Session | None = None):
     """Returns a pandas dataframe."""
 
-    s = session or Session()
+    s = session or create_session()
     req = s.get(url)
 
     if req.text == "":
@@ -108,13 +115,13 @@ def get_data(url, session: Session | None = None):
     return df
 
 
-def data_processor(df, logger: Logger) -> list[tuple[datetime, ProductionMix]]:
+def data_processor(df, logger: Logger) -> pd.DataFrame:
     """
     Takes a dataframe and logging instance as input.
     Checks for new generation types and logs a warning if any are found.
-    Parses the dataframe row by row removing unneeded keys.
+    Removes the unneeded columns.
 
-    :return: list of tuples containing a datetime object and production dictionary.
+    :return: the dataframe with the "GMT MKT Interval" column and the production columns of `MAPPING`.
     """
 
     # Remove leading whitespace in column headers.
@@ -154,18 +161,10 @@ def data_processor(df, logger: Logger) -> list[tuple[datetime, ProductionMix]]:
             extra={"key": "US-SPP"},
         )
 
-    processed_data = []
-    for index in range(len(df)):
-        mix = ProductionMix()
-        production = df.iloc[index].to_dict()
-        dt_aware = production["GMT MKT Interval"].to_pydatetime()
-        for k in keys_to_remove | unknown_keys:
-            production.pop(k, None)
-
-        for k, v in production.items():
-            mix.add_value(MAPPING[k], float(v))
-        processed_data.append((dt_aware, mix))
-    return processed_data
+    return df.drop(
+        columns=list((keys_to_remove - {"GMT MKT Interval"}) | unknown_keys),
+        errors="ignore",
+    )
 
 
 @refetch_frequency(timedelta(days=1))
@@ -219,25 +218,22 @@ def fetch_production(
 
     processed_data = data_processor(raw_data, logger)
 
-    production_list = ProductionBreakdownList(logger)
-    for dt, mix in processed_data:
-        production_list.append(
-            zoneKey=zone_key,
-            datetime=dt.replace(tzinfo=timezone.utc),
-            production=mix,
-            source=SOURCE,
-        )
+    production_columns: dict[str, list[str]] = {}
+    for column in processed_data.columns.drop("GMT MKT Interval"):
+        production_columns.setdefault(MAPPING[column], []).append(column)
+    production_list = production_breakdowns_from_frame(
+        processed_data,
+        logger,
+        zone_key,
+        SOURCE,
+        production=production_columns,
+        datetime_column="GMT MKT Interval",
+        tz=timezone.utc,
+    )
 
     return production_list.to_list()
 
 
-def _NaN_safe_get(forecast: dict, key: str) -> float:
-    try:
-        return float(forecast[key])
-    except ValueError:
-        return math.nan
-
-
 def fetch_load_forecast(
     zone_key: ZoneKey,
     session: Session | None = None,
@@ -257,27 +253,25 @@ def fetch_load_forecast(
 
     raw_data = get_data(LOAD_URL)
 
-    consumption_list = TotalConsumptionList(logger)
-    for index in range(len(raw_data)):
-        forecast = raw_data.loc[index].to_dict()
-
-        dt = parser.parse(forecast["GMTIntervalEnd"]).replace(tzinfo=timezone.utc)
-        load = _NaN_safe_get(forecast, "STLF")  # short term load forecast
-        if math.isnan(load):
-            load = _NaN_safe_get(forecast, "MTLF")  # medium term load forecast
-        if math.isnan(load):
-            # STLF is reported every 5 minutes while MTLF is reported once every hour so we know load is None at times like 12.05, 12.10, etc
-            logger.warning(f"fetch_load_forecast: {dt} has no forecasted load")
-            # Drop there data points to prevent errors in .append
-            continue
-
-        consumption_list.append(
-            datetime=dt,
-            consumption=load,
-            zoneKey=zone_key,
-            source=SOURCE,
-            sourceType=EventSourceType.forecasted,
-        )
+    raw_data["datetime"] = pd.to_datetime(raw_data["GMTIntervalEnd"], utc=True)
+    # Short term load forecast, else medium term load forecast.
+    raw_data["load"] = pd.to_numeric(raw_data["STLF"], errors="coerce").fillna(
+        pd.to_numeric(raw_data["MTLF"], errors="coerce")
+    )
+    # STLF is reported every 5 minutes while MTLF is reported once every hour so we know load is None at times like 12.05, 12.10, etc
+    missing_load = raw_data["load"].isna()
+    for dt in raw_data.loc[missing_load, "datetime"]:
+        logger.warning(f"fetch_load_forecast: {dt} has no forecasted load")
+    # Drop there data points to prevent errors in .append
+    consumption_list = total_consumptions_from_frame(
+        raw_data[~missing_load],
+        logger,
+        zone_key,
+        SOURCE,
+        "load",
+        datetime_column="datetime",
+        sourceType=EventSourceType.forecasted,
+    )
 
     return consumption_list.to_list()
 
@@ -316,32 +310,27 @@ def fetch_wind_solar_forecasts(
     # sometimes there is a leading whitespace in column names
     raw_data.columns = raw_data.columns.str.lstrip()
 
-    production_list = ProductionBreakdownList(logger)
-    for index in range(len(raw_data)):
-        forecast = raw_data.loc[index].to_dict()
-
-        dt = parser.parse(forecast["GMTIntervalEnd"]).replace(tzinfo=timezone.utc)
-
-        # Get short term forecast if available, else medium term
-        solar = _NaN_safe_get(forecast, "Solar Forecast MW")
-        wind = _NaN_safe_get(forecast, "Wind Forecast MW")
-
-        if math.isnan(solar) and math.isnan(wind):
-            logger.info(
-                f"fetch_wind_solar_forecasts: {dt} has no solar nor wind forecasted production"
-            )
-            continue
-
-        mix = ProductionMix(solar=solar, wind=wind)
-
-        production_list.append(
-            datetime=dt,
-            production=mix,
-            zoneKey=zone_key,
-            source=SOURCE,
-            sourceType=EventSourceType.forecasted,
+    raw_data["datetime"] = pd.to_datetime(raw_data["GMTIntervalEnd"], utc=True)
+    for column in ("Solar Forecast MW", "Wind Forecast MW"):
+        raw_data[column] = pd.to_numeric(raw_data[column], errors="coerce")
+    missing_forecast = (
+        raw_data[["Solar Forecast MW", "Wind Forecast MW"]].isna().all(axis=1)
+    )
+    for dt in raw_data.loc[missing_forecast, "datetime"]:
+        logger.info(
+            f"fetch_wind_solar_forecasts: {dt} has no solar nor wind forecasted production"
         )
 
+    production_list = production_breakdowns_from_frame(
+        raw_data[~missing_forecast],
+        logger,
+        zone_key,
+        SOURCE,
+        production={"solar": "Solar Forecast MW", "wind": "Wind Forecast MW"},
+        datetime_column="datetime",
+        sourceType=EventSourceType.forecasted,
+    )
+
     return production_list.to_list()
 
 
@@ -424,7 +413,7 @@ def format_exchange_data(
 def fetch_exchange(
     zone_key1: ZoneKey,
     zone_key2: ZoneKey,
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
@@ -457,32 +446,57 @@ def fetch_realtime_locational_marginal_price(
     if target_datetime.tzinfo is None:
         target_datetime = target_datetime.replace(tzinfo=timezone.utc)
 
-    prices = LocationalMarginalPriceList(logger)
+    session = session or create_session()
+
     # Get data for target datetime and previous 30 minutes in 5 min intervals
-    for minutes in range(0, 35, 5):
-        check_datetime = target_datetime - timedelta(minutes=minutes)
-        url = get_realtime_url(check_datetime)
-        raw_data = get_data(url, session)
+    urls = {
+        get_realtime_url(target_datetime - timedelta(minutes=minutes)): minutes
+        for minutes in range(0, 35, 5)
+    }
+    # Only the intervals not fetched by a previous call are downloaded.
+    node_prices = {url: REALTIME_NODE_PRICES.get(url) for url in urls}
+    missing_urls = [url for url, df in node_prices.items() if df is None]
+    for url, raw_data in zip(
+        missing_urls,
+        fetch_concurrently(
+            lambda url: get_data(url, session), missing_urls, REALTIME_PRICE_URL
+        ),
+        strict=True,
+    ):
         if raw_data.empty:
+            check_datetime = target_datetime - timedelta(minutes=urls[url])
             logger.warning(f"Empty response for {check_datetime}")
             continue
+        node_prices[url] = _node_prices(raw_data)
+        REALTIME_NODE_PRICES.set(url, node_prices[url])
+
+    available_node_prices = [df for df in node_prices.values() if df is not None]
+    prices = LocationalMarginalPriceColumns(logger, zone_key, SOURCE, "USD")
+    if available_node_prices:
+        _append_node_prices(prices, pd.concat(available_node_prices))
+    return prices.to_list()
+
+
+def _node_prices(raw_data: pd.DataFrame) -> pd.DataFrame:
+    """Returns the first LMP of each (Pnode, GMTIntervalEnd) of an LMP file."""
+    grouped = raw_data.groupby(["Pnode", "GMTIntervalEnd"]).first().reset_index()
+    return pd.DataFrame(
+        {
+            "datetime": pd.to_datetime(
+                grouped["GMTIntervalEnd"], format="%m/%d/%Y %H:%M:%S", utc=True
+            ),
+            "node": grouped["Pnode"],
+            "price": grouped["LMP"],
+        }
+    )
 
-        grouped = raw_data.groupby(["Pnode", "GMTIntervalEnd"]).first()
-
-        for (node, interval_end), row in grouped.iterrows():
-            prices.append(
-                zoneKey=zone_key,
-                datetime=datetime.strptime(interval_end, "%m/%d/%Y %H:%M:%S").replace(
-                    tzinfo=timezone.utc
-                ),
-                price=row["LMP"],
-                currency="USD",
-                node=node,
-                source=SOURCE,
-            )
 
-    price_list = prices.to_list()
-    return price_list
+def _append_node_prices(
+    prices: LocationalMarginalPriceColumns, node_prices: pd.DataFrame
+) -> None:
+    prices.append_many(
+        node_prices["datetime"], node_prices["node"], node_prices["price"]
+    )
 
 
 @refetch_frequency(timedelta(days=1))
@@ -500,23 +514,9 @@ def fetch_dayahead_locational_marginal_price(
     if raw_data.empty:
         logger.warning(f"Empty response for {target_datetime}")
         return []
-    # filter by column "Settlement Location" so it only includes SPPNORTH_HUB
-    grouped = raw_data.groupby(["Pnode", "GMTIntervalEnd"]).first()
-    prices = LocationalMarginalPriceList(logger)
-    for (node, interval_end), row in grouped.iterrows():
-        prices.append(
-            zoneKey=zone_key,
-            datetime=datetime.strptime(interval_end, "%m/%d/%Y %H:%M:%S").replace(
-                tzinfo=timezone.utc
-            ),
-            price=row["LMP"],
-            currency="USD",
-            node=node,
-            source=SOURCE,
-        )
-
-    price_list = prices.to_list()
-    return price_list
+    prices = LocationalMarginalPriceColumns(logger, zone_key, SOURCE, "USD")
+    _append_node_prices(prices, _node_prices(raw_data))
+    return prices.to_list()
 
 
 def get_closest_5_minutes_datetime(target_datetime: datetime) -> datetime:
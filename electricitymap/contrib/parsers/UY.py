@@ -20,6 +20,7 @@ from electricitymap.contrib.lib.models.event_lists import (
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 UY_TZ = ZoneInfo("America/Montevideo")
@@ -118,14 +119,14 @@ def fix_solar_production(dt: datetime, value: float) -> int:
 @refetch_frequency(timedelta(days=1))
 def fetch_production(
     zone_key: str = "UY",
-    session: Session = Session(),
+    session: Session = create_session(),
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list:
     """collects production data from ADME and format all data points for target_datetime"""
     if target_datetime is None:
         target_datetime = datetime.now(tz=UY_TZ)
-    session = session or Session()
+    session = session or create_session()
 
     production_list = ProductionBreakdownList(logger)
 
@@ -172,7 +173,7 @@ def fetch_consumption(
     """collects consumption data from ADME and format all data points for target_datetime"""
     if target_datetime is None:
         target_datetime = datetime.now(tz=UY_TZ)
-    session = session or Session()
+    session = session or create_session()
 
     consumption_list = TotalConsumptionList(logger)
 
@@ -208,7 +209,7 @@ def fetch_exchange(
     """collects exchanges data from ADME and format all data points for target_datetime"""
     if target_datetime is None:
         target_datetime = datetime.now(tz=UY_TZ)
-    session = session or Session()
+    session = session or create_session()
 
     exchange_list = ExchangeList(logger)
 
@@ -13,6 +13,7 @@ from electricitymap.contrib.lib.models.event_lists import (
     TotalConsumptionList,
 )
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 
 ## Vietnamese National Load Dispatch Center https://www.nldc.evn.vn/
 # Access via day, can also parse historical data
@@ -145,7 +146,7 @@ def fetch_price(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ):
-    session = session or Session()
+    session = session or create_session()
     if target_datetime is None:
         live_consumption = fetch_live_price(zone_key, session, logger)
         if len(live_consumption) > 0:
@@ -175,7 +176,7 @@ def fetch_consumption(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ):
-    session = session or Session()
+    session = session or create_session()
     if target_datetime is None:
         live_consumption = fetch_live_consumption(zone_key, session, logger)
         # Live data is empty at 00:00, resort to historical from previous day
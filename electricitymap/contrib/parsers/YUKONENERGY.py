@@ -12,6 +12,7 @@ from requests import Session
 from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownList
 from electricitymap.contrib.lib.models.events import ProductionMix
 from electricitymap.contrib.parsers.lib.exceptions import ParserException
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 SOURCE = "yukonenergy.ca"
@@ -59,7 +60,7 @@ def fetch_production(
             "YUKONENERGY.py", "Unable to fetch historical data", zone_key
         )
 
-    session = session or Session()
+    session = session or create_session()
 
     response = session.get(URL)
     html = response.text
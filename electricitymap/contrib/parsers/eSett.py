@@ -7,6 +7,7 @@ from electricitymap.contrib.lib.models.event_lists import ProductionBreakdownLis
 from electricitymap.contrib.lib.models.events import ProductionMix, StorageMix
 from electricitymap.contrib.parsers.ENTSOE import ENTSOE_DOMAIN_MAPPINGS
 from electricitymap.contrib.parsers.lib.config import refetch_frequency
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.types import ZoneKey
 
 BASE_URL = "https://api.opendata.esett.com"
@@ -34,7 +35,7 @@ def fetch_production(
     target_datetime: datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list:
-    session = session or Session()
+    session = session or create_session()
     target_datetime = (target_datetime or datetime.now(timezone.utc)).astimezone(
         timezone.utc
     )
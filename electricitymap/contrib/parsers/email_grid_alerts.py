@@ -11,6 +11,7 @@ from requests.auth import HTTPBasicAuth
 from electricitymap.contrib.config import ZoneKey
 from electricitymap.contrib.lib.models.event_lists import GridAlertList
 from electricitymap.contrib.lib.models.events import GridAlertType
+from electricitymap.contrib.parsers.lib.session import create_session
 from electricitymap.contrib.parsers.lib.utils import get_token
 
 # CONFIGURATION
@@ -24,7 +25,7 @@ def fetch_grid_alerts_emails(
     target_datetime: datetime.datetime | None = None,
     logger: Logger = getLogger(__name__),
 ) -> list[dict[str, Any]]:
-    session = session or Session()
+    session = session or create_session()
     MAILGUN_API_KEY = get_token("MAILGUN_TOKEN")
 
     domain_name = "alerts.electricitymaps.com"
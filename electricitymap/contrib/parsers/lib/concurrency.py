@@ -0,0 +1,70 @@
+"""Bounded concurrent fetching for parsers that fan out over several requests."""
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from threading import BoundedSemaphore, Lock
+from typing import TypeVar
+from urllib.parse import urlsplit
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_MAX_CONCURRENCY_PER_HOST = 4
+
+# One semaphore per host, shared by every fetch of the process, so that
+# concurrent parser runs together stay under the host's cap.
+_HOST_SEMAPHORES: dict[str, BoundedSemaphore] = {}
+_HOST_SEMAPHORES_LOCK = Lock()
+
+
+def host_semaphore(
+    url: str, max_concurrency: int = DEFAULT_MAX_CONCURRENCY_PER_HOST
+) -> BoundedSemaphore:
+    """Returns the semaphore capping the concurrent requests to the host of `url`.
+
+    The cap is set by the first caller for a given host.
+    """
+    host = urlsplit(url).netloc
+    with _HOST_SEMAPHORES_LOCK:
+        if host not in _HOST_SEMAPHORES:
+            _HOST_SEMAPHORES[host] = BoundedSemaphore(max_concurrency)
+        return _HOST_SEMAPHORES[host]
+
+
+def fetch_concurrently(
+    fetch: Callable[[T], R],
+    items: Sequence[T],
+    url: str,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY_PER_HOST,
+) -> list[R]:
+    """Calls `fetch` on each item concurrently, and returns the results in order.
+
+    At most `max_concurrency` calls run at once for the host of `url`, across
+    all the threads of the process.
+
+    Errors behave as if the items were fetched one after another: the exception
+    raised for the first failing item is re-raised, and the calls that have not
+    started yet are cancelled.
+    """
+    if len(items) <= 1:
+        return [fetch(item) for item in items]
+
+    semaphore = host_semaphore(url, max_concurrency)
+
+    def bounded_fetch(item: T) -> R:
+        with semaphore:
+            return fetch(item)
+
+    with ThreadPoolExecutor(max_workers=min(len(items), max_concurrency)) as executor:
+        # Each call runs in a copy of the caller's context, so that context
+        # bound state such as the model metrics being collected follows it.
+        futures = [
+            executor.submit(copy_context().run, bounded_fetch, item) for item in items
+        ]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
@@ -0,0 +1,57 @@
+"""The files behind the optional disk stores of the parser caches.
+
+The response, token and NTESMO report link caches keep their entries in memory,
+and can also be pointed at a directory shared by several processes. Their files
+are written atomically: to a temporary file in the same directory first, then
+renamed over the previous version, so that a process reading a file while
+another one writes it gets either version, never a partially written one.
+Cache files are only readable by their owner, as some of them hold credentials.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_atomically(path: Path, data: bytes) -> None:
+    """Replaces the content of the file at `path` with `data`, see the module docstring."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    file_descriptor, temporary_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(data)
+        os.replace(temporary_name, path)
+    except BaseException:
+        Path(temporary_name).unlink(missing_ok=True)
+        raise
+
+
+class CacheDirectory:
+    """
+    A directory of cache files named after the SHA-256 of their key, so that
+    any key (e.g. a URL) maps to a valid file name. An entry can be made of
+    several files, told apart by their suffix.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def file(self, key: str, suffix: str) -> Path:
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return self.path / f"{name}{suffix}"
+
+    def read(self, key: str, suffix: str) -> bytes | None:
+        """Returns the content of a file, or None if it cannot be read."""
+        try:
+            return self.file(key, suffix).read_bytes()
+        except OSError:
+            return None
+
+    def write(self, key: str, suffix: str, data: bytes) -> None:
+        write_atomically(self.file(key, suffix), data)
+
+    def delete(self, key: str, suffix: str) -> None:
+        self.file(key, suffix).unlink(missing_ok=True)
@@ -0,0 +1,110 @@
+"""Optical character recognition of regions of the images published by some sources.
+
+A few sources only publish their figures as an image, e.g. a dashboard exported
+as a JPEG, and parsers read the values off rectangles of it with tesseract. Each
+region read is a tesseract process, and a parser reading dozens of regions spent
+most of its run spawning them one after another, for an image that is only
+updated every few minutes.
+
+`OCR_ENGINE.read(content, regions)` reads all the regions of an image at once:
+- the image is decoded once, and each region cropped and preprocessed from it,
+- the regions are read concurrently, one tesseract process each,
+- the texts read are cached by hash of the image and regions, so that an image
+  that has not changed since the last run is not read again.
+
+Each region is read exactly as by a separate `image_to_string` call, with its
+own language and configuration: tiling the regions into one image would have to
+give up the single line page segmentation (`--psm 7`) the regions are read with.
+"""
+
+import hashlib
+import os
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+
+from PIL import Image
+from pytesseract import image_to_string
+
+from electricitymap.contrib.parsers.lib.ttl_cache import TTLCache
+
+
+@dataclass(frozen=True)
+class OCRRegion:
+    """A rectangle of an image to read, (x, y, x, y) = upper left, lower right corner."""
+
+    box: tuple[float, float, float, float]
+    lang: str = "eng"
+    config: str = ""
+    # Applied to the cropped region before it is read, to improve recognition.
+    preprocess: Callable[[Image.Image], Image.Image] | None = None
+    # Whether `box` is given as fractions of the image's width and height.
+    relative: bool = False
+
+    def crop(self, image: Image.Image) -> Image.Image:
+        if self.relative:
+            width, height = image.size
+            left, top, right, bottom = self.box
+            box = (
+                int(width * left),
+                int(height * top),
+                int(width * right),
+                int(height * bottom),
+            )
+        else:
+            box = tuple(int(coordinate) for coordinate in self.box)
+        region_image = image.crop(box)
+        if self.preprocess is not None:
+            region_image = self.preprocess(region_image)
+        return region_image
+
+
+class OCREngine:
+    """Reads regions of images concurrently, see the module docstring."""
+
+    def __init__(
+        self,
+        name: str = "ocr",
+        max_workers: int | None = None,
+        cache_entries: int = 32,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._texts: TTLCache[tuple, dict[str, str]] = TTLCache(
+            f"{name}.texts", max_entries=cache_entries
+        )
+
+    def read(self, content: bytes, regions: Mapping[str, OCRRegion]) -> dict[str, str]:
+        """Returns the text read in each region of the image encoded in `content`."""
+        key = (hashlib.sha256(content).hexdigest(), tuple(regions.items()))
+        texts = self._texts.get(key)
+        if texts is not None:
+            return dict(texts)
+
+        image = Image.open(BytesIO(content))
+        image.load()
+        region_images = [region.crop(image) for region in regions.values()]
+
+        def read_region(region: OCRRegion, region_image: Image.Image) -> str:
+            return image_to_string(region_image, lang=region.lang, config=region.config)
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(regions), self.max_workers))
+        ) as executor:
+            texts = dict(
+                zip(
+                    regions,
+                    executor.map(read_region, regions.values(), region_images),
+                    strict=True,
+                )
+            )
+        self._texts.set(key, texts)
+        return dict(texts)
+
+    def clear(self) -> None:
+        self._texts.clear()
+
+
+# The engine of the image-based parsers (SG, IN_MH), so that zones reading the
+# same image share its recognized regions.
+OCR_ENGINE = OCREngine()
@@ -1,36 +1,166 @@
 import importlib
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import Any
 
 from electricitymap.contrib.config import EXCHANGES_CONFIG, ZONES_CONFIG
 from electricitymap.contrib.types import ParserDataType
 
+# Suffix of the bulk counterpart of a parser function, see `LazyParserDict.bulk_parser`.
+BULK_PARSER_SUFFIX = "_for_zones"
+
+
+class LazyParserDict(Mapping[str, Callable[..., Any]]):
+    """
+    Maps zone and exchange keys to their parser functions.
+
+    Parsers are stored as "package.module.function" references and their module
+    is only imported the first time the parser is looked up, so that running
+    one parser does not import the modules (and dependencies) of all the
+    others. Iterating over the keys and `in` checks do not import anything,
+    while iterating over the values imports every module of the dict.
+
+    The parsers of the registry below are registered by `ConfigParsers`, which
+    only reads the config of a key when it is first looked up; iterating over
+    the dict (or taking its length) reads all the configs.
+    """
+
+    def __init__(self, configs: "ConfigParsers | None" = None) -> None:
+        self._references: dict[str, str] = {}
+        self._parsers: dict[str, Callable[..., Any]] = {}
+        self._configs = configs
+
+    def _load(self, key: object) -> None:
+        if self._configs is not None:
+            self._configs.load(key)
+
+    def _load_all(self) -> None:
+        if self._configs is not None:
+            self._configs.load_all()
+
+    def register(self, key: str, reference: str) -> None:
+        """Registers the parser of `key` by its "package.module.function" reference."""
+        self._references[key] = reference
+        self._parsers.pop(key, None)
+
+    def reference(self, key: str) -> str:
+        """Returns the "package.module.function" reference of a parser, without importing it."""
+        self._load(key)
+        return self._references[key]
+
+    def group_by_reference(self, keys: Iterable[str]) -> dict[str, list[str]]:
+        """Groups keys by the reference of their parser, without importing it."""
+        groups: dict[str, list[str]] = {}
+        for key in keys:
+            self._load(key)
+            groups.setdefault(self._references[key], []).append(key)
+        return groups
+
+    def bulk_parser(self, key: str) -> Callable[..., Mapping[str, Any]] | None:
+        """
+        Returns the bulk counterpart of the parser of `key`, if its module defines one.
+
+        The bulk counterpart of `fetch_price` is `fetch_price_for_zones`. It takes the
+        zone keys sharing the parser in place of a single one, the other arguments
+        being the same, and returns the result of the parser for each zone key, built
+        from as few requests as possible. Combined with `group_by_reference`, it lets
+        a scheduler fetch all the zones of a shared source at once.
+        """
+        module_name, _, function_name = self.reference(key).rpartition(".")
+        return getattr(
+            importlib.import_module(module_name),
+            f"{function_name}{BULK_PARSER_SUFFIX}",
+            None,
+        )
+
+    def __getitem__(self, key: str) -> Callable[..., Any]:
+        parser = self._parsers.get(key)
+        if parser is None:
+            module_name, _, function_name = self.reference(key).rpartition(".")
+            parser = getattr(importlib.import_module(module_name), function_name)
+            self._parsers[key] = parser
+        return parser
+
+    def __contains__(self, key: object) -> bool:
+        self._load(key)
+        return key in self._references
+
+    def __iter__(self) -> Iterator[str]:
+        self._load_all()
+        return iter(self._references)
+
+    def __len__(self) -> int:
+        self._load_all()
+        return len(self._references)
+
+    def __repr__(self) -> str:
+        self._load_all()
+        return f"{type(self).__name__}({self._references!r})"
+
+
+class ConfigParsers:
+    """
+    Registers the parsers of the zone and exchange configs in `PARSER_DATA_TYPE_TO_DICT`.
+
+    The keys are known from the names of the config files, and the `parsers` block
+    of a config is only read the first time its key is looked up in one of the
+    dicts, so that a process running the parsers of one zone only parses its file.
+    """
+
+    def __init__(self) -> None:
+        self._loaded: set[str] = set()
+        self._lock = threading.Lock()
+
+    def load(self, key: object) -> None:
+        """Registers the parsers of `key`, if it is a zone or an exchange not read yet."""
+        if key in self._loaded:
+            return
+        if key in ZONES_CONFIG.paths:
+            kind, configs = "zone", ZONES_CONFIG
+        elif key in EXCHANGES_CONFIG.paths:
+            kind, configs = "exchange", EXCHANGES_CONFIG
+        else:
+            return
+        with self._lock:
+            if key not in self._loaded:
+                _register_parsers(kind, key, configs.get(key))
+                self._loaded.add(key)
+
+    def load_all(self) -> None:
+        """Registers the parsers of every zone and exchange."""
+        for key in [*ZONES_CONFIG.paths, *EXCHANGES_CONFIG.paths]:
+            self.load(key)
+
+
 # Prepare all parsers
-CONSUMPTION_PARSERS = {}
-PRODUCTION_PARSERS = {}
-PRODUCTION_PER_MODE_FORECAST_PARSERS = {}
-PRODUCTION_PER_MODE_FORECAST_DAY_AHEAD_PARSERS = {}
-PRODUCTION_PER_MODE_FORECAST_INTRADAY_PARSERS = {}
-PRODUCTION_PER_MODE_FORECAST_LATEST_PARSERS = {}
-EXCHANGE_PARSERS = {}
-EXCHANGE_CAPACITY_FORECAST_DAY_AHEAD_PARSERS = {}
-EXCHANGE_CAPACITY_FORECAST_WEEK_AHEAD_PARSERS = {}
-EXCHANGE_CAPACITY_FORECAST_MONTH_AHEAD_PARSERS = {}
-ATC_DAY_AHEAD_PARSERS = {}
-MAX_BEX_DAY_AHEAD_PARSERS = {}
-SCHEDULED_EXCHANGES_DAY_AHEAD_PARSERS = {}
-SCHEDULED_EXCHANGES_TOTAL_PARSERS = {}
-MAX_BFLOW_DAY_AHEAD_PARSERS = {}
-PRICE_PARSERS = {}
-PRICE_INTRADAY_PARSERS = {}
-CONSUMPTION_FORECAST_PARSERS = {}
-GENERATION_FORECAST_PARSERS = {}
-EXCHANGE_FORECAST_PARSERS = {}
-PRODUCTION_CAPACITY_PARSERS = {}
-DAYAHEAD_LOCATIONAL_MARGINAL_PRICE_PARSERS = {}
-REALTIME_LOCATIONAL_MARGINAL_PRICE_PARSERS = {}
-GRID_ALERTS_PARSERS = {}
-INTRADAY_CONTRACT_STATISTICS_PARSERS = {}
+CONFIG_PARSERS = ConfigParsers()
+CONSUMPTION_PARSERS = LazyParserDict(CONFIG_PARSERS)
+PRODUCTION_PARSERS = LazyParserDict(CONFIG_PARSERS)
+PRODUCTION_PER_MODE_FORECAST_PARSERS = LazyParserDict(CONFIG_PARSERS)
+PRODUCTION_PER_MODE_FORECAST_DAY_AHEAD_PARSERS = LazyParserDict(CONFIG_PARSERS)
+PRODUCTION_PER_MODE_FORECAST_INTRADAY_PARSERS = LazyParserDict(CONFIG_PARSERS)
+PRODUCTION_PER_MODE_FORECAST_LATEST_PARSERS = LazyParserDict(CONFIG_PARSERS)
+EXCHANGE_PARSERS = LazyParserDict(CONFIG_PARSERS)
+EXCHANGE_CAPACITY_FORECAST_DAY_AHEAD_PARSERS = LazyParserDict(CONFIG_PARSERS)
+EXCHANGE_CAPACITY_FORECAST_WEEK_AHEAD_PARSERS = LazyParserDict(CONFIG_PARSERS)
+EXCHANGE_CAPACITY_FORECAST_MONTH_AHEAD_PARSERS = LazyParserDict(CONFIG_PARSERS)
+ATC_DAY_AHEAD_PARSERS = LazyParserDict(CONFIG_PARSERS)
+MAX_BEX_DAY_AHEAD_PARSERS = LazyParserDict(CONFIG_PARSERS)
+SCHEDULED_EXCHANGES_DAY_AHEAD_PARSERS = LazyParserDict(CONFIG_PARSERS)
+SCHEDULED_EXCHANGES_TOTAL_PARSERS = LazyParserDict(CONFIG_PARSERS)
+MAX_BFLOW_DAY_AHEAD_PARSERS = LazyParserDict(CONFIG_PARSERS)
+PRICE_PARSERS = LazyParserDict(CONFIG_PARSERS)
+PRICE_INTRADAY_PARSERS = LazyParserDict(CONFIG_PARSERS)
+CONSUMPTION_FORECAST_PARSERS = LazyParserDict(CONFIG_PARSERS)
+GENERATION_FORECAST_PARSERS = LazyParserDict(CONFIG_PARSERS)
+EXCHANGE_FORECAST_PARSERS = LazyParserDict(CONFIG_PARSERS)
+PRODUCTION_CAPACITY_PARSERS = LazyParserDict(CONFIG_PARSERS)
+DAYAHEAD_LOCATIONAL_MARGINAL_PRICE_PARSERS = LazyParserDict(CONFIG_PARSERS)
+REALTIME_LOCATIONAL_MARGINAL_PRICE_PARSERS = LazyParserDict(CONFIG_PARSERS)
+GRID_ALERTS_PARSERS = LazyParserDict(CONFIG_PARSERS)
+INTRADAY_CONTRACT_STATISTICS_PARSERS = LazyParserDict(CONFIG_PARSERS)
 # TODO remove
-PRODUCTION_PER_UNIT_PARSERS = {}
+PRODUCTION_PER_UNIT_PARSERS = LazyParserDict(CONFIG_PARSERS)
 
 PARSER_DATA_TYPE_TO_DICT = {
     ParserDataType.CONSUMPTION: CONSUMPTION_PARSERS,
@@ -71,33 +201,20 @@ def _parser_key_to_parser_folder(parser_key: ParserDataType):
     )
 
 
-# Read all zones
-for zone_id, zone_config in ZONES_CONFIG.items():
-    for parser_key, v in zone_config.get("parsers", {}).items():
-        mod_name, fun_name = v.split(".")
-        try:
-            _parser_key = ParserDataType(parser_key)
-        except ValueError:
-            raise ValueError(
-                f"Invalid parser key: {parser_key} for zone: {zone_id}"
-            ) from None
-        mod = importlib.import_module(
-            f"{_parser_key_to_parser_folder(_parser_key)}.{mod_name}"
-        )
-        PARSER_DATA_TYPE_TO_DICT[_parser_key][zone_id] = getattr(mod, fun_name)
-
-
-# Read all exchanges
-for exchange_id, exchange_config in EXCHANGES_CONFIG.items():
-    for parser_key, v in exchange_config.get("parsers", {}).items():
+def _register_parsers(kind: str, key: str, config: Mapping[str, Any] | None) -> None:
+    """Registers the parsers of the `parsers` block of a zone or exchange config."""
+    if config is None:
+        # Configs that cannot be parsed are left out of the config registry.
+        return
+    for parser_key, v in config.get("parsers", {}).items():
         try:
             _parser_key = ParserDataType(parser_key)
         except ValueError:
             raise ValueError(
-                f"Invalid parser key: {parser_key} for exchange: {exchange_id}"
+                f"Invalid parser key: {parser_key} for {kind}: {key}"
             ) from None
         mod_name, fun_name = v.split(".")
-        mod = importlib.import_module(
-            f"{_parser_key_to_parser_folder(_parser_key)}.{mod_name}"
+        PARSER_DATA_TYPE_TO_DICT[_parser_key].register(
+            key,
+            f"{_parser_key_to_parser_folder(_parser_key)}.{mod_name}.{fun_name}",
         )
-        PARSER_DATA_TYPE_TO_DICT[_parser_key][exchange_id] = getattr(mod, fun_name)
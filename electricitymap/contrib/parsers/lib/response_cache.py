@@ -0,0 +1,244 @@
+"""An HTTP response cache for the archive files downloaded by parsers.
+
+Some sources only publish their data as monthly or yearly files (CSV, Excel or
+ZIP archives), while parsers are called for one datetime at a time: without a
+cache, a backfill downloads the same archive again for every day it covers.
+
+`RESPONSE_CACHE.fetch` sends GET requests through the parser's session and keeps
+the successful responses, keyed by URL and query parameters:
+- a response younger than the `ttl` given by the caller is served from the cache,
+- an older one is revalidated with `If-None-Match` / `If-Modified-Since` when the
+  source sent an `ETag` / `Last-Modified`, so that a `304 Not Modified` costs no
+  download, and is downloaded again otherwise,
+- responses are kept in memory up to `DEFAULT_MAX_MEMORY_BYTES`, the least
+  recently used ones being evicted first (see `parsers.lib.ttl_cache`).
+  `enable_response_disk_cache` also keeps them on disk, to share them between
+  processes and runs.
+
+The members of a cached ZIP archive are only decompressed when read, and the
+archive's index is parsed once per cached response.
+"""
+
+import json
+import os
+import time
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
+from functools import cached_property
+from io import BytesIO
+from pathlib import Path
+from typing import IO, Any
+from zipfile import ZipFile
+
+from requests import HTTPError, Request, Session
+
+from electricitymap.contrib.parsers.lib.disk_cache import CacheDirectory
+from electricitymap.contrib.parsers.lib.ttl_cache import TTLCache
+
+DEFAULT_MAX_MEMORY_BYTES = 256 * 1024**2
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_DISK_BYTES = 2 * 1024**3
+
+_BODY_SUFFIX = ".body"
+_METADATA_SUFFIX = ".json"
+
+
+@dataclass
+class CachedResponse:
+    """The parts of a `requests.Response` parsers read, kept by `ResponseCache`."""
+
+    url: str
+    status_code: int
+    content: bytes = field(repr=False)
+    reason: str = ""
+    etag: str | None = None
+    last_modified: str | None = None
+    # The `time.time()` of the download, or of the last revalidation.
+    fetched_at: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise HTTPError(
+                f"{self.status_code} Error: {self.reason} for url: {self.url}"
+            )
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    @cached_property
+    def _archive(self) -> ZipFile:
+        return ZipFile(BytesIO(self.content))
+
+    def zip_namelist(self) -> list[str]:
+        return self._archive.namelist()
+
+    def open_zip_member(self, name: str | None = None) -> IO[bytes]:
+        """Opens a member of the ZIP archive, the first one by default, for reading."""
+        return self._archive.open(name if name is not None else self.zip_namelist()[0])
+
+    def read_zip_member(self, name: str | None = None) -> bytes:
+        with self.open_zip_member(name) as member:
+            return member.read()
+
+
+def _cache_key(url: str, params: Mapping[str, Any] | None) -> str:
+    return Request("GET", url, params=params).prepare().url or url
+
+
+class ResponseCache:
+    """
+    A cache of GET responses, see the module docstring. The responses held in
+    memory are the entries of a `TTLCache` named `name`, so its hits, misses
+    and evictions are reported by `cache_metrics()`. They never expire there:
+    their freshness depends on the `ttl` of each `fetch`, and stale ones are
+    kept for revalidation.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        directory: str | Path | None = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.directory = Path(directory) if directory is not None else None
+        self.max_disk_bytes = max_disk_bytes
+        self._responses: TTLCache[str, CachedResponse] = TTLCache(
+            name,
+            max_entries=max_entries,
+            max_bytes=max_memory_bytes,
+            size_of=lambda response: len(response.content),
+        )
+
+    def fetch(
+        self,
+        session: Session,
+        url: str,
+        *,
+        ttl: float,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> CachedResponse:
+        """GETs `url`, unless a response younger than `ttl` seconds is cached.
+
+        Only successful responses are cached, error responses are returned for
+        the caller to handle as usual.
+        """
+        key = _cache_key(url, params)
+        cached = self._lookup(key)
+        now = time.time()
+        if cached is not None and now - cached.fetched_at < ttl:
+            return cached
+
+        request_headers = dict(headers or {})
+        if cached is not None and cached.etag:
+            request_headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified:
+            request_headers["If-Modified-Since"] = cached.last_modified
+        response = session.get(url, params=params, headers=request_headers)
+        if cached is not None and response.status_code == 304:
+            cached.fetched_at = now
+            self._store(key, cached)
+            return cached
+
+        fetched = CachedResponse(
+            url=url,
+            status_code=response.status_code,
+            content=response.content,
+            reason=response.reason or "",
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            fetched_at=now,
+        )
+        if response.status_code == 200:
+            self._store(key, fetched)
+        return fetched
+
+    def clear(self) -> None:
+        """Drops the responses held in memory, e.g. between tests.
+        The disk cache, shared with other processes, is left as is."""
+        self._responses.clear()
+
+    def _lookup(self, key: str) -> CachedResponse | None:
+        cached = self._responses.get(key)
+        if cached is None:
+            cached = self._read_disk(key)
+            if cached is not None:
+                self._responses.set(key, cached)
+        return cached
+
+    def _store(self, key: str, response: CachedResponse) -> None:
+        self._responses.set(key, response)
+        self._write_disk(key, response)
+
+    # On disk, a response is a pair of files: its body, and its other fields
+    # as JSON.
+
+    def _files(self) -> CacheDirectory | None:
+        return CacheDirectory(self.directory) if self.directory is not None else None
+
+    def _read_disk(self, key: str) -> CachedResponse | None:
+        files = self._files()
+        if files is None:
+            return None
+        metadata = files.read(key, _METADATA_SUFFIX)
+        content = files.read(key, _BODY_SUFFIX)
+        if metadata is None or content is None:
+            return None
+        try:
+            response = CachedResponse(content=content, **json.loads(metadata))
+            # The modification time orders the files for eviction.
+            os.utime(files.file(key, _BODY_SUFFIX))
+        except (OSError, TypeError, ValueError):
+            return None
+        return response
+
+    def _write_disk(self, key: str, response: CachedResponse) -> None:
+        files = self._files()
+        if files is None:
+            return
+        metadata = asdict(response)
+        del metadata["content"]
+        files.write(key, _BODY_SUFFIX, response.content)
+        files.write(key, _METADATA_SUFFIX, json.dumps(metadata).encode())
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        assert self.directory is not None
+        bodies = []
+        for path in self.directory.glob(f"*{_BODY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            bodies.append((stat.st_mtime, stat.st_size, path))
+        total_size = sum(size for _, size, _ in bodies)
+        for _, size, path in sorted(bodies):
+            if total_size <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            path.with_suffix(_METADATA_SUFFIX).unlink(missing_ok=True)
+            total_size -= size
+
+
+# The archive files downloaded by the JP, US_ERCOT and IN parsers, kept in
+# memory unless `enable_response_disk_cache` is called.
+RESPONSE_CACHE = ResponseCache("parsers.archive_responses")
+
+
+def enable_response_disk_cache(
+    directory: str | Path, max_bytes: int = DEFAULT_MAX_DISK_BYTES
+) -> None:
+    """Also keep the responses of `RESPONSE_CACHE` in `directory`.
+
+    A backfill split across processes then downloads each archive once, and
+    the next runs start from the archives it left, the least recently read
+    ones being deleted beyond `max_bytes`.
+    """
+    RESPONSE_CACHE.directory = Path(directory)
+    RESPONSE_CACHE.max_disk_bytes = max_bytes
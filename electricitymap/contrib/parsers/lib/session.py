@@ -1,9 +1,15 @@
 """Shared transport-layer helpers for parser HTTP sessions."""
 
-from requests import Session
+import socket
+import time
+from threading import Lock
+
+from requests import PreparedRequest, Response, Session
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from electricitymap.contrib.lib.models.instrumentation import NETWORK, current_metrics
+
 # 3 retries on 429 + transient 5xx, 0/2/4 s exponential backoff. urllib3
 # honours `Retry-After` for free. Pass a custom `Retry` to `mount_retry`
 # to widen `allowed_methods` (e.g. POST for OAuth token endpoints).
@@ -18,6 +24,14 @@ DEFAULT_RETRY = Retry(
     allowed_methods=["GET"],
 )
 
+# (connect, read) timeouts in seconds of the sessions made by `create_session`,
+# for requests that do not pass their own `timeout`.
+DEFAULT_TIMEOUT = (10, 120)
+# Number of hosts whose connections are kept alive by `create_session` sessions,
+# and number of connections kept alive per host.
+DEFAULT_POOL_CONNECTIONS = 64
+DEFAULT_POOL_MAXSIZE = 16
+
 
 def mount_retry(session: Session, retry: Retry = DEFAULT_RETRY) -> Session:
     """Mount a retrying HTTPAdapter on `session` for http(s)://.
@@ -25,9 +39,155 @@ def mount_retry(session: Session, retry: Retry = DEFAULT_RETRY) -> Session:
     Idempotent — re-mounting overrides the previous adapter with one
     carrying the same Retry config, so calling this multiple times is
     safe (each public fetcher can call it without coordinating).
-    Returns `session` so the call composes with `session or Session()`.
+    On a session made by `create_session`, the new adapter keeps sending
+    through the shared connection pools (see `PooledHTTPAdapter.with_retry`).
+    Returns `session` so the call composes with `session or create_session()`.
+    """
+    current = session.get_adapter("https://")
+    if isinstance(current, PooledHTTPAdapter):
+        adapter: HTTPAdapter = current.with_retry(retry)
+    else:
+        adapter = HTTPAdapter(max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """An HTTPAdapter shared by many sessions, with a default timeout.
+
+    Its pool manager keeps one pool of keep-alive connections per host, so the
+    sessions sharing it reuse each other's connections (and TLS handshakes).
+    Closing one of these sessions must not close the connections of the others,
+    so `close` leaves the pools open.
+    The requests it sends are timed as network when model metrics are
+    collected, see `electricitymap.contrib.lib.models.instrumentation`.
+    """
+
+    __attrs__ = [*HTTPAdapter.__attrs__, "timeout"]
+
+    def __init__(
+        self, timeout: float | tuple[float, float] = DEFAULT_TIMEOUT, **kwargs
+    ):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(
+        self, request: PreparedRequest, stream=False, timeout=None, **kwargs
+    ) -> Response:
+        if timeout is None:
+            timeout = self.timeout
+        metrics = current_metrics()
+        if metrics is None:
+            return super().send(request, stream=stream, timeout=timeout, **kwargs)
+        with metrics.timer(NETWORK):
+            response = super().send(request, stream=stream, timeout=timeout, **kwargs)
+            if not stream:
+                # The session reads the body right after, count it as network.
+                response.content  # noqa: B018
+        return response
+
+    def with_retry(self, retry: Retry) -> "PooledHTTPAdapter":
+        """Returns an adapter retrying with `retry`, sharing the pools of this one."""
+        adapter = PooledHTTPAdapter(
+            timeout=self.timeout,
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=self._pool_block,
+            max_retries=retry,
+        )
+        adapter.poolmanager = self.poolmanager
+        adapter.proxy_manager = self.proxy_manager
+        return adapter
+
+    def close(self) -> None:
+        """Leaves the pools open, see `close_pools` to close them."""
+
+    def close_pools(self) -> None:
+        """Closes the connections of every session sharing this adapter."""
+        super().close()
+
+
+_POOLED_ADAPTERS: dict[float | tuple[float, float], PooledHTTPAdapter] = {}
+_POOLED_ADAPTERS_LOCK = Lock()
+
+
+def create_session(timeout: float | tuple[float, float] = DEFAULT_TIMEOUT) -> Session:
+    """Create a session whose connections are pooled process-wide.
+
+    Each call returns a new `Session`, so headers, cookies and mounts set by one
+    parser do not leak into another, but all of them send their requests
+    through the same `PooledHTTPAdapter`. Connections to a host are therefore
+    kept alive across sessions, requests without a `timeout` use `timeout`,
+    and `DEFAULT_RETRY` applies to every request. Unlike `mount_retry`, a
+    response still failing after the retries is returned rather than raised,
+    so parsers keep handling error status codes themselves.
     """
-    adapter = HTTPAdapter(max_retries=retry)
+    with _POOLED_ADAPTERS_LOCK:
+        if timeout not in _POOLED_ADAPTERS:
+            _POOLED_ADAPTERS[timeout] = PooledHTTPAdapter(
+                timeout=timeout,
+                pool_connections=DEFAULT_POOL_CONNECTIONS,
+                pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                max_retries=DEFAULT_RETRY.new(raise_on_status=False),
+            )
+        adapter = _POOLED_ADAPTERS[timeout]
+    session = Session()
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     return session
+
+
+def close_pooled_sessions() -> None:
+    """Closes the pooled connections of every session made by `create_session`.
+
+    The sessions stay usable and open new connections when needed. Meant for
+    processes shutting down, or giving back their sockets between batches of
+    parsers, as closing a single session does not close the shared pools.
+    """
+    with _POOLED_ADAPTERS_LOCK:
+        for adapter in _POOLED_ADAPTERS.values():
+            adapter.close_pools()
+
+
+# The number of DNS resolutions cached by `enable_dns_cache`, the oldest being
+# evicted first.
+DNS_CACHE_MAXSIZE = 1024
+_DNS_CACHE: dict[tuple, tuple[float, list]] = {}
+_DNS_CACHE_LOCK = Lock()
+_getaddrinfo = socket.getaddrinfo
+
+
+def enable_dns_cache(ttl: float = 300, maxsize: int = DNS_CACHE_MAXSIZE) -> None:
+    """Cache the DNS resolutions of the process for `ttl` seconds.
+
+    Meant for schedulers running many parsers in a row against a handful of
+    hosts. It replaces `socket.getaddrinfo`, so it applies to every library
+    of the process, which is why it is never enabled by the parsers themselves.
+    At most `maxsize` resolutions are kept. Calling it again only changes
+    the TTL and size, and `disable_dns_cache` restores `socket.getaddrinfo`.
+    """
+
+    def cached_getaddrinfo(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with _DNS_CACHE_LOCK:
+            cached = _DNS_CACHE.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        addresses = _getaddrinfo(*args, **kwargs)
+        with _DNS_CACHE_LOCK:
+            _DNS_CACHE.pop(key, None)
+            _DNS_CACHE[key] = (now, addresses)
+            while len(_DNS_CACHE) > maxsize:
+                del _DNS_CACHE[next(iter(_DNS_CACHE))]
+        return addresses
+
+    socket.getaddrinfo = cached_getaddrinfo
+
+
+def disable_dns_cache() -> None:
+    """Undoes `enable_dns_cache`, dropping the cached resolutions."""
+    socket.getaddrinfo = _getaddrinfo
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE.clear()
@@ -0,0 +1,68 @@
+import threading
+import time
+
+import pytest
+
+from electricitymap.contrib.parsers.lib.concurrency import fetch_concurrently
+
+
+def test_fetch_concurrently_keeps_the_order_of_the_items():
+    def fetch(item):
+        time.sleep(0.01 * (5 - item))
+        return item * 10
+
+    assert fetch_concurrently(fetch, range(5), "https://order.test") == [
+        0,
+        10,
+        20,
+        30,
+        40,
+    ]
+
+
+def test_fetch_concurrently_caps_the_requests_per_host():
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def fetch(item):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return item
+
+    # Two fan-outs to the same host run at the same time, sharing the cap.
+    threads = [
+        threading.Thread(
+            target=fetch_concurrently,
+            args=(fetch, range(6), "https://cap.test/a", 2),
+        ),
+        threading.Thread(
+            target=fetch_concurrently,
+            args=(fetch, range(6), "https://cap.test/b", 2),
+        ),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max_running == 2
+
+
+def test_fetch_concurrently_raises_the_error_of_the_first_failing_item():
+    def fetch(item):
+        if item == 3:
+            raise ValueError("item 3")
+        if item == 1:
+            # Fails after item 3 did.
+            time.sleep(0.05)
+            raise ValueError("item 1")
+        return item
+
+    with pytest.raises(ValueError, match="item 1"):
+        fetch_concurrently(fetch, range(5), "https://errors.test")
@@ -0,0 +1,30 @@
+import stat
+
+from electricitymap.contrib.parsers.lib.disk_cache import (
+    CacheDirectory,
+    write_atomically,
+)
+
+
+def test_write_atomically_replaces_the_file(tmp_path):
+    path = tmp_path / "cache" / "index.json"
+
+    write_atomically(path, b"first")
+    write_atomically(path, b"second")
+
+    assert path.read_bytes() == b"second"
+    assert [file.name for file in path.parent.iterdir()] == ["index.json"]
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+def test_cache_directory_files_are_named_after_their_key(tmp_path):
+    files = CacheDirectory(tmp_path)
+
+    files.write("https://example.com/?month=01", ".body", b"archive")
+
+    assert files.read("https://example.com/?month=01", ".body") == b"archive"
+    assert files.read("https://example.com/?month=02", ".body") is None
+    (path,) = tmp_path.iterdir()
+    assert path.name.endswith(".body") and "/" not in path.stem
+    files.delete("https://example.com/?month=01", ".body")
+    assert not path.exists()
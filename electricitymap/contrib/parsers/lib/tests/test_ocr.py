@@ -0,0 +1,61 @@
+from importlib import resources
+from io import BytesIO
+from unittest.mock import patch
+
+from PIL import Image, ImageOps
+
+from electricitymap.contrib.parsers import SG
+from electricitymap.contrib.parsers.lib.ocr import OCREngine, OCRRegion
+
+
+def _solar_image(name: str) -> bytes:
+    return (
+        resources.files("electricitymap.contrib.parsers.tests.mocks")
+        .joinpath(name)
+        .read_bytes()
+    )
+
+
+def test_relative_regions_are_cropped_like_fractions_of_the_image():
+    content = _solar_image("SG_ema_gov_sg_solar_map.png")
+    image = Image.open(BytesIO(content))
+    w, h = image.size
+    region = OCRRegion(
+        (0.55, 0.70, 0.87, 0.75), preprocess=ImageOps.grayscale, relative=True
+    )
+
+    expected = ImageOps.grayscale(
+        image.crop((int(w * 0.55), int(h * 0.70), int(w * 0.87), int(h * 0.75)))
+    )
+    assert region.crop(image).tobytes() == expected.tobytes()
+
+
+def test_reads_each_region_with_its_own_configuration():
+    engine = OCREngine("test.ocr.configuration")
+    content = _solar_image("SG_ema_gov_sg_solar_map.png")
+
+    with patch(
+        "electricitymap.contrib.parsers.lib.ocr.image_to_string",
+        side_effect=lambda image, lang, config: f"{lang} {config}",
+    ):
+        texts = engine.read(content, SG.SOLAR_IMAGE_REGIONS)
+
+    assert texts == {
+        "output": "eng --psm 7",
+        "datetime": 'eng --psm 7 -c tessedit_char_whitelist="0123456789:- "',
+    }
+
+
+def test_unchanged_images_are_not_read_again():
+    engine = OCREngine("test.ocr.cache")
+    zero = _solar_image("SG_ema_gov_sg_solar_map.png")
+    nonzero = _solar_image("SG_ema_gov_sg_solar_map_nonzero.png")
+
+    with patch(
+        "electricitymap.contrib.parsers.lib.ocr.image_to_string", return_value="text"
+    ) as image_to_string:
+        engine.read(zero, SG.SOLAR_IMAGE_REGIONS)
+        engine.read(zero, SG.SOLAR_IMAGE_REGIONS)
+        assert image_to_string.call_count == 2
+        engine.read(nonzero, SG.SOLAR_IMAGE_REGIONS)
+        assert image_to_string.call_count == 4
@@ -0,0 +1,90 @@
+import sys
+
+import pytest
+from ruamel.yaml.error import YAMLError
+
+from electricitymap.contrib.config.reading import (
+    LazyConfigDirectory,
+    lazy_exchanges_config,
+)
+from electricitymap.contrib.parsers.lib import parsers as parsers_module
+from electricitymap.contrib.parsers.lib.parsers import (
+    PARSER_DATA_TYPE_TO_DICT,
+    ConfigParsers,
+    LazyParserDict,
+)
+from electricitymap.contrib.types import ParserDataType
+
+
+def test_parsers_are_imported_on_first_lookup(monkeypatch):
+    monkeypatch.delitem(sys.modules, "json.tool", raising=False)
+    parsers = LazyParserDict()
+    parsers.register("AA", "json.tool.main")
+
+    assert "AA" in parsers
+    assert "BB" not in parsers
+    assert list(parsers) == ["AA"]
+    assert parsers.reference("AA") == "json.tool.main"
+    assert "json.tool" not in sys.modules
+
+    from json.tool import main
+
+    assert parsers["AA"] is main
+
+
+def test_configs_are_read_on_first_lookup(monkeypatch, tmp_path):
+    zones_dir = tmp_path / "zones"
+    zones_dir.mkdir()
+    (tmp_path / "exchanges").mkdir()
+    zones_dir.joinpath("AA.yaml").write_text(
+        "parsers:\n  production: FR.fetch_production\n"
+    )
+    # Parsing this file raises, so looking up AA must not read it.
+    zones_dir.joinpath("BB.yaml").write_text("parsers: [\n")
+    configs = ConfigParsers()
+    registry = {data_type: LazyParserDict(configs) for data_type in ParserDataType}
+    monkeypatch.setattr(parsers_module, "ZONES_CONFIG", LazyConfigDirectory(zones_dir))
+    monkeypatch.setattr(
+        parsers_module, "EXCHANGES_CONFIG", lazy_exchanges_config(tmp_path)
+    )
+    monkeypatch.setattr(parsers_module, "PARSER_DATA_TYPE_TO_DICT", registry)
+
+    production_parsers = registry[ParserDataType.PRODUCTION]
+    assert "CC" not in production_parsers
+    assert "AA" in production_parsers
+    assert "AA" not in registry[ParserDataType.PRICE]
+    assert production_parsers.reference("AA") == (
+        "electricitymap.contrib.parsers.FR.fetch_production"
+    )
+    with pytest.raises(YAMLError):
+        production_parsers.reference("BB")
+
+
+def test_all_registered_parsers_can_be_imported():
+    for parser_data_type, parsers in PARSER_DATA_TYPE_TO_DICT.items():
+        for key, parser in parsers.items():
+            assert callable(parser), (parser_data_type, key)
+
+
+def test_registry_contents():
+    production_parsers = PARSER_DATA_TYPE_TO_DICT[ParserDataType.PRODUCTION]
+    assert production_parsers.reference("FR") == (
+        "electricitymap.contrib.parsers.FR.fetch_production"
+    )
+    assert (
+        PARSER_DATA_TYPE_TO_DICT[ParserDataType.PRODUCTION_CAPACITY]
+        .reference("FR")
+        .startswith("electricitymap.contrib.capacity_parsers.")
+    )
+
+
+def test_bulk_parsers_are_looked_up_next_to_the_parser():
+    price_parsers = PARSER_DATA_TYPE_TO_DICT[ParserDataType.PRICE]
+    groups = price_parsers.group_by_reference(["AL", "BG", "FR"])
+    assert groups["electricitymap.contrib.parsers.ENTSOE.fetch_price"] == ["AL", "BG"]
+    assert groups["electricitymap.contrib.parsers.NORDPOOL.fetch_price"] == ["FR"]
+
+    from electricitymap.contrib.parsers import ENTSOE
+
+    assert price_parsers.bulk_parser("AL") is ENTSOE.fetch_price_for_zones
+    assert PARSER_DATA_TYPE_TO_DICT[ParserDataType.PRODUCTION].bulk_parser("FR") is None
@@ -0,0 +1,122 @@
+from io import BytesIO
+from zipfile import ZipFile
+
+import pytest
+from freezegun import freeze_time
+from requests import HTTPError, Session
+
+from electricitymap.contrib.parsers.lib.response_cache import ResponseCache
+from electricitymap.contrib.parsers.lib.ttl_cache import cache_metrics
+
+URL = "https://example.com/archive.csv"
+
+
+def test_serves_fresh_responses_from_the_cache(requests_mock):
+    requests_mock.get(URL, content=b"archive")
+    cache = ResponseCache("test.responses")
+    session = Session()
+
+    first = cache.fetch(session, URL, ttl=60, params={"month": "01"})
+    second = cache.fetch(session, URL, ttl=60, params={"month": "01"})
+    cache.fetch(session, URL, ttl=60, params={"month": "02"})
+
+    assert first is second
+    assert second.content == b"archive"
+    assert requests_mock.call_count == 2
+
+
+def test_revalidates_stale_responses(requests_mock):
+    requests_mock.get(
+        URL,
+        [
+            {"content": b"archive", "headers": {"ETag": '"v1"'}},
+            {"status_code": 304},
+            {"content": b"updated archive", "headers": {"ETag": '"v2"'}},
+        ],
+    )
+    cache = ResponseCache("test.responses")
+    session = Session()
+
+    with freeze_time("2024-01-01") as frozen_time:
+        cache.fetch(session, URL, ttl=60)
+        frozen_time.tick(61)
+        revalidated = cache.fetch(session, URL, ttl=60)
+        frozen_time.tick(61)
+        updated = cache.fetch(session, URL, ttl=60)
+
+    assert revalidated.content == b"archive"
+    assert requests_mock.request_history[1].headers["If-None-Match"] == '"v1"'
+    assert updated.content == b"updated archive"
+    assert updated.etag == '"v2"'
+
+
+def test_does_not_cache_errors(requests_mock):
+    requests_mock.get(URL, [{"status_code": 404}, {"content": b"archive"}])
+    cache = ResponseCache("test.responses")
+    session = Session()
+
+    missing = cache.fetch(session, URL, ttl=60)
+    with pytest.raises(HTTPError):
+        missing.raise_for_status()
+    assert cache.fetch(session, URL, ttl=60).content == b"archive"
+
+
+def test_evicts_the_least_recently_used_responses(requests_mock):
+    for name in "abc":
+        requests_mock.get(f"https://example.com/{name}", content=name.encode() * 4)
+    cache = ResponseCache("test.lru", max_memory_bytes=8)
+    session = Session()
+
+    cache.fetch(session, "https://example.com/a", ttl=60)
+    cache.fetch(session, "https://example.com/b", ttl=60)
+    cache.fetch(session, "https://example.com/a", ttl=60)
+    cache.fetch(session, "https://example.com/c", ttl=60)
+    cache.fetch(session, "https://example.com/a", ttl=60)
+    cache.fetch(session, "https://example.com/b", ttl=60)
+
+    assert [request.path for request in requests_mock.request_history] == [
+        "/a",
+        "/b",
+        "/c",
+        "/b",
+    ]
+    metrics = cache_metrics()["test.lru"]
+    assert (metrics["hits"], metrics["misses"], metrics["evictions"]) == (2, 4, 2)
+
+
+def test_shares_the_disk_cache_across_instances(requests_mock, tmp_path):
+    requests_mock.get(URL, content=b"archive")
+    ResponseCache("test.disk", directory=tmp_path).fetch(Session(), URL, ttl=60)
+
+    cached = ResponseCache("test.disk", directory=tmp_path).fetch(
+        Session(), URL, ttl=60
+    )
+
+    assert cached.content == b"archive"
+    assert requests_mock.call_count == 1
+
+
+def test_disk_cache_is_bounded(requests_mock, tmp_path):
+    for name in "ab":
+        requests_mock.get(f"https://example.com/{name}", content=b"x" * 8)
+    cache = ResponseCache("test.disk_bound", directory=tmp_path, max_disk_bytes=10)
+
+    cache.fetch(Session(), "https://example.com/a", ttl=60)
+    cache.fetch(Session(), "https://example.com/b", ttl=60)
+
+    assert len(list(tmp_path.glob("*.body"))) == 1
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_reads_zip_members(requests_mock):
+    buffer = BytesIO()
+    with ZipFile(buffer, "w") as archive:
+        archive.writestr("2024-01.csv", b"january")
+        archive.writestr("2024-02.csv", b"february")
+    requests_mock.get(URL, content=buffer.getvalue())
+
+    response = ResponseCache("test.responses").fetch(Session(), URL, ttl=60)
+
+    assert response.zip_namelist() == ["2024-01.csv", "2024-02.csv"]
+    assert response.read_zip_member() == b"january"
+    assert response.read_zip_member("2024-02.csv") == b"february"
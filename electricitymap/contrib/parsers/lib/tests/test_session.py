@@ -0,0 +1,109 @@
+import socket
+from copy import deepcopy
+
+from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from electricitymap.contrib.parsers.lib.session import (
+    DEFAULT_TIMEOUT,
+    PooledHTTPAdapter,
+    close_pooled_sessions,
+    create_session,
+    disable_dns_cache,
+    enable_dns_cache,
+    mount_retry,
+)
+
+
+def test_sessions_share_their_connection_pools():
+    session_a, session_b = create_session(), create_session()
+
+    assert session_a is not session_b
+    adapter = session_a.get_adapter("https://example.com")
+    assert isinstance(adapter, PooledHTTPAdapter)
+    assert session_b.get_adapter("http://example.org") is adapter
+    assert create_session(timeout=5).get_adapter("https://example.com") is not adapter
+
+
+def test_sessions_do_not_share_their_state():
+    session_a, session_b = create_session(), create_session()
+    session_a.headers["Authorization"] = "token"
+    session_a.cookies.set("name", "value")
+
+    assert "Authorization" not in session_b.headers
+    assert not session_b.cookies
+
+
+def test_closing_a_session_keeps_the_pools_open(monkeypatch):
+    session = create_session()
+    poolmanager = session.get_adapter("https://example.com").poolmanager
+    cleared = []
+    monkeypatch.setattr(poolmanager, "clear", lambda: cleared.append(True))
+
+    session.close()
+
+    assert cleared == []
+
+    close_pooled_sessions()
+
+    assert cleared == [True]
+
+
+def test_mount_retry_keeps_the_shared_pools():
+    retry = Retry(total=1)
+    session = mount_retry(create_session(), retry=retry)
+
+    adapter = session.get_adapter("https://example.com")
+    assert isinstance(adapter, PooledHTTPAdapter)
+    assert adapter.max_retries is retry
+    assert adapter.poolmanager is create_session().get_adapter("https://").poolmanager
+
+
+def test_default_timeout(monkeypatch):
+    timeouts = []
+
+    def send(self, request, stream=False, timeout=None, **kwargs):
+        timeouts.append(timeout)
+        response = Response()
+        response.status_code = 200
+        return response
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+    session = create_session()
+
+    session.get("https://example.com")
+    session.get("https://example.com", timeout=3)
+
+    assert timeouts == [DEFAULT_TIMEOUT, 3]
+
+
+def test_adapters_can_be_copied():
+    # `retry_policy` deep copies the adapters of the sessions it is given.
+    adapter = deepcopy(create_session().get_adapter("https://example.com"))
+    assert isinstance(adapter, PooledHTTPAdapter)
+    assert adapter.timeout == DEFAULT_TIMEOUT
+
+
+def test_dns_cache_is_bounded_and_can_be_disabled(monkeypatch):
+    resolutions = []
+
+    def getaddrinfo(host, *args, **kwargs):
+        resolutions.append(host)
+        return [host]
+
+    # Restored by monkeypatch, as `disable_dns_cache` restores the fake below.
+    monkeypatch.setattr(socket, "getaddrinfo", socket.getaddrinfo)
+    monkeypatch.setattr(
+        "electricitymap.contrib.parsers.lib.session._getaddrinfo", getaddrinfo
+    )
+    enable_dns_cache(maxsize=2)
+    try:
+        for host in ("a", "a", "b", "c", "a"):
+            socket.getaddrinfo(host, 443)
+    finally:
+        disable_dns_cache()
+
+    # "a" was evicted by "c", the oldest resolution being dropped first.
+    assert resolutions == ["a", "b", "c", "a"]
+    assert socket.getaddrinfo is getaddrinfo
@@ -0,0 +1,93 @@
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from freezegun import freeze_time
+
+from electricitymap.contrib.parsers.lib.token_cache import CachedToken, TokenCache
+
+
+def _token_fetcher(lifetime: float = 3600):
+    fetched = []
+
+    def fetch() -> CachedToken:
+        fetched.append(None)
+        return CachedToken.expiring_in(f"token-{len(fetched)}", lifetime)
+
+    return fetch, fetched
+
+
+def test_refreshes_tokens_before_they_expire():
+    cache = TokenCache(refresh_margin=60)
+    fetch, fetched = _token_fetcher()
+
+    with freeze_time("2024-01-01") as frozen_time:
+        assert cache.get("provider", fetch) == "token-1"
+        frozen_time.tick(3500)
+        assert cache.get("provider", fetch) == "token-1"
+        frozen_time.tick(60)
+        assert cache.get("provider", fetch) == "token-2"
+
+    assert len(fetched) == 2
+
+
+def test_caches_tokens_by_provider():
+    cache = TokenCache()
+    fetch, fetched = _token_fetcher()
+
+    cache.get("a", fetch)
+    cache.get("b", fetch)
+    cache.get("a", fetch)
+
+    assert len(fetched) == 2
+
+
+def test_concurrent_callers_refresh_once():
+    cache = TokenCache()
+    fetched = []
+
+    def slow_fetch() -> CachedToken:
+        fetched.append(None)
+        time.sleep(0.05)
+        return CachedToken.expiring_in("token", 3600)
+
+    barrier = threading.Barrier(8)
+
+    def get(_):
+        barrier.wait()
+        return cache.get("provider", slow_fetch)
+
+    with ThreadPoolExecutor(8) as executor:
+        tokens = list(executor.map(get, range(8)))
+
+    assert tokens == ["token"] * 8
+    assert len(fetched) == 1
+
+
+def test_invalidated_tokens_are_fetched_again():
+    cache = TokenCache()
+    fetch, _ = _token_fetcher()
+
+    cache.get("provider", fetch)
+    cache.invalidate("provider")
+
+    assert cache.get("provider", fetch) == "token-2"
+
+
+def test_shares_the_disk_store_across_instances(tmp_path):
+    fetch, fetched = _token_fetcher()
+    TokenCache(directory=tmp_path).get("provider", fetch)
+
+    assert TokenCache(directory=tmp_path).get("provider", fetch) == "token-1"
+    assert len(fetched) == 1
+    (token_file,) = tmp_path.glob("*.token.json")
+    assert stat.S_IMODE(token_file.stat().st_mode) == 0o600
+
+
+def test_expired_tokens_on_disk_are_refreshed(tmp_path):
+    fetch, fetched = _token_fetcher(lifetime=30)
+    TokenCache(directory=tmp_path).get("provider", fetch)
+
+    assert TokenCache(directory=tmp_path).get("provider", fetch) == "token-2"
+    assert len(fetched) == 2
@@ -0,0 +1,100 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+from freezegun import freeze_time
+
+from electricitymap.contrib.parsers.lib.ttl_cache import (
+    TTLCache,
+    cache_metrics,
+    day_ttl,
+    month_ttl,
+)
+
+
+def test_evicts_least_recently_used_entries():
+    cache = TTLCache("test.entries", max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats().evictions == 1
+
+
+def test_evicts_entries_beyond_max_bytes():
+    cache = TTLCache("test.bytes", max_bytes=10)
+    cache.set("a", b"12345")
+    cache.set("b", b"12345")
+    cache.set("c", b"123")
+    # Larger than the whole cache, not cached at all.
+    cache.set("d", b"12345678901")
+
+    assert "a" not in cache
+    assert "d" not in cache
+    assert cache.stats().bytes == 8
+
+
+def test_sizes_dataframes_by_their_memory_usage():
+    df = pd.DataFrame({"value": range(1000)})
+    cache = TTLCache("test.frames", max_bytes=1000)
+    cache.set("df", df)
+
+    assert "df" not in cache
+
+
+def test_entries_expire_after_their_ttl():
+    cache = TTLCache("test.ttl")
+
+    with freeze_time("2024-01-01") as frozen_time:
+        cache.set("volatile", 1, ttl=60)
+        cache.set("immutable", 2)
+        frozen_time.tick(59)
+        assert cache.get("volatile") == 1
+        frozen_time.tick(1)
+        assert cache.get("volatile") is None
+        assert cache.get("immutable") == 2
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.expirations, stats.entries) == (2, 1, 1, 1)
+
+
+def test_get_or_set_computes_missing_values_once():
+    cache = TTLCache("test.get_or_set")
+    computed = []
+
+    def compute():
+        computed.append(None)
+        return len(computed)
+
+    assert cache.get_or_set("key", compute) == 1
+    assert cache.get_or_set("key", compute) == 1
+    assert len(computed) == 1
+
+
+def test_cache_metrics_reports_caches_by_name():
+    cache = TTLCache("test.metrics")
+    cache.get("missing")
+
+    assert cache_metrics()["test.metrics"]["misses"] == 1
+
+
+@freeze_time("2024-03-15 12:00")
+def test_month_ttl_keeps_past_months_until_evicted():
+    tz = ZoneInfo("America/Mexico_City")
+    assert month_ttl(datetime(2024, 2, 29, tzinfo=tz), 3600) is None
+    assert month_ttl(datetime(2024, 2, 29, tzinfo=tz), 3600, 86400) == 86400
+    assert month_ttl(datetime(2024, 3, 1, tzinfo=tz), 3600) == 3600
+    assert month_ttl(datetime(2024, 4, 1, tzinfo=tz), 3600) == 3600
+
+
+@freeze_time("2024-03-15 12:00")
+def test_day_ttl_keeps_past_days_until_evicted():
+    tz = ZoneInfo("Asia/Tokyo")
+    # It is already the 15th at 21:00 in Tokyo.
+    assert day_ttl(datetime(2024, 3, 14, 23, tzinfo=tz), 0, 86400) == 86400
+    assert day_ttl(datetime(2024, 3, 14, 23, tzinfo=tz), 0) is None
+    assert day_ttl(datetime(2024, 3, 15, tzinfo=tz), 0, 86400) == 0
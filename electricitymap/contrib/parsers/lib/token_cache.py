@@ -0,0 +1,156 @@
+"""A cache of the access tokens of the sources requiring an OAuth-style login.
+
+Tokens live for minutes to hours, while parsers are called once per zone and
+datetime: without a cache, every call costs a round trip to the token endpoint,
+which is where sources rate limit us the most.
+
+`TOKEN_CACHE.get(provider, fetch)` returns the cached token of `provider`, and
+calls `fetch` for a new one when there is none yet or when the cached one
+expires within `refresh_margin` seconds, so that a token is never sent just as
+it expires. Concurrent callers wait for a single refresh per provider.
+
+`enable_token_disk_cache` also keeps the tokens on disk, readable by their
+owner only, so that forked workers and successive runs share them. The disk
+store is locked during a refresh where `fcntl` is available, so that workers
+refreshing at once log in only once.
+"""
+
+import json
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from threading import Lock
+
+from electricitymap.contrib.parsers.lib.disk_cache import CacheDirectory
+
+try:
+    import fcntl
+except ImportError:  # Windows, the disk store is then only written atomically.
+    fcntl = None
+
+DEFAULT_REFRESH_MARGIN = 60.0
+
+_TOKEN_SUFFIX = ".token.json"
+_LOCK_SUFFIX = ".token.lock"
+
+
+@dataclass
+class CachedToken:
+    value: str
+    # The `time.time()` the token expires at.
+    expires_at: float
+
+    @classmethod
+    def expiring_in(cls, value: str, expires_in: float) -> "CachedToken":
+        """Builds a token from the lifetime in seconds given by token endpoints."""
+        return cls(value=value, expires_at=time.time() + float(expires_in))
+
+
+class TokenCache:
+    """A cache of access tokens by provider, see the module docstring."""
+
+    def __init__(
+        self,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        directory: str | Path | None = None,
+    ):
+        self.refresh_margin = refresh_margin
+        self.directory = Path(directory) if directory is not None else None
+        self._tokens: dict[str, CachedToken] = {}
+        self._locks: dict[str, Lock] = {}
+        self._lock = Lock()
+
+    def get(self, provider: str, fetch: Callable[[], CachedToken]) -> str:
+        """Returns the token of `provider`, calling `fetch` to refresh it when needed."""
+        token = self._fresh(self._tokens.get(provider))
+        if token is not None:
+            return token.value
+        with self._provider_lock(provider), self._disk_lock(provider):
+            # Refreshed by another thread or process while waiting for the lock.
+            token = self._fresh(self._tokens.get(provider)) or self._fresh(
+                self._read_disk(provider)
+            )
+            if token is None:
+                token = fetch()
+                self._write_disk(provider, token)
+            self._tokens[provider] = token
+        return token.value
+
+    def store(self, provider: str, token: CachedToken) -> None:
+        with self._provider_lock(provider):
+            self._tokens[provider] = token
+            self._write_disk(provider, token)
+
+    def invalidate(self, provider: str) -> None:
+        """Drops the token of `provider`, e.g. after the source rejected it."""
+        with self._provider_lock(provider):
+            self._tokens.pop(provider, None)
+            files = self._files()
+            if files is not None:
+                files.delete(provider, _TOKEN_SUFFIX)
+
+    def clear(self) -> None:
+        """Forgets the tokens held by this process, e.g. between tests.
+        A token stored on disk is read again by the next `get` of its provider."""
+        with self._lock:
+            self._tokens.clear()
+
+    def _fresh(self, token: CachedToken | None) -> CachedToken | None:
+        if token is None or token.expires_at - time.time() <= self.refresh_margin:
+            return None
+        return token
+
+    def _provider_lock(self, provider: str) -> Lock:
+        with self._lock:
+            return self._locks.setdefault(provider, Lock())
+
+    # On disk, a provider has a JSON file holding its token and a lock file
+    # taken while it is refreshed.
+
+    def _files(self) -> CacheDirectory | None:
+        return CacheDirectory(self.directory) if self.directory is not None else None
+
+    @contextmanager
+    def _disk_lock(self, provider: str) -> Iterator[None]:
+        files = self._files()
+        if files is None or fcntl is None:
+            yield
+            return
+        files.path.mkdir(parents=True, exist_ok=True)
+        with open(files.file(provider, _LOCK_SUFFIX), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_disk(self, provider: str) -> CachedToken | None:
+        files = self._files()
+        data = files.read(provider, _TOKEN_SUFFIX) if files is not None else None
+        if data is None:
+            return None
+        try:
+            return CachedToken(**json.loads(data))
+        except (TypeError, ValueError):
+            return None
+
+    def _write_disk(self, provider: str, token: CachedToken) -> None:
+        files = self._files()
+        if files is not None:
+            files.write(provider, _TOKEN_SUFFIX, json.dumps(asdict(token)).encode())
+
+
+# The tokens of the sources logged into by the parsers, e.g. ERCOT and Nordpool.
+TOKEN_CACHE = TokenCache()
+
+
+def enable_token_disk_cache(directory: str | Path) -> None:
+    """Also keep the tokens of `TOKEN_CACHE` in `directory`.
+
+    Worker processes sharing the directory then log in once per token lifetime
+    in total, instead of once each, the first worker to refresh a token
+    holding the others back until it is stored.
+    """
+    TOKEN_CACHE.directory = Path(directory)
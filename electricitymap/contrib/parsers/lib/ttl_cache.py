@@ -0,0 +1,200 @@
+"""A bounded in-process cache for the data parsers keep between calls.
+
+Parsers called repeatedly by a long-lived worker keep some parsed data around,
+e.g. the DataFrame of a whole month fetched for one of its days. Kept in a plain
+module dict, that data grows without limit and is never refreshed.
+
+`TTLCache` is a least recently used cache bounded both in entries and in bytes,
+whose entries expire after a time to live given per entry. It counts its hits,
+misses, evictions and expirations, and `cache_metrics()` reports them for all
+the caches of the process.
+
+`month_ttl` implements the common policy of monthly publications: the data of
+the current month is still being updated and is kept for a short while, while
+the data of past months is final and is only evicted to make room. `day_ttl`
+is the same policy for daily publications.
+"""
+
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+
+import pandas as pd
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_BYTES = 256 * 1024**2
+
+# The caches of the process, by name, for `cache_metrics()`.
+_CACHES: "weakref.WeakValueDictionary[str, TTLCache]" = weakref.WeakValueDictionary()
+
+
+def _size_of(value: Any) -> int:
+    """Returns the approximate size of a cached value in bytes."""
+    if isinstance(value, pd.DataFrame | pd.Series):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, bytes | bytearray | memoryview):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    size: int
+    # The `time.time()` the entry expires at, None if it never expires.
+    expires_at: float | None
+
+
+class TTLCache(Generic[K, V]):
+    """A size- and byte-bounded LRU cache with a TTL per entry, see the module docstring."""
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        size_of: Callable[[Any], int] = _size_of,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._size_of = size_of
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+        _CACHES[name] = self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            return self._live_entry(key) is not None
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Returns the value of `key`, or `default` if it is missing or expired."""
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                self._stats.misses += 1
+                return default
+            self._stats.hits += 1
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """
+        Caches `value` for `ttl` seconds, or until evicted if `ttl` is None.
+        Values larger than `max_bytes` are not cached.
+        """
+        size = self._size_of(value)
+        expires_at = None if ttl is None else time.time() + ttl
+        with self._lock:
+            self._pop(key)
+            if size > self.max_bytes or (ttl is not None and ttl <= 0):
+                return
+            self._entries[key] = _Entry(value, size, expires_at)
+            self._stats.bytes += size
+            while (
+                len(self._entries) > self.max_entries
+                or self._stats.bytes > self.max_bytes
+            ):
+                oldest_key = next(iter(self._entries))
+                self._pop(oldest_key)
+                self._stats.evictions += 1
+
+    def get_or_set(
+        self, key: K, compute: Callable[[], V], ttl: float | None = None
+    ) -> V:
+        """Returns the value of `key`, computing and caching it if it is missing or expired.
+        None values are not told apart from missing ones."""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats.bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**{**asdict(self._stats), "entries": len(self._entries)})
+
+    def _live_entry(self, key: K) -> _Entry[V] | None:
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and entry.expires_at is not None
+            and entry.expires_at <= time.time()
+        ):
+            self._pop(key)
+            self._stats.expirations += 1
+            return None
+        return entry
+
+    def _pop(self, key: K) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._stats.bytes -= entry.size
+
+
+def cache_metrics() -> dict[str, dict[str, int]]:
+    """Returns the stats of the caches of the process by name, to be exported by a scheduler."""
+    return {name: cache.stats().as_dict() for name, cache in list(_CACHES.items())}
+
+
+def month_ttl(
+    target_datetime: datetime,
+    current_month_ttl: float,
+    past_month_ttl: float | None = None,
+) -> float | None:
+    """
+    Returns the TTL of data covering the month of `target_datetime`: the current
+    (or a future) month is volatile and kept for `current_month_ttl` seconds, past
+    months are immutable and kept for `past_month_ttl`, until evicted by default.
+    """
+    now = datetime.now(target_datetime.tzinfo)
+    if (target_datetime.year, target_datetime.month) < (now.year, now.month):
+        return past_month_ttl
+    return current_month_ttl
+
+
+def day_ttl(
+    target_datetime: datetime,
+    current_day_ttl: float,
+    past_day_ttl: float | None = None,
+) -> float | None:
+    """The daily counterpart of `month_ttl`, for data covering the day of `target_datetime`."""
+    now = datetime.now(target_datetime.tzinfo)
+    if target_datetime.date() < now.date():
+        return past_day_ttl
+    return current_day_ttl
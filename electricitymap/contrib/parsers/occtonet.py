@@ -8,6 +8,7 @@ import pandas as pd
 from requests import Session, cookies
 
 from .lib.exceptions import ParserException
+from .lib.session import create_session
 
 # Abbreviations:
 # JP-HKD : Hokkaido
@@ -94,7 +95,7 @@ def fetch_exchange(
 ) -> list[dict]:
     """Requests the last known power exchange (in MW) between two zones."""
     if not session:
-        session = Session()
+        session = create_session()
     now = datetime.now(ZONE_INFO)
     if target_datetime is None:
         target_datetime = now
@@ -116,7 +117,7 @@ def fetch_exchange_forecast(
 ) -> list[dict]:
     """Gets exchange forecast between two specified zones."""
     if not session:
-        session = Session()
+        session = create_session()
     now = datetime.now(ZONE_INFO)
     if target_datetime is None:
         target_datetime = now
@@ -136,7 +137,7 @@ def fetch_exchange_forecast(
 
 def get_cookies(session: Session | None = None) -> cookies.RequestsCookieJar:
     if not session:
-        session = Session()
+        session = create_session()
     session.get("http://occtonet.occto.or.jp/public/dfw/RP11/OCCTO/SD/LOGIN_login")
     return session.cookies
 
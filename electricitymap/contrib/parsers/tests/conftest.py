@@ -16,7 +16,16 @@ requests-mock ref: https://requests-mock.readthedocs.io/en/latest/pytest.html
 import pytest
 from requests import Session
 
+from electricitymap.contrib.parsers.lib.response_cache import RESPONSE_CACHE
+
 
 @pytest.fixture
 def session():
     yield Session()
+
+
+@pytest.fixture(autouse=True)
+def _clear_response_cache():
+    """Keep the responses cached by one test from being served to another."""
+    RESPONSE_CACHE.clear()
+    yield
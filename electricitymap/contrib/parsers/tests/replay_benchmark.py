@@ -0,0 +1,319 @@
+"""
+Pytest plugin replaying the recorded parser mocks to benchmark the parsers.
+
+The parser tests already serve the recorded payloads of `mocks/` to the real
+`fetch_*` entry points through `requests_mock`. With this plugin, every such
+call made by a test is recorded, and replayed once the test is done (while its
+mocks are still registered, and at the same frozen time if the test froze it)
+to measure:
+
+- the wall and CPU time of the call (median over `--replay-runs` runs),
+- the peak memory allocated by the call, measured in a separate run with
+  `tracemalloc` so that tracing does not slow down the timed runs,
+- the number of events returned, and the events per second of CPU time.
+
+The caches the parsers keep between calls (responses, tokens, OCR results,
+parsed reports) are cleared before each run, so that every run does the work of
+a first call instead of reading back what the test or the previous run stored.
+
+Calls that cannot be replayed are not measured but counted: calls made by a
+failed test are skipped, and calls whose replay raises are failed, their
+errors being listed in the JSON output.
+
+Results are aggregated per entry point and written as JSON to the path given
+with `--replay-benchmark`. Passing an earlier JSON file with `--replay-baseline`
+reports the change of each entry point against it.
+
+Usage (see also scripts/benchmark_parser_replay.py):
+    uv run pytest electricitymap/contrib/parsers/tests \\
+        -p electricitymap.contrib.parsers.tests.replay_benchmark \\
+        --replay-benchmark=replay.json
+"""
+
+import functools
+import importlib
+import json
+import pkgutil
+import statistics
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import freezegun
+import freezegun.api
+import pytest
+
+import electricitymap.contrib.parsers
+
+BENCHMARK_FORMAT_VERSION = 2
+
+# The module-level caches of the parsers, as (module, attribute, method clearing
+# it), relative to `electricitymap.contrib.parsers`.
+PARSER_CACHES = (
+    ("lib.response_cache", "RESPONSE_CACHE", "clear"),
+    ("lib.token_cache", "TOKEN_CACHE", "clear"),
+    ("lib.ocr", "OCR_ENGINE", "clear"),
+    ("US_SPP", "REALTIME_NODE_PRICES", "clear"),
+    ("CENACE", "DATA_CACHE", "clear"),
+    ("NTESMO", "DAILY_REPORT_INDEX", "reset"),
+)
+
+
+@dataclass
+class RecordedCall:
+    entry_point: str
+    function: Callable[..., Any]
+    args: tuple
+    kwargs: dict[str, Any]
+    frozen_time: datetime | None
+
+
+@dataclass
+class EntryPointStats:
+    """Measurements of one entry point, one value per replayed call."""
+
+    wall_time_s: list[float] = field(default_factory=list)
+    cpu_time_s: list[float] = field(default_factory=list)
+    peak_memory_kib: list[float] = field(default_factory=list)
+    events: list[int] = field(default_factory=list)
+    # The calls recorded by failed tests, which are not replayed.
+    skipped: int = 0
+    # The errors of the calls whose replay raised.
+    errors: list[str] = field(default_factory=list)
+
+    def summary(self) -> dict[str, float]:
+        cpu_time = sum(self.cpu_time_s)
+        return {
+            "calls": len(self.events),
+            "skipped": self.skipped,
+            "failed": len(self.errors),
+            "wall_time_s": sum(self.wall_time_s),
+            "cpu_time_s": cpu_time,
+            # CPU-bound calls have a CPU time close to their wall time.
+            "cpu_ratio": cpu_time / sum(self.wall_time_s) if self.wall_time_s else 0,
+            "peak_memory_kib": max(self.peak_memory_kib, default=0),
+            "events": sum(self.events),
+            "events_per_s": sum(self.events) / cpu_time if cpu_time else 0,
+        }
+
+
+def _count_events(result: Any) -> int:
+    if result is None:
+        return 0
+    if isinstance(result, dict):
+        return 1
+    try:
+        return len(result)
+    except TypeError:
+        return 1
+
+
+class ReplayBenchmark:
+    def __init__(self, config: pytest.Config):
+        self.output = Path(config.getoption("replay_benchmark"))
+        self.baseline = config.getoption("replay_baseline")
+        self.runs = config.getoption("replay_runs")
+        self.stats: dict[str, EntryPointStats] = defaultdict(EntryPointStats)
+        self._recording = False
+        self._recorded: list[RecordedCall] = []
+        self._local = threading.local()
+        self._cache_clears: list[Callable[[], None]] = []
+
+    def install(self) -> None:
+        """Wraps the `fetch_*` functions of every parser module to record their calls."""
+        package = electricitymap.contrib.parsers
+        for module_name, attribute, method in PARSER_CACHES:
+            try:
+                module = importlib.import_module(f"{package.__name__}.{module_name}")
+            except Exception:
+                continue
+            self._cache_clears.append(getattr(getattr(module, attribute), method))
+        for module_info in pkgutil.iter_modules(package.__path__):
+            try:
+                module = importlib.import_module(
+                    f"{package.__name__}.{module_info.name}"
+                )
+            except Exception:
+                # Parsers whose optional dependencies are missing are skipped.
+                continue
+            for name, value in list(vars(module).items()):
+                if (
+                    name.startswith("fetch_")
+                    and callable(value)
+                    and getattr(value, "__module__", None) == module.__name__
+                ):
+                    setattr(
+                        module,
+                        name,
+                        self._recording_wrapper(f"{module_info.name}.{name}", value),
+                    )
+
+    def _recording_wrapper(
+        self, entry_point: str, function: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            depth = getattr(self._local, "depth", 0)
+            # Only the outermost entry point is recorded, and only from the
+            # test itself, not from the replays.
+            if self._recording and depth == 0:
+                frozen_time = (
+                    datetime.now(timezone.utc)
+                    if freezegun.api.freeze_factories
+                    else None
+                )
+                self._local.depth = depth + 1
+                try:
+                    result = function(*args, **kwargs)
+                finally:
+                    self._local.depth = depth
+                self._recorded.append(
+                    RecordedCall(entry_point, function, args, kwargs, frozen_time)
+                )
+                return result
+            self._local.depth = depth + 1
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._local.depth = depth
+
+        return wrapper
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item):
+        uses_mocks = "requests_mock" in getattr(item, "fixturenames", ())
+        self._recording = uses_mocks
+        self._recorded = []
+        outcome = yield
+        self._recording = False
+        # Calls of failed tests are not representative, and mocks registered
+        # by the test are still active until its teardown.
+        for call in self._recorded:
+            if outcome.excinfo is None:
+                self._replay(call)
+            else:
+                self.stats[call.entry_point].skipped += 1
+        self._recorded = []
+
+    def _clear_caches(self) -> None:
+        for clear in self._cache_clears:
+            clear()
+
+    def _replay(self, call: RecordedCall) -> None:
+        def run() -> Any:
+            if call.frozen_time is None:
+                return call.function(*call.args, **call.kwargs)
+            with freezegun.freeze_time(call.frozen_time):
+                return call.function(*call.args, **call.kwargs)
+
+        stats = self.stats[call.entry_point]
+        try:
+            self._clear_caches()
+            result = run()
+            wall_times, cpu_times = [], []
+            for _ in range(self.runs):
+                self._clear_caches()
+                wall_start, cpu_start = time.perf_counter(), time.process_time()
+                run()
+                wall_times.append(time.perf_counter() - wall_start)
+                cpu_times.append(time.process_time() - cpu_start)
+            self._clear_caches()
+            tracemalloc.start()
+            try:
+                run()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        except Exception as error:
+            # Some tests assert on state consumed by the first call (e.g. a
+            # one-shot mock response), such calls cannot be replayed.
+            stats.errors.append(f"{type(error).__name__}: {error}")
+            return
+        finally:
+            self._clear_caches()
+
+        stats.wall_time_s.append(statistics.median(wall_times))
+        stats.cpu_time_s.append(statistics.median(cpu_times))
+        stats.peak_memory_kib.append(peak / 1024)
+        stats.events.append(_count_events(result))
+
+    def results(self) -> dict[str, Any]:
+        return {
+            "version": BENCHMARK_FORMAT_VERSION,
+            "runs": self.runs,
+            "entry_points": {
+                entry_point: {**stats.summary(), "measurements": asdict(stats)}
+                for entry_point, stats in sorted(self.stats.items())
+            },
+        }
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        results = self.results()
+        self.output.write_text(json.dumps(results, indent=2))
+        baseline = {}
+        if self.baseline:
+            baseline = json.loads(Path(self.baseline).read_text())["entry_points"]
+
+        write = terminalreporter.write_line
+        terminalreporter.section("parser replay benchmark")
+        write(
+            f"{'entry point':<48}{'calls':>6}{'skipped':>8}{'failed':>7}"
+            f"{'wall (ms)':>11}{'cpu (ms)':>10}"
+            f"{'cpu %':>7}{'peak (KiB)':>12}{'events':>8}{'events/s':>11}"
+            + (f"{'vs baseline':>13}" if baseline else "")
+        )
+        for entry_point, summary in results["entry_points"].items():
+            line = (
+                f"{entry_point:<48}{summary['calls']:>6}"
+                f"{summary['skipped']:>8}{summary['failed']:>7}"
+                f"{summary['wall_time_s'] * 1000:>11.1f}"
+                f"{summary['cpu_time_s'] * 1000:>10.1f}"
+                f"{summary['cpu_ratio'] * 100:>7.0f}"
+                f"{summary['peak_memory_kib']:>12.0f}{summary['events']:>8}"
+                f"{summary['events_per_s']:>11.0f}"
+            )
+            previous = baseline.get(entry_point)
+            if previous and previous["cpu_time_s"]:
+                change = summary["cpu_time_s"] / previous["cpu_time_s"] - 1
+                line += f"{change:>+13.0%}"
+            write(line)
+        skipped = sum(
+            summary["skipped"] for summary in results["entry_points"].values()
+        )
+        failed = sum(summary["failed"] for summary in results["entry_points"].values())
+        if skipped or failed:
+            write(
+                f"{skipped} call(s) of failed tests skipped, {failed} replay(s) failed,"
+                " see the errors in the results"
+            )
+        write(f"Results written to {self.output}")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("replay benchmark")
+    group.addoption(
+        "--replay-benchmark",
+        metavar="PATH",
+        help="Replay the parser calls of the tests and write the measurements to PATH",
+    )
+    group.addoption(
+        "--replay-baseline",
+        metavar="PATH",
+        help="Compare the measurements to an earlier --replay-benchmark output",
+    )
+    group.addoption(
+        "--replay-runs", type=int, default=5, help="Timed runs per replayed call"
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if config.getoption("replay_benchmark"):
+        benchmark = ReplayBenchmark(config)
+        benchmark.install()
+        config.pluginmanager.register(benchmark, "replay_benchmark_instance")
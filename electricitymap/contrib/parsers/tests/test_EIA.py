@@ -582,3 +582,71 @@ def test_fetch_returns_storage(requests_mock, session, snapshot):
     data_list = EIA.fetch_production_mix(ZoneKey("US-CAL-IID"), session)
 
     assert data_list == snapshot
+
+
+def test_fetch_follows_pagination(requests_mock, session, monkeypatch):
+    monkeypatch.setattr(EIA, "EIA_PAGE_LENGTH", 2)
+    periods = ["2023-05-01T10", "2023-05-01T11", "2023-05-01T12"]
+    pages = [
+        {"json": {"response": {"total": "3", "data": page}}}
+        for page in (
+            [{"period": period, "value": 1} for period in periods[:2]],
+            [{"period": periods[2], "value": 1}],
+        )
+    ]
+    requests_mock.register_uri(GET, ANY, pages)
+
+    data_list = EIA.fetch_consumption(
+        ZoneKey("US-NW-BPAT"),
+        session,
+        target_datetime=datetime(2023, 5, 1, 12, tzinfo=timezone.utc),
+    )
+
+    assert [data["datetime"].hour for data in data_list] == [9, 10, 11]
+    assert [request.qs["offset"] for request in requests_mock.request_history] == [
+        ["0"],
+        ["2"],
+    ]
+
+
+def test_fetch_consumption_for_zones_splits_rows_by_respondent(requests_mock, session):
+    requests_mock.register_uri(
+        GET,
+        ANY,
+        json={
+            "response": {
+                "total": "4",
+                "data": [
+                    {"period": "2023-05-01T10", "respondent": "CFE", "value": 1},
+                    {"period": "2023-05-01T10", "respondent": "CISO", "value": 2},
+                    {"period": "2023-05-01T11", "respondent": "CFE", "value": 3},
+                    {"period": "2023-05-01T11", "respondent": "CISO", "value": 4},
+                ],
+            }
+        },
+    )
+
+    consumptions = EIA.fetch_consumption_for_zones(
+        [ZoneKey("US-CAL-CISO"), ZoneKey("MX-BC"), ZoneKey("MX-NO")],
+        session,
+        target_datetime=datetime(2023, 5, 1, 12, tzinfo=timezone.utc),
+    )
+
+    assert requests_mock.call_count == 1
+    assert requests_mock.request_history[0].qs["facets[respondent][]"] == [
+        "ciso",
+        "cfe",
+    ]
+    assert [data["consumption"] for data in consumptions[ZoneKey("US-CAL-CISO")]] == [
+        2,
+        4,
+    ]
+    for zone_key in ("MX-BC", "MX-NO"):
+        assert [data["zoneKey"] for data in consumptions[ZoneKey(zone_key)]] == [
+            zone_key,
+            zone_key,
+        ]
+        assert [data["consumption"] for data in consumptions[ZoneKey(zone_key)]] == [
+            1,
+            3,
+        ]
@@ -18,6 +18,7 @@ from electricitymap.contrib.parsers.ENTSOE import (
     _get_datetime_value_from_timeseries,
     _merge_forecast_transfer_capacities,
     fetch_production,
+    iter_timeseries_points,
     parse_forecast_transfer_capacity,
     zulu_to_utc,
 )
@@ -78,10 +79,13 @@ def test_fetch_consumption_aggregated_zone(monkeypatch):
 
     result = ENTSOE.fetch_consumption(ZoneKey("IT-SO"), session=None)
 
-    assert called_domains == [
-        ENTSOE.ENTSOE_DOMAIN_MAPPINGS["IT-CA"],
-        ENTSOE.ENTSOE_DOMAIN_MAPPINGS["IT-SO"],
-    ]
+    # The zones of an aggregate are queried concurrently.
+    assert sorted(called_domains) == sorted(
+        [
+            ENTSOE.ENTSOE_DOMAIN_MAPPINGS["IT-CA"],
+            ENTSOE.ENTSOE_DOMAIN_MAPPINGS["IT-SO"],
+        ]
+    )
     assert result == [
         {
             "datetime": dt,
@@ -132,10 +136,13 @@ def test_fetch_generation_forecast_aggregated_zone(monkeypatch):
 
     result = ENTSOE.fetch_generation_forecast(ZoneKey("IT-SO"), session=None)
 
-    assert called_domains == [
-        ENTSOE.ENTSOE_DOMAIN_MAPPINGS["IT-CA"],
-        ENTSOE.ENTSOE_DOMAIN_MAPPINGS["IT-SO"],
-    ]
+    # The zones of an aggregate are queried concurrently.
+    assert sorted(called_domains) == sorted(
+        [
+            ENTSOE.ENTSOE_DOMAIN_MAPPINGS["IT-CA"],
+            ENTSOE.ENTSOE_DOMAIN_MAPPINGS["IT-SO"],
+        ]
+    )
     assert result == [
         {
             "datetime": dt,
@@ -248,6 +255,32 @@ def test_fetch_exchange_with_aggregated_exchanges(requests_mock, session, snapsh
     )
 
 
+def test_fetch_exchange_with_aggregated_exchanges_names_the_failing_pair(
+    requests_mock, session
+):
+    requests_mock.register_uri(
+        GET,
+        ANY,
+        content=(
+            base_path_to_mock / "FR-COR_IT-SAR_AC_exchange_imports.xml"
+        ).read_bytes(),
+    )
+    requests_mock.register_uri(
+        GET,
+        "?documentType=A11&in_Domain=10Y1001A1001A74G&out_Domain=10Y1001A1001A893",
+        status_code=500,
+    )
+
+    with pytest.raises(ENTSOE.ParserException) as exc_info:
+        ENTSOE.fetch_exchange(
+            zone_key1=ZoneKey("FR-COR"), zone_key2=ZoneKey("IT-SAR"), session=session
+        )
+    assert "Failed to query export for 10Y1001A1001A74G -> 10Y1001A1001A893" in str(
+        exc_info.value
+    )
+    assert requests_mock.call_count == 4
+
+
 def test_fetch_exchange_forecast(requests_mock, session, snapshot):
     imports = base_path_to_mock / "DK-DK2_SE-SE4_exchange_forecast_imports.xml"
     exports = base_path_to_mock / "DK-DK2_SE-SE4_exchange_forecast_exports.xml"
@@ -643,6 +676,31 @@ def test_a03_curve_decompression(fixture, snapshot):
     assert snapshot(extension_class=SingleFileAmberSnapshotExtension) == results
 
 
+@pytest.mark.parametrize(
+    "fixture", sorted(path.name for path in base_path_to_mock.glob("*.xml"))
+)
+def test_xml_decoders_yield_the_same_points(monkeypatch, fixture):
+    """The streaming lxml decoder matches the BeautifulSoup one, headers included."""
+    xml = (base_path_to_mock / fixture).read_bytes()
+    target_str = "price.amount" if b"price.amount" in xml else "quantity"
+
+    def decode(decoder):
+        monkeypatch.setattr(ENTSOE, "XML_DECODER", decoder)
+        return list(iter_timeseries_points(xml, target_str, production_parsing=True))
+
+    points = decode("lxml")
+    assert points
+    assert points == decode("soup")
+
+
+def test_xml_decoder_is_validated(monkeypatch):
+    monkeypatch.setenv("ENTSOE_XML_DECODER", "soup")
+    assert ENTSOE._xml_decoder_from_environment() == "soup"
+    monkeypatch.setenv("ENTSOE_XML_DECODER", "html")
+    with pytest.raises(ValueError, match="Invalid ENTSOE_XML_DECODER 'html'"):
+        ENTSOE._xml_decoder_from_environment()
+
+
 # ─── parse_forecast_transfer_capacity ────────────────────────────────────────
 
 
@@ -1132,3 +1190,36 @@ def test_fetch_exchange_capacity_forecasts_month_ahead(
         zone_key2=ZoneKey("FR"),
         session=session,
     )
+
+
+def test_fetch_price_for_zones_queries_shared_domains_once(requests_mock, session):
+    data = base_path_to_mock / "FR_prices.xml"
+    adapter = requests_mock.register_uri(GET, ANY, content=data.read_bytes())
+
+    prices = ENTSOE.fetch_price_for_zones(
+        [ZoneKey("DE"), ZoneKey("DE-LU"), ZoneKey("FR")], session
+    )
+
+    assert adapter.call_count == 2
+    assert prices[ZoneKey("DE")] == ENTSOE.fetch_price(ZoneKey("DE"), session)
+    assert prices[ZoneKey("FR")] == ENTSOE.fetch_price(ZoneKey("FR"), session)
+
+
+def test_fetch_production_for_zones_queries_aggregated_zones_once(
+    requests_mock, session
+):
+    data = base_path_to_mock / "FI_production.xml"
+    adapter = requests_mock.register_uri(GET, ANY, content=data.read_bytes())
+    logger = logging.Logger("test")
+
+    productions = ENTSOE.fetch_production_for_zones(
+        [ZoneKey("IT-SO"), ZoneKey("IT-CA")], session, logger=logger
+    )
+
+    assert adapter.call_count == 2
+    assert productions[ZoneKey("IT-SO")] == fetch_production(
+        ZoneKey("IT-SO"), session, logger=logger
+    )
+    assert productions[ZoneKey("IT-CA")] == fetch_production(
+        ZoneKey("IT-CA"), session, logger=logger
+    )
@@ -15,6 +15,9 @@ from electricitymap.contrib.parsers.GB import (
     ELEXON_MILS_STREAM,
     ELEXON_PN_STREAM,
     NESO_API,
+    _compute_storage_mixes,
+    _rows_to_df,
+    _settlement_periods,
     fetch_consumption_forecast,
     fetch_price,
     fetch_production,
@@ -90,6 +93,52 @@ def test_fetch_production(requests_mock, session, snapshot):
     )
 
 
+def test_compute_storage_mixes_precedence():
+    start = datetime(2024, 12, 16, 12, 0, tzinfo=timezone.utc)
+    periods = _settlement_periods(
+        [start, datetime(2024, 12, 16, 12, 30, tzinfo=timezone.utc)]
+    )
+
+    def rows(*records):
+        return _rows_to_df(
+            [
+                {
+                    "nationalGridBmUnit": unit,
+                    "timeFrom": f"2024-12-16T{time_from}:00Z",
+                    "timeTo": f"2024-12-16T{time_to}:00Z",
+                    "levelFrom": level,
+                    "acceptanceNumber": acceptance_number,
+                }
+                for unit, time_from, time_to, level, acceptance_number in records
+            ]
+        )
+
+    storage_mixes = _compute_storage_mixes(
+        periods,
+        hydro_units=["HYDRO"],
+        battery_units=["BATTERY"],
+        pn_df=rows(
+            ("HYDRO", "12:00", "13:00", 100, 0),
+            ("BATTERY", "12:00", "12:30", -60, 0),
+            ("BATTERY", "12:15", "12:30", 30, 0),
+        ),
+        mels_df=rows(("HYDRO", "12:00", "13:00", 40, 0)),
+        mils_df=rows(("BATTERY", "12:00", "13:00", -20, 0)),
+        boalf_df=rows(
+            ("HYDRO", "12:30", "12:45", 10, 1),
+            ("HYDRO", "12:30", "12:45", 70, 2),
+            ("HYDRO", "12:30", "12:45", None, 3),
+        ),
+    )
+
+    # Hydro: PN clamped to MELS, then BOALF with the highest acceptance number.
+    assert storage_mixes[start].hydro == -40
+    assert storage_mixes[periods[start]].hydro == -(15 * 70 + 15 * 40) / 30
+    # Battery: the latest PN record wins, clamped to MILS, then no data.
+    assert storage_mixes[start].battery == -(15 * -20 + 15 * 30) / 30
+    assert storage_mixes[periods[start]].battery == 0
+
+
 @freeze_time("2024-12-16 12:00:00")
 def test_fetch_wind_solar_forecasts_day_ahead_live(requests_mock, session, snapshot):
     gb_mock = resources.files("electricitymap.contrib.parsers.tests.mocks.GB")
@@ -27,7 +27,6 @@ from requests_mock import GET
 from syrupy.extensions.single_file import SingleFileAmberSnapshotExtension
 
 from electricitymap.contrib.parsers.JP import (
-    _ARCHIVE_CACHE,
     _AREA_COLUMN_MAP,
     _AREA_CSV_CONFIGS,
     _LEGACY_AREA_CONFIGS,
@@ -53,13 +52,6 @@ MOCKS_DIR = Path(__file__).parent / "mocks" / "JP_area"
 LOGGER = getLogger(__name__)
 
 
-@pytest.fixture(autouse=True)
-def _clear_archive_cache():
-    """Keep the module-level archive cache from leaking between tests."""
-    _ARCHIVE_CACHE.clear()
-    yield
-
-
 # Zone number → (zone_key, fixture_file, target_date, schema_cols, fixture_rows, target_day_rows)
 # fixture_rows: total data rows in the fixture CSV (most are 102-line files = 100 data rows;
 #   JP-TH is a daily-rolling realtime file capped at 48 rows for the day).
@@ -687,6 +679,8 @@ class _FakeResponse:
     def __init__(self, status_code: int, content: bytes = b""):
         self.status_code = status_code
         self.content = content
+        self.reason = ""
+        self.headers: dict[str, str] = {}
 
     def raise_for_status(self):
         if self.status_code >= 400:
@@ -700,7 +694,7 @@ class _FakeSession:
         self._route = route
         self.urls: list[str] = []
 
-    def get(self, url: str, headers: dict | None = None):
+    def get(self, url: str, params: dict | None = None, headers: dict | None = None):
         self.urls.append(url)
         return self._route(url)
 
@@ -1289,7 +1283,7 @@ class _HeaderRecordingSession:
         self.headers: dict | None = None
         self.calls = 0
 
-    def get(self, url: str, headers: dict | None = None):
+    def get(self, url: str, params: dict | None = None, headers: dict | None = None):
         self.calls += 1
         self.url = url
         self.headers = headers or {}
@@ -46,6 +46,51 @@ def test_price_parser_se(requests_mock, session, snapshot):
     )
 
 
+def test_price_parser_for_zones_requests_areas_together(requests_mock, session):
+    mock_token = Path(base_path_to_mock, "token.json")
+    prices_by_date = {
+        "2024-07-08": loads(
+            Path(base_path_to_mock, "se_current_day_price.json").read_text()
+        ),
+        "2024-07-09": loads(
+            Path(base_path_to_mock, "se_next_day_price.json").read_text()
+        ),
+    }
+
+    def prices(request, context):
+        areas = prices_by_date[request.qs["date"][0]]
+        return [*areas, {**areas[0], "deliveryArea": "SE3"}]
+
+    requests_mock.register_uri(
+        POST,
+        "https://sts.nordpoolgroup.com/connect/token",
+        json=loads(mock_token.read_text()),
+    )
+    price_adapter = requests_mock.register_uri(
+        GET,
+        "https://data-api.nordpoolgroup.com/api/v2/Auction/Prices/ByAreas",
+        json=prices,
+    )
+
+    zone_prices = NORDPOOL.fetch_price_for_zones(
+        zone_keys=[ZoneKey("SE-SE4"), ZoneKey("SE-SE3")],
+        session=session,
+        target_datetime=datetime.fromisoformat("2024-07-08"),
+    )
+
+    assert price_adapter.call_count == 2
+    assert price_adapter.last_request.qs["areas"] == ["se4,se3"]
+    assert [price["price"] for price in zone_prices[ZoneKey("SE-SE3")]] == [
+        price["price"] for price in zone_prices[ZoneKey("SE-SE4")]
+    ]
+    assert {price["zoneKey"] for price in zone_prices[ZoneKey("SE-SE3")]} == {"SE-SE3"}
+    assert zone_prices[ZoneKey("SE-SE4")] == NORDPOOL.fetch_price(
+        zone_key=ZoneKey("SE-SE4"),
+        session=session,
+        target_datetime=datetime.fromisoformat("2024-07-08"),
+    )
+
+
 def test_exchange_parser_fi_se1(requests_mock, session, snapshot):
     mock_token = Path(base_path_to_mock, "token.json")
     mock_data_current_day = Path(base_path_to_mock, "fi_se1_current_day_exchange.json")
@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from json import loads
 from pathlib import Path
 from zoneinfo import ZoneInfo
@@ -7,7 +7,11 @@ import pytest
 import requests
 from requests_mock import ANY, GET
 
+from electricitymap.contrib.parsers.lib.exceptions import ParserException
 from electricitymap.contrib.parsers.NTESMO import (
+    API_URL,
+    DAILY_REPORT_INDEX,
+    DailyReportIndex,
     fetch_consumption,
     fetch_consumption_forecast,
     fetch_price,
@@ -17,6 +21,12 @@ from electricitymap.contrib.parsers.NTESMO import (
 australia = ZoneInfo("Australia/Darwin")
 
 
+@pytest.fixture(autouse=True)
+def _clear_daily_report_index():
+    DAILY_REPORT_INDEX.reset()
+    yield
+
+
 @pytest.fixture()
 def fixture_session_mock(requests_mock, session) -> tuple[requests.Session, object]:
     index_page = """<div class="smp-tiles-article__item">
@@ -170,3 +180,106 @@ def test_snapshot_fetch_consumption_forecast(requests_mock, session, snapshot):
 
     # Compare to snapshot
     assert snapshot == result
+
+
+def _report_cards(dates: list[date]) -> str:
+    return "".join(
+        f"""<a href="https://ntesmo.com.au/__data/assets/excel_doc/{day:%y%m%d}.xlsx">
+            <div class="smp-tiles-article__title">{day:%d %B %Y}</div>
+        </a>"""
+        for day in dates
+    )
+
+
+def _link(day: date) -> str:
+    return f"https://ntesmo.com.au/__data/assets/excel_doc/{day:%y%m%d}.xlsx"
+
+
+def _register_listing(requests_mock, newest_date: date, num_reports: int) -> None:
+    """Registers the paginated report cards of the current year, 9 per page."""
+    dates = [newest_date - timedelta(days=day) for day in range(num_reports)]
+    pages = [dates[:9]] + [dates[start : start + 9] for start in range(0, 90, 9)]
+    for page_number, page in enumerate(pages):
+        requests_mock.get(
+            f"{API_URL}?result_70160_result_page={page_number}",
+            text=_report_cards(page),
+        )
+
+
+def test_daily_report_index_scans_historical_pages_once(requests_mock, session):
+    requests_mock.get(
+        f"{API_URL}/historical-daily-trading-data/2022-daily-trading-data",
+        text=_report_cards([date(2022, 12, 2), date(2022, 12, 1)]),
+    )
+    index = DailyReportIndex()
+    today_date = date(2024, 6, 10)
+
+    assert index.find(date(2022, 12, 1), today_date, session) == _link(
+        date(2022, 12, 1)
+    )
+    assert index.find(date(2022, 12, 2), today_date, session) == _link(
+        date(2022, 12, 2)
+    )
+    with pytest.raises(ParserException):
+        index.find(date(2022, 11, 30), today_date, session)
+    assert requests_mock.call_count == 1
+
+
+def test_daily_report_index_scans_current_year_pages_incrementally(
+    requests_mock, session
+):
+    today_date = date(2024, 6, 10)
+    _register_listing(requests_mock, date(2024, 6, 8), num_reports=60)
+    index = DailyReportIndex()
+
+    # Pages 0 (a copy of page 1) to 3 down to the target date.
+    assert index.find(date(2024, 5, 20), today_date, session) == _link(
+        date(2024, 5, 20)
+    )
+    assert requests_mock.call_count == 4
+
+    # Indexed already, or capped to the latest report.
+    index.find(date(2024, 6, 1), today_date, session)
+    index.find(date(2024, 6, 8), today_date, session)
+    assert requests_mock.call_count == 4
+
+    # Older reports are searched from the last page scanned on.
+    assert index.find(date(2024, 5, 5), today_date, session) == _link(date(2024, 5, 5))
+    assert requests_mock.call_count == 5
+
+    # Newer reports are searched until the indexed ones are reached.
+    _register_listing(requests_mock, date(2024, 6, 9), num_reports=61)
+    assert index.find(date(2024, 6, 10), today_date, session) == _link(date(2024, 6, 9))
+    assert requests_mock.call_count == 6
+
+
+def test_daily_report_index_disk_cache(requests_mock, session, tmp_path):
+    requests_mock.get(
+        f"{API_URL}/historical-daily-trading-data/2022-daily-trading-data",
+        text=_report_cards([date(2022, 12, 1)]),
+    )
+    today_date = date(2024, 6, 10)
+    path = tmp_path / "ntesmo_daily_reports.json"
+    DailyReportIndex(path).find(date(2022, 12, 1), today_date, session)
+
+    assert DailyReportIndex(path).find(date(2022, 12, 1), today_date, session) == _link(
+        date(2022, 12, 1)
+    )
+    assert requests_mock.call_count == 1
+
+
+def test_daily_report_index_enable_disk_cache(requests_mock, session, tmp_path):
+    requests_mock.get(
+        f"{API_URL}/historical-daily-trading-data/2022-daily-trading-data",
+        text=_report_cards([date(2022, 12, 1)]),
+    )
+    today_date = date(2024, 6, 10)
+    path = tmp_path / "ntesmo_daily_reports.json"
+    DailyReportIndex(path).find(date(2022, 12, 1), today_date, session)
+    index = DailyReportIndex()
+    index.enable_disk_cache(path)
+
+    assert index.find(date(2022, 12, 1), today_date, session) == _link(
+        date(2022, 12, 1)
+    )
+    assert requests_mock.call_count == 1
@@ -16,6 +16,7 @@ from electricitymap.contrib.parsers.OPENNEM import (
     fetch_exchange,
     fetch_price,
     fetch_production,
+    fetch_production_for_zones,
 )
 
 base_path_to_mock = Path("electricitymap/contrib/parsers/tests/mocks/OPENNEM")
@@ -41,6 +42,38 @@ def test_production(requests_mock, session, snapshot, zone):
     ) == fetch_production(zone, session, datetime.fromisoformat("2025-03-23"))
 
 
+def test_production_for_zones_requests_each_network_once(requests_mock, session):
+    zones = [ZoneKey("AU-NSW"), ZoneKey("AU-QLD")]
+    mocks = {
+        zone: json.loads(Path(base_path_to_mock, f"OPENNEM_{zone}.v4.json").read_text())
+        for zone in zones
+    }
+    network_mock = {
+        **mocks[zones[0]],
+        "data": [
+            {
+                **mocks[zones[0]]["data"][0],
+                "results": [
+                    result
+                    for zone in zones
+                    for result in mocks[zone]["data"][0]["results"]
+                ],
+            }
+        ],
+    }
+    requests_mock.register_uri(ANY, ANY, json=network_mock)
+    target_datetime = datetime.fromisoformat("2025-03-23")
+
+    productions = fetch_production_for_zones(zones, session, target_datetime)
+
+    assert requests_mock.call_count == 1
+    assert requests_mock.last_request.qs["primary_grouping"] == ["network_region"]
+    assert "network_region" not in requests_mock.last_request.qs
+    for zone in zones:
+        requests_mock.register_uri(ANY, ANY, json=mocks[zone])
+        assert productions[zone] == fetch_production(zone, session, target_datetime)
+
+
 @pytest.mark.parametrize("zone", ["AU-SA"])
 def test_price(requests_mock, session, snapshot, zone):
     mock_data = Path(base_path_to_mock, f"OPENNEM_price_{zone}.json")
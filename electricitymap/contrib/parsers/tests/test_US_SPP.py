@@ -4,6 +4,7 @@ from pathlib import Path
 from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
+import pytest
 from pandas import read_pickle
 from requests_mock import GET
 from testfixtures import LogCapture
@@ -54,7 +55,13 @@ def test_SPP_logging():
         )
 
 
-def test_fetch_realtime_locational_marginal_price(requests_mock, session, snapshot):
+@pytest.fixture(autouse=True)
+def _clear_realtime_node_prices():
+    US_SPP.REALTIME_NODE_PRICES.clear()
+    yield
+
+
+def _register_realtime_intervals(requests_mock):
     # Mock 8 consecutive 5-minute intervals of LMP data
     base_url = "https://us-ca-proxy-jfnx5klx2a-uw.a.run.app/file-browser-api/download/rtbm-lmp-by-location?host=https://portal.spp.org&path=/2025/03/By_Interval/31/RTBM-LMP-SL-{}.csv"
     times = [
@@ -75,6 +82,10 @@ def test_fetch_realtime_locational_marginal_price(requests_mock, session, snapsh
             GET, base_url.format(time), text=mock_csv.read_text()
         )
 
+
+def test_fetch_realtime_locational_marginal_price(requests_mock, session, snapshot):
+    _register_realtime_intervals(requests_mock)
+
     realtime_LMP = US_SPP.fetch_realtime_locational_marginal_price(
         zone_key=ZoneKey("US-CENT-SWPP"),
         session=session,
@@ -86,6 +97,30 @@ def test_fetch_realtime_locational_marginal_price(requests_mock, session, snapsh
     assert snapshot == realtime_LMP
 
 
+def test_fetch_realtime_locational_marginal_price_reuses_fetched_intervals(
+    requests_mock, session
+):
+    _register_realtime_intervals(requests_mock)
+    target_datetime = datetime(2025, 3, 31, 9, 10, tzinfo=ZoneInfo("America/Chicago"))
+
+    first_LMP = US_SPP.fetch_realtime_locational_marginal_price(
+        zone_key=ZoneKey("US-CENT-SWPP"),
+        session=session,
+        target_datetime=target_datetime,
+    )
+    assert requests_mock.call_count == 7
+    second_LMP = US_SPP.fetch_realtime_locational_marginal_price(
+        zone_key=ZoneKey("US-CENT-SWPP"),
+        session=session,
+        target_datetime=target_datetime,
+    )
+
+    assert second_LMP == first_LMP
+    # Only the empty 08:45 interval, not published yet, is fetched again.
+    assert requests_mock.call_count == 8
+    assert requests_mock.request_history[-1].url.endswith("202503310845.csv")
+
+
 def test_fetch_dayahead_locational_marginal_price(requests_mock, session, snapshot):
     mock_csv = Path(
         "electricitymap/contrib/parsers/tests/mocks/US_SPP/DA-LMP-SL-202503190100.csv"
@@ -12,6 +12,7 @@ from electricitymap.contrib.parsers.lib.nordpool_intraday_schemas import (
     STATS_AREAS,
     ContractStatisticsResponse,
 )
+from electricitymap.contrib.parsers.lib.token_cache import TOKEN_CACHE, CachedToken
 from electricitymap.contrib.types import ZoneKey
 
 FIXTURE = Path(__file__).parent / "mocks" / "NORDPOOL" / "stats_ger_2026-05-09.json"
@@ -77,16 +78,19 @@ def test_unknown_field_raises_drift_alert(real_payload) -> None:
 
 
 def _stub_session(payload):
-    """Build a mock session and pre-populate the module-level token cache."""
+    """Build a mock session and pre-populate the token cache."""
     session = MagicMock()
     response = MagicMock()
     response.status_code = 200
     response.json.return_value = payload
     session.get.return_value = response
 
-    nordpool_mod.CURRENT_TOKEN = nordpool_mod.NordpoolToken(
-        token="fake",
-        expiration=datetime(2099, 1, 1, tzinfo=timezone.utc),
+    TOKEN_CACHE.store(
+        nordpool_mod.TOKEN_PROVIDER,
+        CachedToken(
+            value="fake",
+            expires_at=datetime(2099, 1, 1, tzinfo=timezone.utc).timestamp(),
+        ),
     )
     return session
 
@@ -105,9 +109,12 @@ def test_fetch_intraday_contract_statistics_happy_path(real_payload) -> None:
     mock_response.json.return_value = payload
 
     with patch.object(nordpool_mod, "_query_nordpool", return_value=mock_response):
-        nordpool_mod.CURRENT_TOKEN = nordpool_mod.NordpoolToken(
-            token="fake",
-            expiration=datetime(2099, 1, 1, tzinfo=timezone.utc),
+        TOKEN_CACHE.store(
+            nordpool_mod.TOKEN_PROVIDER,
+            CachedToken(
+                value="fake",
+                expires_at=datetime(2099, 1, 1, tzinfo=timezone.utc).timestamp(),
+            ),
         )
         result = nordpool_mod.fetch_intraday_contract_statistics(
             zone_key=ZoneKey("DE"),
@@ -149,9 +156,12 @@ def test_fetch_intraday_contract_statistics_drift(real_payload) -> None:
     mock_response.json.return_value = drifted_payload
 
     with patch.object(nordpool_mod, "_query_nordpool", return_value=mock_response):
-        nordpool_mod.CURRENT_TOKEN = nordpool_mod.NordpoolToken(
-            token="fake",
-            expiration=datetime(2099, 1, 1, tzinfo=timezone.utc),
+        TOKEN_CACHE.store(
+            nordpool_mod.TOKEN_PROVIDER,
+            CachedToken(
+                value="fake",
+                expires_at=datetime(2099, 1, 1, tzinfo=timezone.utc).timestamp(),
+            ),
         )
         with pytest.raises(ValidationError) as excinfo:
             nordpool_mod.fetch_intraday_contract_statistics(
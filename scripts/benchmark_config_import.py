@@ -0,0 +1,71 @@
+"""
+This script measures how long it takes to import and use the config.
+
+Each measurement runs in a fresh interpreter. A cold run starts from an empty
+config snapshot cache, so the yaml files are parsed, while a warm run reuses
+the snapshot written by the previous run.
+
+Usage:
+    uv run python scripts/benchmark_config_import.py
+    uv run python scripts/benchmark_config_import.py --runs 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from electricitymap.contrib.config.reading import SNAPSHOT_CACHE_DIR_ENV
+
+STATEMENTS = {
+    "import events": "import electricitymap.contrib.lib.models.events",
+    "one zone": (
+        "from electricitymap.contrib.config import ZONES_CONFIG; ZONES_CONFIG['DE']"
+    ),
+    "all config": (
+        "from electricitymap.contrib.config import CO2EQ_PARAMETERS, "
+        "ZONE_NEIGHBOURS, RETIRED_ZONES_CONFIG; dict(RETIRED_ZONES_CONFIG)"
+    ),
+}
+
+
+def time_statement(statement: str, cache_dir: str) -> float:
+    """Runs a statement in a new interpreter and returns its duration in seconds."""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"{statement}; print(time.perf_counter() - start)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, SNAPSHOT_CACHE_DIR_ENV: cache_dir},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    print(f"{'':<16}{'cold (s)':>12}{'warm (s)':>12}")
+    for name, statement in STATEMENTS.items():
+        cold, warm = [], []
+        for _ in range(args.runs):
+            with tempfile.TemporaryDirectory() as cache_dir:
+                # Loading every file fills the cache, which the warm run reuses.
+                cold.append(time_statement(statement, cache_dir))
+                time_statement(STATEMENTS["all config"], cache_dir)
+                warm.append(time_statement(statement, cache_dir))
+        print(
+            f"{name:<16}{statistics.median(cold):>12.3f}"
+            f"{statistics.median(warm):>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+This script compares the ENTSOE XML decoders on recorded documents.
+
+Each document is decoded with every decoder of `ENTSOE.XML_DECODER`, and the
+points they yield are checked to be identical. By default the documents are the
+recorded fixtures of the ENTSOE parser tests.
+
+Usage:
+    uv run python scripts/benchmark_entsoe_decoder.py
+    uv run python scripts/benchmark_entsoe_decoder.py --runs 20 path/to/document.xml
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from electricitymap.contrib.parsers import ENTSOE
+
+FIXTURES_DIR = Path(__file__).parent.parent.joinpath(
+    "electricitymap", "contrib", "parsers", "tests", "mocks", "ENTSOE"
+)
+DECODERS = ENTSOE.XML_DECODERS
+
+
+def decode(xml: bytes, decoder: str) -> list:
+    ENTSOE.XML_DECODER = decoder
+    target_str = "price.amount" if b"price.amount" in xml else "quantity"
+    return list(ENTSOE.iter_timeseries_points(xml, target_str, production_parsing=True))
+
+
+def time_decoder(xml: bytes, decoder: str, runs: int) -> float:
+    """Returns the median duration of decoding a document, in seconds."""
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        decode(xml, decoder)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=10, help="Runs per measurement")
+    parser.add_argument(
+        "documents",
+        nargs="*",
+        type=Path,
+        help="ENTSOE XML documents, defaults to the recorded test fixtures",
+    )
+    args = parser.parse_args()
+    documents = args.documents or sorted(FIXTURES_DIR.glob("*.xml"))
+
+    print(f"{'document':<48}{'points':>8}" + "".join(f"{d:>12}" for d in DECODERS))
+    totals = dict.fromkeys(DECODERS, 0.0)
+    for document in documents:
+        xml = document.read_bytes()
+        points = [decode(xml, decoder) for decoder in DECODERS]
+        if any(p != points[0] for p in points):
+            raise ValueError(f"The decoders disagree on {document}")
+        durations = {d: time_decoder(xml, d, args.runs) for d in DECODERS}
+        for decoder, duration in durations.items():
+            totals[decoder] += duration
+        print(
+            f"{document.name:<48}{len(points[0]):>8}"
+            + "".join(f"{durations[d] * 1000:>10.2f}ms" for d in DECODERS)
+        )
+    print(f"{'total':<56}" + "".join(f"{totals[d] * 1000:>10.2f}ms" for d in DECODERS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+This script benchmarks the parsers offline, by replaying the recorded mocks of their tests.
+
+Every `fetch_*` call made by the parser tests against `requests_mock` is
+replayed through the real entry point, and its wall time, CPU time, peak memory
+and events per second are reported per entry point. The measurements are
+written as JSON, which can be passed back with `--baseline` to compare a change
+against them. See `electricitymap/contrib/parsers/tests/replay_benchmark.py`.
+
+Usage:
+    uv run python scripts/benchmark_parser_replay.py --output before.json
+    uv run python scripts/benchmark_parser_replay.py -k "ENTSOE or GB" --baseline before.json
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import pytest
+
+TESTS_DIR = Path(__file__).parent.parent.joinpath(
+    "electricitymap", "contrib", "parsers", "tests"
+)
+PLUGIN = "electricitymap.contrib.parsers.tests.replay_benchmark"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per replayed call")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("parser_replay_benchmark.json"),
+        help="Where to write the measurements",
+    )
+    parser.add_argument(
+        "--baseline", type=Path, help="Earlier measurements to compare against"
+    )
+    parser.add_argument("-k", help="Only replay the tests matching this expression")
+    args = parser.parse_args()
+
+    pytest_args = [
+        str(TESTS_DIR),
+        "-q",
+        "-p",
+        PLUGIN,
+        f"--replay-benchmark={args.output}",
+        f"--replay-runs={args.runs}",
+    ]
+    if args.baseline:
+        pytest_args.append(f"--replay-baseline={args.baseline}")
+    if args.k:
+        pytest_args += ["-k", args.k]
+    sys.exit(pytest.main(pytest_args))
+
+
+if __name__ == "__main__":
+    main()
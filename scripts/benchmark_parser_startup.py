@@ -0,0 +1,65 @@
+"""
+This script measures the start up cost of running a single parser.
+
+Each measurement runs in a fresh interpreter and reports its duration and the
+peak memory (RSS) of the process. Importing the parser registry only imports
+the modules of the parsers that are looked up, "all parsers" imports every
+parser module, as the registry used to do on import.
+
+Usage:
+    uv run python scripts/benchmark_parser_startup.py
+    uv run python scripts/benchmark_parser_startup.py --runs 10 --zone DE
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import registry": "from electricitymap.contrib.parsers.lib.parsers import "
+    "PARSER_DATA_TYPE_TO_DICT",
+    "one parser": "from electricitymap.contrib.parsers.lib.parsers import "
+    "PARSER_DATA_TYPE_TO_DICT; from electricitymap.contrib.types import "
+    "ParserDataType; PARSER_DATA_TYPE_TO_DICT[ParserDataType.PRODUCTION][{zone!r}]",
+    "all parsers": "from electricitymap.contrib.parsers.lib.parsers import "
+    "PARSER_DATA_TYPE_TO_DICT; [dict(parsers) for parsers in "
+    "PARSER_DATA_TYPE_TO_DICT.values()]",
+}
+
+
+def measure(statement: str) -> tuple[float, float]:
+    """Runs a statement in a new interpreter, returns its duration (s) and peak RSS (MB)."""
+    code = (
+        "import json, resource, sys, time; start = time.perf_counter(); "
+        f"{statement}; duration = time.perf_counter() - start; "
+        "print(json.dumps([duration, "
+        "resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return tuple(json.loads(result.stdout.strip().splitlines()[-1]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement")
+    parser.add_argument("--zone", default="FR", help="Zone of the production parser")
+    args = parser.parse_args()
+
+    print(f"{'':<20}{'time (s)':>12}{'RSS (MB)':>12}")
+    for name, statement in STATEMENTS.items():
+        durations, rss = zip(
+            *(measure(statement.format(zone=args.zone)) for _ in range(args.runs)),
+            strict=True,
+        )
+        print(
+            f"{name:<20}{statistics.median(durations):>12.3f}"
+            f"{statistics.median(rss):>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
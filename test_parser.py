@@ -7,11 +7,13 @@ import logging
 import pprint
 import time
 from collections.abc import Callable
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from typing import Any
 
 import click
 
+from electricitymap.contrib.lib.models.instrumentation import collect_model_metrics
 from electricitymap.contrib.parsers.lib.parsers import PARSER_DATA_TYPE_TO_DICT
 from electricitymap.contrib.parsers.lib.quality import (
     ValidationError,
@@ -27,7 +29,14 @@ logger = logging.getLogger(__name__)
 @click.argument("zone")
 @click.argument("data-type", default="")
 @click.option("--target_datetime", default=None, show_default=True)
-def test_parser(zone: ZoneKey, data_type: str, target_datetime: str | None):
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print where the time went (network, validation, merge, serialization)",
+)
+def test_parser(
+    zone: ZoneKey, data_type: str, target_datetime: str | None, profile: bool
+):
     """
     Parameters
     ----------
@@ -41,6 +50,7 @@ def test_parser(zone: ZoneKey, data_type: str, target_datetime: str | None):
     >>> uv run test_parser FR production
     >>> uv run test_parser "NO-NO3->SE" exchange
     >>> uv run test_parser GE production --target_datetime="2022-04-10 15:00"
+    >>> uv run test_parser FR production --profile
 
     """
     if not data_type:
@@ -65,7 +75,8 @@ def test_parser(zone: ZoneKey, data_type: str, target_datetime: str | None):
 
     args = zone.split("->") if parser_data_type in EXCHANGE_DATA_TYPES else [zone]
 
-    res = parser(*args, target_datetime=parsed_target_datetime, logger=logger)
+    with collect_model_metrics() if profile else nullcontext() as metrics:
+        res = parser(*args, target_datetime=parsed_target_datetime, logger=logger)
 
     if not res:
         raise ValueError(f"Error: parser returned nothing ({res})")
@@ -117,6 +128,8 @@ def test_parser(zone: ZoneKey, data_type: str, target_datetime: str | None):
             ]
         )
     )
+    if metrics is not None:
+        print(f"---------------------\nprofile: {metrics.report()}")
 
     if isinstance(res, dict):
         res = [res]
@@ -0,0 +1,104 @@
+import json
+import os
+
+import pytest
+
+from electricitymap.contrib.config import reading
+from electricitymap.contrib.config.reading import (
+    SNAPSHOT_CACHE_DIR_ENV,
+    LazyConfigDirectory,
+    lazy_exchanges_config,
+    lazy_zones_config,
+)
+
+
+@pytest.fixture()
+def config_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(SNAPSHOT_CACHE_DIR_ENV, str(tmp_path / "cache"))
+    config_dir = tmp_path / "config"
+    config_dir.joinpath("zones").mkdir(parents=True)
+    config_dir.joinpath("zones", "AA.yaml").write_text("capacity:\n  wind: 1\n")
+    config_dir.joinpath("zones", "BB.yaml").write_text("capacity:\n  wind: 2\n")
+    config_dir.joinpath("exchanges").mkdir()
+    config_dir.joinpath("exchanges", "AA_BB.yaml").write_text("lonlat: [1, 2]\n")
+    return config_dir
+
+
+def test_files_are_parsed_on_demand(config_dir, monkeypatch):
+    parsed_files = []
+    load = reading.yaml.load
+    monkeypatch.setattr(
+        reading.yaml, "load", lambda file: parsed_files.append(file.name) or load(file)
+    )
+    zones_config = lazy_zones_config(config_dir)
+
+    assert "CC" not in zones_config
+    assert parsed_files == []
+    assert zones_config["AA"] == {"capacity": {"wind": 1}}
+    assert "AA" in zones_config
+    assert [os.path.basename(name) for name in parsed_files] == ["AA.yaml"]
+    assert dict(zones_config) == {
+        "AA": {"capacity": {"wind": 1}},
+        "BB": {"capacity": {"wind": 2}},
+    }
+
+
+def test_exchange_keys(config_dir):
+    assert dict(lazy_exchanges_config(config_dir)) == {"AA->BB": {"lonlat": [1, 2]}}
+
+
+def test_transform_keeps_raw_items(config_dir):
+    zones_config = lazy_zones_config(config_dir, transform=lambda config: {})
+    assert zones_config["AA"] == {}
+    assert dict(zones_config.raw_items())["AA"] == {"capacity": {"wind": 1}}
+
+
+def test_snapshot_is_reused_until_a_file_changes(config_dir, monkeypatch):
+    dict(lazy_zones_config(config_dir))
+
+    def fail(file):
+        raise AssertionError("the snapshot should have been used")
+
+    monkeypatch.setattr(reading.yaml, "load", fail)
+    assert lazy_zones_config(config_dir)["BB"] == {"capacity": {"wind": 2}}
+
+    monkeypatch.undo()
+    monkeypatch.setenv(SNAPSHOT_CACHE_DIR_ENV, str(config_dir.parent / "cache"))
+    config_dir.joinpath("zones", "BB.yaml").write_text("capacity:\n  wind: 30\n")
+    assert lazy_zones_config(config_dir)["BB"] == {"capacity": {"wind": 30}}
+
+
+def test_invalid_files_are_skipped(config_dir, capsys):
+    config_dir.joinpath("zones", "CC.yaml").write_text("capacity: [\n")
+    zones_config = lazy_zones_config(config_dir)
+
+    # Membership agrees with lookups, before and after them.
+    assert "CC" not in zones_config
+    with pytest.raises(KeyError):
+        zones_config["CC"]
+    assert "CC" not in zones_config
+    assert list(zones_config) == ["AA", "BB"]
+    assert "Error reading config for CC" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("cache_dir", [None, ""])
+def test_snapshot_cache_is_opt_in(config_dir, monkeypatch, cache_dir):
+    if cache_dir is None:
+        monkeypatch.delenv(SNAPSHOT_CACHE_DIR_ENV)
+    else:
+        monkeypatch.setenv(SNAPSHOT_CACHE_DIR_ENV, cache_dir)
+    zones_config = LazyConfigDirectory(config_dir / "zones")
+    assert len(zones_config) == 2
+    assert not config_dir.parent.joinpath("cache").exists()
+
+
+def test_snapshots_are_json_and_invalid_ones_are_ignored(config_dir):
+    dict(lazy_zones_config(config_dir))
+    (snapshot_path,) = config_dir.parent.joinpath("cache").iterdir()
+    assert json.loads(snapshot_path.read_text()) == {
+        "AA": {"capacity": {"wind": 1}},
+        "BB": {"capacity": {"wind": 2}},
+    }
+
+    snapshot_path.write_text("[1, 2]")
+    assert lazy_zones_config(config_dir)["AA"] == {"capacity": {"wind": 1}}
@@ -0,0 +1,72 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from electricitymap.contrib import config
+from electricitymap.contrib.config import capacity
+from electricitymap.contrib.config.registry import CONFIG_REGISTRY, ConfigRegistry
+from electricitymap.contrib.types import ZoneKey
+
+
+def test_config_modules_share_the_registry():
+    assert config.ZONES_CONFIG is CONFIG_REGISTRY.zones
+    assert capacity.ZONES_CONFIG is CONFIG_REGISTRY.zones
+    assert config.ZONES_CONFIG["DE"] is capacity.ZONES_CONFIG["DE"]
+    assert (
+        capacity.CAPACITY_PARSER_SOURCE_TO_ZONES
+        is CONFIG_REGISTRY.capacity_parser_source_to_zones
+    )
+
+
+def test_configs_are_read_only():
+    with pytest.raises(TypeError):
+        config.ZONES_CONFIG["DE"]["capacity"] = {}
+    with pytest.raises(TypeError):
+        config.ZONES_CONFIG["DE"]["capacity"]["wind"].append({})
+    with pytest.raises(TypeError):
+        config.EXCHANGES_CONFIG["DE->FR"]["lonlat"][0] = 0
+    with pytest.raises(TypeError):
+        config.ZONE_PARENT.pop(ZoneKey("DK-DK1"))
+    with pytest.raises(TypeError):
+        config.CO2EQ_PARAMETERS_DIRECT["emissionFactors"]["zoneOverrides"].clear()
+
+
+def test_configs_copy_to_plain_containers():
+    for value in (
+        config.ZONES_CONFIG["DE"],
+        config.EXCHANGES_CONFIG["DE->FR"],
+        config.ZONE_PARENT,
+    ):
+        assert isinstance(value, dict)
+        assert json.loads(json.dumps(value)) == value
+        assert pickle.loads(pickle.dumps(value)) == value
+        copied = copy.deepcopy(value)
+        assert copied == value
+        copied.clear()
+    zone_config = copy.deepcopy(config.ZONES_CONFIG["DE"])
+    zone_config["capacity"]["wind"].append({})
+    assert config.ZONES_CONFIG["DE"]["capacity"]["wind"][-1] != {}
+
+
+def test_co2eq_parameters_are_kept_out_of_zone_configs():
+    assert "emissionFactors" not in config.ZONES_CONFIG["DE"]
+    assert "DE" in config.CO2EQ_PARAMETERS_DIRECT["emissionFactors"]["zoneOverrides"]
+
+
+def test_capacity_parser_indexes():
+    zone_to_source = capacity.ZONE_TO_CAPACITY_PARSER_SOURCE
+    for source, zones in capacity.CAPACITY_PARSER_SOURCE_TO_ZONES.items():
+        for zone in zones:
+            assert zone_to_source[zone] == source
+            assert config.ZONES_CONFIG[zone]["parsers"][
+                "productionCapacity"
+            ].startswith(f"{source}.")
+
+
+def test_preload():
+    registry = ConfigRegistry(CONFIG_REGISTRY.config_dir)
+    registry.preload(freeze=False)
+    assert "zone_neighbours" in vars(registry)
+    assert registry.zone_parents[ZoneKey("DK-DK1")] == "DK"
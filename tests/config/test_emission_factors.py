@@ -1,12 +1,17 @@
+import copy
 from datetime import datetime, timezone
 
 import pandas as pd
 
 from electricitymap.contrib.config import CO2EQ_PARAMETERS_DIRECT
 from electricitymap.contrib.config.emission_factors_lookup import (
+    CO2EQ_PARAMETER_LOOKUP_DIRECT,
+    Co2eqParameterLookup,
+    get_co2eq_parameter_lookup,
     get_emission_factors_with_metadata_all_years,
     get_zone_specific_co2eq_parameter,
 )
+from electricitymap.contrib.config.model import EmissionFactorVariant
 
 
 def test_all_emission_factor_error(snapshot):
@@ -56,3 +61,97 @@ def test_get_zone_specific_co2eq_parameter_identical_return():
     )
 
     assert res1["value"] == res2["value"]
+
+
+CO2EQ_PARAMETERS_WITH_HISTORY = {
+    "emissionFactors": {
+        "defaults": {"coal": {"source": "default", "value": 1000}},
+        "zoneOverrides": {
+            "AT": {
+                "coal": [
+                    {"datetime": "2022-01-01", "source": "b", "value": 900},
+                    {"datetime": "2020-01-01", "source": "a", "value": 950},
+                ]
+            }
+        },
+    }
+}
+
+
+def test_compiled_lookup_does_not_mutate_parameters():
+    lookup = Co2eqParameterLookup(CO2EQ_PARAMETERS_WITH_HISTORY)
+    result = lookup.get(
+        "AT",
+        "emissionFactors",
+        "coal",
+        datetime(2021, 6, 1, tzinfo=timezone.utc),
+        metadata=True,
+    )
+    assert result == {
+        "datetime": "2020-01-01",
+        "source": "a",
+        "value": 950,
+        "variant": EmissionFactorVariant.ZONE_FALLBACK_OLDER.value,
+    }
+    overrides = CO2EQ_PARAMETERS_WITH_HISTORY["emissionFactors"]["zoneOverrides"]
+    assert [entry["datetime"] for entry in overrides["AT"]["coal"]] == [
+        "2022-01-01",
+        "2020-01-01",
+    ]
+    assert "variant" not in overrides["AT"]["coal"][1]
+
+
+def test_compiled_lookup_resolves_many_datetimes():
+    lookup = Co2eqParameterLookup(CO2EQ_PARAMETERS_WITH_HISTORY)
+    datetimes = pd.DatetimeIndex(
+        ["2019-06-01", "2020-01-01", "2021-03-01", "2022-01-01", "2024-01-01"],
+        tz="UTC",
+    )
+    compiled = lookup.compile("AT", "emissionFactors", "coal")
+
+    assert compiled.values_at(datetimes).tolist() == [950, 950, 950, 900, 900]
+    assert compiled.sources_at(datetimes).tolist() == ["a", "a", "a", "b", "b"]
+    assert compiled.variants_at(datetimes).tolist() == [
+        EmissionFactorVariant.ZONE_FALLBACK_OLDEST,
+        EmissionFactorVariant.ZONE_EXACT_TIMELY,
+        EmissionFactorVariant.ZONE_FALLBACK_OLDER,
+        EmissionFactorVariant.ZONE_EXACT_TIMELY,
+        EmissionFactorVariant.ZONE_FALLBACK_LATEST,
+    ]
+    for dt, variant in zip(
+        datetimes.to_pydatetime(), compiled.variants_at(datetimes), strict=True
+    ):
+        result = lookup.get("AT", "emissionFactors", "coal", dt, metadata=True)
+        assert result["variant"] == variant.value
+    assert lookup.emission_factors("DE", "coal", datetimes).tolist() == [1000] * 5
+
+
+def test_compiled_lookup_resolves_datetime_max():
+    lookup = Co2eqParameterLookup(CO2EQ_PARAMETERS_WITH_HISTORY)
+    compiled = lookup.compile("AT", "emissionFactors", "coal")
+    datetimes = [datetime(2021, 6, 1, tzinfo=timezone.utc), datetime.max]
+
+    assert compiled.values_at(datetimes).tolist() == [950, 900]
+    assert compiled.variants_at(datetimes).tolist() == [
+        EmissionFactorVariant.ZONE_FALLBACK_OLDER,
+        EmissionFactorVariant.ZONE_FALLBACK_LATEST,
+    ]
+    assert compiled.get(datetime.max)[0]["value"] == 900
+
+
+def test_only_config_lookups_are_shared():
+    assert get_co2eq_parameter_lookup(CO2EQ_PARAMETERS_DIRECT) is (
+        CO2EQ_PARAMETER_LOOKUP_DIRECT
+    )
+    co2eq_parameters = copy.deepcopy(CO2EQ_PARAMETERS_WITH_HISTORY)
+    dt = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    kwargs = {
+        "co2eq_parameters": co2eq_parameters,
+        "zone_key": "AT",
+        "key": "emissionFactors",
+        "sub_key": "coal",
+        "dt": dt,
+    }
+    assert get_zone_specific_co2eq_parameter(**kwargs)["value"] == 900
+    co2eq_parameters["emissionFactors"]["zoneOverrides"]["AT"]["coal"][0]["value"] = 800
+    assert get_zone_specific_co2eq_parameter(**kwargs)["value"] == 800